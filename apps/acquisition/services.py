@@ -1,4 +1,4 @@
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 
 
 # from .models import Study  <-- COMENTADO TEMPORALMENTE
@@ -34,4 +34,11 @@ class AcquisitionService:
         """Obtiene el ID del proyecto al que pertenece el estudio (MOCK)"""
         if study_id == 999:
             return None
-        return 1
\ No newline at end of file
+        return 1
+
+    @staticmethod
+    def get_study_ids_by_project(project_id: int) -> List[int]:
+        """IDs de los estudios incluidos en un proyecto (MOCK)"""
+        if project_id == 999:
+            return []
+        return list(range(1, 21))
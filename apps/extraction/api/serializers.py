@@ -31,6 +31,7 @@ class QuoteLocationInputSerializer(serializers.Serializer):
     y1 = serializers.FloatField(required=False, allow_null=True)
     x2 = serializers.FloatField(required=False, allow_null=True)
     y2 = serializers.FloatField(required=False, allow_null=True)
+    page_count = serializers.IntegerField(required=False, allow_null=True, min_value=1)
 
 
 class CreateQuoteInputSerializer(serializers.Serializer):
@@ -42,6 +43,10 @@ class CreateQuoteInputSerializer(serializers.Serializer):
         help_text="Lista de IDs de tags a asociar"
     )
     location = QuoteLocationInputSerializer()
+    allow_duplicate = serializers.BooleanField(
+        default=False,
+        help_text="Guardar aunque ya exista un fragmento casi idéntico en la extracción"
+    )
 
 
 class CreateTagInputSerializer(serializers.Serializer):
@@ -49,17 +54,147 @@ class CreateTagInputSerializer(serializers.Serializer):
     project_id = serializers.IntegerField(help_text="ID del proyecto externo")
     is_inductive = serializers.BooleanField(default=True)
     question_id = serializers.IntegerField(required=False, allow_null=True)
+    parent_id = serializers.IntegerField(required=False, allow_null=True, help_text="Tema padre")
 
 
 class ModerateTagInputSerializer(serializers.Serializer):
     action = serializers.ChoiceField(choices=['APPROVE', 'REJECT'])
 
 
+class BulkModerateTagsInputSerializer(serializers.Serializer):
+    approve = serializers.ListField(child=serializers.IntegerField(), required=False, default=list, max_length=5000)
+    reject = serializers.ListField(child=serializers.IntegerField(), required=False, default=list, max_length=5000)
+
+    def validate(self, attrs):
+        if not attrs['approve'] and not attrs['reject']:
+            raise serializers.ValidationError("Se requiere al menos un tag en `approve` o `reject`")
+        return attrs
+
+
+class ModerationQueueInputSerializer(serializers.Serializer):
+    project_id = serializers.IntegerField()
+    cursor = serializers.IntegerField(default=0, min_value=0, help_text="Id del último tag de la página anterior")
+    limit = serializers.IntegerField(default=50, min_value=1, max_value=500)
+
+
 class MergeTagInputSerializer(serializers.Serializer):
     target_tag_id = serializers.IntegerField()
     source_tag_id = serializers.IntegerField()
 
 
+class ImportCodebookInputSerializer(serializers.Serializer):
+    """Archivo CSV/JSON (multipart) o la lista de códigos en el cuerpo JSON"""
+    project_id = serializers.IntegerField()
+    file = serializers.FileField(required=False)
+    format = serializers.ChoiceField(choices=['csv', 'json'], required=False)
+    tags = serializers.ListField(child=serializers.DictField(), required=False, allow_empty=False)
+
+    def validate(self, attrs):
+        if not attrs.get('file') and not attrs.get('tags'):
+            raise serializers.ValidationError("Se requiere `file` o `tags`")
+        return attrs
+
+
+class CloneCodebookInputSerializer(serializers.Serializer):
+    source_project_id = serializers.IntegerField()
+
+
+class MoveTagInputSerializer(serializers.Serializer):
+    parent_id = serializers.IntegerField(allow_null=True, help_text="Nuevo tema padre; null lo vuelve raíz")
+
+
+class TagSubtreeQuotesInputSerializer(serializers.Serializer):
+    limit = serializers.IntegerField(default=50, min_value=1, max_value=500)
+    offset = serializers.IntegerField(default=0, min_value=0)
+
+
+class AutocompleteTagsInputSerializer(serializers.Serializer):
+    project_id = serializers.IntegerField()
+    q = serializers.CharField(required=False, allow_blank=True, default="", max_length=100)
+    limit = serializers.IntegerField(default=10, min_value=1, max_value=50)
+
+
+class MergeCandidatesInputSerializer(serializers.Serializer):
+    project_id = serializers.IntegerField()
+    tag_id = serializers.IntegerField(required=False)
+    min_score = serializers.FloatField(default=0.5, min_value=0.4, max_value=1.0)
+    limit = serializers.IntegerField(default=50, min_value=1, max_value=500)
+    co_usage = serializers.BooleanField(
+        default=False,
+        help_text="Combinar el nombre con el uso de los tags en los mismos estudios"
+    )
+
+
+class StartQuoteClusteringInputSerializer(serializers.Serializer):
+    k = serializers.IntegerField(default=20, min_value=2, max_value=200)
+    max_tags = serializers.IntegerField(
+        required=False,
+        allow_null=True,
+        min_value=1,
+        help_text="Solo quotes con a lo sumo esta cantidad de tags"
+    )
+
+
+class ClusterQuotesInputSerializer(serializers.Serializer):
+    limit = serializers.IntegerField(default=50, min_value=1, max_value=500)
+    offset = serializers.IntegerField(default=0, min_value=0)
+
+
+class CreateTagFromClusterInputSerializer(serializers.Serializer):
+    name = serializers.CharField(required=False, max_length=100, min_length=1)
+
+
+class ExportProjectQuotesInputSerializer(serializers.Serializer):
+    """Query params de la exportación (no se usa `format`: lo reserva DRF)"""
+    output = serializers.ChoiceField(choices=['csv', 'jsonl'], default='csv')
+    chunk_size = serializers.IntegerField(default=2000, min_value=100, max_value=20000)
+
+
+class TagCooccurrenceInputSerializer(serializers.Serializer):
+    level = serializers.ChoiceField(choices=['quote', 'extraction', 'study'], default='quote')
+    min_count = serializers.IntegerField(default=1, min_value=1)
+    rollup_level = serializers.IntegerField(
+        required=False,
+        min_value=0,
+        help_text="Agrega cada código a su tema de ese nivel del libro de códigos (0 = raíces)"
+    )
+
+
+class SaturationCurveInputSerializer(serializers.Serializer):
+    rebuild = serializers.BooleanField(default=False)
+
+
+class PageHeatmapInputSerializer(serializers.Serializer):
+    study_id = serializers.IntegerField(required=False)
+    normalize = serializers.BooleanField(
+        default=False,
+        help_text="Posición relativa en el documento (página / total de páginas) en vez de página absoluta"
+    )
+    bins = serializers.IntegerField(default=10, min_value=2, max_value=100)
+
+
+class FrameworkMatrixInputSerializer(serializers.Serializer):
+    output = serializers.ChoiceField(choices=['json', 'csv'], default='json')
+    snippets = serializers.BooleanField(default=False)
+    snippet_length = serializers.IntegerField(default=200, min_value=20, max_value=2000)
+
+
+class SuggestTagsInputSerializer(serializers.Serializer):
+    project_id = serializers.IntegerField()
+    text = serializers.CharField(min_length=1, max_length=5000)
+    limit = serializers.IntegerField(default=5, min_value=1, max_value=20)
+
+
+class SearchQuotesInputSerializer(serializers.Serializer):
+    q = serializers.CharField(min_length=1, max_length=200)
+    project_id = serializers.IntegerField()
+    tag_id = serializers.IntegerField(required=False)
+    researcher_id = serializers.IntegerField(required=False)
+    page = serializers.IntegerField(required=False, min_value=1, help_text="Página del PDF")
+    limit = serializers.IntegerField(default=20, min_value=1, max_value=100)
+    offset = serializers.IntegerField(default=0, min_value=0)
+
+
 # --- READ SERIALIZERS (Salida) ---
 class ExtractionPhaseResponseSerializer(serializers.Serializer):
     """Respuesta de fase de extracción"""
@@ -88,6 +223,7 @@ class TagResponseSerializer(serializers.Serializer):
     type = serializers.CharField()
     created_by_user_id = serializers.IntegerField()
     question_id = serializers.IntegerField(allow_null=True)
+    parent_id = serializers.IntegerField(allow_null=True, required=False)
 
 
 class QuoteLocationResponseSerializer(serializers.Serializer):
@@ -95,6 +231,7 @@ class QuoteLocationResponseSerializer(serializers.Serializer):
     page = serializers.IntegerField()
     text_location = serializers.CharField()
     coordinates = serializers.DictField(allow_null=True)
+    page_count = serializers.IntegerField(allow_null=True, required=False)
 
 
 class QuoteResponseSerializer(serializers.Serializer):
@@ -130,4 +267,53 @@ class ExtractionDetailSerializer(serializers.Serializer):
 
 class CreateExtractionInputSerializer(serializers.Serializer):
     """Input para crear extracción"""
-    study_id = serializers.IntegerField()
\ No newline at end of file
+    study_id = serializers.IntegerField()
+
+
+class ClaimNextStudyInputSerializer(serializers.Serializer):
+    project_id = serializers.IntegerField()
+
+
+class BuildConsensusInputSerializer(serializers.Serializer):
+    dry_run = serializers.BooleanField(default=False, help_text="Solo el reporte, sin crear el borrador")
+    replace = serializers.BooleanField(default=False, help_text="Rehace el borrador existente")
+
+
+class ExtractionDiffInputSerializer(serializers.Serializer):
+    a = serializers.IntegerField(help_text="Extracción de la izquierda")
+    b = serializers.IntegerField(help_text="Extracción de la derecha")
+
+
+class AssignStudiesInputSerializer(serializers.Serializer):
+    user_ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, max_length=500)
+    study_ids = serializers.ListField(
+        child=serializers.IntegerField(), required=False, allow_empty=False, max_length=20000,
+        help_text="Por defecto: todos los estudios del proyecto"
+    )
+
+
+class ReassignCoderInputSerializer(serializers.Serializer):
+    leaving_user_id = serializers.IntegerField()
+    user_ids = serializers.ListField(
+        child=serializers.IntegerField(), required=False, allow_empty=False, max_length=500,
+        help_text="Por defecto: el resto del equipo del proyecto, sin el owner"
+    )
+
+
+class QuoteSearchHitSerializer(serializers.Serializer):
+    quote_id = serializers.IntegerField()
+    extraction_id = serializers.IntegerField()
+    researcher_id = serializers.IntegerField()
+    page = serializers.IntegerField(allow_null=True)
+    snippet = serializers.CharField()
+    rank = serializers.FloatField()
+
+
+class TagSuggestionSerializer(serializers.Serializer):
+    id = serializers.IntegerField(source='tag_id')
+    name = serializers.CharField()
+    color = serializers.CharField()
+    is_mandatory = serializers.BooleanField()
+    type = serializers.CharField()
+    status = serializers.CharField()
+    quote_count = serializers.IntegerField()
@@ -1,11 +1,13 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import ExtractionViewSet, QuoteViewSet, TagViewSet
+from .views import ExtractionViewSet, QuoteViewSet, TagViewSet, ProjectViewSet, StudyViewSet
 
 router = DefaultRouter()
 router.register(r'extractions', ExtractionViewSet, basename='extraction')
 router.register(r'quotes', QuoteViewSet, basename='quote')
 router.register(r'tags', TagViewSet, basename='tag')
+router.register(r'projects', ProjectViewSet, basename='project')
+router.register(r'studies', StudyViewSet, basename='study')
 
 urlpatterns = [
     path('extraction/', include(router.urls)),
@@ -1,4 +1,5 @@
 # apps/extraction/api/views.py
+from django.http import HttpResponse, StreamingHttpResponse
 from django.shortcuts import render
 from rest_framework import viewsets, status
 from rest_framework.generics import get_object_or_404
@@ -14,8 +15,31 @@ from ..application.commands.create_quote import CreateQuoteCommand
 from ..application.commands.create_tag import CreateTagCommand
 from ..application.commands.moderate_tag import ModerateTagCommand
 from ..application.commands.merge_tags import MergeTagsCommand
-from ..application.queries.get_extraction import GetExtractionQuery
+from ..application.commands.move_tag import MoveTagCommand
+from ..application.commands.bulk_moderate_tags import BulkModerateTagsCommand
+from ..application.commands.import_codebook import ImportCodebookCommand
+from ..application.commands.clone_codebook import CloneCodebookCommand
+from ..application.commands.assign_studies import AssignStudiesCommand
+from ..application.commands.reassign_coder import ReassignCoderCommand
+from ..application.commands.claim_next_study import ClaimNextStudyCommand
+from ..application.commands.build_consensus import BuildConsensusCommand
+from ..application.commands.start_quote_clustering import StartQuoteClusteringCommand
+from ..application.commands.create_tag_from_cluster import CreateTagFromClusterCommand
+from ..application.queries.get_extraction_detail import GetExtractionDetailQuery
 from ..application.queries.list_extractions import ListExtractionsQuery
+from ..application.queries.export_project_quotes import EXPORT_COLUMNS, ExportProjectQuotesQuery
+from ..application.queries.get_tag_cooccurrence import GetTagCooccurrenceQuery
+from ..application.queries.get_framework_matrix import GetFrameworkMatrixQuery
+from ..application.queries.search_quotes import SearchQuotesQuery
+from ..application.queries.get_merge_candidates import GetMergeCandidatesQuery
+from ..application.queries.autocomplete_tags import AutocompleteTagsQuery
+from ..application.queries.suggest_tags import SuggestTagsQuery
+from ..application.queries.get_quote_clusters import GetQuoteClustersQuery
+from ..application.queries.get_saturation_curve import GetSaturationCurveQuery
+from ..application.queries.get_page_tag_heatmap import GetPageTagHeatmapQuery
+from ..application.queries.get_tag_subtree import GetTagSubtreeQuery
+from ..application.queries.get_moderation_queue import GetModerationQueueQuery
+from ..application.queries.get_extraction_diff import GetExtractionDiffQuery
 
 from . import serializers as dtos
 from ..domain.exceptions.extraction_exceptions import (  # ✅
@@ -28,6 +52,9 @@ from ..domain.exceptions.extraction_exceptions import (  # ✅
     TagNotFound,
     ProjectAccessDenied,
 )
+from ..infrastructure.cache.tag_fragments import json_array, splice
+from ..infrastructure.exporters.streaming import CONTENT_TYPES, STREAM_WRITERS, stream_csv
+from ..infrastructure.importers.codebook import entries_from_json, parse_codebook
 from ..infrastructure.models import ExtractionModel
 from apps.extraction.infrastructure.adapters.acquisition_service_adapter import (
     AcquisitionServiceAdapter)
@@ -189,14 +216,53 @@ class ExtractionViewSet(viewsets.ViewSet):
             return self._handle_exception(e)
 
 
+    @action(detail=False, methods=['post'], url_path='claim-next')
+    def claim_next(self, request):
+        """
+        Reserva el siguiente estudio que aún necesita extracción en el proyecto.
+
+        POST /api/extraction/extractions/claim-next/ {"project_id": 1}
+        204 si no queda trabajo disponible para el usuario.
+        """
+        serializer = dtos.ClaimNextStudyInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        command = ClaimNextStudyCommand(
+            project_id=serializer.validated_data['project_id'],
+            user_id=request.user.id
+        )
+
+        try:
+            extraction = container.claim_next_study_handler.handle(command)
+            if not extraction:
+                return Response(status=status.HTTP_204_NO_CONTENT)
+            response_data = {
+                "id": extraction.id,
+                "study_id": extraction.study_id,
+                "status": extraction.status.value,
+                "assigned_to_user_id": extraction.assigned_to_user_id,
+                "extraction_order": extraction.extraction_order,
+            }
+            return Response(response_data, status=status.HTTP_201_CREATED)
+        except ExtractionException as e:
+            return self._handle_exception(e)
+
+
     def retrieve(self, request, pk=None):
-        query = GetExtractionQuery(extraction_id=int(pk))
+        """
+        GET /api/extraction/extractions/{id}/
+
+        El documento sale tal cual de la proyección de lectura (ver
+        DjangoExtractionDetailProjection): un acceso por clave primaria y
+        ningún mapeo ni serializer en el camino.
+        """
+        query = GetExtractionDetailQuery(extraction_id=int(pk))
         try:
-            extraction = container.get_extraction_handler.handle(query)
+            detail = container.get_extraction_detail_handler.handle(query)
 
-            if extraction.assigned_to_user_id != request.user.id:
-                project_id = container.acquisition_adapter.get_project_context(
-                    extraction.study_id
+            if detail.assigned_to_user_id != request.user.id:
+                project_id = detail.project_id or container.acquisition_adapter.get_project_context(
+                    detail.study_id
                 )
                 if project_id:
                     project = container.project_adapter.get_project_by_id(project_id)
@@ -209,40 +275,11 @@ class ExtractionViewSet(viewsets.ViewSet):
                         "No tienes permiso para ver esta extracción"
                     )
 
-            data = {
-                "id": extraction.id,
-                "study_id": extraction.study_id,
-                "assigned_to_user_id": extraction.assigned_to_user_id,
-                "status": extraction.status.value,
-                "started_at": extraction.started_at,
-                "completed_at": extraction.completed_at,
-                "is_active": extraction.is_active,
-                "quotes": [
-                    {
-                        "id": q.id,
-                        "text": q.text,
-                        "location": q.location,
-                        "researcher_id": q.researcher_id,
-                        "tags": [
-                            {
-                                "id": t.id,
-                                "name": t.name,
-                                "project_id": t.project_id,
-                                "is_mandatory": t.is_mandatory,
-                                "status": t.status.value,
-                                "visibility": t.visibility.value,
-                                "type": t.type.value,
-                                "created_by_user_id": t.created_by_user_id,
-                                "question_id": t.question_id,
-                            }
-                            for t in q.tags
-                        ]
-                    }
-                    for q in extraction.quotes
-                ]
-            }
-            serializer = dtos.ExtractionDetailSerializer(data)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return HttpResponse(
+                detail.document,
+                content_type='application/json',
+                status=status.HTTP_200_OK
+            )
 
         except ExtractionException as e:
             return self._handle_exception(e)
@@ -326,36 +363,28 @@ class QuoteViewSet(viewsets.ViewSet):
             x1=location_data.get('x1'),
             y1=location_data.get('y1'),
             x2=location_data.get('x2'),
-            y2=location_data.get('y2')
+            y2=location_data.get('y2'),
+            page_count=location_data.get('page_count'),
+            allow_duplicate=data['allow_duplicate']
         )
 
         try:
             quote = container.create_quote_handler.handle(command)
 
-            response_data = {
-                "id": quote.id,
-                "text": quote.text,
-                "location": quote.location.to_dict() if quote.location else None,
-                "researcher_id": quote.researcher_id,
-                "tags": [
-                    {
-                        "id": t.id,
-                        "name": t.name,
-                        "color": t.color,
-                        "project_id": t.project_id,
-                        "is_mandatory": t.is_mandatory,
-                        "status": t.status.value,
-                        "visibility": t.visibility.value,
-                        "type": t.type.value,
-                        "created_by_user_id": t.created_by_user_id,
-                        "question_id": t.question_id,
-                    }
-                    for t in quote.tags
-                ]
-            }
-            response_serializer = dtos.QuoteResponseSerializer(response_data)
-            return Response(
-                response_serializer.data,
+            # Mismo contrato que QuoteResponseSerializer, con los tags desde la caché de fragmentos
+            cache = container.tag_fragments
+            body = splice(
+                {
+                    "id": quote.id,
+                    "text": quote.text,
+                    "location": quote.location.to_dict() if quote.location else None,
+                    "researcher_id": quote.researcher_id,
+                },
+                tags=cache.join(cache.fragments(quote.tags), quote.tags)
+            )
+            return HttpResponse(
+                body,
+                content_type='application/json',
                 status=status.HTTP_201_CREATED
             )
         except ExtractionException as e:
@@ -377,11 +406,107 @@ class QuoteViewSet(viewsets.ViewSet):
         )
 
         try:
-            result = container.get_extraction_quotes_handler.handle(query)
-            return Response(result, status=status.HTTP_200_OK)
+            extraction = container.get_extraction_quotes_handler.handle(query)
+        except ExtractionException as e:
+            return self._handle_exception(e)
+
+        # Cada quote se serializa una vez (aparece en la lista y en su página)
+        cache = container.tag_fragments
+        fragments = cache.fragments((t for q in extraction.quotes for t in q.tags), shape='compact')
+
+        quotes_list = []
+        quotes_by_page = {}
+        for quote in extraction.quotes:
+            quote_json = splice(
+                {
+                    "id": quote.id,
+                    "text": quote.text,
+                    "page": quote.page_number,
+                    "location": quote.location.to_dict() if quote.location else None,
+                    "researcher_id": quote.researcher_id
+                },
+                tags=cache.join(fragments, quote.tags)
+            )
+            quotes_list.append(quote_json)
+            if quote.page_number:
+                quotes_by_page.setdefault(quote.page_number, []).append(quote_json)
+
+        body = splice(
+            {
+                "extraction_id": extraction.id,
+                "study_id": extraction.study_id,
+                "total_quotes": len(quotes_list),
+            },
+            quotes=json_array(quotes_list),
+            quotes_by_page=splice(
+                {},
+                **{str(page): json_array(items) for page, items in quotes_by_page.items()}
+            )
+        )
+        return HttpResponse(body, content_type='application/json', status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['post'], url_path='suggest-tags')
+    def suggest_tags(self, request):
+        """
+        Sugiere tags para un fragmento antes de guardarlo.
+
+        POST /api/extraction/quotes/suggest-tags/ {"project_id": 1, "text": "..."}
+        """
+        serializer = dtos.SuggestTagsInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        query = SuggestTagsQuery(
+            project_id=data['project_id'],
+            user_id=request.user.id,
+            text=data['text'],
+            limit=data['limit']
+        )
+
+        try:
+            suggestions = container.suggest_tags_handler.handle(query)
+        except ProjectAccessDenied as e:
+            return Response({"error": str(e)}, status=status.HTTP_403_FORBIDDEN)
+        except ExtractionException as e:
+            return self._handle_exception(e)
+
+        return Response({"suggestions": suggestions}, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['get'])
+    def search(self, request):
+        """
+        Búsqueda de texto completo sobre las quotes de un proyecto.
+
+        GET /api/extraction/quotes/search/?q=costo&project_id=1&tag_id=3&page=4
+        """
+        serializer = dtos.SearchQuotesInputSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        query = SearchQuotesQuery(
+            text=data['q'],
+            project_id=data['project_id'],
+            user_id=request.user.id,
+            tag_id=data.get('tag_id'),
+            researcher_id=data.get('researcher_id'),
+            page=data.get('page'),
+            limit=data['limit'],
+            offset=data['offset']
+        )
+
+        try:
+            hits = container.search_quotes_handler.handle(query)
+        except ProjectAccessDenied as e:
+            return Response({"error": str(e)}, status=status.HTTP_403_FORBIDDEN)
         except ExtractionException as e:
             return self._handle_exception(e)
 
+        response_serializer = dtos.QuoteSearchHitSerializer(hits, many=True)
+        return Response(
+            {"count": len(hits), "results": response_serializer.data},
+            status=status.HTTP_200_OK
+        )
+
 
 class TagViewSet(viewsets.ViewSet):
     """Maneja la entidad: Tag (Propuesta y Moderación)"""
@@ -415,7 +540,8 @@ class TagViewSet(viewsets.ViewSet):
             user_id=request.user.id,
             project_id=data['project_id'],
             is_inductive=data['is_inductive'],
-            question_id=data.get('question_id')
+            question_id=data.get('question_id'),
+            parent_id=data.get('parent_id')
         )
 
         try:
@@ -431,6 +557,7 @@ class TagViewSet(viewsets.ViewSet):
                 "type": tag.type.value,
                 "created_by_user_id": tag.created_by_user_id,
                 "question_id": tag.question_id,
+                "parent_id": tag.parent_id,
             }
             response_serializer = dtos.TagResponseSerializer(response_data)
             return Response(
@@ -460,6 +587,149 @@ class TagViewSet(viewsets.ViewSet):
         except ExtractionValidationError as e:
             return Response({"error": str(e)}, status=status.HTTP_422_UNPROCESSABLE_ENTITY)
 
+    @action(detail=False, methods=['post'], url_path='import')
+    def import_codebook(self, request):
+        """
+        Importa un libro de códigos deductivo en lote.
+
+        POST /api/extraction/tags/import/ (multipart: project_id, file=codebook.csv)
+        POST /api/extraction/tags/import/ {"project_id": 1, "tags": [{"path": "Tema > Código"}]}
+        """
+        serializer = dtos.ImportCodebookInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        try:
+            upload = data.get('file')
+            if upload:
+                fmt = data.get('format') or ('json' if upload.name.lower().endswith('.json') else 'csv')
+                entries = parse_codebook(upload.read().decode('utf-8'), fmt)
+            else:
+                entries = entries_from_json(data['tags'])
+
+            result = container.import_codebook_handler.handle(ImportCodebookCommand(
+                project_id=data['project_id'],
+                user_id=request.user.id,
+                entries=entries
+            ))
+            return Response(result.to_dict(), status=status.HTTP_201_CREATED)
+        except UnicodeDecodeError:
+            return Response({"error": "El archivo debe estar en UTF-8"}, status=status.HTTP_400_BAD_REQUEST)
+        except ExtractionException as e:
+            return self._handle_exception(e)
+
+    @action(detail=True, methods=['post'])
+    def move(self, request, pk=None):
+        """
+        Mueve el tag (con su subárbol) bajo otro tema del libro de códigos.
+
+        POST /api/extraction/tags/7/move/ {"parent_id": 3}
+        """
+        serializer = dtos.MoveTagInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        command = MoveTagCommand(
+            tag_id=int(pk),
+            new_parent_id=serializer.validated_data['parent_id'],
+            user_id=request.user.id
+        )
+
+        try:
+            tag = container.move_tag_handler.handle(command)
+            return Response({"id": tag.id, "parent_id": tag.parent_id}, status=status.HTTP_200_OK)
+        except ExtractionException as e:
+            return self._handle_exception(e)
+
+    @action(detail=True, methods=['get'])
+    def subtree(self, request, pk=None):
+        """
+        Subárbol del tag con conteo de quotes por nodo (propias y acumuladas).
+
+        GET /api/extraction/tags/3/subtree/
+        """
+        try:
+            result = container.get_tag_subtree_handler.handle(
+                GetTagSubtreeQuery(tag_id=int(pk), user_id=request.user.id)
+            )
+        except ProjectAccessDenied as e:
+            return Response({"error": str(e)}, status=status.HTTP_403_FORBIDDEN)
+        except ExtractionException as e:
+            return self._handle_exception(e)
+
+        return Response(result, status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=['get'], url_path='subtree/quotes')
+    def subtree_quotes(self, request, pk=None):
+        """
+        Quotes codificadas con el tag o con cualquiera de sus descendientes.
+
+        GET /api/extraction/tags/3/subtree/quotes/?limit=50&offset=0
+        """
+        serializer = dtos.TagSubtreeQuotesInputSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        query = GetTagSubtreeQuery(
+            tag_id=int(pk),
+            user_id=request.user.id,
+            quotes=True,
+            limit=serializer.validated_data['limit'],
+            offset=serializer.validated_data['offset']
+        )
+
+        try:
+            result = container.get_tag_subtree_handler.handle(query)
+        except ProjectAccessDenied as e:
+            return Response({"error": str(e)}, status=status.HTTP_403_FORBIDDEN)
+        except ExtractionException as e:
+            return self._handle_exception(e)
+
+        return Response(result, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['post'], url_path='moderate/bulk')
+    def moderate_bulk(self, request):
+        """
+        Aprueba y rechaza tags en lote.
+
+        POST /api/extraction/tags/moderate/bulk/ {"approve": [4, 7], "reject": [9]}
+        """
+        serializer = dtos.BulkModerateTagsInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        command = BulkModerateTagsCommand(
+            owner_id=request.user.id,
+            approve_ids=serializer.validated_data['approve'],
+            reject_ids=serializer.validated_data['reject']
+        )
+
+        try:
+            result = container.bulk_moderate_tags_handler.handle(command)
+            return Response(result, status=status.HTTP_200_OK)
+        except ExtractionException as e:
+            return self._handle_exception(e)
+
+    @action(detail=False, methods=['get'], url_path='moderation-queue')
+    def moderation_queue(self, request):
+        """
+        Tags pendientes de moderación, paginados por cursor.
+
+        GET /api/extraction/tags/moderation-queue/?project_id=1&limit=50&cursor=120
+        """
+        serializer = dtos.ModerationQueueInputSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        query = GetModerationQueueQuery(
+            project_id=data['project_id'],
+            owner_id=request.user.id,
+            after_id=data['cursor'],
+            limit=data['limit']
+        )
+
+        try:
+            return Response(container.get_moderation_queue_handler.handle(query), status=status.HTTP_200_OK)
+        except ExtractionException as e:
+            return self._handle_exception(e)
+
     @action(detail=False, methods=['post'], url_path='merge')
     def merge(self, request):
         """Fusionar tags"""
@@ -478,6 +748,473 @@ class TagViewSet(viewsets.ViewSet):
         except ExtractionException as e:
             return self._handle_exception(e)
 
+    @action(detail=False, methods=['get'])
+    def autocomplete(self, request):
+        """
+        Tags cuyo nombre (o alguna de sus palabras) empieza por `q`,
+        ordenados por uso.
+
+        GET /api/extraction/tags/autocomplete/?project_id=1&q=cos&limit=10
+        """
+        serializer = dtos.AutocompleteTagsInputSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        query = AutocompleteTagsQuery(
+            project_id=data['project_id'],
+            user_id=request.user.id,
+            prefix=data['q'],
+            limit=data['limit']
+        )
+
+        try:
+            suggestions = container.autocomplete_tags_handler.handle(query)
+        except ProjectAccessDenied as e:
+            return Response({"error": str(e)}, status=status.HTTP_403_FORBIDDEN)
+        except ExtractionException as e:
+            return self._handle_exception(e)
+
+        return Response(
+            {"tags": dtos.TagSuggestionSerializer(suggestions, many=True).data},
+            status=status.HTTP_200_OK
+        )
+
+    @action(detail=False, methods=['get'], url_path='merge-candidates')
+    def merge_candidates(self, request):
+        """
+        Pares de tags con nombres casi iguales, candidatos a fusionar.
+
+        GET /api/extraction/tags/merge-candidates/?project_id=1&co_usage=true
+        """
+        serializer = dtos.MergeCandidatesInputSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        query = GetMergeCandidatesQuery(
+            project_id=data['project_id'],
+            user_id=request.user.id,
+            tag_id=data.get('tag_id'),
+            min_score=data['min_score'],
+            limit=data['limit'],
+            co_usage=data['co_usage']
+        )
+
+        try:
+            candidates = container.get_merge_candidates_handler.handle(query)
+        except ProjectAccessDenied as e:
+            return Response({"error": str(e)}, status=status.HTTP_403_FORBIDDEN)
+        except ExtractionException as e:
+            return self._handle_exception(e)
+
+        return Response(candidates, status=status.HTTP_200_OK)
+
+
+class StudyViewSet(viewsets.ViewSet):
+    """Operaciones sobre todas las extracciones de un estudio"""
+
+    def _handle_exception(self, exc: Exception) -> Response:
+        if isinstance(exc, (UnauthorizedExtractionAccess, ProjectAccessDenied)):
+            return Response({"error": str(exc)}, status=status.HTTP_403_FORBIDDEN)
+        elif isinstance(exc, (StudyNotFound, ExtractionNotFound)):
+            return Response({"error": str(exc)}, status=status.HTTP_404_NOT_FOUND)
+        elif isinstance(exc, (InvalidExtractionState, ExtractionValidationError)):
+            return Response({"error": str(exc)}, status=status.HTTP_422_UNPROCESSABLE_ENTITY)
+        elif isinstance(exc, ExtractionException):
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        else:
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.exception("Error inesperado en StudyViewSet")
+            return Response(
+                {"error": "Error interno del servidor"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    @action(detail=True, methods=['post'])
+    def consensus(self, request, pk=None):
+        """
+        Alinea las extracciones completadas del estudio y crea el borrador de consenso.
+
+        POST /api/extraction/studies/7/consensus/ {"dry_run": false, "replace": false}
+        """
+        serializer = dtos.BuildConsensusInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        command = BuildConsensusCommand(
+            study_id=int(pk),
+            user_id=request.user.id,
+            dry_run=serializer.validated_data['dry_run'],
+            replace=serializer.validated_data['replace']
+        )
+
+        try:
+            report = container.build_consensus_handler.handle(command)
+            code = status.HTTP_200_OK if command.dry_run else status.HTTP_201_CREATED
+            return Response(report.to_dict(), status=code)
+        except ExtractionException as e:
+            return self._handle_exception(e)
+
+    @action(detail=True, methods=['get'])
+    def diff(self, request, pk=None):
+        """
+        Diff lado a lado de dos extracciones del estudio.
+
+        GET /api/extraction/studies/7/diff/?a=12&b=13
+        """
+        serializer = dtos.ExtractionDiffInputSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        query = GetExtractionDiffQuery(
+            study_id=int(pk),
+            user_id=request.user.id,
+            a=serializer.validated_data['a'],
+            b=serializer.validated_data['b']
+        )
+
+        try:
+            return Response(container.get_extraction_diff_handler.handle(query), status=status.HTTP_200_OK)
+        except ExtractionException as e:
+            return self._handle_exception(e)
+
+
+class ProjectViewSet(viewsets.ViewSet):
+    """Lecturas a nivel de proyecto: exportaciones y analítica"""
+
+    def _handle_exception(self, exc: Exception) -> Response:
+        if isinstance(exc, (ProjectAccessDenied, UnauthorizedExtractionAccess)):
+            return Response({"error": str(exc)}, status=status.HTTP_403_FORBIDDEN)
+        elif isinstance(exc, ExtractionNotFound):
+            return Response({"error": str(exc)}, status=status.HTTP_404_NOT_FOUND)
+        elif isinstance(exc, (InvalidExtractionState, ExtractionValidationError)):
+            return Response({"error": str(exc)}, status=status.HTTP_422_UNPROCESSABLE_ENTITY)
+        elif isinstance(exc, ExtractionException):
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        else:
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.exception("Error inesperado en ProjectViewSet")
+            return Response(
+                {"error": "Error interno del servidor"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    @action(detail=True, methods=['get'])
+    def export(self, request, pk=None):
+        """
+        Exporta todas las quotes codificadas del proyecto en streaming.
+
+        GET /api/extraction/projects/1/export/?output=csv|jsonl
+        """
+        serializer = dtos.ExportProjectQuotesInputSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        output = serializer.validated_data['output']
+
+        query = ExportProjectQuotesQuery(
+            project_id=int(pk),
+            user_id=request.user.id,
+            chunk_size=serializer.validated_data['chunk_size']
+        )
+
+        try:
+            rows = container.export_project_quotes_handler.handle(query)
+        except ExtractionException as e:
+            return self._handle_exception(e)
+
+        response = StreamingHttpResponse(
+            STREAM_WRITERS[output](rows, EXPORT_COLUMNS),
+            content_type=CONTENT_TYPES[output]
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="project_{pk}_quotes.{output}"'
+        )
+        return response
+
+    @action(detail=True, methods=['get'])
+    def cooccurrence(self, request, pk=None):
+        """
+        Co-ocurrencia de tags por quote, extracción o estudio.
+
+        GET /api/extraction/projects/1/cooccurrence/?level=study&min_count=2&rollup_level=0
+        """
+        serializer = dtos.TagCooccurrenceInputSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        query = GetTagCooccurrenceQuery(
+            project_id=int(pk),
+            user_id=request.user.id,
+            level=serializer.validated_data['level'],
+            min_count=serializer.validated_data['min_count'],
+            rollup_level=serializer.validated_data.get('rollup_level')
+        )
+
+        try:
+            result = container.get_tag_cooccurrence_handler.handle(query)
+            return Response(result, status=status.HTTP_200_OK)
+        except ExtractionException as e:
+            return self._handle_exception(e)
+
+    @action(detail=True, methods=['post'], url_path='codebook/clone')
+    def clone_codebook(self, request, pk=None):
+        """
+        Copia los tags aprobados (con su jerarquía) de otro proyecto a este.
+
+        POST /api/extraction/projects/2/codebook/clone/ {"source_project_id": 1}
+        """
+        serializer = dtos.CloneCodebookInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        command = CloneCodebookCommand(
+            source_project_id=serializer.validated_data['source_project_id'],
+            target_project_id=int(pk),
+            user_id=request.user.id
+        )
+
+        try:
+            result = container.clone_codebook_handler.handle(command)
+            return Response(result.to_dict(), status=status.HTTP_201_CREATED)
+        except ExtractionException as e:
+            return self._handle_exception(e)
+
+    @action(detail=True, methods=['post'], url_path='assignments')
+    def assign_studies(self, request, pk=None):
+        """
+        Reparte los estudios del proyecto entre codificadores según el modo de la fase.
+
+        POST /api/extraction/projects/1/assignments/ {"user_ids": [2, 3, 4], "study_ids": [1, 2]}
+        """
+        serializer = dtos.AssignStudiesInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        command = AssignStudiesCommand(
+            project_id=int(pk),
+            owner_id=request.user.id,
+            user_ids=serializer.validated_data['user_ids'],
+            study_ids=serializer.validated_data.get('study_ids')
+        )
+
+        try:
+            result = container.assign_studies_handler.handle(command)
+            return Response(result.to_dict(), status=status.HTTP_201_CREATED)
+        except ExtractionException as e:
+            return self._handle_exception(e)
+
+    @action(detail=True, methods=['post'], url_path='assignments/reassign')
+    def reassign_coder(self, request, pk=None):
+        """
+        Traspasa las extracciones abiertas de un codificador al resto del equipo.
+
+        POST /api/extraction/projects/1/assignments/reassign/ {"leaving_user_id": 3}
+        """
+        serializer = dtos.ReassignCoderInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        command = ReassignCoderCommand(
+            project_id=int(pk),
+            owner_id=request.user.id,
+            leaving_user_id=serializer.validated_data['leaving_user_id'],
+            user_ids=serializer.validated_data.get('user_ids')
+        )
+
+        try:
+            result = container.reassign_coder_handler.handle(command)
+            return Response(result.to_dict(), status=status.HTTP_200_OK)
+        except ExtractionException as e:
+            return self._handle_exception(e)
+
+    @action(detail=True, methods=['get'], url_path='page-heatmap')
+    def page_heatmap(self, request, pk=None):
+        """
+        Densidad de quotes por página (o posición relativa) y tag.
+
+        GET /api/extraction/projects/1/page-heatmap/?study_id=3&normalize=true&bins=10
+        """
+        serializer = dtos.PageHeatmapInputSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        query = GetPageTagHeatmapQuery(
+            project_id=int(pk),
+            user_id=request.user.id,
+            study_id=data.get('study_id'),
+            normalize=data['normalize'],
+            bins=data['bins']
+        )
+
+        try:
+            result = container.get_page_tag_heatmap_handler.handle(query)
+            return Response(result, status=status.HTTP_200_OK)
+        except ExtractionException as e:
+            return self._handle_exception(e)
+
+    @action(detail=True, methods=['get'])
+    def saturation(self, request, pk=None):
+        """
+        Curva de saturación: códigos nuevos acumulados por extracción completada.
+
+        GET /api/extraction/projects/1/saturation/?rebuild=true
+        """
+        serializer = dtos.SaturationCurveInputSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        query = GetSaturationCurveQuery(
+            project_id=int(pk),
+            user_id=request.user.id,
+            rebuild=serializer.validated_data['rebuild']
+        )
+
+        try:
+            result = container.get_saturation_curve_handler.handle(query)
+            return Response(result, status=status.HTTP_200_OK)
+        except ExtractionException as e:
+            return self._handle_exception(e)
+
+    @action(detail=True, methods=['get', 'post'])
+    def clusters(self, request, pk=None):
+        """
+        Agrupamientos de quotes del proyecto (fase inductiva).
+
+        GET  /api/extraction/projects/1/clusters/          -> ejecuciones
+        POST /api/extraction/projects/1/clusters/ {"k": 20} -> encola una nueva
+        """
+        try:
+            if request.method == 'GET':
+                runs = container.get_quote_clusters_handler.handle(
+                    GetQuoteClustersQuery(project_id=int(pk), user_id=request.user.id)
+                )
+                return Response(runs, status=status.HTTP_200_OK)
+
+            serializer = dtos.StartQuoteClusteringInputSerializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            run = container.start_quote_clustering_handler.handle(StartQuoteClusteringCommand(
+                project_id=int(pk),
+                user_id=request.user.id,
+                k=serializer.validated_data['k'],
+                max_tags=serializer.validated_data.get('max_tags')
+            ))
+            return Response(
+                {"id": run.id, "status": run.status.value, "k": run.k},
+                status=status.HTTP_202_ACCEPTED
+            )
+        except ExtractionException as e:
+            return self._handle_exception(e)
+
+    @action(detail=True, methods=['get'], url_path=r'clusters/(?P<run_id>\d+)')
+    def cluster_run(self, request, pk=None, run_id=None):
+        """GET /api/extraction/projects/1/clusters/7/ -> clusters con términos principales"""
+        query = GetQuoteClustersQuery(
+            project_id=int(pk),
+            user_id=request.user.id,
+            run_id=int(run_id)
+        )
+        try:
+            return Response(container.get_quote_clusters_handler.handle(query), status=status.HTTP_200_OK)
+        except ExtractionException as e:
+            return self._handle_exception(e)
+
+    @action(detail=True, methods=['get'], url_path=r'clusters/(?P<run_id>\d+)/(?P<label>\d+)/quotes')
+    def cluster_quotes(self, request, pk=None, run_id=None, label=None):
+        """GET /api/extraction/projects/1/clusters/7/3/quotes/ -> quotes del cluster"""
+        serializer = dtos.ClusterQuotesInputSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        query = GetQuoteClustersQuery(
+            project_id=int(pk),
+            user_id=request.user.id,
+            run_id=int(run_id),
+            label=int(label),
+            limit=serializer.validated_data['limit'],
+            offset=serializer.validated_data['offset']
+        )
+        try:
+            return Response(container.get_quote_clusters_handler.handle(query), status=status.HTTP_200_OK)
+        except ExtractionException as e:
+            return self._handle_exception(e)
+
+    @action(detail=True, methods=['post'], url_path=r'clusters/(?P<run_id>\d+)/(?P<label>\d+)/tag')
+    def cluster_tag(self, request, pk=None, run_id=None, label=None):
+        """POST /api/extraction/projects/1/clusters/7/3/tag/ -> crea un tag inductivo desde el cluster"""
+        serializer = dtos.CreateTagFromClusterInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            # Valida que la ejecución pertenezca a este proyecto y al owner
+            container.get_quote_clusters_handler.handle(GetQuoteClustersQuery(
+                project_id=int(pk),
+                user_id=request.user.id,
+                run_id=int(run_id)
+            ))
+            tag = container.create_tag_from_cluster_handler.handle(CreateTagFromClusterCommand(
+                run_id=int(run_id),
+                label=int(label),
+                user_id=request.user.id,
+                name=serializer.validated_data.get('name')
+            ))
+        except ExtractionException as e:
+            return self._handle_exception(e)
+
+        response_data = {
+            "id": tag.id,
+            "name": tag.name,
+            "project_id": tag.project_id,
+            "is_mandatory": tag.is_mandatory,
+            "status": tag.status.value,
+            "visibility": tag.visibility.value,
+            "type": tag.type.value,
+            "created_by_user_id": tag.created_by_user_id,
+            "question_id": tag.question_id,
+        }
+        return Response(dtos.TagResponseSerializer(response_data).data, status=status.HTTP_201_CREATED)
+
+    @action(detail=True, methods=['get'], url_path='framework-matrix')
+    def framework_matrix(self, request, pk=None):
+        """
+        Matriz estudio x tag (conteo de quotes y fragmento opcional por celda).
+
+        GET /api/extraction/projects/1/framework-matrix/?output=csv&snippets=true
+        """
+        serializer = dtos.FrameworkMatrixInputSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        query = GetFrameworkMatrixQuery(
+            project_id=int(pk),
+            user_id=request.user.id,
+            with_snippets=data['snippets'],
+            snippet_length=data['snippet_length']
+        )
+        handler = container.get_framework_matrix_handler
+
+        try:
+            matrix = handler.handle(query)
+        except ExtractionException as e:
+            return self._handle_exception(e)
+
+        if data['output'] == 'csv':
+            response = StreamingHttpResponse(
+                stream_csv(
+                    handler.iter_rows(matrix, query.with_snippets, query.snippet_length),
+                    handler.columns(matrix)
+                ),
+                content_type=CONTENT_TYPES['csv']
+            )
+            response['Content-Disposition'] = (
+                f'attachment; filename="project_{pk}_framework_matrix.csv"'
+            )
+            return response
+
+        result = {
+            "project_id": int(pk),
+            "studies": matrix.study_ids.tolist(),
+            "tags": [
+                {"id": int(tag_id), "name": name}
+                for tag_id, name in zip(matrix.tag_ids, matrix.tag_names)
+            ],
+            "counts": matrix.counts.tolist(),
+        }
+        if query.with_snippets:
+            result["snippets"] = list(handler.iter_snippet_rows(matrix, query.snippet_length))
+        return Response(result, status=status.HTTP_200_OK)
+
 
 def pdf_viewer(request, extraction_id):
     """Vista para el visor de PDF con extracción de quotes"""
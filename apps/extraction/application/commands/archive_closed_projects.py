@@ -0,0 +1,66 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Optional
+
+from ...domain.exceptions.extraction_exceptions import ExtractionValidationError
+from ...domain.repositories.i_extraction_phase_repository import IExtractionPhaseRepository
+from ...domain.repositories.i_extraction_snapshot_repository import IExtractionSnapshotRepository
+from ...domain.repositories.i_quote_search_index import IQuoteSearchIndex
+
+
+@dataclass
+class ArchiveClosedProjectsCommand:
+    closed_before: datetime
+    project_id: Optional[int] = None  # None = todos los proyectos elegibles
+    dry_run: bool = False
+    chunk_size: int = 500
+
+
+@dataclass
+class ArchiveClosedProjectsResult:
+    archived_quotes_by_project: Dict[int, int] = field(default_factory=dict)
+
+    @property
+    def archived_quotes(self) -> int:
+        return sum(self.archived_quotes_by_project.values())
+
+
+class ArchiveClosedProjectsHandler:
+    """
+    Archivo en frío de proyectos cerrados hace tiempo.
+
+    Congela cada extracción en su snapshot y borra sus quotes de las tablas
+    calientes (con ellas se van sus tags, firmas y filas del índice de
+    búsqueda). El detalle, el diff y la exportación siguen funcionando desde
+    los snapshots; la analítica del proyecto deja de ver esas quotes.
+    """
+
+    def __init__(
+            self,
+            phase_repo: IExtractionPhaseRepository,
+            snapshots: IExtractionSnapshotRepository,
+            search_index: IQuoteSearchIndex
+    ):
+        self.phase_repo = phase_repo
+        self.snapshots = snapshots
+        self.search_index = search_index
+
+    def handle(self, command: ArchiveClosedProjectsCommand) -> ArchiveClosedProjectsResult:
+        eligible = self.phase_repo.list_closed_project_ids(command.closed_before)
+        if command.project_id is not None:
+            if command.project_id not in eligible:
+                raise ExtractionValidationError(
+                    f"La fase del proyecto {command.project_id} no está cerrada desde antes de "
+                    f"{command.closed_before:%Y-%m-%d}"
+                )
+            eligible = [command.project_id]
+
+        result = ArchiveClosedProjectsResult()
+        for project_id in eligible:
+            if command.dry_run:
+                result.archived_quotes_by_project[project_id] = 0
+                continue
+            quote_ids = self.snapshots.archive_project(project_id, chunk_size=command.chunk_size)
+            self.search_index.remove_quotes(quote_ids)
+            result.archived_quotes_by_project[project_id] = len(quote_ids)
+        return result
@@ -0,0 +1,153 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+from django.db import IntegrityError, transaction
+
+from ...domain.dtos.assignment_dtos import AssignmentResultDTO, PlannedAssignmentDTO
+from ...domain.entities.extraction import Extraction
+from ...domain.entities.extraction_phase import ExtractionPhase
+from ...domain.exceptions.extraction_exceptions import (
+    ExtractionValidationError,
+    UnauthorizedExtractionAccess
+)
+from ...domain.repositories.i_acquisition_repository import IAcquisitionRepository
+from ...domain.repositories.i_extraction_detail_projection import IExtractionDetailProjection
+from ...domain.repositories.i_extraction_phase_repository import IExtractionPhaseRepository
+from ...domain.repositories.i_extraction_repository import IExtractionRepository
+from ...domain.repositories.i_project_repository import IProjectRepository
+from ...domain.services.workload_balancer import WorkloadBalancer
+from ...domain.value_objects.extraction_status import ExtractionStatus
+from ...domain.value_objects.phase_status import PhaseStatus
+
+
+@dataclass
+class AssignStudiesCommand:
+    project_id: int
+    owner_id: int
+    user_ids: List[int]
+    study_ids: Optional[List[int]] = None  # None = todos los estudios del proyecto
+
+
+class AssignStudiesHandler:
+    """
+    Asigna en bloque los estudios de un proyecto a un grupo de codificadores.
+
+    En lugar de que cada codificador cree su extracción (y cada creación
+    cargue todas las del estudio con sus quotes para contarlas), se lee una
+    sola vez quién tiene qué en el proyecto, se reparte con WorkloadBalancer
+    y las extracciones nuevas entran en un único bulk_create.
+
+    Reglas de Negocio:
+    - Solo el owner del proyecto asigna estudios
+    - Cada estudio se completa hasta las extracciones que pide el modo de la fase
+    - Los codificadores deben pertenecer al proyecto
+    """
+
+    def __init__(
+            self,
+            repository: IExtractionRepository,
+            phase_repo: IExtractionPhaseRepository,
+            study_adapter: IAcquisitionRepository,
+            project_repo: IProjectRepository,
+            projection: IExtractionDetailProjection
+    ):
+        self.repository = repository
+        self.phase_repo = phase_repo
+        self.study_adapter = study_adapter
+        self.project_repo = project_repo
+        self.projection = projection
+
+    @transaction.atomic
+    def handle(self, command: AssignStudiesCommand) -> AssignmentResultDTO:
+        self.ensure_owner(command.project_id, command.owner_id)
+        phase = self.open_phase(command.project_id)
+        self.ensure_members(command.project_id, command.user_ids)
+
+        project_studies = set(self.study_adapter.get_study_ids_by_project(command.project_id))
+        study_ids = project_studies
+        if command.study_ids is not None:
+            study_ids = set(command.study_ids)
+            foreign = sorted(study_ids - project_studies)
+            if foreign:
+                raise ExtractionValidationError(
+                    f"Estudios que no pertenecen al proyecto: {', '.join(map(str, foreign))}"
+                )
+
+        # La carga se mide sobre todo el proyecto, no solo sobre los estudios pedidos
+        balancer = WorkloadBalancer(
+            command.user_ids,
+            self.repository.get_slots_by_studies(project_studies)
+        )
+        planned, unfilled = balancer.plan(study_ids, phase.expected_extractions_per_study)
+
+        vacant = {p.extraction_id: p.user_id for p in planned if p.extraction_id}
+        conflict = ExtractionValidationError(
+            "Las asignaciones del proyecto cambiaron mientras se calculaban; reintenta"
+        )
+        try:
+            with transaction.atomic():
+                created = self.repository.bulk_create(
+                    self.build_extractions([p for p in planned if not p.extraction_id], phase)
+                )
+                filled = self.repository.fill_vacant(vacant) if vacant else 0
+                if filled < len(vacant):
+                    raise conflict
+        except IntegrityError:
+            raise conflict
+
+        # Las extracciones nuevas se proyectan en su primera lectura
+        self.projection.refresh(vacant)
+
+        return AssignmentResultDTO(
+            project_id=command.project_id,
+            assigned=created + filled,
+            unfilled_study_ids=unfilled,
+            load_by_user=balancer.load_by_user
+        )
+
+    @staticmethod
+    def build_extractions(
+            planned: List[PlannedAssignmentDTO],
+            phase: ExtractionPhase
+    ) -> List[Extraction]:
+        return [
+            Extraction(
+                id=None,
+                study_id=p.study_id,
+                assigned_to_user_id=p.user_id,
+                status=ExtractionStatus.PENDING,
+                extraction_order=p.extraction_order,
+                max_quotes=phase.max_quotes_per_extraction,
+                project_id=phase.project_id
+            )
+            for p in planned
+        ]
+
+    def ensure_owner(self, project_id: int, user_id: int) -> None:
+        project = self.project_repo.get_project_by_id(project_id)
+        if not project:
+            raise ExtractionValidationError(f"El proyecto {project_id} no existe")
+        if project.owner_id != user_id:
+            raise UnauthorizedExtractionAccess(
+                "Solo el owner del proyecto puede asignar estudios"
+            )
+
+    def open_phase(self, project_id: int) -> ExtractionPhase:
+        # Bloquea la fase: serializa asignaciones y apertura de cupos del proyecto
+        phase = self.phase_repo.get_by_project_id(project_id, for_update=True)
+        if not phase:
+            raise ExtractionValidationError(
+                "La fase de extracción no está configurada para este proyecto"
+            )
+        if phase.status in (PhaseStatus.COMPLETED, PhaseStatus.AUTO_CLOSED):
+            raise ExtractionValidationError("La fase de extracción ya cerró")
+        return phase
+
+    def ensure_members(self, project_id: int, user_ids: List[int]) -> None:
+        if not user_ids:
+            raise ExtractionValidationError("Indica al menos un codificador")
+        outsiders = sorted(u for u in set(user_ids) if not self.project_repo.is_member(project_id, u))
+        if outsiders:
+            raise ExtractionValidationError(
+                f"Usuarios que no pertenecen al proyecto: {', '.join(map(str, outsiders))}"
+            )
@@ -0,0 +1,135 @@
+from dataclasses import dataclass
+
+from django.db import transaction
+from django.utils import timezone
+
+from ...domain.dtos.consensus_dtos import ConsensusReportDTO
+from ...domain.entities.extraction import Extraction
+from ...domain.entities.quote import Quote
+from ...domain.exceptions.extraction_exceptions import (
+    ExtractionValidationError,
+    StudyNotFound,
+    UnauthorizedExtractionAccess
+)
+from ...domain.repositories.i_acquisition_repository import IAcquisitionRepository
+from ...domain.repositories.i_extraction_detail_projection import IExtractionDetailProjection
+from ...domain.repositories.i_extraction_repository import IExtractionRepository
+from ...domain.repositories.i_project_repository import IProjectRepository
+from ...domain.repositories.i_quote_repository import IQuoteRepository
+from ...domain.services.consensus import ConsensusBuilder
+from ...domain.value_objects.consensus_status import ConsensusStatus
+from ...domain.value_objects.extraction_status import ExtractionStatus
+
+CONSENSUS_ORDER = 0
+
+
+@dataclass
+class BuildConsensusCommand:
+    study_id: int
+    user_id: int
+    dry_run: bool = False  # Solo el reporte, sin crear el borrador
+    replace: bool = False  # Rehace un borrador existente
+
+
+class BuildConsensusHandler:
+    """
+    Reconcilia las extracciones completadas de un estudio.
+
+    Alinea sus quotes con ConsensusBuilder, las clasifica (acordadas, en
+    conflicto, únicas) y crea un borrador de consenso asignado al owner:
+    una extracción con is_consensus=True y extraction_order=0 (la restricción
+    única la limita a una por estudio) que contiene las quotes acordadas y,
+    de las que están en conflicto, la cita con los tags en que todos
+    coinciden. Las únicas y los tags en disputa quedan en el reporte para
+    revisión manual.
+    """
+
+    def __init__(
+            self,
+            extraction_repo: IExtractionRepository,
+            quote_repo: IQuoteRepository,
+            study_adapter: IAcquisitionRepository,
+            project_repo: IProjectRepository,
+            projection: IExtractionDetailProjection,
+            builder: ConsensusBuilder = None
+    ):
+        self.extraction_repo = extraction_repo
+        self.quote_repo = quote_repo
+        self.study_adapter = study_adapter
+        self.project_repo = project_repo
+        self.projection = projection
+        self.builder = builder or ConsensusBuilder()
+
+    @transaction.atomic
+    def handle(self, command: BuildConsensusCommand) -> ConsensusReportDTO:
+        project_id = self.study_adapter.get_project_context(command.study_id)
+        if not project_id:
+            raise StudyNotFound(f"El estudio {command.study_id} no existe")
+
+        project = self.project_repo.get_project_by_id(project_id)
+        if not project or project.owner_id != command.user_id:
+            raise UnauthorizedExtractionAccess(
+                "Solo el owner del proyecto puede consolidar extracciones"
+            )
+
+        extractions = self.extraction_repo.get_all_by_study_id(command.study_id)
+        draft = next((e for e in extractions if e.is_consensus), None)
+        completed = [
+            e for e in extractions
+            if not e.is_consensus and e.status == ExtractionStatus.DONE
+        ]
+        if len(completed) < 2:
+            raise ExtractionValidationError(
+                "Se necesitan al menos dos extracciones completadas del estudio"
+            )
+
+        items = self.builder.align(completed)
+        report = ConsensusReportDTO(
+            study_id=command.study_id,
+            extraction_ids=[e.id for e in completed],
+            items=items
+        )
+        if command.dry_run:
+            report.consensus_extraction_id = draft.id if draft else None
+            return report
+
+        if draft:
+            if not command.replace:
+                raise ExtractionValidationError(
+                    f"El estudio ya tiene un borrador de consenso ({draft.id}); usa replace para rehacerlo"
+                )
+            self.extraction_repo.delete(draft.id)
+
+        consensus = self.extraction_repo.save(Extraction(
+            id=None,
+            study_id=command.study_id,
+            assigned_to_user_id=command.user_id,
+            status=ExtractionStatus.IN_PROGRESS,
+            started_at=timezone.now(),
+            extraction_order=CONSENSUS_ORDER,
+            is_consensus=True,
+            project_id=project_id
+        ))
+
+        quotes_by_id = {q.id: q for e in completed for q in e.quotes}
+        draft_quotes = []
+        for item in items:
+            if item.status == ConsensusStatus.UNIQUE or not item.agreed_tag_ids:
+                continue
+            source = quotes_by_id[next(iter(item.quote_ids.values()))]
+            agreed = set(item.agreed_tag_ids)
+            draft_quotes.append(Quote(
+                id=None,
+                extraction_id=consensus.id,
+                text=source.text,
+                researcher_id=command.user_id,
+                tags=[t for t in source.tags if t.id in agreed],
+                location=source.location,
+                project_id=project_id
+            ))
+
+        if draft_quotes:
+            self.quote_repo.bulk_create(draft_quotes)
+        self.projection.refresh([consensus.id])
+        report.consensus_extraction_id = consensus.id
+        return report
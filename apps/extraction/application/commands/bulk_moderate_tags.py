@@ -0,0 +1,79 @@
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from django.db import transaction
+
+from ...domain.entities.tag import Tag
+from ...domain.exceptions.extraction_exceptions import (
+    ExtractionValidationError,
+    TagNotFound,
+    UnauthorizedExtractionAccess
+)
+from ...domain.repositories.i_extraction_detail_projection import IExtractionDetailProjection
+from ...domain.repositories.i_project_repository import IProjectRepository
+from ...domain.repositories.i_tag_repository import ITagRepository
+
+
+@dataclass
+class BulkModerateTagsCommand:
+    owner_id: int
+    approve_ids: List[int] = field(default_factory=list)
+    reject_ids: List[int] = field(default_factory=list)
+
+
+class BulkModerateTagsHandler:
+    """
+    Modera muchos tags de una vez.
+
+    Una consulta carga todos los tags, la propiedad se verifica una vez por
+    proyecto involucrado y cada acción es un único UPDATE sobre sus ids.
+    """
+
+    def __init__(
+            self,
+            tag_repo: ITagRepository,
+            project_repo: IProjectRepository,
+            projection: IExtractionDetailProjection
+    ):
+        self.tag_repo = tag_repo
+        self.project_repo = project_repo
+        self.projection = projection
+
+    @transaction.atomic
+    def handle(self, command: BulkModerateTagsCommand) -> Dict[str, int]:
+        by_action = {
+            'APPROVE': sorted(set(command.approve_ids)),
+            'REJECT': sorted(set(command.reject_ids)),
+        }
+
+        conflicting = set(by_action['APPROVE']) & set(by_action['REJECT'])
+        if conflicting:
+            raise ExtractionValidationError(
+                f"Tags a aprobar y rechazar a la vez: {', '.join(map(str, sorted(conflicting)))}"
+            )
+
+        requested = by_action['APPROVE'] + by_action['REJECT']
+        tags = self.tag_repo.get_by_ids(requested)
+        missing = set(requested) - {t.id for t in tags}
+        if missing:
+            raise TagNotFound(f"Tags inexistentes: {', '.join(map(str, sorted(missing)))}")
+
+        project_by_tag = {t.id: t.project_id for t in tags}
+        for project_id in sorted(set(project_by_tag.values())):
+            project = self.project_repo.get_project_by_id(project_id)
+            if not project or project.owner_id != command.owner_id:
+                raise UnauthorizedExtractionAccess(
+                    f"Solo el owner del proyecto {project_id} puede moderar sus tags"
+                )
+
+        result = {}
+        for action, tag_ids in by_action.items():
+            if not tag_ids:
+                result[action.lower()] = 0
+                continue
+            status, visibility = Tag.MODERATION_OUTCOMES[action]
+            result[action.lower()] = self.tag_repo.set_moderation(
+                tag_ids, status, visibility, {project_by_tag[i] for i in tag_ids}
+            )
+        self.projection.refresh_by_tags(requested)
+        return result
@@ -0,0 +1,79 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from django.db import transaction
+
+from ...domain.entities.extraction import Extraction
+from ...domain.exceptions.extraction_exceptions import (
+    ExtractionValidationError,
+    UnauthorizedExtractionAccess
+)
+from ...domain.repositories.i_acquisition_repository import IAcquisitionRepository
+from ...domain.repositories.i_extraction_detail_projection import IExtractionDetailProjection
+from ...domain.repositories.i_extraction_phase_repository import IExtractionPhaseRepository
+from ...domain.repositories.i_extraction_repository import IExtractionRepository
+from ...domain.repositories.i_project_repository import IProjectRepository
+from ...domain.services.workload_balancer import WorkloadBalancer
+from .assign_studies import AssignStudiesHandler
+
+
+@dataclass
+class ClaimNextStudyCommand:
+    project_id: int
+    user_id: int
+
+
+class ClaimNextStudyHandler:
+    """
+    Reserva para el codificador el siguiente estudio que aún necesita extracción.
+
+    Los cupos que pide el modo de la fase existen como extracciones sin asignar;
+    reclamar uno es un UPDATE condicional sin bloqueos entre codificadores. La
+    primera vez (o cuando se agotan) los cupos faltantes del proyecto se abren
+    en un bulk_create, con la fase bloqueada para que dos procesos no los
+    dupliquen.
+    """
+
+    def __init__(
+            self,
+            repository: IExtractionRepository,
+            phase_repo: IExtractionPhaseRepository,
+            study_adapter: IAcquisitionRepository,
+            project_repo: IProjectRepository,
+            projection: IExtractionDetailProjection
+    ):
+        self.repository = repository
+        self.phase_repo = phase_repo
+        self.study_adapter = study_adapter
+        self.project_repo = project_repo
+        self.projection = projection
+
+    def handle(self, command: ClaimNextStudyCommand) -> Optional[Extraction]:
+        if not self.project_repo.is_member(command.project_id, command.user_id):
+            raise UnauthorizedExtractionAccess("No perteneces al equipo de este proyecto")
+
+        phase = self.phase_repo.get_by_project_id(command.project_id)
+        if not phase:
+            raise ExtractionValidationError(
+                "La fase de extracción no está configurada para este proyecto"
+            )
+        if not phase.is_open_for_extraction():
+            raise ExtractionValidationError(
+                "La fase de extracción no está activa o ya cerró"
+            )
+
+        study_ids = self.study_adapter.get_study_ids_by_project(command.project_id)
+        claimed = self.repository.claim_vacant(study_ids, command.user_id)
+        if not claimed and self._open_missing_slots(command.project_id, study_ids):
+            claimed = self.repository.claim_vacant(study_ids, command.user_id)
+
+        if claimed:
+            self.projection.refresh([claimed.id])
+        return claimed
+
+    @transaction.atomic
+    def _open_missing_slots(self, project_id: int, study_ids) -> int:
+        phase = self.phase_repo.get_by_project_id(project_id, for_update=True)
+        balancer = WorkloadBalancer((), self.repository.get_slots_by_studies(study_ids))
+        slots = balancer.open_slots(study_ids, phase.expected_extractions_per_study)
+        return self.repository.bulk_create(AssignStudiesHandler.build_extractions(slots, phase))
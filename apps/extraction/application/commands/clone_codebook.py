@@ -0,0 +1,73 @@
+from dataclasses import dataclass
+
+from ...domain.dtos.codebook_dtos import CodebookEntryDTO, CodebookImportResultDTO
+from ...domain.exceptions.extraction_exceptions import ExtractionValidationError, ProjectAccessDenied
+from ...domain.repositories.i_tag_repository import ITagRepository
+from ...domain.services.codebook import path_key
+from ...domain.services.tag_tree import TagTree
+from ...domain.value_objects.tag_status import TagStatus
+from .import_codebook import ImportCodebookHandler
+
+
+@dataclass
+class CloneCodebookCommand:
+    source_project_id: int
+    target_project_id: int
+    user_id: int
+
+
+class CloneCodebookHandler:
+    """
+    Copia los tags aprobados de un proyecto (con su jerarquía) a otro.
+
+    Las preguntas de investigación son propias de cada proyecto: se conserva
+    el vínculo solo si la pregunta también pertenece al destino; las demás
+    se informan en dropped_question_ids.
+    """
+
+    def __init__(self, tag_repo: ITagRepository, importer: ImportCodebookHandler):
+        self.tag_repo = tag_repo
+        self.importer = importer
+
+    def handle(self, command: CloneCodebookCommand) -> CodebookImportResultDTO:
+        if command.source_project_id == command.target_project_id:
+            raise ExtractionValidationError("El proyecto origen y el destino son el mismo")
+
+        self.importer.ensure_owner(command.target_project_id, command.user_id)
+        if not self.importer.project_repo.is_member(command.source_project_id, command.user_id):
+            raise ProjectAccessDenied(
+                f"El usuario {command.user_id} no pertenece al proyecto {command.source_project_id}"
+            )
+
+        source = [
+            t for t in self.tag_repo.list_by_project(command.source_project_id)
+            if t.status == TagStatus.APPROVED
+        ]
+        names = {t.id: t.name for t in source}
+        # Un tag aprobado bajo un tema no aprobado se copia como raíz
+        tree = TagTree({t.id: t.parent_id if t.parent_id in names else None for t in source})
+        target_questions = self.importer.project_question_ids(command.target_project_id)
+
+        entries, dropped, seen = [], set(), set()
+        for tag in source:
+            path = tuple(names[node] for node in tree.path(tag.id))
+            if path_key(path) in seen:
+                # Homónimos bajo el mismo tema (ej: inductivos de distintos coders)
+                continue
+            seen.add(path_key(path))
+
+            question_id = tag.question_id
+            if question_id and question_id not in target_questions:
+                dropped.add(question_id)
+                question_id = None
+            entries.append(CodebookEntryDTO(
+                path=path,
+                is_mandatory=tag.is_mandatory,
+                question_id=question_id
+            ))
+
+        result = self.importer.import_entries(
+            command.target_project_id, command.user_id, entries
+        )
+        result.dropped_question_ids = sorted(dropped)
+        return result
@@ -1,26 +1,50 @@
-from django.core.management.base import BaseCommand
-from apps.extraction.container import container
-
-
-class Command(BaseCommand):
-    help = 'Cierra automáticamente fases de extracción que ya pasaron su end_date'
-
-    def handle(self, *args, **options):
-        phases = container.phase_repository.get_active_phases_to_close()
-
-        closed_count = 0
-        for phase in phases:
-            if phase.auto_close_if_needed():
-                container.phase_repository.save(phase)
-                closed_count += 1
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f'Fase cerrada: Project {phase.project_id}'
-                    )
-                )
-
-        self.stdout.write(
-            self.style.SUCCESS(
-                f'Total de fases cerradas: {closed_count}'
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+from django.utils import timezone
+
+from ...domain.repositories.i_extraction_phase_repository import IExtractionPhaseRepository
+from ...domain.repositories.i_job_queue_repository import IJobQueueRepository
+
+FREEZE_PROJECT_JOB_KIND = 'snapshots.freeze_project'
+
+
+@dataclass
+class CloseExpiredPhasesCommand:
+    now: Optional[datetime] = None
+    batch_size: int = 500
+
+
+@dataclass
+class CloseExpiredPhasesResult:
+    closed_project_ids: List[int] = field(default_factory=list)
+
+    @property
+    def closed_count(self) -> int:
+        return len(self.closed_project_ids)
+
+
+class CloseExpiredPhasesHandler:
+    """
+    Cierra automáticamente las fases vencidas con un UPDATE por lote.
+
+    Lo invocan tanto el scheduler de deadlines del worker como el comando
+    de gestión `close_expired_phases` (respaldo para cron). Por cada proyecto
+    cerrado se encola el congelamiento de sus extracciones en snapshots.
+    """
+
+    def __init__(self, phase_repo: IExtractionPhaseRepository, job_queue: IJobQueueRepository):
+        self.phase_repo = phase_repo
+        self.job_queue = job_queue
+
+    def handle(self, command: CloseExpiredPhasesCommand) -> CloseExpiredPhasesResult:
+        now = command.now or timezone.now()
+        closed = self.phase_repo.close_expired_phases(now, batch_size=command.batch_size)
+        for project_id in closed:
+            self.job_queue.enqueue(
+                FREEZE_PROJECT_JOB_KIND,
+                {'project_id': project_id},
+                dedupe_key=f'{FREEZE_PROJECT_JOB_KIND}:{project_id}'
             )
-        )
\ No newline at end of file
+        return CloseExpiredPhasesResult(closed_project_ids=closed)
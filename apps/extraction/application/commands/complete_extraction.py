@@ -1,5 +1,10 @@
 from dataclasses import dataclass
+
+from django.db import transaction
+
 from ...domain.repositories.i_extraction_repository import IExtractionRepository
+from ...domain.repositories.i_extraction_snapshot_repository import IExtractionSnapshotRepository
+from ...domain.repositories.i_extraction_detail_projection import IExtractionDetailProjection
 from ...domain.services.extraction_validator import ExtractionValidator
 from ...domain.exceptions.extraction_exceptions import ExtractionValidationError
 
@@ -13,10 +18,15 @@ class CompleteExtractionCommand:
 class CompleteExtractionHandler:
     def __init__(self,
                  repository: IExtractionRepository,
-                 validator: ExtractionValidator):
+                 validator: ExtractionValidator,
+                 projection: IExtractionDetailProjection,
+                 snapshots: IExtractionSnapshotRepository):
         self.repository = repository
         self.validator = validator
+        self.projection = projection
+        self.snapshots = snapshots
 
+    @transaction.atomic
     def handle(self, command: CompleteExtractionCommand):
         extraction = self.repository.get_by_id(command.extraction_id)
         if not extraction:
@@ -29,4 +39,7 @@ class CompleteExtractionHandler:
 
         extraction.complete(missing_mandatory_tags=missing_tags)
 
-        self.repository.save(extraction)
\ No newline at end of file
+        self.repository.save(extraction)
+        # DONE no vuelve a cambiar: sus lecturas pasan a salir del snapshot
+        self.snapshots.capture([extraction.id])
+        self.projection.refresh([extraction.id])
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
+from typing import Optional
 from django.db import transaction
 
+from ...domain.repositories.i_extraction_detail_projection import IExtractionDetailProjection
 from ...domain.repositories.i_extraction_phase_repository import IExtractionPhaseRepository
 from ...domain.repositories.i_extraction_repository import IExtractionRepository
 from ...domain.entities.extraction import Extraction
@@ -12,14 +14,30 @@ from ...domain.exceptions.extraction_exceptions import StudyNotFound, Extraction
 class CreateExtractionCommand:
     study_id: int
     user_id: int
-    project_id: int
+    project_id: Optional[int] = None  # None = el proyecto del estudio
 
 
 class CreateExtractionHandler:
-    def __init__(self, repository: IExtractionRepository, study_adapter, phase_repo: IExtractionPhaseRepository):
+    """
+    Crea la extracción de un codificador para un estudio.
+
+    La capacidad del modo se valida con un COUNT y el extraction_order se
+    toma del primer cupo libre: si el estudio tiene un cupo vacante (ver
+    ClaimNextStudyHandler) se ocupa; si no, se inserta y la restricción
+    única (study_id, extraction_order) resuelve las altas simultáneas.
+    """
+
+    def __init__(
+            self,
+            repository: IExtractionRepository,
+            study_adapter,
+            phase_repo: IExtractionPhaseRepository,
+            projection: IExtractionDetailProjection
+    ):
         self.repository = repository
         self.study_adapter = study_adapter
         self.phase_repo = phase_repo
+        self.projection = projection
 
     @transaction.atomic
     def handle(self, command: CreateExtractionCommand) -> Extraction:
@@ -28,7 +46,8 @@ class CreateExtractionHandler:
                 f"El estudio {command.study_id} no existe"
             )
 
-        phase = self.phase_repo.get_by_project_id(command.project_id)
+        project_id = command.project_id or self.study_adapter.get_project_context(command.study_id)
+        phase = self.phase_repo.get_by_project_id(project_id)
         if not phase:
             raise ExtractionValidationError(
                 "La fase de extracción no está configurada para este proyecto"
@@ -39,31 +58,41 @@ class CreateExtractionHandler:
                 "La fase de extracción no está activa o ya cerró"
             )
 
-        existing_extractions = self.repository.get_all_by_study_id(command.study_id)
-        current_count = len(existing_extractions)
-
-        phase.validate_extraction_count(command.study_id, current_count)
-
-        user_extraction = self.repository.get_by_study_and_user(
-            command.study_id,
-            command.user_id
-        )
-
-        if user_extraction:
+        if self.repository.has_user_extraction(command.study_id, command.user_id):
             raise ExtractionValidationError(
                 "Ya tienes una extracción asignada para este estudio"
             )
 
-        extraction_order = current_count + 1
+        capacity = phase.expected_extractions_per_study
+        phase.validate_extraction_count(
+            command.study_id,
+            self.repository.count_assigned_by_study(command.study_id)
+        )
+
+        claimed = self.repository.claim_vacant([command.study_id], command.user_id)
+        if claimed:
+            self.projection.refresh([claimed.id])
+            return claimed
 
         new_extraction = Extraction(
             id=None,
             study_id=command.study_id,
             assigned_to_user_id=command.user_id,
             status=ExtractionStatus.PENDING,
-            extraction_order=extraction_order,
-            max_quotes=phase.max_quotes_per_extraction
+            max_quotes=phase.max_quotes_per_extraction,
+            project_id=project_id
         )
 
-        saved_extraction = self.repository.save(new_extraction)
-        return saved_extraction
\ No newline at end of file
+        saved_extraction = self.repository.insert_in_free_slot(new_extraction, capacity)
+        if not saved_extraction:
+            # Otra alta concurrente ganó el último cupo (o el mismo usuario se adelantó)
+            if self.repository.has_user_extraction(command.study_id, command.user_id):
+                raise ExtractionValidationError(
+                    "Ya tienes una extracción asignada para este estudio"
+                )
+            raise ExtractionValidationError(
+                "El estudio ya tiene todas las extracciones que pide el modo de la fase"
+            )
+
+        self.projection.refresh([saved_extraction.id])
+        return saved_extraction
@@ -6,6 +6,9 @@ from ...domain.repositories.i_extraction_repository import IExtractionRepository
 from ...domain.repositories.i_quote_repository import IQuoteRepository
 from ...domain.repositories.i_tag_repository import ITagRepository
 from ...domain.repositories.i_acquisition_repository import IAcquisitionRepository
+from ...domain.repositories.i_quote_search_index import IQuoteSearchIndex
+from ...domain.repositories.i_near_duplicate_index import INearDuplicateIndex
+from ...domain.repositories.i_extraction_detail_projection import IExtractionDetailProjection
 from ...domain.value_objects.quote_location import QuoteLocation
 from ...domain.value_objects.tag_status import TagStatus
 from ...domain.exceptions.extraction_exceptions import (
@@ -13,9 +16,14 @@ from ...domain.exceptions.extraction_exceptions import (
     UnauthorizedExtractionAccess,
     InvalidExtractionState,
     TagNotFound,
-    ExtractionValidationError
+    ExtractionValidationError,
+    DuplicateQuote
 )
 
+# Similitud estimada (Jaccard de shingles) a partir de la cual dos quotes
+# de la misma extracción se consideran el mismo pasaje
+DUPLICATE_SIMILARITY_THRESHOLD = 0.9
+
 
 @dataclass
 class CreateQuoteCommand:
@@ -30,6 +38,8 @@ class CreateQuoteCommand:
     y1: Optional[float] = None
     x2: Optional[float] = None
     y2: Optional[float] = None
+    page_count: Optional[int] = None
+    allow_duplicate: bool = False
 
 
 class CreateQuoteHandler:
@@ -38,12 +48,18 @@ class CreateQuoteHandler:
             extraction_repo: IExtractionRepository,
             quote_repo: IQuoteRepository,
             tag_repo: ITagRepository,
-            acquisition_adapter: IAcquisitionRepository
+            acquisition_adapter: IAcquisitionRepository,
+            search_index: IQuoteSearchIndex,
+            duplicate_index: INearDuplicateIndex,
+            projection: IExtractionDetailProjection
     ):
         self.extraction_repo = extraction_repo
         self.quote_repo = quote_repo
         self.tag_repo = tag_repo
         self.acquisition_adapter = acquisition_adapter
+        self.search_index = search_index
+        self.duplicate_index = duplicate_index
+        self.projection = projection
 
     @transaction.atomic
     def handle(self, command: CreateQuoteCommand) -> Quote:
@@ -68,7 +84,7 @@ class CreateQuoteHandler:
             missing = set(command.tag_ids) - found_ids
             raise TagNotFound(f"Tags no encontrados: {missing}")
 
-        project_id = self.acquisition_adapter.get_project_context(
+        project_id = extraction.project_id or self.acquisition_adapter.get_project_context(
             extraction.study_id
         )
         if not project_id:
@@ -97,11 +113,25 @@ class CreateQuoteHandler:
                 x1=command.x1,
                 y1=command.y1,
                 x2=command.x2,
-                y2=command.y2
+                y2=command.y2,
+                page_count=command.page_count
             )
         except ValueError as e:
             raise ExtractionValidationError(f"Ubicación inválida: {str(e)}")
 
+        if not command.allow_duplicate:
+            duplicates = self.duplicate_index.find_similar(
+                project_id,
+                command.text,
+                threshold=DUPLICATE_SIMILARITY_THRESHOLD,
+                extraction_id=command.extraction_id
+            )
+            if duplicates:
+                raise DuplicateQuote(
+                    f"Ya guardaste este fragmento en la extracción "
+                    f"(quote {duplicates[0].quote_id}, similitud {duplicates[0].similarity:.0%})"
+                )
+
         quote = Quote(
             id=None,
             extraction_id=command.extraction_id,
@@ -109,11 +139,15 @@ class CreateQuoteHandler:
             researcher_id=command.user_id,
             tags=tags,
             location=location,
+            project_id=project_id,
         )
 
         extraction.add_quote(quote)
 
         saved_quote = self.quote_repo.save(quote)
         self.extraction_repo.save(extraction)
+        self.search_index.index_quotes([saved_quote.id])
+        self.duplicate_index.index_quotes(project_id, [saved_quote.id])
+        self.projection.refresh([command.extraction_id])
 
         return saved_quote
\ No newline at end of file
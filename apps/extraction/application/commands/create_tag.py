@@ -11,7 +11,8 @@ from ...domain.value_objects.tag_visibility import TagVisibility
 from ...domain.repositories.i_tag_repository import ITagRepository
 from ...domain.exceptions.extraction_exceptions import (
     ProjectAccessDenied,
-    ExtractionValidationError
+    ExtractionValidationError,
+    InvalidTagHierarchy
 )
 
 
@@ -22,6 +23,7 @@ class CreateTagCommand:
     project_id: int
     is_inductive: bool
     question_id: Optional[int] = None
+    parent_id: Optional[int] = None
 
 
 class CreateTagHandler:
@@ -59,6 +61,13 @@ class CreateTagHandler:
                     "La pregunta no pertenece al proyecto indicado"
                 )
 
+        if command.parent_id:
+            parents = self.tag_repo.get_by_ids([command.parent_id])
+            if not parents or parents[0].project_id != command.project_id:
+                raise InvalidTagHierarchy(
+                    f"El tag padre {command.parent_id} no existe en el proyecto"
+                )
+
         status = TagStatus.PENDING if command.is_inductive else TagStatus.APPROVED
         visibility = TagVisibility.PRIVATE if command.is_inductive else TagVisibility.PUBLIC
         type_ = TagType.INDUCTIVE if command.is_inductive else TagType.DEDUCTIVE
@@ -72,7 +81,8 @@ class CreateTagHandler:
             question_id=command.question_id,
             status=status,
             visibility=visibility,
-            type=type_
+            type=type_,
+            parent_id=command.parent_id
         )
 
         return self.tag_repo.save(tag)
\ No newline at end of file
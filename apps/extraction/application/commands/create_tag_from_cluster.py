@@ -0,0 +1,63 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from django.db import transaction
+
+from ...domain.entities.tag import Tag
+from ...domain.repositories.i_quote_cluster_repository import IQuoteClusterRepository
+from ...domain.value_objects.job_status import JobStatus
+from ...domain.exceptions.extraction_exceptions import (
+    ExtractionNotFound,
+    InvalidExtractionState,
+    ExtractionValidationError
+)
+from .create_tag import CreateTagCommand, CreateTagHandler
+
+
+@dataclass
+class CreateTagFromClusterCommand:
+    run_id: int
+    label: int
+    user_id: int
+    name: Optional[str] = None
+
+
+class CreateTagFromClusterHandler:
+    """
+    Crea un tag inductivo a partir de un cluster (por defecto, nombrado con
+    sus términos principales) y lo vincula al cluster. Reutiliza
+    CreateTagHandler, que valida la pertenencia al proyecto.
+    """
+
+    def __init__(self, cluster_repo: IQuoteClusterRepository, create_tag_handler: CreateTagHandler):
+        self.cluster_repo = cluster_repo
+        self.create_tag_handler = create_tag_handler
+
+    @transaction.atomic
+    def handle(self, command: CreateTagFromClusterCommand) -> Tag:
+        run = self.cluster_repo.get_run(command.run_id)
+        if not run:
+            raise ExtractionNotFound(f"Ejecución de agrupamiento {command.run_id} no encontrada")
+        if run.status != JobStatus.DONE:
+            raise InvalidExtractionState("La ejecución de agrupamiento aún no terminó")
+
+        cluster = self.cluster_repo.get_cluster(run.id, command.label)
+        if not cluster:
+            raise ExtractionNotFound(f"Cluster {command.label} no encontrado")
+        if cluster.tag_id:
+            raise ExtractionValidationError(
+                f"El cluster ya tiene el tag {cluster.tag_id}"
+            )
+
+        name = (command.name or cluster.suggested_tag_name).strip()
+        if not name:
+            raise ExtractionValidationError("Indica un nombre para el tag")
+
+        tag = self.create_tag_handler.handle(CreateTagCommand(
+            name=name,
+            user_id=command.user_id,
+            project_id=run.project_id,
+            is_inductive=True
+        ))
+        self.cluster_repo.set_cluster_tag(run.id, cluster.label, tag.id)
+        return tag
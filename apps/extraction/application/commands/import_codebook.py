@@ -0,0 +1,117 @@
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from django.db import transaction
+
+from ...domain.dtos.codebook_dtos import CodebookEntryDTO, CodebookImportResultDTO
+from ...domain.entities.tag import Tag
+from ...domain.exceptions.extraction_exceptions import (
+    ExtractionValidationError,
+    UnauthorizedExtractionAccess
+)
+from ...domain.repositories.i_design_repository import IDesignRepository
+from ...domain.repositories.i_project_repository import IProjectRepository
+from ...domain.repositories.i_tag_repository import ITagRepository
+from ...domain.services.codebook import CodebookPlanner, path_key
+from ...domain.services.tag_tree import TagTree
+from ...domain.value_objects.tag_status import TagStatus
+from ...domain.value_objects.tag_type import TagType
+from ...domain.value_objects.tag_visibility import TagVisibility
+
+
+@dataclass
+class ImportCodebookCommand:
+    project_id: int
+    user_id: int
+    entries: List[CodebookEntryDTO]
+
+
+class ImportCodebookHandler:
+    """
+    Importa un libro de códigos deductivo completo.
+
+    A diferencia de CreateTagHandler (cuatro llamadas a otros contextos por
+    tag), el proyecto y las preguntas se validan una sola vez para todo el
+    archivo y los tags se insertan con bulk_create, un lote por nivel del
+    árbol, dentro de una única transacción.
+    """
+
+    def __init__(
+            self,
+            tag_repo: ITagRepository,
+            design_repo: IDesignRepository,
+            project_repo: IProjectRepository,
+            planner: CodebookPlanner = None
+    ):
+        self.tag_repo = tag_repo
+        self.design_repo = design_repo
+        self.project_repo = project_repo
+        self.planner = planner or CodebookPlanner()
+
+    def handle(self, command: ImportCodebookCommand) -> CodebookImportResultDTO:
+        self.ensure_owner(command.project_id, command.user_id)
+
+        question_ids = {e.question_id for e in command.entries if e.question_id}
+        unknown = sorted(question_ids - self.project_question_ids(command.project_id))
+        if unknown:
+            raise ExtractionValidationError(
+                f"Preguntas que no pertenecen al proyecto: {', '.join(map(str, unknown))}"
+            )
+
+        return self.import_entries(command.project_id, command.user_id, command.entries)
+
+    def ensure_owner(self, project_id: int, user_id: int) -> None:
+        project = self.project_repo.get_project_by_id(project_id)
+        if not project:
+            raise ExtractionValidationError(f"El proyecto {project_id} no existe")
+        if project.owner_id != user_id:
+            raise UnauthorizedExtractionAccess(
+                "Solo el owner del proyecto puede importar un libro de códigos"
+            )
+
+    def project_question_ids(self, project_id: int) -> set:
+        return {q.id for q in self.design_repo.get_questions_by_project(project_id)}
+
+    @transaction.atomic
+    def import_entries(
+            self,
+            project_id: int,
+            user_id: int,
+            entries: List[CodebookEntryDTO]
+    ) -> CodebookImportResultDTO:
+        ids_by_path = self._existing_paths(project_id)
+        levels, existing = self.planner.plan(entries, ids_by_path)
+
+        created = 0
+        for level in levels:
+            tags = [
+                Tag(
+                    id=None,
+                    name=planned.name,
+                    project_id=project_id,
+                    is_mandatory=planned.is_mandatory,
+                    created_by_user_id=user_id,
+                    question_id=planned.question_id,
+                    status=TagStatus.APPROVED,
+                    visibility=TagVisibility.PUBLIC,
+                    type=TagType.DEDUCTIVE,
+                    parent_id=ids_by_path[planned.parent_key] if planned.parent_key else None
+                )
+                for planned in level
+            ]
+            self.tag_repo.bulk_create(tags)
+
+            for planned, tag in zip(level, tags):
+                ids_by_path[path_key(planned.path)] = tag.id
+            created += len(tags)
+
+        return CodebookImportResultDTO(project_id=project_id, created=created, existing=existing)
+
+    def _existing_paths(self, project_id: int) -> Dict[Tuple[str, ...], int]:
+        tags = [t for t in self.tag_repo.list_by_project(project_id) if t.status != TagStatus.REJECTED]
+        names = {t.id: t.name for t in tags}
+        tree = TagTree({t.id: t.parent_id for t in tags})
+        return {
+            path_key(names.get(node, '') for node in tree.path(t.id)): t.id
+            for t in tags
+        }
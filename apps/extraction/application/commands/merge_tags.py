@@ -4,6 +4,7 @@ from django.db import transaction
 
 from apps.extraction.domain.exceptions.extraction_exceptions import ExtractionValidationError, \
     UnauthorizedExtractionAccess
+from apps.extraction.domain.repositories.i_extraction_detail_projection import IExtractionDetailProjection
 from apps.extraction.domain.repositories.i_project_repository import IProjectRepository
 from apps.extraction.domain.value_objects.tag_status import TagStatus
 
@@ -20,11 +21,13 @@ class MergeTagsHandler:
         self,
         tag_repo,
         merge_service,
-        project_repo: IProjectRepository
+        project_repo: IProjectRepository,
+        projection: IExtractionDetailProjection
     ):
         self.tag_repo = tag_repo
         self.merge_service = merge_service
         self.project_repo = project_repo
+        self.projection = projection
 
     @transaction.atomic
     def handle(self, command):
@@ -52,4 +55,6 @@ class MergeTagsHandler:
                 "No se puede fusionar un tag obligatorio"
             )
 
-        self.merge_service.merge_tags(target, source)
\ No newline at end of file
+        self.merge_service.merge_tags(target, source)
+        # Las quotes de source ya apuntan a target
+        self.projection.refresh_by_tags([target.id])
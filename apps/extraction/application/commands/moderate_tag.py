@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from django.db import transaction
 
 from apps.extraction.domain.exceptions.extraction_exceptions import UnauthorizedExtractionAccess
+from apps.extraction.domain.repositories.i_extraction_detail_projection import IExtractionDetailProjection
 from apps.extraction.domain.repositories.i_project_repository import IProjectRepository
 from apps.extraction.domain.repositories.i_tag_repository import ITagRepository
 
@@ -15,9 +16,15 @@ class ModerateTagCommand:
 
 
 class ModerateTagHandler:
-    def __init__(self, tag_repo: ITagRepository, project_repo: IProjectRepository):
+    def __init__(
+            self,
+            tag_repo: ITagRepository,
+            project_repo: IProjectRepository,
+            projection: IExtractionDetailProjection
+    ):
         self.tag_repo = tag_repo
         self.project_repo = project_repo
+        self.projection = projection
 
     @transaction.atomic
     def handle(self, command):
@@ -33,4 +40,5 @@ class ModerateTagHandler:
         elif command.action == 'REJECT':
             tag.reject()
 
-        self.tag_repo.save(tag)
\ No newline at end of file
+        self.tag_repo.save(tag)
+        self.projection.refresh_by_tags([tag.id])
@@ -0,0 +1,66 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from django.db import transaction
+
+from ...domain.entities.tag import Tag
+from ...domain.exceptions.extraction_exceptions import (
+    InvalidTagHierarchy,
+    TagNotFound,
+    UnauthorizedExtractionAccess
+)
+from ...domain.repositories.i_project_repository import IProjectRepository
+from ...domain.repositories.i_tag_repository import ITagRepository
+
+
+@dataclass
+class MoveTagCommand:
+    tag_id: int
+    new_parent_id: Optional[int]  # None = el tag pasa a ser raíz
+    user_id: int
+
+
+class MoveTagHandler:
+    """
+    Mueve un tag con todo su subárbol dentro del libro de códigos.
+
+    Reglas de Negocio:
+    - Solo el owner del proyecto reorganiza la jerarquía
+    - El nuevo padre debe ser del mismo proyecto
+    - Un tag no puede colgar de sí mismo ni de uno de sus descendientes
+    """
+
+    def __init__(self, tag_repo: ITagRepository, project_repo: IProjectRepository):
+        self.tag_repo = tag_repo
+        self.project_repo = project_repo
+
+    @transaction.atomic
+    def handle(self, command: MoveTagCommand) -> Tag:
+        ids = [command.tag_id] + ([command.new_parent_id] if command.new_parent_id else [])
+        tags = {t.id: t for t in self.tag_repo.get_by_ids(ids)}
+
+        tag = tags.get(command.tag_id)
+        if not tag:
+            raise TagNotFound(f"El tag {command.tag_id} no existe")
+
+        project = self.project_repo.get_project_by_id(tag.project_id)
+        if not project or project.owner_id != command.user_id:
+            raise UnauthorizedExtractionAccess(
+                "Solo el owner del proyecto puede reorganizar el libro de códigos"
+            )
+
+        if command.new_parent_id:
+            parent = tags.get(command.new_parent_id)
+            if not parent:
+                raise TagNotFound(f"El tag {command.new_parent_id} no existe")
+            if parent.project_id != tag.project_id:
+                raise InvalidTagHierarchy("El tag padre debe pertenecer al mismo proyecto")
+            if parent.id in self.tag_repo.get_subtree_ids(tag.id):
+                raise InvalidTagHierarchy(
+                    f"No se puede mover '{tag.name}' dentro de su propio subárbol"
+                )
+
+        if tag.parent_id != command.new_parent_id:
+            self.tag_repo.move(tag, command.new_parent_id)
+
+        return tag
@@ -0,0 +1,65 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+from django.db import transaction
+
+from ...domain.dtos.assignment_dtos import AssignmentResultDTO
+from ...domain.services.workload_balancer import WorkloadBalancer
+from .assign_studies import AssignStudiesHandler
+
+
+@dataclass
+class ReassignCoderCommand:
+    project_id: int
+    owner_id: int
+    leaving_user_id: int
+    user_ids: Optional[List[int]] = None  # None = el resto del equipo, sin el owner
+
+
+class ReassignCoderHandler:
+    """
+    Traspasa las extracciones abiertas de un codificador que deja el proyecto.
+
+    Cada extracción conserva su extraction_order, sus quotes y su estado;
+    solo cambia el asignado, elegido por menor carga entre quienes todavía
+    no trabajan en ese estudio. Las extracciones terminadas no se tocan.
+    """
+
+    def __init__(self, assigner: AssignStudiesHandler):
+        self.assigner = assigner
+
+    @transaction.atomic
+    def handle(self, command: ReassignCoderCommand) -> AssignmentResultDTO:
+        self.assigner.ensure_owner(command.project_id, command.owner_id)
+        self.assigner.open_phase(command.project_id)
+
+        user_ids = command.user_ids
+        if user_ids is None:
+            # El owner solo recibe extracciones si se lo pide explícitamente
+            user_ids = [
+                m.user_id for m in self.assigner.project_repo.get_members(command.project_id)
+                if m.user_id != command.owner_id
+            ]
+        user_ids = [u for u in user_ids if u != command.leaving_user_id]
+        self.assigner.ensure_members(command.project_id, user_ids)
+
+        study_ids = self.assigner.study_adapter.get_study_ids_by_project(command.project_id)
+        balancer = WorkloadBalancer(
+            user_ids,
+            self.assigner.repository.get_slots_by_studies(study_ids)
+        )
+        moves, orphaned = balancer.plan_handover(command.leaving_user_id)
+        reassigned = self.assigner.repository.reassign(moves) if moves else 0
+        self.assigner.projection.refresh(moves)
+
+        # Estudios donde todos los candidatos ya tienen extracción: quedan para el owner
+        orphaned = set(orphaned)
+        orphaned_studies = sorted({
+            slot.study_id for slot in balancer.slots if slot.extraction_id in orphaned
+        })
+        return AssignmentResultDTO(
+            project_id=command.project_id,
+            assigned=reassigned,
+            unfilled_study_ids=orphaned_studies,
+            load_by_user=balancer.load_by_user
+        )
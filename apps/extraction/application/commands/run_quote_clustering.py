@@ -0,0 +1,65 @@
+from dataclasses import dataclass
+
+from ...domain.repositories.i_analytics_repository import IAnalyticsRepository
+from ...domain.repositories.i_quote_cluster_repository import IQuoteClusterRepository
+from ...domain.exceptions.extraction_exceptions import ExtractionNotFound
+
+
+@dataclass
+class RunQuoteClusteringCommand:
+    run_id: int
+    chunk_size: int = 5000
+
+
+class RunQuoteClusteringHandler:
+    """
+    Ejecuta una corrida de agrupamiento: lee las quotes del proyecto por
+    lotes, las agrupa con el clusterer (pool de procesos) y persiste
+    asignaciones y resumen por cluster.
+    """
+
+    def __init__(
+            self,
+            cluster_repo: IQuoteClusterRepository,
+            analytics_repo: IAnalyticsRepository,
+            clusterer
+    ):
+        self.cluster_repo = cluster_repo
+        self.analytics_repo = analytics_repo
+        self.clusterer = clusterer
+
+    def handle(self, command: RunQuoteClusteringCommand) -> dict:
+        run = self.cluster_repo.get_run(command.run_id)
+        if not run:
+            raise ExtractionNotFound(f"Ejecución de agrupamiento {command.run_id} no encontrada")
+
+        self.cluster_repo.mark_running(run.id)
+        try:
+            batches = self.analytics_repo.iter_quote_text_batches(
+                run.project_id,
+                chunk_size=command.chunk_size
+            )
+            if run.max_tags is not None:
+                batches = (self._loosely_coded(batch, run.max_tags) for batch in batches)
+
+            result = self.clusterer.cluster(batches, k=run.k, seed=run.id)
+            self.cluster_repo.save_results(run.id, result)
+        except Exception as exc:
+            self.cluster_repo.mark_failed(run.id, f"{type(exc).__name__}: {exc}")
+            raise
+
+        return {
+            'run_id': run.id,
+            'quote_count': len(result.quote_ids),
+            'clusters': len(result.clusters),
+            'cohesion': round(result.cohesion, 4),
+        }
+
+    @staticmethod
+    def _loosely_coded(batch, max_tags: int):
+        keep = [i for i, tags in enumerate(batch.tag_ids) if len(tags) <= max_tags]
+        return type(batch)(
+            quote_ids=[batch.quote_ids[i] for i in keep],
+            texts=[batch.texts[i] for i in keep],
+            tag_ids=[batch.tag_ids[i] for i in keep],
+        )
@@ -0,0 +1,57 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from django.db import transaction
+
+from ...domain.entities.quote_cluster import QuoteClusterRun
+from ...domain.repositories.i_job_queue_repository import IJobQueueRepository
+from ...domain.repositories.i_project_repository import IProjectRepository
+from ...domain.repositories.i_quote_cluster_repository import IQuoteClusterRepository
+from ...domain.exceptions.extraction_exceptions import ProjectAccessDenied
+
+CLUSTER_JOB_KIND = 'quotes.cluster'
+
+
+@dataclass
+class StartQuoteClusteringCommand:
+    project_id: int
+    user_id: int
+    k: int = 20
+    max_tags: Optional[int] = None
+
+
+class StartQuoteClusteringHandler:
+    """Registra la ejecución y la encola; el trabajo pesado lo hace un worker"""
+
+    def __init__(
+            self,
+            cluster_repo: IQuoteClusterRepository,
+            job_queue: IJobQueueRepository,
+            project_repo: IProjectRepository
+    ):
+        self.cluster_repo = cluster_repo
+        self.job_queue = job_queue
+        self.project_repo = project_repo
+
+    @transaction.atomic
+    def handle(self, command: StartQuoteClusteringCommand) -> QuoteClusterRun:
+        project = self.project_repo.get_project_by_id(command.project_id)
+        if not project or project.owner_id != command.user_id:
+            raise ProjectAccessDenied(
+                "Solo el owner del proyecto puede agrupar sus quotes"
+            )
+
+        run = self.cluster_repo.create_run(QuoteClusterRun(
+            id=None,
+            project_id=command.project_id,
+            requested_by_user_id=command.user_id,
+            k=command.k,
+            max_tags=command.max_tags,
+        ))
+        self.job_queue.enqueue(
+            CLUSTER_JOB_KIND,
+            {'run_id': run.id},
+            max_attempts=2,
+            dedupe_key=f'{CLUSTER_JOB_KIND}:{run.id}'
+        )
+        return run
@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+from typing import List
+from ...domain.dtos.tag_dtos import TagSuggestionDTO
+from ...domain.repositories.i_project_repository import IProjectRepository
+from ...domain.repositories.i_project_version_repository import IProjectVersionRepository
+from ...domain.repositories.i_tag_repository import ITagRepository
+from ...domain.services.tag_trie import TagPrefixTrie
+from ...domain.exceptions.extraction_exceptions import ProjectAccessDenied
+
+
+@dataclass
+class AutocompleteTagsQuery:
+    project_id: int
+    user_id: int
+    prefix: str = ""
+    limit: int = 10
+
+
+class AutocompleteTagsHandler:
+    """
+    Autocompletado de tags con un trie por proyecto y ámbito de visibilidad:
+    uno con los tags públicos (compartido por todos los miembros) y uno con
+    los tags propios del usuario. Ambos viven en la caché local del proceso
+    bajo las versiones de catálogo y de codificación (el orden depende del
+    uso de cada tag), así que se reconstruyen al cambiar un tag o una quote.
+    """
+
+    def __init__(
+            self,
+            tag_repo: ITagRepository,
+            version_repo: IProjectVersionRepository,
+            project_repo: IProjectRepository,
+            cache
+    ):
+        self.tag_repo = tag_repo
+        self.version_repo = version_repo
+        self.project_repo = project_repo
+        self.cache = cache
+
+    def _trie(self, project_id: int, versions_token: str, user_id: int = None) -> TagPrefixTrie:
+        scope = 'public' if user_id is None else f'user{user_id}'
+        key = self.cache.key('tag_trie', project_id, versions_token, scope)
+        return self.cache.get_or_compute(
+            key,
+            lambda: TagPrefixTrie(self.tag_repo.list_suggestions(project_id, user_id))
+        )
+
+    def handle(self, query: AutocompleteTagsQuery) -> List[TagSuggestionDTO]:
+        if not self.project_repo.is_member(query.project_id, query.user_id):
+            raise ProjectAccessDenied(
+                f"El usuario {query.user_id} no pertenece al proyecto {query.project_id}"
+            )
+
+        version = self.version_repo.get(query.project_id).cache_token
+        matches = (
+            self._trie(query.project_id, version).search(query.prefix, query.limit) +
+            self._trie(query.project_id, version, query.user_id).search(query.prefix, query.limit)
+        )
+        matches.sort(key=lambda s: s.rank)
+        return matches[:query.limit]
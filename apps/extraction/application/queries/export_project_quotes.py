@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+from typing import Iterator
+from ...domain.repositories.i_project_repository import IProjectRepository
+from ...domain.repositories.i_quote_repository import IQuoteRepository
+from ...domain.exceptions.extraction_exceptions import ProjectAccessDenied
+
+EXPORT_COLUMNS = [
+    'quote_id',
+    'project_id',
+    'study_id',
+    'extraction_id',
+    'extraction_order',
+    'extraction_status',
+    'researcher_id',
+    'page',
+    'text_location',
+    'text',
+    'tag_ids',
+    'tag_names',
+    'tag_paths',
+    'created_at',
+]
+
+
+@dataclass
+class ExportProjectQuotesQuery:
+    project_id: int
+    user_id: int
+    chunk_size: int = 2000
+
+
+class ExportProjectQuotesHandler:
+    """
+    Exporta las quotes codificadas de un proyecto para análisis externo.
+
+    Retorna un iterador perezoso: la consulta se ejecuta por lotes a medida
+    que se consume, así el volumen del proyecto no afecta la memoria.
+    """
+
+    def __init__(self, quote_repo: IQuoteRepository, project_repo: IProjectRepository):
+        self.quote_repo = quote_repo
+        self.project_repo = project_repo
+
+    def handle(self, query: ExportProjectQuotesQuery) -> Iterator[dict]:
+        project = self.project_repo.get_project_by_id(query.project_id)
+        if not project or project.owner_id != query.user_id:
+            raise ProjectAccessDenied(
+                "Solo el owner del proyecto puede exportar sus datos"
+            )
+
+        return self.quote_repo.iter_export_rows_by_project(
+            query.project_id,
+            chunk_size=query.chunk_size
+        )
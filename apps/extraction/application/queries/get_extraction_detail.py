@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from ...domain.dtos.extraction_detail_dtos import ExtractionDetailDocumentDTO
+from ...domain.repositories.i_extraction_detail_projection import IExtractionDetailProjection
+from ...domain.exceptions.extraction_exceptions import ExtractionNotFound
+
+
+@dataclass
+class GetExtractionDetailQuery:
+    extraction_id: int
+
+
+class GetExtractionDetailHandler:
+    """
+    Lee el detalle desde el modelo de lectura. Si la extracción todavía no se
+    proyectó (datos previos a la tabla, o creada en bloque sin quotes) se
+    renderiza en este momento y queda guardada para las próximas lecturas.
+    """
+
+    def __init__(self, projection: IExtractionDetailProjection):
+        self.projection = projection
+
+    def handle(self, query: GetExtractionDetailQuery) -> ExtractionDetailDocumentDTO:
+        detail = self.projection.get(query.extraction_id) or self.projection.render(query.extraction_id)
+        if not detail:
+            raise ExtractionNotFound(f"Extracción {query.extraction_id} no encontrada.")
+        return detail
@@ -0,0 +1,82 @@
+from dataclasses import dataclass
+
+from ...domain.exceptions.extraction_exceptions import (
+    ExtractionNotFound,
+    ExtractionValidationError,
+    ProjectAccessDenied,
+    StudyNotFound
+)
+from ...domain.repositories.i_acquisition_repository import IAcquisitionRepository
+from ...domain.repositories.i_extraction_repository import IExtractionRepository
+from ...domain.repositories.i_project_repository import IProjectRepository
+from ...domain.repositories.i_project_version_repository import IProjectVersionRepository
+from ...domain.services.extraction_diff import ExtractionDiffer
+
+
+@dataclass
+class GetExtractionDiffQuery:
+    study_id: int
+    user_id: int
+    a: int
+    b: int
+
+
+class GetExtractionDiffHandler:
+    """
+    Diff lado a lado de dos extracciones de un estudio.
+
+    La clave de caché lleva la versión de ambas extracciones (y la del
+    catálogo de tags, por los nombres): mientras nadie codifique en ellas,
+    repetir la vista cuesta una consulta de versiones y una lectura de caché.
+    """
+
+    def __init__(
+            self,
+            extraction_repo: IExtractionRepository,
+            study_adapter: IAcquisitionRepository,
+            version_repo: IProjectVersionRepository,
+            project_repo: IProjectRepository,
+            cache,
+            differ: ExtractionDiffer = None
+    ):
+        self.extraction_repo = extraction_repo
+        self.study_adapter = study_adapter
+        self.version_repo = version_repo
+        self.project_repo = project_repo
+        self.cache = cache
+        self.differ = differ or ExtractionDiffer()
+
+    def handle(self, query: GetExtractionDiffQuery) -> dict:
+        if query.a == query.b:
+            raise ExtractionValidationError("Indica dos extracciones distintas")
+
+        project_id = self.study_adapter.get_project_context(query.study_id)
+        if not project_id:
+            raise StudyNotFound(f"El estudio {query.study_id} no existe")
+        if not self.project_repo.is_member(project_id, query.user_id):
+            raise ProjectAccessDenied(
+                f"El usuario {query.user_id} no pertenece al proyecto {project_id}"
+            )
+
+        stamps = self.extraction_repo.get_version_stamps([query.a, query.b])
+        for extraction_id in (query.a, query.b):
+            if extraction_id not in stamps:
+                raise ExtractionNotFound(f"La extracción {extraction_id} no existe")
+            if stamps[extraction_id][0] != query.study_id:
+                raise ExtractionValidationError(
+                    f"La extracción {extraction_id} no pertenece al estudio {query.study_id}"
+                )
+
+        key = self.cache.key(
+            'extraction_diff',
+            query.a, stamps[query.a][1],
+            query.b, stamps[query.b][1],
+            self.version_repo.get(project_id).tag_catalog_version
+        )
+
+        def compute():
+            a = self.extraction_repo.get_by_id(query.a)
+            b = self.extraction_repo.get_by_id(query.b)
+            return self.differ.diff(a, b).to_dict()
+
+        return self.cache.get_or_compute(key, compute)
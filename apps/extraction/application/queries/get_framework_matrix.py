@@ -0,0 +1,73 @@
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from ...domain.repositories.i_analytics_repository import IAnalyticsRepository
+from ...domain.repositories.i_project_repository import IProjectRepository
+from ...domain.services.framework_matrix import FrameworkMatrix, FrameworkMatrixBuilder
+from ...domain.exceptions.extraction_exceptions import ProjectAccessDenied
+
+
+@dataclass
+class GetFrameworkMatrixQuery:
+    project_id: int
+    user_id: int
+    with_snippets: bool = False
+    snippet_length: int = 200
+
+
+class GetFrameworkMatrixHandler:
+    """
+    Matriz estudio x tag de un proyecto.
+
+    Una consulta agrupada trae las celdas no vacías; el pivot es NumPy y los
+    fragmentos se piden por lotes al iterar, nunca una consulta por celda.
+    """
+
+    def __init__(
+            self,
+            analytics_repo: IAnalyticsRepository,
+            project_repo: IProjectRepository,
+            builder: FrameworkMatrixBuilder = None
+    ):
+        self.analytics_repo = analytics_repo
+        self.project_repo = project_repo
+        self.builder = builder or FrameworkMatrixBuilder()
+
+    def handle(self, query: GetFrameworkMatrixQuery) -> FrameworkMatrix:
+        project = self.project_repo.get_project_by_id(query.project_id)
+        if not project or project.owner_id != query.user_id:
+            raise ProjectAccessDenied(
+                "Solo el owner del proyecto puede generar la matriz de síntesis"
+            )
+
+        return self.build_matrix(query.project_id)
+
+    def build_matrix(self, project_id: int) -> FrameworkMatrix:
+        """Matriz del proyecto sin verificar permisos (uso administrativo y `handle`)"""
+        return self.builder.build(
+            self.analytics_repo.get_study_tag_cells(project_id),
+            self.analytics_repo.get_tag_names(project_id)
+        )
+
+    def snippet_loader(self, snippet_length: int) -> Callable[[Iterable[int]], Dict[int, str]]:
+        """Carga por lotes los fragmentos de las quotes de ejemplo"""
+        def loader(quote_ids):
+            return self.analytics_repo.get_quote_snippets(quote_ids, length=snippet_length)
+        return loader
+
+    def iter_rows(
+            self,
+            matrix: FrameworkMatrix,
+            with_snippets: bool = False,
+            snippet_length: int = 200
+    ) -> Iterator[dict]:
+        loader = self.snippet_loader(snippet_length) if with_snippets else None
+        return self.builder.iter_rows(matrix, snippet_loader=loader)
+
+    def iter_snippet_rows(self, matrix: FrameworkMatrix, snippet_length: int = 200) -> Iterator[List[Optional[str]]]:
+        """Texto de la quote de ejemplo por celda, alineado con `counts`"""
+        return self.builder.iter_snippet_rows(matrix, self.snippet_loader(snippet_length))
+
+    @staticmethod
+    def columns(matrix: FrameworkMatrix) -> List[str]:
+        return ["study_id", *matrix.column_labels]
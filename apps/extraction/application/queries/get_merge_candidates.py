@@ -0,0 +1,79 @@
+from dataclasses import dataclass
+from typing import List, Optional
+from ...domain.repositories.i_analytics_repository import IAnalyticsRepository
+from ...domain.repositories.i_project_repository import IProjectRepository
+from ...domain.repositories.i_project_version_repository import IProjectVersionRepository
+from ...domain.services.tag_similarity import MergeCandidateFinder
+from ...domain.exceptions.extraction_exceptions import ProjectAccessDenied
+
+# Umbral con el que se calcula (y cachea) la lista completa del proyecto
+CANDIDATE_FLOOR = 0.4
+
+
+@dataclass
+class GetMergeCandidatesQuery:
+    project_id: int
+    user_id: int
+    tag_id: Optional[int] = None
+    min_score: float = 0.5
+    limit: int = 50
+    co_usage: bool = False
+
+
+class GetMergeCandidatesHandler:
+    """
+    Candidatos a fusión entre tags inductivos del proyecto (solo owner).
+
+    La lista completa se cachea por versión del proyecto; filtrar por tag,
+    score o límite se hace sobre la lista cacheada.
+    """
+
+    def __init__(
+            self,
+            analytics_repo: IAnalyticsRepository,
+            version_repo: IProjectVersionRepository,
+            project_repo: IProjectRepository,
+            cache,
+            finder: MergeCandidateFinder = None
+    ):
+        self.analytics_repo = analytics_repo
+        self.version_repo = version_repo
+        self.project_repo = project_repo
+        self.cache = cache
+        self.finder = finder or MergeCandidateFinder()
+
+    def handle(self, query: GetMergeCandidatesQuery) -> List[dict]:
+        project = self.project_repo.get_project_by_id(query.project_id)
+        if not project or project.owner_id != query.user_id:
+            raise ProjectAccessDenied(
+                "Solo el owner del proyecto puede revisar candidatos a fusión"
+            )
+
+        versions = self.version_repo.get(query.project_id)
+        key = self.cache.key(
+            'merge_candidates',
+            query.project_id,
+            versions.cache_token,
+            'usage' if query.co_usage else 'names'
+        )
+
+        def compute():
+            usage = (
+                self.analytics_repo.get_study_tag_cells(query.project_id)
+                if query.co_usage else None
+            )
+            return self.finder.find(
+                self.analytics_repo.get_tag_catalog(query.project_id),
+                usage,
+                min_score=CANDIDATE_FLOOR
+            )
+
+        candidates = self.cache.get_or_compute(key, compute)
+
+        selected = [
+            c for c in candidates
+            if c['score'] >= query.min_score and (
+                query.tag_id is None or query.tag_id in (c['target_tag_id'], c['source_tag_id'])
+            )
+        ]
+        return selected[:query.limit]
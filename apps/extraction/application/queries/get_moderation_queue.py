@@ -0,0 +1,40 @@
+from dataclasses import asdict, dataclass
+
+from ...domain.exceptions.extraction_exceptions import UnauthorizedExtractionAccess
+from ...domain.repositories.i_project_repository import IProjectRepository
+from ...domain.repositories.i_tag_repository import ITagRepository
+
+
+@dataclass
+class GetModerationQueueQuery:
+    project_id: int
+    owner_id: int
+    after_id: int = 0
+    limit: int = 50
+
+
+class GetModerationQueueHandler:
+    """
+    Cola de tags pendientes de moderación, paginada por cursor (id del
+    último tag visto) sobre el índice (project_id, status, id): cada página
+    cuesta lo mismo sin importar cuán adentro de la cola esté.
+    """
+
+    def __init__(self, tag_repo: ITagRepository, project_repo: IProjectRepository):
+        self.tag_repo = tag_repo
+        self.project_repo = project_repo
+
+    def handle(self, query: GetModerationQueueQuery) -> dict:
+        project = self.project_repo.get_project_by_id(query.project_id)
+        if not project or project.owner_id != query.owner_id:
+            raise UnauthorizedExtractionAccess(
+                "Solo el owner del proyecto puede ver la cola de moderación"
+            )
+
+        items = self.tag_repo.list_pending(query.project_id, after_id=query.after_id, limit=query.limit)
+        return {
+            'project_id': query.project_id,
+            'pending': self.tag_repo.count_pending(query.project_id),
+            'tags': [asdict(item) for item in items],
+            'next_cursor': items[-1].tag_id if len(items) == query.limit else None,
+        }
@@ -0,0 +1,75 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from ...domain.repositories.i_analytics_repository import IAnalyticsRepository
+from ...domain.repositories.i_project_repository import IProjectRepository
+from ...domain.repositories.i_project_version_repository import IProjectVersionRepository
+from ...domain.services.page_heatmap import PageTagHeatmapBuilder
+from ...domain.exceptions.extraction_exceptions import ProjectAccessDenied
+
+
+@dataclass
+class GetPageTagHeatmapQuery:
+    project_id: int
+    user_id: int
+    study_id: Optional[int] = None
+    normalize: bool = False
+    bins: int = 10
+
+
+class GetPageTagHeatmapHandler:
+    """
+    Mapa de calor página x tag de un proyecto o de un estudio.
+
+    Las celdas se cachean por extracción y versión de la extracción: al
+    codificar una quote solo se recalcula su extracción, y todas las que
+    falten se cargan juntas en una sola lectura masiva.
+    """
+
+    def __init__(
+            self,
+            analytics_repo: IAnalyticsRepository,
+            version_repo: IProjectVersionRepository,
+            project_repo: IProjectRepository,
+            cache,
+            builder: PageTagHeatmapBuilder = None
+    ):
+        self.analytics_repo = analytics_repo
+        self.version_repo = version_repo
+        self.project_repo = project_repo
+        self.cache = cache
+        self.builder = builder or PageTagHeatmapBuilder()
+
+    def handle(self, query: GetPageTagHeatmapQuery) -> dict:
+        if not self.project_repo.is_member(query.project_id, query.user_id):
+            raise ProjectAccessDenied(
+                f"El usuario {query.user_id} no pertenece al proyecto {query.project_id}"
+            )
+
+        # Borrar un tag elimina enlaces sin tocar la extracción
+        catalog_version = self.version_repo.get(query.project_id).tag_catalog_version
+        bins_token = f"n{query.bins}" if query.normalize else "p"
+
+        versions = self.analytics_repo.get_extraction_versions(query.project_id, query.study_id)
+        keys = {
+            extraction_id: self.cache.key(
+                'page_heatmap', extraction_id, version, catalog_version, bins_token
+            )
+            for extraction_id, version in versions.items()
+        }
+
+        def compute_missing(extraction_ids):
+            links = self.analytics_repo.get_page_tag_links(query.project_id, extraction_ids)
+            cells = self.builder.cells(links, query.normalize, query.bins)
+            # Las extracciones sin páginas también se cachean (vacías)
+            return {extraction_id: cells.get(extraction_id, []) for extraction_id in extraction_ids}
+
+        cells = self.cache.get_many_or_compute(keys, compute_missing)
+        heatmap = self.builder.assemble(cells.values(), query.normalize, query.bins)
+
+        return {
+            'project_id': query.project_id,
+            'study_id': query.study_id,
+            'extractions': len(versions),
+            **heatmap.to_dict(self.analytics_repo.get_tag_names(query.project_id)),
+        }
@@ -0,0 +1,73 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from ...domain.entities.quote_cluster import QuoteClusterRun
+from ...domain.repositories.i_project_repository import IProjectRepository
+from ...domain.repositories.i_quote_cluster_repository import IQuoteClusterRepository
+from ...domain.exceptions.extraction_exceptions import ExtractionNotFound, ProjectAccessDenied
+
+
+@dataclass
+class GetQuoteClustersQuery:
+    """Sin run_id lista las ejecuciones del proyecto; con run_id, su detalle"""
+    project_id: int
+    user_id: int
+    run_id: Optional[int] = None
+    label: Optional[int] = None  # Con label: quotes de ese cluster
+    limit: int = 50
+    offset: int = 0
+
+
+class GetQuoteClustersHandler:
+
+    def __init__(self, cluster_repo: IQuoteClusterRepository, project_repo: IProjectRepository):
+        self.cluster_repo = cluster_repo
+        self.project_repo = project_repo
+
+    def handle(self, query: GetQuoteClustersQuery):
+        project = self.project_repo.get_project_by_id(query.project_id)
+        if not project or project.owner_id != query.user_id:
+            raise ProjectAccessDenied(
+                "Solo el owner del proyecto puede ver los agrupamientos"
+            )
+
+        if query.run_id is None:
+            return [self._run_dict(run) for run in self.cluster_repo.list_runs(query.project_id)]
+
+        run = self.cluster_repo.get_run(query.run_id)
+        if not run or run.project_id != query.project_id:
+            raise ExtractionNotFound(f"Ejecución de agrupamiento {query.run_id} no encontrada")
+
+        if query.label is not None:
+            return self.cluster_repo.get_cluster_quotes(
+                run.id, query.label, limit=query.limit, offset=query.offset
+            )
+
+        result = self._run_dict(run)
+        result['clusters'] = [
+            {
+                'label': c.label,
+                'size': c.size,
+                'top_terms': c.top_terms,
+                'suggested_tag_name': c.suggested_tag_name,
+                'sample_quote_ids': c.sample_quote_ids,
+                'tag_id': c.tag_id,
+            }
+            for c in self.cluster_repo.get_clusters(run.id)
+        ]
+        return result
+
+    @staticmethod
+    def _run_dict(run: QuoteClusterRun) -> dict:
+        return {
+            'id': run.id,
+            'project_id': run.project_id,
+            'k': run.k,
+            'max_tags': run.max_tags,
+            'status': run.status.value,
+            'quote_count': run.quote_count,
+            'cohesion': run.cohesion,
+            'error': run.error,
+            'created_at': run.created_at,
+            'finished_at': run.finished_at,
+        }
@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+
+from django.db import transaction
+
+from ...domain.repositories.i_project_repository import IProjectRepository
+from ...domain.repositories.i_project_version_repository import IProjectVersionRepository
+from ...domain.repositories.i_saturation_repository import ISaturationRepository
+from ...domain.services.saturation import SaturationTracker
+from ...domain.exceptions.extraction_exceptions import ProjectAccessDenied
+
+
+@dataclass
+class GetSaturationCurveQuery:
+    project_id: int
+    user_id: int
+    rebuild: bool = False
+
+
+class GetSaturationCurveHandler:
+    """
+    Curva de saturación temática: códigos nuevos acumulados a medida que se
+    completan extracciones.
+
+    Cada consulta solo procesa las extracciones completadas después de la
+    última vista (cursor persistido); la fila de estado se bloquea mientras
+    tanto para que dos consultas simultáneas no procesen lo mismo.
+    """
+
+    def __init__(
+            self,
+            saturation_repo: ISaturationRepository,
+            version_repo: IProjectVersionRepository,
+            project_repo: IProjectRepository,
+            tracker: SaturationTracker = None
+    ):
+        self.saturation_repo = saturation_repo
+        self.version_repo = version_repo
+        self.project_repo = project_repo
+        self.tracker = tracker or SaturationTracker()
+
+    @transaction.atomic
+    def handle(self, query: GetSaturationCurveQuery) -> dict:
+        if not self.project_repo.is_member(query.project_id, query.user_id):
+            raise ProjectAccessDenied(
+                f"El usuario {query.user_id} no pertenece al proyecto {query.project_id}"
+            )
+
+        state = self.saturation_repo.get_state_for_update(query.project_id)
+        catalog_version = self.version_repo.get(query.project_id).tag_catalog_version
+        if query.rebuild or state.tag_catalog_version != catalog_version:
+            state.reset(catalog_version)
+
+        processed = self.tracker.advance(
+            state,
+            self.saturation_repo.iter_completed_extractions(
+                query.project_id,
+                state.last_completed_at,
+                state.last_extraction_id
+            )
+        )
+        if processed or query.rebuild:
+            self.saturation_repo.save_state(state)
+
+        return {
+            'project_id': query.project_id,
+            **self.tracker.summary(state),
+            'points': [p.to_dict() for p in state.points],
+        }
@@ -0,0 +1,75 @@
+from dataclasses import dataclass
+from typing import Optional
+from ...domain.repositories.i_analytics_repository import IAnalyticsRepository
+from ...domain.repositories.i_project_repository import IProjectRepository
+from ...domain.repositories.i_project_version_repository import IProjectVersionRepository
+from ...domain.services.tag_cooccurrence import TagCooccurrenceCalculator
+from ...domain.services.tag_tree import TagTree
+from ...domain.exceptions.extraction_exceptions import ProjectAccessDenied
+
+
+@dataclass
+class GetTagCooccurrenceQuery:
+    project_id: int
+    user_id: int
+    level: str = 'quote'
+    min_count: int = 1
+    rollup_level: Optional[int] = None  # Agrega los códigos a su tema de ese nivel (0 = raíces)
+
+
+class GetTagCooccurrenceHandler:
+    """
+    Co-ocurrencia de tags de un proyecto.
+
+    El resultado se cachea por versión del catálogo de tags y de la
+    codificación del proyecto: mientras nadie cree quotes ni edite tags,
+    las consultas repetidas no tocan la BD más allá de leer la versión.
+    """
+
+    def __init__(
+            self,
+            analytics_repo: IAnalyticsRepository,
+            version_repo: IProjectVersionRepository,
+            project_repo: IProjectRepository,
+            cache,
+            calculator: TagCooccurrenceCalculator = None
+    ):
+        self.analytics_repo = analytics_repo
+        self.version_repo = version_repo
+        self.project_repo = project_repo
+        self.cache = cache
+        self.calculator = calculator or TagCooccurrenceCalculator()
+
+    def handle(self, query: GetTagCooccurrenceQuery) -> dict:
+        if not self.project_repo.is_member(query.project_id, query.user_id):
+            raise ProjectAccessDenied(
+                f"El usuario {query.user_id} no pertenece al proyecto {query.project_id}"
+            )
+
+        versions = self.version_repo.get(query.project_id)
+        key = self.cache.key(
+            'cooccurrence',
+            query.project_id,
+            versions.cache_token,
+            query.level,
+            query.min_count,
+            'flat' if query.rollup_level is None else f'l{query.rollup_level}'
+        )
+
+        def compute():
+            incidence = self.analytics_repo.get_quote_tag_incidence(query.project_id)
+            if query.rollup_level is not None:
+                tree = TagTree(self.analytics_repo.get_tag_parents(query.project_id))
+                incidence = self.calculator.roll_up(incidence, tree.rollup_map(query.rollup_level))
+
+            result = self.calculator.compute(
+                incidence,
+                self.analytics_repo.get_tag_names(query.project_id),
+                level=query.level,
+                min_count=query.min_count
+            )
+            result["project_id"] = query.project_id
+            result["version"] = versions.cache_token
+            return result
+
+        return self.cache.get_or_compute(key, compute)
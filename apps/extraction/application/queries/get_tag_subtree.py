@@ -0,0 +1,65 @@
+from dataclasses import asdict, dataclass
+
+from ...domain.exceptions.extraction_exceptions import ProjectAccessDenied, TagNotFound
+from ...domain.repositories.i_project_repository import IProjectRepository
+from ...domain.repositories.i_quote_repository import IQuoteRepository
+from ...domain.repositories.i_tag_repository import ITagRepository
+
+
+@dataclass
+class GetTagSubtreeQuery:
+    tag_id: int
+    user_id: int
+    quotes: bool = False  # True: quotes de todo el subárbol en vez de los nodos
+    limit: int = 50
+    offset: int = 0
+
+
+class GetTagSubtreeHandler:
+    """Subárbol de un tema del libro de códigos, o las quotes codificadas bajo él"""
+
+    def __init__(
+            self,
+            tag_repo: ITagRepository,
+            quote_repo: IQuoteRepository,
+            project_repo: IProjectRepository
+    ):
+        self.tag_repo = tag_repo
+        self.quote_repo = quote_repo
+        self.project_repo = project_repo
+
+    def handle(self, query: GetTagSubtreeQuery) -> dict:
+        tags = self.tag_repo.get_by_ids([query.tag_id])
+        if not tags:
+            raise TagNotFound(f"El tag {query.tag_id} no existe")
+
+        tag = tags[0]
+        if not self.project_repo.is_member(tag.project_id, query.user_id):
+            raise ProjectAccessDenied(
+                f"El usuario {query.user_id} no pertenece al proyecto {tag.project_id}"
+            )
+
+        if not query.quotes:
+            return {
+                'tag_id': tag.id,
+                'nodes': [asdict(node) for node in self.tag_repo.get_subtree(tag.id)],
+            }
+
+        total, quotes = self.quote_repo.get_by_tag_subtree(
+            tag.id, offset=query.offset, limit=query.limit
+        )
+        return {
+            'tag_id': tag.id,
+            'total': total,
+            'offset': query.offset,
+            'quotes': [
+                {
+                    'id': quote.id,
+                    'extraction_id': quote.extraction_id,
+                    'text': quote.text,
+                    'page': quote.location.page if quote.location else None,
+                    'tag_ids': [t.id for t in quote.tags],
+                }
+                for quote in quotes
+            ],
+        }
@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from typing import List, Optional
+from ...domain.dtos.search_dtos import QuoteSearchFilters, QuoteSearchHitDTO
+from ...domain.repositories.i_project_repository import IProjectRepository
+from ...domain.repositories.i_quote_search_index import IQuoteSearchIndex
+from ...domain.exceptions.extraction_exceptions import ProjectAccessDenied
+
+
+@dataclass
+class SearchQuotesQuery:
+    text: str
+    project_id: int
+    user_id: int
+    tag_id: Optional[int] = None
+    researcher_id: Optional[int] = None
+    page: Optional[int] = None
+    limit: int = 20
+    offset: int = 0
+
+
+class SearchQuotesHandler:
+    def __init__(self, search_index: IQuoteSearchIndex, project_repo: IProjectRepository):
+        self.search_index = search_index
+        self.project_repo = project_repo
+
+    def handle(self, query: SearchQuotesQuery) -> List[QuoteSearchHitDTO]:
+        if not self.project_repo.is_member(query.project_id, query.user_id):
+            raise ProjectAccessDenied(
+                f"El usuario {query.user_id} no pertenece al proyecto {query.project_id}"
+            )
+
+        filters = QuoteSearchFilters(
+            project_id=query.project_id,
+            tag_id=query.tag_id,
+            researcher_id=query.researcher_id,
+            page=query.page
+        )
+        return self.search_index.search(
+            query.text,
+            filters,
+            limit=query.limit,
+            offset=query.offset
+        )
@@ -0,0 +1,58 @@
+from dataclasses import dataclass
+from typing import List
+from ...domain.repositories.i_project_repository import IProjectRepository
+from ...domain.repositories.i_tag_repository import ITagRepository
+from ...domain.value_objects.tag_status import TagStatus
+from ...domain.value_objects.tag_visibility import TagVisibility
+from ...domain.exceptions.extraction_exceptions import ProjectAccessDenied
+
+
+@dataclass
+class SuggestTagsQuery:
+    project_id: int
+    user_id: int
+    text: str
+    limit: int = 5
+    neighbours: int = 25
+
+
+class SuggestTagsHandler:
+    """
+    Tags probables para un fragmento aún no guardado, a partir de las quotes
+    más parecidas ya codificadas en el proyecto. Solo se devuelven tags que
+    el usuario puede usar (públicos aprobados o propios no rechazados).
+    """
+
+    def __init__(self, model_store, tag_repo: ITagRepository, project_repo: IProjectRepository):
+        self.model_store = model_store
+        self.tag_repo = tag_repo
+        self.project_repo = project_repo
+
+    def handle(self, query: SuggestTagsQuery) -> List[dict]:
+        if not self.project_repo.is_member(query.project_id, query.user_id):
+            raise ProjectAccessDenied(
+                f"El usuario {query.user_id} no pertenece al proyecto {query.project_id}"
+            )
+
+        suggester = self.model_store.get(query.project_id)
+        # Se piden de más por si alguno no es utilizable por este usuario
+        ranked = suggester.suggest(query.text, k=query.neighbours, limit=query.limit * 2)
+        if not ranked:
+            return []
+
+        tags = {t.id: t for t in self.tag_repo.get_by_ids([r['tag_id'] for r in ranked])}
+
+        suggestions = []
+        for item in ranked:
+            tag = tags.get(item['tag_id'])
+            if not tag or not self._usable(tag, query.user_id):
+                continue
+            suggestions.append({**item, 'name': tag.name, 'is_mandatory': tag.is_mandatory})
+
+        return suggestions[:query.limit]
+
+    @staticmethod
+    def _usable(tag, user_id: int) -> bool:
+        if tag.created_by_user_id == user_id:
+            return tag.status != TagStatus.REJECTED
+        return tag.status == TagStatus.APPROVED and tag.visibility == TagVisibility.PUBLIC
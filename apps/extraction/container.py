@@ -1,4 +1,10 @@
 from .application.commands.activate_extraction_phase import ActivateExtractionPhaseHandler
+from .application.commands.close_expired_phases import (
+    FREEZE_PROJECT_JOB_KIND,
+    CloseExpiredPhasesCommand,
+    CloseExpiredPhasesHandler
+)
+from .application.commands.archive_closed_projects import ArchiveClosedProjectsHandler
 from .application.commands.configure_extraction_phase import ConfigureExtractionPhaseHandler
 from .application.queries.get_extraction_quotes_with_locations import GetExtractionQuotesWithLocationsHandler
 from .infrastructure.adapters.acquisition_service_adapter import AcquisitionServiceAdapter
@@ -6,6 +12,8 @@ from .infrastructure.adapters.design_service_adapter import DesignServiceAdapter
 from .infrastructure.adapters.project_service_adapter import ProjectServiceAdapter
 from .infrastructure.repositories.django_extraction_phase_repository import DjangoExtractionPhaseRepository
 from .infrastructure.repositories.django_extraction_repository import DjangoExtractionRepository
+from .infrastructure.repositories.django_job_queue_repository import DjangoJobQueueRepository
+from .infrastructure.jobs.scheduler import PhaseDeadlineScheduler
 from .infrastructure.repositories.django_tag_repository import DjangoTagRepository
 from .domain.services.extraction_validator import ExtractionValidator
 from .application.commands.create_extraction import CreateExtractionHandler
@@ -16,19 +24,71 @@ from .application.commands.create_quote import CreateQuoteHandler
 from .application.commands.create_tag import CreateTagHandler
 from .application.commands.moderate_tag import ModerateTagHandler
 from .application.commands.merge_tags import MergeTagsHandler
+from .application.commands.move_tag import MoveTagHandler
+from .application.commands.bulk_moderate_tags import BulkModerateTagsHandler
+from .application.commands.import_codebook import ImportCodebookHandler
+from .application.commands.clone_codebook import CloneCodebookHandler
+from .application.commands.assign_studies import AssignStudiesHandler
+from .application.commands.reassign_coder import ReassignCoderHandler
+from .application.commands.claim_next_study import ClaimNextStudyHandler
+from .application.commands.build_consensus import BuildConsensusHandler
 from .application.queries.get_extraction import GetExtractionHandler
+from .application.queries.get_extraction_detail import GetExtractionDetailHandler
 from .application.queries.list_extractions import ListExtractionsHandler
+from .application.queries.export_project_quotes import ExportProjectQuotesHandler
+from .application.queries.get_tag_cooccurrence import GetTagCooccurrenceHandler
+from .application.queries.get_framework_matrix import GetFrameworkMatrixHandler
+from .application.queries.search_quotes import SearchQuotesHandler
+from .application.queries.get_merge_candidates import GetMergeCandidatesHandler
+from .application.queries.autocomplete_tags import AutocompleteTagsHandler
+from .application.queries.suggest_tags import SuggestTagsHandler
+from .infrastructure.ml.tag_suggestion_store import TagSuggestionModelStore
+from .infrastructure.ml.parallel_clustering import ParallelQuoteClusterer
+from .infrastructure.repositories.django_quote_cluster_repository import DjangoQuoteClusterRepository
+from .application.commands.start_quote_clustering import CLUSTER_JOB_KIND, StartQuoteClusteringHandler
+from .application.commands.run_quote_clustering import RunQuoteClusteringCommand, RunQuoteClusteringHandler
+from .application.commands.create_tag_from_cluster import CreateTagFromClusterHandler
+from .application.queries.get_quote_clusters import GetQuoteClustersHandler
+from .application.queries.get_saturation_curve import GetSaturationCurveHandler
+from .application.queries.get_page_tag_heatmap import GetPageTagHeatmapHandler
+from .application.queries.get_tag_subtree import GetTagSubtreeHandler
+from .application.queries.get_moderation_queue import GetModerationQueueHandler
+from .application.queries.get_extraction_diff import GetExtractionDiffHandler
+from .infrastructure.repositories.django_saturation_repository import DjangoSaturationRepository
+from .infrastructure.search.factory import build_quote_search_index
+from .infrastructure.search.minhash_lsh import MinHashLshIndex
+from .infrastructure.projections.extraction_detail import DjangoExtractionDetailProjection
+from .infrastructure.repositories.django_extraction_snapshot_repository import DjangoExtractionSnapshotRepository
+from .infrastructure.cache.versioned_cache import VersionedCache
+from .infrastructure.cache.local_cache import LocalVersionedCache
+from .infrastructure.cache.tag_fragments import TagFragmentCache
+from .infrastructure.repositories.django_analytics_repository import DjangoAnalyticsRepository
+from .infrastructure.repositories.django_project_version_repository import DjangoProjectVersionRepository
 
 
 class Container:
     # Repositories & Adapters
+    project_version_repository = DjangoProjectVersionRepository()
     extraction_repository = DjangoExtractionRepository()
-    quote_repository = DjangoQuoteRepository()
+    quote_repository = DjangoQuoteRepository(project_version_repository)
     acquisition_adapter = AcquisitionServiceAdapter()
     design_adapter = DesignServiceAdapter()
     project_adapter = ProjectServiceAdapter()
-    tag_repository = DjangoTagRepository(acquisition_adapter)
+    tag_repository = DjangoTagRepository(acquisition_adapter, project_version_repository)
     phase_repository = DjangoExtractionPhaseRepository()
+    job_queue = DjangoJobQueueRepository()
+    analytics_repository = DjangoAnalyticsRepository()
+    analytics_cache = VersionedCache()
+    local_cache = LocalVersionedCache()
+    tag_suggestion_models = TagSuggestionModelStore(analytics_repository, project_version_repository)
+    quote_cluster_repository = DjangoQuoteClusterRepository()
+    quote_clusterer = ParallelQuoteClusterer()
+    saturation_repository = DjangoSaturationRepository()
+    quote_search_index = build_quote_search_index()
+    near_duplicate_index = MinHashLshIndex()
+    tag_fragments = TagFragmentCache(project_version_repository)
+    extraction_detail_projection = DjangoExtractionDetailProjection(tag_fragments)
+    extraction_snapshot_repository = DjangoExtractionSnapshotRepository(project_version_repository)
 
     # Domain Services
     extraction_validator = ExtractionValidator(tag_repository)
@@ -49,19 +109,68 @@ class Container:
             self.project_adapter
         )
 
+    @property
+    def close_expired_phases_handler(self):
+        return CloseExpiredPhasesHandler(self.phase_repository, self.job_queue)
+
     @property
     def create_extraction_handler(self):
         return CreateExtractionHandler(
             self.extraction_repository,
             self.acquisition_adapter,
-            self.phase_repository
+            self.phase_repository,
+            self.extraction_detail_projection
+        )
+
+    @property
+    def assign_studies_handler(self):
+        return AssignStudiesHandler(
+            self.extraction_repository,
+            self.phase_repository,
+            self.acquisition_adapter,
+            self.project_adapter,
+            self.extraction_detail_projection
+        )
+
+    @property
+    def claim_next_study_handler(self):
+        return ClaimNextStudyHandler(
+            self.extraction_repository,
+            self.phase_repository,
+            self.acquisition_adapter,
+            self.project_adapter,
+            self.extraction_detail_projection
         )
 
+    @property
+    def reassign_coder_handler(self):
+        return ReassignCoderHandler(self.assign_studies_handler)
+
     @property
     def complete_extraction_handler(self):
         return CompleteExtractionHandler(
             self.extraction_repository,
-            self.extraction_validator
+            self.extraction_validator,
+            self.extraction_detail_projection,
+            self.extraction_snapshot_repository
+        )
+
+    @property
+    def archive_closed_projects_handler(self):
+        return ArchiveClosedProjectsHandler(
+            self.phase_repository,
+            self.extraction_snapshot_repository,
+            self.quote_search_index
+        )
+
+    @property
+    def build_consensus_handler(self):
+        return BuildConsensusHandler(
+            self.extraction_repository,
+            self.quote_repository,
+            self.acquisition_adapter,
+            self.project_adapter,
+            self.extraction_detail_projection
         )
 
     @property
@@ -70,7 +179,10 @@ class Container:
             extraction_repo=self.extraction_repository,
             quote_repo=self.quote_repository,
             tag_repo=self.tag_repository,
-            acquisition_adapter=self.acquisition_adapter
+            acquisition_adapter=self.acquisition_adapter,
+            search_index=self.quote_search_index,
+            duplicate_index=self.near_duplicate_index,
+            projection=self.extraction_detail_projection
         )
 
     @property
@@ -83,28 +195,226 @@ class Container:
 
     @property
     def moderate_tag_handler(self):
-        return ModerateTagHandler(self.tag_repository, self.project_adapter)
+        return ModerateTagHandler(
+            self.tag_repository,
+            self.project_adapter,
+            self.extraction_detail_projection
+        )
+
+    @property
+    def bulk_moderate_tags_handler(self):
+        return BulkModerateTagsHandler(
+            self.tag_repository,
+            self.project_adapter,
+            self.extraction_detail_projection
+        )
 
     @property
     def merge_tags_handler(self):
         return MergeTagsHandler(
             self.tag_repository,
             self.tag_merger,
+            self.project_adapter,
+            self.extraction_detail_projection
+        )
+
+    @property
+    def move_tag_handler(self):
+        return MoveTagHandler(self.tag_repository, self.project_adapter)
+
+    @property
+    def import_codebook_handler(self):
+        return ImportCodebookHandler(
+            self.tag_repository,
+            self.design_adapter,
+            self.project_adapter
+        )
+
+    @property
+    def clone_codebook_handler(self):
+        return CloneCodebookHandler(self.tag_repository, self.import_codebook_handler)
+
+    @property
+    def start_quote_clustering_handler(self):
+        return StartQuoteClusteringHandler(
+            self.quote_cluster_repository,
+            self.job_queue,
             self.project_adapter
         )
 
+    @property
+    def run_quote_clustering_handler(self):
+        return RunQuoteClusteringHandler(
+            self.quote_cluster_repository,
+            self.analytics_repository,
+            self.quote_clusterer
+        )
+
+    @property
+    def create_tag_from_cluster_handler(self):
+        return CreateTagFromClusterHandler(
+            self.quote_cluster_repository,
+            self.create_tag_handler
+        )
+
     @property
     def get_extraction_handler(self):
         return GetExtractionHandler(self.extraction_repository)
 
+    @property
+    def get_extraction_detail_handler(self):
+        return GetExtractionDetailHandler(self.extraction_detail_projection)
+
     @property
     def list_extractions_handler(self):
         return ListExtractionsHandler(self.extraction_repository)
 
+    @property
+    def get_extraction_diff_handler(self):
+        return GetExtractionDiffHandler(
+            self.extraction_repository,
+            self.acquisition_adapter,
+            self.project_version_repository,
+            self.project_adapter,
+            self.analytics_cache
+        )
+
     @property
     def get_extraction_quotes_handler(self):
         return GetExtractionQuotesWithLocationsHandler(
             self.extraction_repository
         )
 
+    @property
+    def export_project_quotes_handler(self):
+        return ExportProjectQuotesHandler(
+            self.quote_repository,
+            self.project_adapter
+        )
+
+    @property
+    def get_tag_cooccurrence_handler(self):
+        return GetTagCooccurrenceHandler(
+            self.analytics_repository,
+            self.project_version_repository,
+            self.project_adapter,
+            self.analytics_cache
+        )
+
+    @property
+    def get_framework_matrix_handler(self):
+        return GetFrameworkMatrixHandler(
+            self.analytics_repository,
+            self.project_adapter
+        )
+
+    @property
+    def get_page_tag_heatmap_handler(self):
+        return GetPageTagHeatmapHandler(
+            self.analytics_repository,
+            self.project_version_repository,
+            self.project_adapter,
+            self.analytics_cache
+        )
+
+    @property
+    def get_tag_subtree_handler(self):
+        return GetTagSubtreeHandler(
+            self.tag_repository,
+            self.quote_repository,
+            self.project_adapter
+        )
+
+    @property
+    def get_moderation_queue_handler(self):
+        return GetModerationQueueHandler(self.tag_repository, self.project_adapter)
+
+    @property
+    def get_merge_candidates_handler(self):
+        return GetMergeCandidatesHandler(
+            self.analytics_repository,
+            self.project_version_repository,
+            self.project_adapter,
+            self.analytics_cache
+        )
+
+    @property
+    def autocomplete_tags_handler(self):
+        return AutocompleteTagsHandler(
+            self.tag_repository,
+            self.project_version_repository,
+            self.project_adapter,
+            self.local_cache
+        )
+
+    @property
+    def suggest_tags_handler(self):
+        return SuggestTagsHandler(
+            self.tag_suggestion_models,
+            self.tag_repository,
+            self.project_adapter
+        )
+
+    @property
+    def get_quote_clusters_handler(self):
+        return GetQuoteClustersHandler(self.quote_cluster_repository, self.project_adapter)
+
+    @property
+    def get_saturation_curve_handler(self):
+        return GetSaturationCurveHandler(
+            self.saturation_repository,
+            self.project_version_repository,
+            self.project_adapter
+        )
+
+    @property
+    def search_quotes_handler(self):
+        return SearchQuotesHandler(self.quote_search_index, self.project_adapter)
+
+    # Background Jobs
+    def phase_deadline_scheduler(self, **options):
+        return PhaseDeadlineScheduler(
+            self.phase_repository,
+            close_expired=lambda now: self.close_expired_phases_handler.handle(
+                CloseExpiredPhasesCommand(now=now)
+            ).closed_project_ids,
+            **options
+        )
+
+    @property
+    def job_handlers(self):
+        """Handlers de la cola de jobs, indexados por `kind`"""
+        return {
+            'phases.close_expired': lambda payload: {
+                'closed_project_ids': self.close_expired_phases_handler.handle(
+                    CloseExpiredPhasesCommand(batch_size=payload.get('batch_size', 500))
+                ).closed_project_ids
+            },
+            FREEZE_PROJECT_JOB_KIND: lambda payload: {
+                'captured': self.extraction_snapshot_repository.capture_project(payload['project_id'])
+            },
+            'projections.rebuild_extraction_detail': lambda payload: {
+                'projected': self.extraction_detail_projection.rebuild(
+                    project_id=payload.get('project_id')
+                )
+            },
+            'search.rebuild_quotes': lambda payload: {
+                'indexed': self.quote_search_index.rebuild(
+                    project_id=payload.get('project_id')
+                )
+            },
+            CLUSTER_JOB_KIND: lambda payload: self.run_quote_clustering_handler.handle(
+                RunQuoteClusteringCommand(run_id=payload['run_id'])
+            ),
+            'quotes.cluster_near_duplicates': lambda payload: {
+                'clusters': [
+                    cluster.to_dict()
+                    for cluster in self.near_duplicate_index.find_clusters(
+                        payload['project_id'],
+                        threshold=payload.get('threshold', 0.8)
+                    )
+                ]
+            },
+        }
+
 container = Container()
\ No newline at end of file
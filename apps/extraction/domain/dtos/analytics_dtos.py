@@ -0,0 +1,102 @@
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ProjectVersionsDTO:
+    project_id: int
+    tag_catalog_version: int = 0
+    coding_version: int = 0
+
+    @property
+    def cache_token(self) -> str:
+        return f"t{self.tag_catalog_version}.c{self.coding_version}"
+
+
+@dataclass(frozen=True)
+class QuoteTagIncidenceDTO:
+    """
+    Enlaces quote-tag de un proyecto como arrays alineados (uno por enlace).
+    """
+    quote_ids: np.ndarray
+    extraction_ids: np.ndarray
+    study_ids: np.ndarray
+    tag_ids: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.tag_ids)
+
+
+@dataclass(frozen=True)
+class StudyTagCellsDTO:
+    """
+    Celdas no vacías estudio x tag (una por par), resultado de un GROUP BY.
+    sample_quote_ids guarda la primera quote de la celda para el fragmento.
+    """
+    study_ids: np.ndarray
+    tag_ids: np.ndarray
+    quote_counts: np.ndarray
+    sample_quote_ids: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.tag_ids)
+
+
+@dataclass(frozen=True)
+class PageTagLinksDTO:
+    """
+    Enlaces quote-tag con la página de la quote (uno por enlace).
+    page_counts vale 0 cuando la quote no registró el total de páginas.
+    """
+    extraction_ids: np.ndarray
+    pages: np.ndarray
+    page_counts: np.ndarray
+    tag_ids: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.tag_ids)
+
+
+@dataclass(frozen=True)
+class TagCatalogEntryDTO:
+    """Tag del catálogo de un proyecto con su número de quotes"""
+    tag_id: int
+    name: str
+    type: str
+    status: str
+    quote_count: int
+
+
+@dataclass(frozen=True)
+class QuoteTextBatchDTO:
+    """Lote de quotes (en orden de id) con su texto y sus tags"""
+    quote_ids: List[int]
+    texts: List[str]
+    tag_ids: List[Tuple[int, ...]]
+
+    def __len__(self) -> int:
+        return len(self.quote_ids)
+
+
+@dataclass(frozen=True)
+class QuoteSetFingerprintDTO:
+    """
+    Huella del conjunto de quotes (y sus vínculos con tags) hasta un id.
+    Cambia si se agrega una quote por debajo del id, se borra o archiva una,
+    o se re-etiqueta; no distingue ediciones de texto.
+    """
+    quote_count: int = 0
+    quote_id_sum: int = 0
+    link_count: int = 0
+    tag_id_sum: int = 0
+
+    def extended(self, batch: QuoteTextBatchDTO) -> 'QuoteSetFingerprintDTO':
+        """Huella tras incorporar un lote de quotes nuevas"""
+        return QuoteSetFingerprintDTO(
+            quote_count=self.quote_count + len(batch),
+            quote_id_sum=self.quote_id_sum + sum(batch.quote_ids),
+            link_count=self.link_count + sum(len(tags) for tags in batch.tag_ids),
+            tag_id_sum=self.tag_id_sum + sum(sum(tags) for tags in batch.tag_ids),
+        )
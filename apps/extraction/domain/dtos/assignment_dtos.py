@@ -0,0 +1,36 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+@dataclass(frozen=True)
+class ExtractionSlotDTO:
+    """Lo mínimo de una extracción existente que necesita el reparto de carga."""
+    extraction_id: int
+    study_id: int
+    user_id: Optional[int]
+    extraction_order: int
+    is_open: bool
+
+
+@dataclass(frozen=True)
+class PlannedAssignmentDTO:
+    study_id: int
+    user_id: Optional[int]  # None = cupo vacante, lo reclama el primer codificador libre
+    extraction_order: int
+    extraction_id: Optional[int] = None  # cupo vacante existente que se ocupa
+
+
+@dataclass
+class AssignmentResultDTO:
+    project_id: int
+    assigned: int = 0
+    unfilled_study_ids: List[int] = field(default_factory=list)
+    load_by_user: Dict[int, int] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {
+            'project_id': self.project_id,
+            'assigned': self.assigned,
+            'unfilled_study_ids': self.unfilled_study_ids,
+            'load_by_user': dict(sorted(self.load_by_user.items())),
+        }
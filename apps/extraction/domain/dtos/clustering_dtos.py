@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ClusterSummaryDTO:
+    label: int
+    size: int
+    top_terms: List[str]
+    sample_quote_ids: List[int]
+
+
+@dataclass(frozen=True)
+class ClusteringResultDTO:
+    """Asignación de cada quote (arrays alineados) y resumen por cluster"""
+    quote_ids: np.ndarray
+    labels: np.ndarray
+    scores: np.ndarray
+    clusters: List[ClusterSummaryDTO]
+
+    @property
+    def cohesion(self) -> float:
+        """Similitud coseno media de cada quote con su centroide"""
+        return float(self.scores.mean()) if len(self.scores) else 0.0
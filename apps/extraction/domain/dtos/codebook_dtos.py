@@ -0,0 +1,33 @@
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class CodebookEntryDTO:
+    """
+    Un código del libro de códigos a importar.
+    path va de la raíz al código: ("Economía", "Costes", "Costo oculto").
+    """
+    path: Tuple[str, ...]
+    is_mandatory: bool = False
+    question_id: Optional[int] = None
+
+    @property
+    def name(self) -> str:
+        return self.path[-1]
+
+
+@dataclass
+class CodebookImportResultDTO:
+    project_id: int
+    created: int = 0
+    existing: int = 0
+    dropped_question_ids: List[int] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            'project_id': self.project_id,
+            'created': self.created,
+            'existing': self.existing,
+            'dropped_question_ids': self.dropped_question_ids,
+        }
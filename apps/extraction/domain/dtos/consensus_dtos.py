@@ -0,0 +1,86 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from ..value_objects.consensus_status import ConsensusStatus
+
+
+@dataclass
+class ConsensusItemDTO:
+    """
+    Un grupo de quotes alineadas (a lo sumo una por extracción).
+    quote_ids va de extraction_id a quote_id; la primera es la representante.
+    """
+    status: ConsensusStatus
+    page: Optional[int]
+    text: str
+    quote_ids: Dict[int, int]
+    agreed_tag_ids: List[int] = field(default_factory=list)
+    disputed_tag_ids: List[int] = field(default_factory=list)
+    score: float = 1.0
+
+    def to_dict(self) -> dict:
+        return {
+            'status': self.status.value,
+            'page': self.page,
+            'text': self.text,
+            'quote_ids': self.quote_ids,
+            'agreed_tag_ids': self.agreed_tag_ids,
+            'disputed_tag_ids': self.disputed_tag_ids,
+            'score': round(self.score, 4),
+        }
+
+
+@dataclass
+class ConsensusReportDTO:
+    study_id: int
+    extraction_ids: List[int]
+    items: List[ConsensusItemDTO] = field(default_factory=list)
+    consensus_extraction_id: Optional[int] = None
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        counts = {s.value: 0 for s in ConsensusStatus}
+        for item in self.items:
+            counts[item.status.value] += 1
+        return counts
+
+    def to_dict(self) -> dict:
+        return {
+            'study_id': self.study_id,
+            'extraction_ids': self.extraction_ids,
+            'consensus_extraction_id': self.consensus_extraction_id,
+            'counts': self.counts,
+            'items': [item.to_dict() for item in self.items],
+        }
+
+
+@dataclass
+class ExtractionDiffDTO:
+    """
+    Diferencias entre dos extracciones del mismo estudio, vistas como a -> b.
+    matched trae las quotes alineadas con los tags que cambian de un lado al otro.
+    """
+    study_id: int
+    a: int
+    b: int
+    matched: List[dict] = field(default_factory=list)
+    only_a: List[dict] = field(default_factory=list)
+    only_b: List[dict] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            'study_id': self.study_id,
+            'a': self.a,
+            'b': self.b,
+            'summary': {
+                'matched': len(self.matched),
+                'matched_with_tag_changes': sum(
+                    1 for m in self.matched if m['tags_only_a'] or m['tags_only_b']
+                ),
+                'only_a': len(self.only_a),
+                'only_b': len(self.only_b),
+            },
+            'matched': self.matched,
+            'only_a': self.only_a,
+            'only_b': self.only_b,
+        }
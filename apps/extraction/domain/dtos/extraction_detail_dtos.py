@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class ExtractionDetailDocumentDTO:
+    """Detalle de una extracción ya renderizado como JSON (modelo de lectura)"""
+    extraction_id: int
+    study_id: int
+    project_id: Optional[int]
+    assigned_to_user_id: Optional[int]
+    document: str
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass(frozen=True)
+class NearDuplicateMatchDTO:
+    quote_id: int
+    extraction_id: int
+    researcher_id: int
+    similarity: float
+
+
+@dataclass(frozen=True)
+class NearDuplicateClusterDTO:
+    quote_ids: List[int]
+    extraction_ids: List[int]
+    researcher_ids: List[int]
+
+    @property
+    def cross_coder(self) -> bool:
+        """Pasaje citado por más de un coder (pareja de doble extracción)"""
+        return len(self.researcher_ids) > 1
+
+    def to_dict(self) -> dict:
+        return {
+            'quote_ids': self.quote_ids,
+            'extraction_ids': self.extraction_ids,
+            'researcher_ids': self.researcher_ids,
+            'cross_coder': self.cross_coder,
+        }
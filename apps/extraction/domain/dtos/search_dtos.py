@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class QuoteSearchFilters:
+    project_id: int
+    tag_id: Optional[int] = None
+    researcher_id: Optional[int] = None
+    page: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class QuoteSearchHitDTO:
+    quote_id: int
+    extraction_id: int
+    researcher_id: int
+    page: Optional[int]
+    snippet: str
+    rank: float
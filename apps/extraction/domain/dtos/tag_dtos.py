@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class TagSuggestionDTO:
+    tag_id: int
+    name: str
+    color: str
+    is_mandatory: bool
+    type: str
+    status: str
+    quote_count: int
+
+    @property
+    def rank(self) -> tuple:
+        """Obligatorios primero, luego los más usados y por nombre"""
+        return (not self.is_mandatory, -self.quote_count, self.name.lower(), self.tag_id)
+
+
+@dataclass(frozen=True)
+class TagTreeNodeDTO:
+    """
+    Nodo de un subárbol del libro de códigos.
+    depth es relativo a la raíz consultada; quote_count cuenta quotes
+    distintas de todo el subárbol del nodo, direct_quote_count solo las suyas.
+    """
+    tag_id: int
+    name: str
+    parent_id: Optional[int]
+    depth: int
+    status: str
+    direct_quote_count: int
+    quote_count: int
+
+
+@dataclass(frozen=True)
+class TagModerationItemDTO:
+    """Tag pendiente en la cola de moderación"""
+    tag_id: int
+    name: str
+    type: str
+    created_by_user_id: int
+    question_id: Optional[int]
+    parent_id: Optional[int]
+    quote_count: int
@@ -11,7 +11,7 @@ from ..exceptions.extraction_exceptions import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class Extraction:
     """Aggregate Root"""
     id: Optional[int]
@@ -23,6 +23,9 @@ class Extraction:
     completed_at: Optional[datetime] = None
     extraction_order: int = 1
     max_quotes: int = 100
+    version: int = 1
+    is_consensus: bool = False
+    project_id: Optional[int] = None
 
     def start_working(self):
         if self.status != ExtractionStatus.PENDING:
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import ClassVar, Dict, Optional
 from ..value_objects.phase_status import PhaseStatus
 from ..value_objects.extraction_mode import ExtractionMode
 from ..exceptions.extraction_exceptions import ExtractionValidationError
@@ -29,9 +29,19 @@ class ExtractionPhase:
     min_quotes_required: int = 1
     max_quotes_per_extraction: int = 100
     requires_approval: bool = False
+    closed_at: Optional[datetime] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
+    _EXTRACTIONS_PER_MODE: ClassVar[Dict[ExtractionMode, int]] = {
+        ExtractionMode.SINGLE: 1,
+        ExtractionMode.DOUBLE: 2,
+    }
+    _FULL_MESSAGES: ClassVar[Dict[ExtractionMode, str]] = {
+        ExtractionMode.SINGLE: "Ya existe una extracción para este estudio (modo: extracción simple)",
+        ExtractionMode.DOUBLE: "Ya existen dos extracciones para este estudio (modo: extracción por pares)",
+    }
+
     def activate(self) -> None:
         """Activa la fase de extracción"""
         if self.status == PhaseStatus.ACTIVE:
@@ -109,32 +119,15 @@ class ExtractionPhase:
             study_id: ID del estudio
             current_count: Número de extracciones existentes para ese estudio
         """
-        if self.mode == ExtractionMode.SINGLE and current_count >= 1:
-            raise ExtractionValidationError(
-                "Ya existe una extracción para este estudio (modo: extracción simple)"
-            )
-
-        if self.mode == ExtractionMode.DOUBLE and current_count >= 2:
-            raise ExtractionValidationError(
-                "Ya existen dos extracciones para este estudio (modo: extracción por pares)"
-            )
-
-        if self.mode == ExtractionMode.TRIPLE and current_count >= 3:
-            raise ExtractionValidationError(
-                "Ya existen tres extracciones para este estudio (modo: triple validación)"
-            )
+        if current_count >= self.expected_extractions_per_study:
+            raise ExtractionValidationError(self._FULL_MESSAGES[self.mode])
 
     @property
     def requires_multiple_extractors(self) -> bool:
         """Indica si requiere múltiples extractores"""
-        return self.mode in [ExtractionMode.DOUBLE, ExtractionMode.TRIPLE]
+        return self.expected_extractions_per_study > 1
 
     @property
     def expected_extractions_per_study(self) -> int:
         """Número esperado de extracciones por estudio"""
-        mode_map = {
-            ExtractionMode.SINGLE: 1,
-            ExtractionMode.DOUBLE: 2,
-            ExtractionMode.TRIPLE: 3,
-        }
-        return mode_map.get(self.mode, 1)
\ No newline at end of file
+        return self._EXTRACTIONS_PER_MODE.get(self.mode, 1)
\ No newline at end of file
@@ -0,0 +1,33 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+from ..value_objects.job_status import JobStatus
+
+
+@dataclass
+class Job:
+    """
+    Trabajo en segundo plano (cierre de fases, exportaciones, analítica...).
+
+    Reglas de Negocio:
+    - Un job solo lo ejecuta el worker que tiene el lease vigente
+    - Si el lease expira (worker caído) el job vuelve a ser reclamable
+    - Cada reclamo consume un intento; al agotar max_attempts queda FAILED
+    """
+    id: Optional[int]
+    kind: str
+    queue: str = 'default'
+    payload: dict = field(default_factory=dict)
+    status: JobStatus = JobStatus.QUEUED
+    attempts: int = 0
+    max_attempts: int = 3
+    run_after: Optional[datetime] = None
+    locked_by: Optional[str] = None
+    locked_until: Optional[datetime] = None
+    result: Optional[dict] = None
+    last_error: str = ""
+    created_at: Optional[datetime] = None
+
+    @property
+    def can_retry(self) -> bool:
+        return self.attempts < self.max_attempts
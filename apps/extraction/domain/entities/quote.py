@@ -4,7 +4,7 @@ from .tag import Tag
 from ..value_objects.quote_location import QuoteLocation
 
 
-@dataclass
+@dataclass(slots=True)
 class Quote:
     """
     Entidad secundaria.
@@ -16,6 +16,7 @@ class Quote:
     researcher_id: int
     tags: List[Tag] = field(default_factory=list)
     location: Optional[QuoteLocation] = None
+    project_id: Optional[int] = None
 
     def add_tag(self, tag: Tag):
         if not any(t.id == tag.id for t in self.tags):
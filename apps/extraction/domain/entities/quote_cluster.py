@@ -0,0 +1,41 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+from ..value_objects.job_status import JobStatus
+
+
+@dataclass
+class QuoteClusterRun:
+    """
+    Ejecución de agrupamiento de quotes de un proyecto (fase inductiva).
+
+    Reglas de Negocio:
+    - Solo el owner del proyecto la solicita
+    - Se procesa en segundo plano; su estado sigue al del job
+    - Sus resultados son una foto: no cambian al codificar quotes nuevas
+    """
+    id: Optional[int]
+    project_id: int
+    requested_by_user_id: int
+    k: int
+    max_tags: Optional[int] = None
+    status: JobStatus = JobStatus.QUEUED
+    quote_count: int = 0
+    cohesion: Optional[float] = None
+    error: str = ""
+    created_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+@dataclass
+class QuoteCluster:
+    run_id: int
+    label: int
+    size: int
+    top_terms: List[str] = field(default_factory=list)
+    sample_quote_ids: List[int] = field(default_factory=list)
+    tag_id: Optional[int] = None
+
+    @property
+    def suggested_tag_name(self) -> str:
+        return " / ".join(self.top_terms[:3])[:100]
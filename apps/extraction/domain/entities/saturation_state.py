@@ -0,0 +1,60 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional, Set
+
+
+@dataclass
+class SaturationPoint:
+    """Una extracción completada y los códigos que aparecieron por primera vez en ella"""
+    extraction_id: int
+    study_id: int
+    completed_at: datetime
+    new_tag_ids: List[int]
+    cumulative: int
+
+    def to_dict(self) -> dict:
+        return {
+            'extraction_id': self.extraction_id,
+            'study_id': self.study_id,
+            'completed_at': self.completed_at.isoformat(),
+            'new_tag_ids': self.new_tag_ids,
+            'new_count': len(self.new_tag_ids),
+            'cumulative': self.cumulative,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'SaturationPoint':
+        return cls(
+            extraction_id=data['extraction_id'],
+            study_id=data['study_id'],
+            completed_at=datetime.fromisoformat(data['completed_at']),
+            new_tag_ids=list(data['new_tag_ids']),
+            cumulative=data['cumulative'],
+        )
+
+
+@dataclass
+class SaturationState:
+    """
+    Estado acumulado de la curva de saturación de un proyecto.
+
+    Reglas de Negocio:
+    - Las extracciones se procesan en orden (completed_at, id); el cursor
+      guarda la última procesada para continuar desde ahí
+    - Un tag cuenta como nuevo solo la primera vez que aparece
+    - Si cambia el catálogo de tags (fusiones, borrados), la historia ya no
+      es válida y el estado se reinicia
+    """
+    project_id: int
+    tag_catalog_version: int = 0
+    seen_tag_ids: Set[int] = field(default_factory=set)
+    points: List[SaturationPoint] = field(default_factory=list)
+    last_completed_at: Optional[datetime] = None
+    last_extraction_id: int = 0
+
+    def reset(self, tag_catalog_version: int) -> None:
+        self.tag_catalog_version = tag_catalog_version
+        self.seen_tag_ids = set()
+        self.points = []
+        self.last_completed_at = None
+        self.last_extraction_id = 0
@@ -1,12 +1,12 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import ClassVar, Dict, Optional, Tuple
 
 from ..value_objects.tag_status import TagStatus
 from ..value_objects.tag_type import TagType
 from ..value_objects.tag_visibility import TagVisibility
 
 
-@dataclass
+@dataclass(slots=True)
 class Tag:
     """
     Entidad.
@@ -22,11 +22,17 @@ class Tag:
     status: TagStatus = TagStatus.PENDING
     visibility: TagVisibility = TagVisibility.PRIVATE
     type: TagType = TagType.DEDUCTIVE
+    parent_id: Optional[int] = None
+    color: str = "#FFFFFF"
+
+    # Estado y visibilidad resultantes de cada acción de moderación
+    MODERATION_OUTCOMES: ClassVar[Dict[str, Tuple[TagStatus, TagVisibility]]] = {
+        'APPROVE': (TagStatus.APPROVED, TagVisibility.PUBLIC),
+        'REJECT': (TagStatus.REJECTED, TagVisibility.PRIVATE),
+    }
 
     def approve(self):
-        self.status = TagStatus.APPROVED
-        self.visibility = TagVisibility.PUBLIC
+        self.status, self.visibility = self.MODERATION_OUTCOMES['APPROVE']
 
     def reject(self):
-        self.status = TagStatus.REJECTED
-        self.visibility = TagVisibility.PRIVATE
\ No newline at end of file
+        self.status, self.visibility = self.MODERATION_OUTCOMES['REJECT']
\ No newline at end of file
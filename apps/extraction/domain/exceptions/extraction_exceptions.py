@@ -32,4 +32,12 @@ class ProjectAccessDenied(ExtractionException):
 
 class QuoteValidationError(ExtractionException):
     """Error de validación en quotes."""
-    pass
\ No newline at end of file
+    pass
+
+class DuplicateQuote(ExtractionValidationError):
+    """Error cuando la quote es casi idéntica a otra ya guardada en la extracción."""
+    pass
+
+class InvalidTagHierarchy(ExtractionValidationError):
+    """Error cuando un movimiento dejaría la jerarquía de tags con ciclos o entre proyectos."""
+    pass
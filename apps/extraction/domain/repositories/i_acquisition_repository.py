@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 
 class IAcquisitionRepository(ABC):
@@ -18,4 +18,8 @@ class IAcquisitionRepository(ABC):
 
     @abstractmethod
     def get_project_context(self, study_id: int) -> Optional[int]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def get_study_ids_by_project(self, project_id: int) -> List[int]:
+        pass
@@ -0,0 +1,65 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Iterator, List, Optional
+from ..dtos.analytics_dtos import PageTagLinksDTO, QuoteSetFingerprintDTO, QuoteTagIncidenceDTO, QuoteTextBatchDTO, StudyTagCellsDTO, TagCatalogEntryDTO
+
+
+class IAnalyticsRepository(ABC):
+    """
+    Puerto de lectura masiva para analítica de proyecto.
+    Retorna datos tabulares (arrays), no agregados de dominio.
+    """
+
+    @abstractmethod
+    def get_quote_tag_incidence(self, project_id: int) -> QuoteTagIncidenceDTO:
+        """Todos los enlaces quote-tag del proyecto, con extracción y estudio"""
+        pass
+
+    @abstractmethod
+    def get_tag_names(self, project_id: int) -> Dict[int, str]:
+        pass
+
+    @abstractmethod
+    def get_tag_parents(self, project_id: int) -> Dict[int, Optional[int]]:
+        """Padre de cada tag del proyecto (None para las raíces)"""
+        pass
+
+    @abstractmethod
+    def get_tag_catalog(self, project_id: int) -> List[TagCatalogEntryDTO]:
+        """Tags del proyecto con tipo, estado y número de quotes"""
+        pass
+
+
+    @abstractmethod
+    def get_study_tag_cells(self, project_id: int) -> StudyTagCellsDTO:
+        """Número de quotes por (estudio, tag) en una sola consulta agrupada"""
+        pass
+
+    @abstractmethod
+    def get_quote_snippets(self, quote_ids: Iterable[int], length: int = 200) -> Dict[int, str]:
+        """Primeros `length` caracteres del texto de cada quote"""
+        pass
+
+    @abstractmethod
+    def iter_quote_text_batches(
+            self,
+            project_id: int,
+            after_quote_id: int = 0,
+            chunk_size: int = 2000
+    ) -> Iterator[QuoteTextBatchDTO]:
+        """Quotes del proyecto con id > after_quote_id, por lotes y en orden de id"""
+        pass
+
+    @abstractmethod
+    def get_quote_set_fingerprint(self, project_id: int, up_to_quote_id: int) -> QuoteSetFingerprintDTO:
+        """Huella de las quotes del proyecto con id <= up_to_quote_id"""
+        pass
+
+    @abstractmethod
+    def get_extraction_versions(self, project_id: int, study_id: Optional[int] = None) -> Dict[int, int]:
+        """Versión actual de cada extracción del proyecto (opcionalmente de un estudio)"""
+        pass
+
+    @abstractmethod
+    def get_page_tag_links(self, project_id: int, extraction_ids: Iterable[int]) -> PageTagLinksDTO:
+        """Enlaces quote-tag de las extracciones indicadas con la página de cada quote"""
+        pass
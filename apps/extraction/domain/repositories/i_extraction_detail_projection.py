@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+from ..dtos.extraction_detail_dtos import ExtractionDetailDocumentDTO
+
+
+class IExtractionDetailProjection(ABC):
+    """
+    Puerto del modelo de lectura del detalle de extracciones.
+
+    Las escrituras piden refresh() y el documento se regenera cuando la
+    transacción confirma; la lectura es un solo acceso por clave primaria.
+    """
+
+    @abstractmethod
+    def get(self, extraction_id: int) -> Optional[ExtractionDetailDocumentDTO]:
+        """Documento guardado, o None si todavía no se proyectó"""
+        pass
+
+    @abstractmethod
+    def render(self, extraction_id: int) -> Optional[ExtractionDetailDocumentDTO]:
+        """Renderiza y guarda el documento ahora (lectura sin proyección previa)"""
+        pass
+
+    @abstractmethod
+    def refresh(self, extraction_ids: Iterable[int]) -> None:
+        """Regenera los documentos indicados al confirmar la transacción en curso"""
+        pass
+
+    @abstractmethod
+    def refresh_by_tags(self, tag_ids: Iterable[int]) -> None:
+        """Regenera las extracciones con quotes que usan alguno de los tags"""
+        pass
+
+    @abstractmethod
+    def rebuild(self, project_id: int = None, chunk_size: int = 500) -> int:
+        """Reproyecta todas las extracciones (o las de un proyecto). Retorna cuántas."""
+        pass
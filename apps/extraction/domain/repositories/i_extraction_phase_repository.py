@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from ..entities.extraction_phase import ExtractionPhase
 
 
@@ -7,8 +8,11 @@ class IExtractionPhaseRepository(ABC):
     """Puerto para gestionar la configuración de la fase de extracción"""
 
     @abstractmethod
-    def get_by_project_id(self, project_id: int) -> Optional[ExtractionPhase]:
-        """Obtiene la fase de extracción de un proyecto"""
+    def get_by_project_id(self, project_id: int, for_update: bool = False) -> Optional[ExtractionPhase]:
+        """
+        Obtiene la fase de extracción de un proyecto.
+        Con for_update bloquea la fila hasta el fin de la transacción (cerrojo por proyecto).
+        """
         pass
 
     @abstractmethod
@@ -22,4 +26,25 @@ class IExtractionPhaseRepository(ABC):
         Obtiene fases activas con auto_close que ya pasaron end_date.
         Útil para un job periódico.
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def close_expired_phases(self, now: datetime, batch_size: int = 500) -> List[int]:
+        """
+        Cierra (AUTO_CLOSED) en bloque las fases activas con auto_close cuyo
+        end_date ya pasó. Un UPDATE por lote. Retorna los project_id cerrados.
+        """
+        pass
+
+    @abstractmethod
+    def list_closed_project_ids(self, closed_before: datetime) -> List[int]:
+        """Proyectos cuya fase está cerrada (COMPLETED o AUTO_CLOSED) desde antes de `closed_before`"""
+        pass
+
+    @abstractmethod
+    def get_upcoming_deadlines(self, until: datetime) -> List[Tuple[datetime, int]]:
+        """
+        Retorna (end_date, project_id) de las fases activas con auto_close
+        cuyo cierre ocurre antes de `until`. Alimenta el scheduler.
+        """
+        pass
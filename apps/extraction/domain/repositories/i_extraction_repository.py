@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List, Tuple
+from ..dtos.assignment_dtos import ExtractionSlotDTO
 from ..entities.extraction import Extraction
 
 
@@ -31,6 +32,62 @@ class IExtractionRepository(ABC):
         """Persiste la entidad y retorna la versión actualizada (con ID)"""
         pass
 
+    @abstractmethod
+    def delete(self, extraction_id: int) -> None:
+        """Elimina la extracción con sus quotes"""
+        pass
+
     @abstractmethod
     def list_by_user(self, user_id: int, include_quotes: bool = False) -> List[Extraction]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def get_slots_by_studies(self, study_ids: Iterable[int]) -> List[ExtractionSlotDTO]:
+        """Extracciones de los estudios, sin quotes: solo quién, qué orden y si sigue abierta"""
+        pass
+
+    @abstractmethod
+    def bulk_create(self, extractions: List[Extraction]) -> int:
+        """Inserta todas las extracciones en un único bulk_create"""
+        pass
+
+    @abstractmethod
+    def reassign(self, moves: Dict[int, int]) -> int:
+        """Cambia el codificador asignado: {extraction_id: user_id}"""
+        pass
+
+    @abstractmethod
+    def fill_vacant(self, moves: Dict[int, int]) -> int:
+        """Asigna cupos vacantes {extraction_id: user_id}; ignora los que ya se ocuparon"""
+        pass
+
+    @abstractmethod
+    def claim_vacant(self, study_ids: Iterable[int], user_id: int) -> Optional[Extraction]:
+        """
+        Reserva para el usuario el siguiente cupo vacante de esos estudios
+        (uno donde todavía no tenga extracción). None si no queda ninguno.
+        """
+        pass
+
+    @abstractmethod
+    def count_assigned_by_study(self, study_id: int) -> int:
+        """Extracciones con codificador del estudio (un COUNT, sin hidratar quotes)"""
+        pass
+
+    @abstractmethod
+    def has_user_extraction(self, study_id: int, user_id: int) -> bool:
+        pass
+
+    @abstractmethod
+    def insert_in_free_slot(self, extraction: Extraction, capacity: int) -> Optional[Extraction]:
+        """
+        Inserta la extracción en el primer extraction_order libre de 1..capacity.
+        Si otra alta gana ese cupo, reintenta con el siguiente. None si el
+        estudio se llenó o el usuario ya tiene una extracción en él.
+        """
+        pass
+
+    @abstractmethod
+    def get_version_stamps(self, extraction_ids: Iterable[int]) -> Dict[int, Tuple[int, int]]:
+        """{extraction_id: (study_id, version)} sin cargar quotes (claves de caché)"""
+        pass
@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, List
+
+
+class IExtractionSnapshotRepository(ABC):
+    """
+    Puerto de los snapshots comprimidos de extracciones congeladas.
+
+    Una extracción se congela al completarse y, en bloque, cuando la fase del
+    proyecto cierra. Mientras no vuelva a cambiar, sus lecturas salen del
+    snapshot; archivada, el snapshot es la única copia de sus quotes.
+    """
+
+    @abstractmethod
+    def capture(self, extraction_ids: Iterable[int]) -> int:
+        """
+        Escribe (o reescribe, si la extracción cambió) el snapshot de cada
+        extracción. Las archivadas no se tocan. Retorna cuántos se escribieron.
+        """
+        pass
+
+    @abstractmethod
+    def capture_project(self, project_id: int, chunk_size: int = 500) -> int:
+        """Congela todas las extracciones del proyecto que no tengan snapshot vigente"""
+        pass
+
+    @abstractmethod
+    def archive_project(self, project_id: int, chunk_size: int = 500) -> List[int]:
+        """
+        Saca de las tablas calientes las quotes de un proyecto ya congelado.
+        Retorna los ids de las quotes archivadas (para limpiar índices).
+        """
+        pass
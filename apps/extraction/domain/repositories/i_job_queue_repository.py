@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional, Sequence
+from ..entities.job import Job
+
+
+class IJobQueueRepository(ABC):
+    """Puerto para la cola persistente de trabajos en segundo plano"""
+
+    @abstractmethod
+    def enqueue(
+            self,
+            kind: str,
+            payload: Optional[dict] = None,
+            queue: str = 'default',
+            run_after: Optional[datetime] = None,
+            max_attempts: int = 3,
+            dedupe_key: Optional[str] = None
+    ) -> Job:
+        """
+        Encola un trabajo. Si se indica dedupe_key y ya existe un job
+        pendiente o en ejecución con esa clave, retorna el existente.
+        """
+        pass
+
+    @abstractmethod
+    def claim(
+            self,
+            worker_id: str,
+            queues: Sequence[str],
+            limit: int = 1,
+            lease_seconds: int = 300
+    ) -> List[Job]:
+        """
+        Reclama hasta `limit` jobs listos (o con lease expirado) para el worker.
+        Dos workers nunca reciben el mismo job.
+        """
+        pass
+
+    @abstractmethod
+    def complete(self, job_id: int, worker_id: str, result: Optional[dict] = None) -> bool:
+        """Marca el job como terminado si el worker aún posee el lease"""
+        pass
+
+    @abstractmethod
+    def fail(self, job_id: int, worker_id: str, error: str, retry_delay_seconds: int = 30) -> bool:
+        """Registra el fallo y reprograma el job si le quedan intentos"""
+        pass
+
+    @abstractmethod
+    def get_by_id(self, job_id: int) -> Optional[Job]:
+        pass
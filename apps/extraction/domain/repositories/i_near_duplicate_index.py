@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional
+from ..dtos.near_duplicate_dtos import NearDuplicateClusterDTO, NearDuplicateMatchDTO
+
+
+class INearDuplicateIndex(ABC):
+    """Puerto del índice MinHash/LSH de quotes casi duplicadas, por proyecto"""
+
+    @abstractmethod
+    def index_quotes(self, project_id: int, quote_ids: Iterable[int]) -> None:
+        """(Re)calcula firma y buckets LSH de las quotes indicadas"""
+        pass
+
+    @abstractmethod
+    def find_similar(
+            self,
+            project_id: int,
+            text: str,
+            threshold: float,
+            extraction_id: Optional[int] = None
+    ) -> List[NearDuplicateMatchDTO]:
+        """Quotes cuya similitud estimada con `text` supera el umbral (mayor primero)"""
+        pass
+
+    @abstractmethod
+    def find_clusters(self, project_id: int, threshold: float) -> List[NearDuplicateClusterDTO]:
+        """Agrupa las quotes casi duplicadas de todo el proyecto"""
+        pass
+
+    @abstractmethod
+    def rebuild(self, project_id: int, chunk_size: int = 2000) -> int:
+        """Recalcula el índice del proyecto. Retorna quotes indexadas."""
+        pass
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from typing import Iterable
+from ..dtos.analytics_dtos import ProjectVersionsDTO
+
+
+class IProjectVersionRepository(ABC):
+    """Puerto para los contadores de versión de datos por proyecto"""
+
+    @abstractmethod
+    def get(self, project_id: int) -> ProjectVersionsDTO:
+        pass
+
+    @abstractmethod
+    def bump_tag_catalog(self, project_ids: Iterable[int]) -> None:
+        pass
+
+    @abstractmethod
+    def bump_coding(self, project_ids: Iterable[int]) -> None:
+        pass
@@ -0,0 +1,49 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from ..dtos.clustering_dtos import ClusteringResultDTO
+from ..entities.quote_cluster import QuoteCluster, QuoteClusterRun
+
+
+class IQuoteClusterRepository(ABC):
+
+    @abstractmethod
+    def create_run(self, run: QuoteClusterRun) -> QuoteClusterRun:
+        pass
+
+    @abstractmethod
+    def get_run(self, run_id: int) -> Optional[QuoteClusterRun]:
+        pass
+
+    @abstractmethod
+    def list_runs(self, project_id: int, limit: int = 20) -> List[QuoteClusterRun]:
+        pass
+
+    @abstractmethod
+    def mark_running(self, run_id: int) -> None:
+        pass
+
+    @abstractmethod
+    def mark_failed(self, run_id: int, error: str) -> None:
+        pass
+
+    @abstractmethod
+    def save_results(self, run_id: int, result: ClusteringResultDTO) -> None:
+        """Reemplaza clusters y asignaciones de la ejecución y la marca terminada"""
+        pass
+
+    @abstractmethod
+    def get_clusters(self, run_id: int) -> List[QuoteCluster]:
+        pass
+
+    @abstractmethod
+    def get_cluster(self, run_id: int, label: int) -> Optional[QuoteCluster]:
+        pass
+
+    @abstractmethod
+    def get_cluster_quotes(self, run_id: int, label: int, limit: int = 50, offset: int = 0) -> List[dict]:
+        """Quotes del cluster (id, texto, similitud), de la más central a la menos"""
+        pass
+
+    @abstractmethod
+    def set_cluster_tag(self, run_id: int, label: int, tag_id: int) -> None:
+        pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 from ..entities.quote import Quote
 
 class IQuoteRepository(ABC):
@@ -7,6 +7,11 @@ class IQuoteRepository(ABC):
     def save(self, quote: Quote) -> Quote:
         pass
 
+    @abstractmethod
+    def bulk_create(self, quotes: List[Quote]) -> int:
+        """Inserta muchas quotes con sus tags (un INSERT por tabla)"""
+        pass
+
     @abstractmethod
     def get_by_id(self, quote_id: int) -> Optional[Quote]:
         pass
@@ -16,6 +21,19 @@ class IQuoteRepository(ABC):
         """Necesario para el TagMergeService"""
         pass
 
+    @abstractmethod
+    def get_by_tag_subtree(self, tag_id: int, offset: int = 0, limit: int = 50) -> Tuple[int, List[Quote]]:
+        """Quotes codificadas con el tag o cualquiera de sus descendientes (total, página)"""
+        pass
+
     @abstractmethod
     def delete(self, quote_id: int) -> None:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def iter_export_rows_by_project(self, project_id: int, chunk_size: int = 2000) -> Iterator[dict]:
+        """
+        Recorre todas las quotes codificadas de un proyecto como filas planas
+        (una por quote, con sus tags), en memoria constante.
+        """
+        pass
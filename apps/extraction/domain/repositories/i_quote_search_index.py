@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, List
+from ..dtos.search_dtos import QuoteSearchFilters, QuoteSearchHitDTO
+
+
+class IQuoteSearchIndex(ABC):
+    """Puerto del índice de búsqueda de texto completo sobre las quotes"""
+
+    @abstractmethod
+    def index_quotes(self, quote_ids: Iterable[int]) -> None:
+        """(Re)indexa las quotes indicadas leyendo su texto actual"""
+        pass
+
+    @abstractmethod
+    def remove_quotes(self, quote_ids: Iterable[int]) -> None:
+        pass
+
+    @abstractmethod
+    def search(
+            self,
+            text: str,
+            filters: QuoteSearchFilters,
+            limit: int = 20,
+            offset: int = 0
+    ) -> List[QuoteSearchHitDTO]:
+        """Búsqueda rankeada, insensible a tildes, con fragmentos resaltados"""
+        pass
+
+    @abstractmethod
+    def rebuild(self, project_id: int = None, chunk_size: int = 2000) -> int:
+        """Reconstruye el índice (completo o de un proyecto). Retorna quotes indexadas."""
+        pass
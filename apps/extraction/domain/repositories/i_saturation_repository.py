@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Iterator, Optional
+from ..entities.saturation_state import SaturationState
+from ..services.saturation import CompletedExtractionRow
+
+
+class ISaturationRepository(ABC):
+
+    @abstractmethod
+    def get_state_for_update(self, project_id: int) -> SaturationState:
+        """Estado del proyecto (vacío si no existe), bloqueado hasta el fin de la transacción"""
+        pass
+
+    @abstractmethod
+    def save_state(self, state: SaturationState) -> None:
+        pass
+
+    @abstractmethod
+    def iter_completed_extractions(
+            self,
+            project_id: int,
+            after_completed_at: Optional[datetime],
+            after_extraction_id: int,
+            batch_size: int = 500
+    ) -> Iterator[CompletedExtractionRow]:
+        """Extracciones completadas posteriores al cursor, en orden (completed_at, id), con sus tags"""
+        pass
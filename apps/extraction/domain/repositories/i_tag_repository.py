@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterable, List, Optional, Set
+from ..dtos.tag_dtos import TagModerationItemDTO, TagSuggestionDTO, TagTreeNodeDTO
+from ..value_objects.tag_status import TagStatus
+from ..value_objects.tag_visibility import TagVisibility
 from ..entities.tag import Tag
 
 
@@ -28,10 +31,74 @@ class ITagRepository(ABC):
         """Retorna tags públicos del proyecto + tags privados del usuario."""
         pass
 
+    @abstractmethod
+    def list_suggestions(self, project_id: int, user_id: Optional[int] = None) -> List[TagSuggestionDTO]:
+        """
+        Tags para autocompletar, con su número de quotes.
+        Sin user_id: los públicos aprobados. Con user_id: los propios aún no
+        públicos (pendientes incluidos, que su creador ya puede usar).
+        """
+        pass
+
+    @abstractmethod
+    def list_by_project(self, project_id: int) -> List[Tag]:
+        """Todo el catálogo del proyecto, sin filtrar por estado ni visibilidad"""
+        pass
+
+    @abstractmethod
+    def bulk_create(self, tags: List[Tag]) -> List[Tag]:
+        """
+        Inserta tags nuevos en lote (con su jerarquía). Los padres deben
+        existir ya: para un árbol, se llama una vez por nivel.
+        """
+        pass
+
+    @abstractmethod
+    def set_moderation(
+            self,
+            tag_ids: List[int],
+            status: TagStatus,
+            visibility: TagVisibility,
+            project_ids: Iterable[int]
+    ) -> int:
+        """Cambia estado y visibilidad de todos los tags con un solo UPDATE. Retorna las filas afectadas."""
+        pass
+
+    @abstractmethod
+    def list_pending(self, project_id: int, after_id: int = 0, limit: int = 50) -> List[TagModerationItemDTO]:
+        """Tags pendientes del proyecto en orden de id, a partir de after_id (paginación por cursor)"""
+        pass
+
+    @abstractmethod
+    def count_pending(self, project_id: int) -> int:
+        pass
+
     @abstractmethod
     def save(self, tag: Tag) -> Tag:
+        """Al crear, ubica el tag bajo parent_id. La jerarquía solo cambia con move()."""
         pass
 
     @abstractmethod
     def delete(self, tag: Tag) -> None:
+        """Elimina el tag; sus hijos pasan a colgar de su padre"""
+        pass
+
+    @abstractmethod
+    def get_subtree_ids(self, tag_id: int) -> List[int]:
+        """El tag y todos sus descendientes"""
+        pass
+
+    @abstractmethod
+    def get_ancestor_ids(self, tag_ids: Iterable[int]) -> Set[int]:
+        """Los tags indicados y todos sus ancestros"""
+        pass
+
+    @abstractmethod
+    def get_subtree(self, tag_id: int) -> List[TagTreeNodeDTO]:
+        """Subárbol del tag con conteos de quotes acumulados por nodo"""
+        pass
+
+    @abstractmethod
+    def move(self, tag: Tag, new_parent_id: Optional[int]) -> None:
+        """Cuelga el tag (con todo su subárbol) de new_parent_id, o lo vuelve raíz"""
         pass
\ No newline at end of file
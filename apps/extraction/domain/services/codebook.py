@@ -0,0 +1,96 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..dtos.codebook_dtos import CodebookEntryDTO
+from ..exceptions.extraction_exceptions import ExtractionValidationError
+
+MAX_TAG_NAME_LENGTH = 100
+PATH_SEPARATOR = ' > '
+
+
+def path_key(path: Iterable[str]) -> Tuple[str, ...]:
+    """Clave de comparación: sin distinguir mayúsculas ni espacios repetidos"""
+    return tuple(' '.join(name.split()).casefold() for name in path)
+
+
+@dataclass
+class PlannedTag:
+    path: Tuple[str, ...]
+    is_mandatory: bool = False
+    question_id: Optional[int] = None
+
+    @property
+    def name(self) -> str:
+        return self.path[-1]
+
+    @property
+    def parent_key(self) -> Optional[Tuple[str, ...]]:
+        return path_key(self.path[:-1]) if len(self.path) > 1 else None
+
+
+class CodebookPlanner:
+    """
+    Convierte las entradas de un libro de códigos en los tags a crear,
+    agrupados por nivel para insertarlos padre antes que hijo.
+
+    Reglas de Negocio:
+    - Los temas intermedios que no aparecen como entrada se crean igual
+    - Un código que ya existe en el proyecto (misma ruta) no se duplica
+    - Una ruta repetida en el archivo es un error
+    """
+
+    def plan(
+            self,
+            entries: Iterable[CodebookEntryDTO],
+            existing_paths: Dict[Tuple[str, ...], int]
+    ) -> Tuple[List[List[PlannedTag]], int]:
+        """Retorna (niveles de tags nuevos, cantidad de entradas que ya existían)"""
+        planned: Dict[Tuple[str, ...], PlannedTag] = {}
+        explicit = set()
+        already = 0
+
+        for entry in entries:
+            path = tuple(' '.join(name.split()) for name in entry.path)
+            self._validate(path)
+            key = path_key(path)
+
+            if key in explicit:
+                raise ExtractionValidationError(
+                    f"El código '{PATH_SEPARATOR.join(path)}' está repetido en el libro de códigos"
+                )
+            explicit.add(key)
+
+            if key in existing_paths:
+                already += 1
+                continue
+
+            # Temas intermedios implícitos
+            for depth in range(1, len(path)):
+                prefix = path[:depth]
+                prefix_key = path_key(prefix)
+                if prefix_key not in existing_paths and prefix_key not in planned:
+                    planned[prefix_key] = PlannedTag(path=prefix)
+
+            tag = planned.setdefault(key, PlannedTag(path=path))
+            tag.is_mandatory = entry.is_mandatory
+            tag.question_id = entry.question_id
+
+        levels: List[List[PlannedTag]] = []
+        for tag in planned.values():
+            while len(levels) < len(tag.path):
+                levels.append([])
+            levels[len(tag.path) - 1].append(tag)
+
+        return [level for level in levels if level], already
+
+    @staticmethod
+    def _validate(path: Tuple[str, ...]) -> None:
+        if not path or any(not name for name in path):
+            raise ExtractionValidationError(
+                f"Ruta de código inválida: '{PATH_SEPARATOR.join(path)}'"
+            )
+        for name in path:
+            if len(name) > MAX_TAG_NAME_LENGTH:
+                raise ExtractionValidationError(
+                    f"El nombre '{name[:30]}...' supera los {MAX_TAG_NAME_LENGTH} caracteres"
+                )
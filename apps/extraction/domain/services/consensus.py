@@ -0,0 +1,231 @@
+import heapq
+import math
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
+
+from ..dtos.consensus_dtos import ConsensusItemDTO
+from ..entities.extraction import Extraction
+from ..entities.quote import Quote
+from ..value_objects.consensus_status import ConsensusStatus
+from .text_normalization import char_ngrams
+
+
+@dataclass(frozen=True)
+class _Span:
+    """Una quote preparada para alinear: rectángulo normalizado y shingles"""
+    index: int
+    extraction_id: int
+    quote: Quote
+    top: float
+    bottom: float
+    rect: Optional[Tuple[float, float, float, float]]
+    shingles: FrozenSet[str]
+
+
+class ConsensusBuilder:
+    """
+    Alinea las quotes de las extracciones de un mismo estudio.
+
+    Dos quotes de extracciones distintas se consideran la misma cita si están
+    en la misma página y sus rectángulos se solapan lo suficiente (IoU) o, sin
+    coordenadas, si sus textos se contienen en gran parte (shingles de
+    caracteres). Por página, las quotes con rectángulo se comparan con un
+    barrido vertical: solo los pares cuyo intervalo [y1, y2] se cruza, así el
+    costo es O(n log n + k) con k pares candidatos, no O(n²). Los pares en los
+    que alguna quote no tiene rectángulo salen de un índice invertido de
+    shingles con filtrado por prefijo (como TrigramTagIndex).
+
+    Los pares se unen de mayor a menor puntaje con la condición de que cada
+    grupo tenga a lo sumo una quote por extracción.
+    """
+
+    def __init__(self, min_overlap: float = 0.3, min_text_similarity: float = 0.6, shingle_size: int = 3):
+        self.min_overlap = min_overlap
+        self.min_text_similarity = min_text_similarity
+        self.shingle_size = shingle_size
+
+    def align(self, extractions: Sequence[Extraction]) -> List[ConsensusItemDTO]:
+        ordered = sorted(extractions, key=lambda e: (e.extraction_order, e.id))
+        spans = [
+            self._span(len_before + i, extraction.id, quote)
+            for len_before, extraction in self._offsets(ordered)
+            for i, quote in enumerate(extraction.quotes)
+        ]
+
+        by_page: Dict[Optional[int], List[_Span]] = defaultdict(list)
+        for span in spans:
+            by_page[span.quote.page_number].append(span)
+
+        edges: List[Tuple[float, int, int]] = []
+        for page_spans in by_page.values():
+            edges.extend(self._candidate_edges([s for s in page_spans if s.rect]))
+            edges.extend(self._text_edges(page_spans))
+
+        groups = self._group(spans, edges)
+        rank = {e.id: position for position, e in enumerate(ordered)}
+        items = [self._item(members, len(ordered), rank, score) for members, score in groups]
+        items.sort(key=lambda item: (item.page is None, item.page or 0, -item.score))
+        return items
+
+    @staticmethod
+    def _offsets(extractions: Sequence[Extraction]):
+        offset = 0
+        for extraction in extractions:
+            yield offset, extraction
+            offset += len(extraction.quotes)
+
+    def _span(self, index: int, extraction_id: int, quote: Quote) -> _Span:
+        rect = None
+        top, bottom = -math.inf, math.inf
+        location = quote.location
+        if location and location.has_coordinates:
+            x1, x2 = sorted((location.x1, location.x2))
+            y1, y2 = sorted((location.y1, location.y2))
+            rect = (x1, y1, x2, y2)
+            top, bottom = y1, y2
+        return _Span(
+            index=index,
+            extraction_id=extraction_id,
+            quote=quote,
+            top=top,
+            bottom=bottom,
+            rect=rect,
+            shingles=frozenset(char_ngrams(quote.text, self.shingle_size))
+        )
+
+    def _candidate_edges(self, spans: List[_Span]) -> List[Tuple[float, int, int]]:
+        """Barrido por y1: el heap guarda las quotes activas ordenadas por y2"""
+        edges = []
+        active: List[Tuple[float, int, _Span]] = []
+        for span in sorted(spans, key=lambda s: (s.top, s.index)):
+            while active and active[0][0] < span.top:
+                heapq.heappop(active)
+
+            for _, _, other in active:
+                if other.extraction_id == span.extraction_id:
+                    continue
+                score = self._score(span, other)
+                if score is not None:
+                    edges.append((score, other.index, span.index))
+
+            heapq.heappush(active, (span.bottom, span.index, span))
+        return edges
+
+    def _text_edges(self, spans: List[_Span]) -> List[Tuple[float, int, int]]:
+        """
+        Pares con alguna quote sin rectángulo: solo pueden unirse por texto.
+
+        Si la contención supera t, la quote más corta comparte con la otra al
+        menos ceil(t·|A|) shingles, así que alguno de sus primeros
+        |A| - ceil(t·|A|) + 1 shingles (de menos a más frecuente) es común.
+        Cada quote recorre solo las listas de ese prefijo.
+        """
+        if all(span.rect for span in spans):
+            return []
+
+        postings: Dict[str, List[int]] = defaultdict(list)
+        for position, span in enumerate(spans):
+            for gram in span.shingles:
+                postings[gram].append(position)
+
+        threshold = self.min_text_similarity
+        candidates: List[Set[int]] = []
+        for span in spans:
+            ordered = sorted(span.shingles, key=lambda g: (len(postings[g]), g))
+            prefix = len(ordered) - math.ceil(threshold * len(ordered)) + 1
+            candidates.append(set().union(*(postings[g] for g in ordered[:max(prefix, 1)])))
+
+        edges = []
+        for position, span in enumerate(spans):
+            for other_position in candidates[position]:
+                # Un par alcanzado desde ambos prefijos se evalúa una sola vez
+                if other_position < position and position in candidates[other_position]:
+                    continue
+                other = spans[other_position]
+                if other.extraction_id == span.extraction_id or (span.rect and other.rect):
+                    continue
+                score = self._score(span, other)
+                if score is not None:
+                    edges.append((score, min(span.index, other.index), max(span.index, other.index)))
+        return edges
+
+    def _score(self, a: _Span, b: _Span) -> Optional[float]:
+        overlap = self._iou(a.rect, b.rect) if a.rect and b.rect else 0.0
+        text = self._containment(a.shingles, b.shingles)
+        if overlap >= self.min_overlap or text >= self.min_text_similarity:
+            return max(overlap, text)
+        return None
+
+    @staticmethod
+    def _iou(a: Tuple[float, ...], b: Tuple[float, ...]) -> float:
+        width = min(a[2], b[2]) - max(a[0], b[0])
+        height = min(a[3], b[3]) - max(a[1], b[1])
+        if width <= 0 or height <= 0:
+            return 0.0
+        intersection = width * height
+        union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - intersection
+        return intersection / union if union > 0 else 0.0
+
+    @staticmethod
+    def _containment(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+        """Fracción del texto más corto contenida en el otro (selecciones de distinto largo)"""
+        if not a or not b:
+            return 0.0
+        return len(a & b) / min(len(a), len(b))
+
+    @staticmethod
+    def _group(
+            spans: List[_Span],
+            edges: List[Tuple[float, int, int]]
+    ) -> List[Tuple[List[_Span], float]]:
+        group_of = list(range(len(spans)))
+        members: Dict[int, List[_Span]] = {s.index: [s] for s in spans}
+        extraction_ids: Dict[int, set] = {s.index: {s.extraction_id} for s in spans}
+        scores: Dict[int, float] = {s.index: 1.0 for s in spans}
+
+        for score, a, b in sorted(edges, key=lambda e: (-e[0], e[1], e[2])):
+            ga, gb = group_of[a], group_of[b]
+            if ga == gb or extraction_ids[ga] & extraction_ids[gb]:
+                continue
+            if len(members[ga]) < len(members[gb]):
+                ga, gb = gb, ga
+            for span in members[gb]:
+                group_of[span.index] = ga
+            members[ga].extend(members.pop(gb))
+            extraction_ids[ga] |= extraction_ids.pop(gb)
+            # Puntaje del grupo: el enlace más débil que lo formó
+            scores[ga] = min(scores[ga], scores.pop(gb), score)
+
+        return [(group, scores[root]) for root, group in members.items()]
+
+    @staticmethod
+    def _item(
+            members: List[_Span],
+            extraction_count: int,
+            rank: Dict[int, int],
+            score: float
+    ) -> ConsensusItemDTO:
+        members = sorted(members, key=lambda s: rank[s.extraction_id])
+        tag_sets = [{t.id for t in s.quote.tags} for s in members]
+        # Una quote sin par no tiene tags acordados: todos quedan por revisar
+        agreed = set.intersection(*tag_sets) if len(members) > 1 else set()
+        disputed = set.union(*tag_sets) - agreed
+
+        if len(members) == 1:
+            status = ConsensusStatus.UNIQUE
+        elif len(members) == extraction_count and not disputed:
+            status = ConsensusStatus.AGREED
+        else:
+            status = ConsensusStatus.CONFLICTING
+
+        representative = members[0].quote
+        return ConsensusItemDTO(
+            status=status,
+            page=representative.page_number,
+            text=representative.text,
+            quote_ids={s.extraction_id: s.quote.id for s in members},
+            agreed_tag_ids=sorted(agreed),
+            disputed_tag_ids=sorted(disputed),
+            score=score
+        )
@@ -0,0 +1,61 @@
+from typing import Dict, List
+
+from ..dtos.consensus_dtos import ExtractionDiffDTO
+from ..entities.extraction import Extraction
+from ..entities.quote import Quote
+from .consensus import ConsensusBuilder
+
+
+class ExtractionDiffer:
+    """
+    Compara dos extracciones de un estudio lado a lado.
+
+    El emparejamiento de quotes es el mismo de ConsensusBuilder (por página,
+    barrido vertical y solapamiento/texto); aquí solo se traduce a a -> b:
+    quotes emparejadas con los tags que difieren y quotes de un solo lado.
+    """
+
+    def __init__(self, builder: ConsensusBuilder = None):
+        self.builder = builder or ConsensusBuilder()
+
+    def diff(self, a: Extraction, b: Extraction) -> ExtractionDiffDTO:
+        quotes: Dict[int, Quote] = {q.id: q for q in a.quotes + b.quotes}
+        result = ExtractionDiffDTO(study_id=a.study_id, a=a.id, b=b.id)
+
+        for item in self.builder.align([a, b]):
+            quote_a = quotes.get(item.quote_ids.get(a.id))
+            quote_b = quotes.get(item.quote_ids.get(b.id))
+            if quote_a and quote_b:
+                result.matched.append(self._matched(quote_a, quote_b, item.score))
+            elif quote_a:
+                result.only_a.append(self._quote(quote_a))
+            else:
+                result.only_b.append(self._quote(quote_b))
+        return result
+
+    def _matched(self, quote_a: Quote, quote_b: Quote, score: float) -> dict:
+        tags_a = {t.id: t.name for t in quote_a.tags}
+        tags_b = {t.id: t.name for t in quote_b.tags}
+        return {
+            'page': quote_a.page_number,
+            'score': round(score, 4),
+            'a': self._quote(quote_a),
+            'b': self._quote(quote_b),
+            'tags_common': self._tags(tags_a, tags_a.keys() & tags_b.keys()),
+            'tags_only_a': self._tags(tags_a, tags_a.keys() - tags_b.keys()),
+            'tags_only_b': self._tags(tags_b, tags_b.keys() - tags_a.keys()),
+        }
+
+    @staticmethod
+    def _quote(quote: Quote) -> dict:
+        return {
+            'quote_id': quote.id,
+            'page': quote.page_number,
+            'text': quote.text,
+            'location': quote.location.to_dict() if quote.location else None,
+            'tag_ids': sorted(t.id for t in quote.tags),
+        }
+
+    @staticmethod
+    def _tags(names: Dict[int, str], ids) -> List[dict]:
+        return [{'id': tag_id, 'name': names[tag_id]} for tag_id in sorted(ids)]
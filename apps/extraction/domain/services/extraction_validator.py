@@ -14,8 +14,11 @@ class ExtractionValidator:
         """
         mandatory_tags = self.tag_repository.get_mandatory_tags_for_project_context(extraction.study_id)
 
-        # Obtener IDs de tags usados en las quotes de esta extracción
-        used_tag_ids = {tag.id for quote in extraction.quotes for tag in quote.tags}
+        # Obtener IDs de tags usados en las quotes de esta extracción. Un tema
+        # obligatorio queda cubierto si se usó cualquier código de su subárbol.
+        used_tag_ids = self.tag_repository.get_ancestor_ids(
+            {tag.id for quote in extraction.quotes for tag in quote.tags}
+        )
 
         missing_tags = []
         for mandatory in mandatory_tags:
@@ -0,0 +1,101 @@
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from ..dtos.analytics_dtos import StudyTagCellsDTO
+
+
+@dataclass
+class FrameworkMatrix:
+    """
+    Matriz de síntesis cualitativa: una fila por estudio, una columna por tag.
+    counts[i, j] = quotes del estudio i codificadas con el tag j.
+    sample_quote_ids[i, j] = quote de ejemplo de la celda (0 si está vacía).
+    """
+    study_ids: np.ndarray
+    tag_ids: np.ndarray
+    tag_names: List[str]
+    counts: np.ndarray
+    sample_quote_ids: np.ndarray
+
+    @property
+    def column_labels(self) -> List[str]:
+        # El id desambigua tags homónimos (ej: inductivos de distintos coders)
+        return [f"{name} [{tag_id}]" for tag_id, name in zip(self.tag_ids, self.tag_names)]
+
+    @property
+    def shape(self) -> tuple:
+        return self.counts.shape
+
+
+class FrameworkMatrixBuilder:
+    """Pivota las celdas agrupadas (estudio, tag) a una matriz densa con NumPy"""
+
+    def build(self, cells: StudyTagCellsDTO, tag_names: Dict[int, str]) -> FrameworkMatrix:
+        study_keys, study_idx = np.unique(cells.study_ids, return_inverse=True)
+
+        # Columnas: todo el catálogo del proyecto, aunque un tag no tenga quotes
+        tag_keys = np.union1d(
+            np.fromiter(tag_names.keys(), dtype=np.int64, count=len(tag_names)),
+            cells.tag_ids
+        )
+        tag_idx = np.searchsorted(tag_keys, cells.tag_ids)
+
+        counts = np.zeros((len(study_keys), len(tag_keys)), dtype=np.int32)
+        samples = np.zeros((len(study_keys), len(tag_keys)), dtype=np.int64)
+        counts[study_idx, tag_idx] = cells.quote_counts
+        samples[study_idx, tag_idx] = cells.sample_quote_ids
+
+        return FrameworkMatrix(
+            study_ids=study_keys,
+            tag_ids=tag_keys,
+            tag_names=[tag_names.get(int(t), "") for t in tag_keys],
+            counts=counts,
+            sample_quote_ids=samples,
+        )
+
+    @staticmethod
+    def iter_rows(
+            matrix: FrameworkMatrix,
+            snippet_loader: Callable[[Iterable[int]], Dict[int, str]] = None,
+            chunk_size: int = 500
+    ) -> Iterator[dict]:
+        """
+        Genera una fila (dict) por estudio. Con snippet_loader, cada celda no
+        vacía se rinde como "N | fragmento"; los fragmentos se cargan por
+        bloques de `chunk_size` estudios para mantener la memoria acotada.
+        """
+        labels = matrix.column_labels
+
+        for start in range(0, len(matrix.study_ids), chunk_size):
+            counts = matrix.counts[start:start + chunk_size]
+            samples = matrix.sample_quote_ids[start:start + chunk_size]
+
+            snippets = {}
+            if snippet_loader:
+                snippets = snippet_loader(samples[samples > 0].tolist())
+
+            for offset, study_id in enumerate(matrix.study_ids[start:start + chunk_size]):
+                row = {"study_id": int(study_id)}
+                row_counts = counts[offset].tolist()
+                row_samples = samples[offset].tolist()
+                for label, count, sample in zip(labels, row_counts, row_samples):
+                    if snippets and count:
+                        row[label] = f"{count} | {snippets.get(sample, '')}"
+                    else:
+                        row[label] = count
+                yield row
+
+    @staticmethod
+    def iter_snippet_rows(
+            matrix: FrameworkMatrix,
+            snippet_loader: Callable[[Iterable[int]], Dict[int, str]],
+            chunk_size: int = 500
+    ) -> Iterator[List[Optional[str]]]:
+        """Fragmento de la quote de ejemplo de cada celda por estudio (None si está vacía)"""
+        for start in range(0, len(matrix.study_ids), chunk_size):
+            samples = matrix.sample_quote_ids[start:start + chunk_size]
+            snippets = snippet_loader(samples[samples > 0].tolist())
+            for row_samples in samples.tolist():
+                yield [snippets.get(sample) if sample else None for sample in row_samples]
@@ -0,0 +1,100 @@
+import hashlib
+import zlib
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from .text_normalization import char_ngrams
+
+# Primo de Mersenne 2^31 - 1: a·x + b cabe en uint64 sin desbordar
+_MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+
+
+class MinHasher:
+    """
+    Firmas MinHash sobre shingles de caracteres del texto normalizado.
+
+    La similitud de Jaccard entre dos textos se estima como la fracción de
+    posiciones iguales en sus firmas. Las firmas se dividen en `bands` bandas
+    de `rows` filas (LSH): dos textos similares comparten alguna banda con
+    alta probabilidad, así la búsqueda consulta solo esos buckets.
+
+    Los hashes son deterministas (crc32/blake2b, no hash() de Python) para que
+    firmas calculadas en distintos procesos sean comparables.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, shingle_size: int = 5, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm debe ser múltiplo de bands")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+
+    def shingles(self, text: str) -> np.ndarray:
+        grams = set(char_ngrams(text, self.shingle_size))
+        return np.fromiter(
+            (zlib.crc32(g.encode('utf-8')) for g in grams),
+            dtype=np.uint64,
+            count=len(grams)
+        ) % _MERSENNE_PRIME
+
+    def signature(self, text: str) -> np.ndarray:
+        shingles = self.shingles(text)
+        if not len(shingles):
+            return np.full(self.num_perm, np.iinfo(np.uint32).max, dtype=np.uint32)
+
+        hashed = (np.outer(self._a, shingles) + self._b[:, None]) % _MERSENNE_PRIME
+        return hashed.min(axis=1).astype(np.uint32)
+
+    def band_keys(self, signature: np.ndarray) -> List[int]:
+        """Una clave int64 por banda (incluye el número de banda)"""
+        keys = []
+        for band in range(self.bands):
+            chunk = signature[band * self.rows:(band + 1) * self.rows]
+            digest = hashlib.blake2b(
+                band.to_bytes(2, 'little') + chunk.tobytes(),
+                digest_size=8
+            ).digest()
+            keys.append(int.from_bytes(digest, 'little', signed=True))
+        return keys
+
+    @staticmethod
+    def similarity(a: np.ndarray, b: np.ndarray) -> float:
+        return float(np.count_nonzero(a == b)) / len(a)
+
+    @staticmethod
+    def to_bytes(signature: np.ndarray) -> bytes:
+        return signature.astype('<u4').tobytes()
+
+    @staticmethod
+    def from_bytes(raw: bytes) -> np.ndarray:
+        return np.frombuffer(bytes(raw), dtype='<u4')
+
+
+def cluster_pairs(pairs: Iterable[Tuple[int, int]]) -> List[List[int]]:
+    """Componentes conexas (union-find) de los pares de quotes similares"""
+    parent: Dict[int, int] = {}
+
+    def find(x: int) -> int:
+        parent.setdefault(x, x)
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for a, b in pairs:
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    groups: Dict[int, List[int]] = {}
+    for node in parent:
+        groups.setdefault(find(node), []).append(node)
+
+    return sorted((sorted(g) for g in groups.values()), key=lambda g: g[0])
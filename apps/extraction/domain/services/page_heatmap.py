@@ -0,0 +1,114 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from ..dtos.analytics_dtos import PageTagLinksDTO
+
+
+@dataclass
+class PageTagHeatmap:
+    """
+    Densidad de quotes por tag y zona del documento.
+    counts[i, j] = enlaces del tag i cuya página cae en el bin j.
+
+    Sin normalizar hay un bin por página (bin_edges = 1..n+1); normalizado,
+    los bins parten la posición relativa página/total en [0, 1).
+    """
+    tag_ids: np.ndarray
+    bin_edges: np.ndarray
+    counts: np.ndarray
+    normalized: bool
+
+    def to_dict(self, tag_names: Dict[int, str]) -> dict:
+        return {
+            'normalized': self.normalized,
+            'bin_edges': self.bin_edges.tolist(),
+            'tags': [
+                {'id': int(tag_id), 'name': tag_names.get(int(tag_id), '')}
+                for tag_id in self.tag_ids
+            ],
+            'counts': self.counts.tolist(),
+        }
+
+
+class PageTagHeatmapBuilder:
+    """
+    Histograma página x tag en dos pasos:
+
+    1. `cells`: un único histogram2d sobre todos los enlaces cargados, con una
+       fila por par (extracción, tag). Se devuelven las celdas no vacías
+       agrupadas por extracción, que es la unidad que se cachea.
+    2. `assemble`: suma las celdas de varias extracciones en la matriz final.
+    """
+
+    def cells(self, links: PageTagLinksDTO, normalize: bool, bins: int) -> Dict[int, np.ndarray]:
+        """Por extracción: array (n, 3) de (tag_id, bin, count)"""
+        if not len(links):
+            return {}
+
+        pairs, row_idx = np.unique(
+            np.column_stack([links.extraction_ids, links.tag_ids]),
+            axis=0,
+            return_inverse=True
+        )
+        row_idx = row_idx.ravel()
+
+        if normalize:
+            positions = self._relative_positions(links)
+            edges = np.linspace(0.0, 1.0, bins + 1)
+        else:
+            positions = links.pages
+            edges = np.arange(1, int(links.pages.max()) + 2)
+
+        hist, _, _ = np.histogram2d(
+            row_idx,
+            positions,
+            bins=[np.arange(len(pairs) + 1), edges]
+        )
+
+        rows, bin_idx = np.nonzero(hist)
+        triples = np.column_stack([
+            pairs[rows, 1],
+            bin_idx,
+            hist[rows, bin_idx].astype(np.int64)
+        ])
+
+        extraction_of_row = pairs[rows, 0]
+        result = {}
+        for extraction_id in np.unique(extraction_of_row):
+            result[int(extraction_id)] = triples[extraction_of_row == extraction_id]
+        return result
+
+    @staticmethod
+    def _relative_positions(links: PageTagLinksDTO) -> np.ndarray:
+        # Sin total registrado se usa la página más alta citada en la extracción
+        extraction_keys, extraction_idx = np.unique(links.extraction_ids, return_inverse=True)
+        max_pages = np.zeros(len(extraction_keys), dtype=np.int64)
+        np.maximum.at(max_pages, extraction_idx, links.pages)
+
+        totals = np.where(links.page_counts > 0, links.page_counts, max_pages[extraction_idx])
+        totals = np.maximum(totals, links.pages)
+        # (página - 1) / total queda en [0, 1): la última página cae en el último bin
+        return (links.pages - 1) / totals
+
+    def assemble(self, cells: Iterable[np.ndarray], normalize: bool, bins: int) -> PageTagHeatmap:
+        parts: List[np.ndarray] = [c for c in cells if len(c)]
+        triples = np.concatenate(parts) if parts else np.zeros((0, 3), dtype=np.int64)
+
+        tag_keys, tag_idx = np.unique(triples[:, 0], return_inverse=True)
+        if normalize:
+            edges = np.linspace(0.0, 1.0, bins + 1)
+        else:
+            last_page = int(triples[:, 1].max()) + 1 if len(triples) else 0
+            edges = np.arange(1, last_page + 2)
+
+        counts = np.zeros((len(tag_keys), len(edges) - 1), dtype=np.int64)
+        np.add.at(counts, (tag_idx.ravel(), triples[:, 1]), triples[:, 2])
+
+        return PageTagHeatmap(
+            tag_ids=tag_keys,
+            bin_edges=edges,
+            counts=counts,
+            normalized=normalize,
+        )
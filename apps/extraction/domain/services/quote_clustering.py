@@ -0,0 +1,94 @@
+from typing import List, Sequence, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+
+
+def assign_to_centroids(matrix: sp.csr_matrix, centroids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Centroide más cercano (coseno) de cada fila normalizada. Función de
+    módulo para poder repartir lotes de filas en un pool de procesos.
+    """
+    similarities = np.asarray(matrix @ centroids.T)
+    labels = similarities.argmax(axis=1)
+    return labels.astype(np.int32), similarities[np.arange(len(labels)), labels].astype(np.float32)
+
+
+class MiniBatchSphericalKMeans:
+    """
+    K-means esférico (coseno) por mini-lotes, sobre filas TF-IDF normalizadas.
+
+    Cada iteración toma un lote aleatorio, lo asigna a los centroides y los
+    mueve hacia la media de sus filas con una tasa 1/n acumulada por centro
+    (Sculley, 2010). El costo por iteración depende del lote, no del corpus,
+    así que el ajuste escala a cientos de miles de quotes.
+    """
+
+    def __init__(self, k: int, batch_size: int = 2048, max_iter: int = 150, seed: int = 0):
+        self.k = k
+        self.batch_size = batch_size
+        self.max_iter = max_iter
+        self.seed = seed
+        self.centroids: np.ndarray = None
+
+    def _init_centroids(self, matrix: sp.csr_matrix, rng: np.random.Generator) -> np.ndarray:
+        """k-means++ sobre una muestra: centros iniciales separados entre sí"""
+        sample_size = min(matrix.shape[0], max(self.k * 50, self.batch_size))
+        sample = matrix[rng.choice(matrix.shape[0], sample_size, replace=False)]
+
+        chosen = [int(rng.integers(sample_size))]
+        closest = np.asarray(sample @ sample[chosen[0]].T.toarray()).ravel()
+        for _ in range(1, self.k):
+            distance = np.clip(1 - closest, 0, None)
+            total = distance.sum()
+            if total <= 0:
+                chosen.append(int(rng.integers(sample_size)))
+                continue
+            nxt = int(rng.choice(sample_size, p=distance / total))
+            chosen.append(nxt)
+            closest = np.maximum(closest, np.asarray(sample @ sample[nxt].T.toarray()).ravel())
+
+        return sample[chosen].toarray().astype(np.float32)
+
+    @staticmethod
+    def _normalize(centroids: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        return centroids / norms
+
+    def fit(self, matrix: sp.csr_matrix) -> np.ndarray:
+        if matrix.shape[0] < self.k:
+            raise ValueError("Hay menos quotes que clusters solicitados")
+
+        rng = np.random.default_rng(self.seed)
+        centroids = self._init_centroids(matrix, rng)
+        counts = np.zeros(self.k, dtype=np.float64)
+
+        for _ in range(self.max_iter):
+            rows = rng.choice(matrix.shape[0], min(self.batch_size, matrix.shape[0]), replace=False)
+            batch = matrix[rows]
+            labels, _ = assign_to_centroids(batch, centroids)
+
+            membership = sp.csr_matrix(
+                (np.ones(len(labels), dtype=np.float32), (labels, np.arange(len(labels)))),
+                shape=(self.k, len(labels))
+            )
+            sums = (membership @ batch).toarray()
+            batch_counts = np.bincount(labels, minlength=self.k)
+
+            touched = batch_counts > 0
+            new_counts = counts[touched] + batch_counts[touched]
+            centroids[touched] = (
+                centroids[touched] * (counts[touched] / new_counts)[:, None]
+                + sums[touched] / new_counts[:, None]
+            )
+            counts[touched] = new_counts
+            centroids = self._normalize(centroids)
+
+        self.centroids = centroids.astype(np.float32)
+        return self.centroids
+
+
+def top_terms(centroid: np.ndarray, terms: Sequence[str], n: int = 10) -> List[str]:
+    best = np.argsort(-centroid, kind='stable')[:n]
+    return [terms[i] for i in best if centroid[i] > 0 and terms[i]]
@@ -0,0 +1,50 @@
+from datetime import datetime
+from typing import Iterable, List, Tuple
+
+from ..entities.saturation_state import SaturationPoint, SaturationState
+
+# (extraction_id, study_id, completed_at, tag_ids)
+CompletedExtractionRow = Tuple[int, int, datetime, Iterable[int]]
+
+
+class SaturationTracker:
+    """Avanza la curva de códigos nuevos acumulados con extracciones recién completadas"""
+
+    def advance(self, state: SaturationState, rows: Iterable[CompletedExtractionRow]) -> int:
+        """Incorpora las filas (ya ordenadas). Retorna cuántas extracciones se procesaron."""
+        processed = 0
+        for extraction_id, study_id, completed_at, tag_ids in rows:
+            new_tag_ids = sorted(set(tag_ids) - state.seen_tag_ids)
+            state.seen_tag_ids.update(new_tag_ids)
+            state.points.append(SaturationPoint(
+                extraction_id=extraction_id,
+                study_id=study_id,
+                completed_at=completed_at,
+                new_tag_ids=new_tag_ids,
+                cumulative=len(state.seen_tag_ids),
+            ))
+            state.last_completed_at = completed_at
+            state.last_extraction_id = extraction_id
+            processed += 1
+        return processed
+
+    @staticmethod
+    def summary(state: SaturationState) -> dict:
+        """Total de códigos y cuántas extracciones seguidas (las últimas) no aportaron ninguno"""
+        streak = 0
+        for point in reversed(state.points):
+            if point.new_tag_ids:
+                break
+            streak += 1
+
+        studies: List[int] = []
+        for point in state.points:
+            if point.study_id not in studies:
+                studies.append(point.study_id)
+
+        return {
+            'total_codes': len(state.seen_tag_ids),
+            'extractions': len(state.points),
+            'studies': len(studies),
+            'extractions_without_new_codes': streak,
+        }
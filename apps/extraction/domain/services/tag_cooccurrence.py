@@ -0,0 +1,107 @@
+from dataclasses import replace
+from typing import Dict, List
+
+import numpy as np
+from scipy import sparse
+
+from ..dtos.analytics_dtos import QuoteTagIncidenceDTO
+from ..exceptions.extraction_exceptions import ExtractionValidationError
+
+COOCCURRENCE_LEVELS = ('quote', 'extraction', 'study')
+
+
+class TagCooccurrenceCalculator:
+    """
+    Calcula la co-ocurrencia tag x tag a partir de la matriz de incidencia
+    unidad x tag (unidad = quote, extracción o estudio).
+
+    Con B binaria (unidades x tags), C = Bᵀ·B: la diagonal es la frecuencia
+    de cada tag y C[a, b] el número de unidades donde aparecen ambos.
+    """
+
+    @staticmethod
+    def roll_up(incidence: QuoteTagIncidenceDTO, mapping: Dict[int, int]) -> QuoteTagIncidenceDTO:
+        """Reemplaza cada tag por su ancestro según `mapping` (agregación jerárquica)"""
+        if not mapping or len(incidence) == 0:
+            return incidence
+
+        keys = np.fromiter(mapping.keys(), dtype=np.int64, count=len(mapping))
+        values = np.fromiter(mapping.values(), dtype=np.int64, count=len(mapping))
+        order = np.argsort(keys)
+        keys, values = keys[order], values[order]
+
+        idx = np.clip(np.searchsorted(keys, incidence.tag_ids), 0, len(keys) - 1)
+        known = keys[idx] == incidence.tag_ids
+        return replace(incidence, tag_ids=np.where(known, values[idx], incidence.tag_ids))
+
+    def compute(
+            self,
+            incidence: QuoteTagIncidenceDTO,
+            tag_names: Dict[int, str],
+            level: str = 'quote',
+            min_count: int = 1
+    ) -> dict:
+        if level not in COOCCURRENCE_LEVELS:
+            raise ExtractionValidationError(
+                f"Nivel inválido: {level}. Opciones: {', '.join(COOCCURRENCE_LEVELS)}"
+            )
+
+        units = {
+            'quote': incidence.quote_ids,
+            'extraction': incidence.extraction_ids,
+            'study': incidence.study_ids,
+        }[level]
+
+        if len(incidence) == 0:
+            return {"level": level, "units": 0, "tags": [], "pairs": []}
+
+        unit_keys, unit_idx = np.unique(units, return_inverse=True)
+        tag_keys, tag_idx = np.unique(incidence.tag_ids, return_inverse=True)
+
+        incidence_matrix = sparse.csr_matrix(
+            (np.ones(len(tag_idx), dtype=np.int32), (unit_idx, tag_idx)),
+            shape=(len(unit_keys), len(tag_keys))
+        )
+        # Un tag repetido en la misma unidad cuenta una sola vez
+        incidence_matrix.data[:] = 1
+
+        cooccurrence = (incidence_matrix.T @ incidence_matrix).tocsr()
+        frequency = cooccurrence.diagonal()
+
+        upper = sparse.triu(cooccurrence, k=1).tocoo()
+        keep = upper.data >= min_count
+        rows, cols, counts = upper.row[keep], upper.col[keep], upper.data[keep]
+
+        freq_a, freq_b = frequency[rows], frequency[cols]
+        jaccard = counts / (freq_a + freq_b - counts)
+        # Coeficiente de Ochiai (coseno sobre vectores binarios)
+        cosine = counts / np.sqrt(freq_a * freq_b)
+        # Fuerza de asociación: observado / esperado bajo independencia
+        association = counts * len(unit_keys) / (freq_a * freq_b)
+
+        order = np.lexsort((cols, rows, -counts))
+        pairs: List[dict] = [
+            {
+                "tag_a": int(tag_keys[rows[i]]),
+                "tag_b": int(tag_keys[cols[i]]),
+                "count": int(counts[i]),
+                "jaccard": round(float(jaccard[i]), 4),
+                "cosine": round(float(cosine[i]), 4),
+                "association": round(float(association[i]), 4),
+            }
+            for i in order
+        ]
+
+        return {
+            "level": level,
+            "units": int(len(unit_keys)),
+            "tags": [
+                {
+                    "id": int(tag_id),
+                    "name": tag_names.get(int(tag_id), ""),
+                    "frequency": int(frequency[i]),
+                }
+                for i, tag_id in enumerate(tag_keys)
+            ],
+            "pairs": pairs,
+        }
@@ -0,0 +1,202 @@
+import math
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+from ..dtos.analytics_dtos import StudyTagCellsDTO, TagCatalogEntryDTO
+from ..value_objects.tag_status import TagStatus
+from ..value_objects.tag_type import TagType
+from .text_normalization import char_ngrams, word_tokens
+
+# Peso del nombre frente al uso compartido en estudios (si se pide)
+NAME_WEIGHT = 0.8
+ABBREVIATION_SCORE = 0.9
+
+
+class TrigramTagIndex:
+    """
+    Índice invertido trigrama -> tags sobre los nombres normalizados.
+
+    Para listar pares con Jaccard >= t usa filtrado por prefijo y por tamaño:
+    los trigramas de cada tag se ordenan de menos a más frecuente y solo se
+    recorren las listas de los primeros |A| - ceil(t·|A|) + 1. Si el par
+    supera el umbral, alguno de esos trigramas raros es común, así que no se
+    pierden pares y se evita recorrer las listas largas (" co", "cio"...).
+    """
+
+    def __init__(self, names: Dict[int, str], n: int = 3):
+        self.names = names
+        self._grams: Dict[int, Set[str]] = {
+            tag_id: set(char_ngrams(name, n)) for tag_id, name in names.items()
+        }
+        self._postings: Dict[str, List[int]] = {}
+        for tag_id, grams in self._grams.items():
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(tag_id)
+
+    def _probe_grams(self, grams: Set[str], threshold: float) -> List[str]:
+        ordered = sorted(grams, key=lambda g: (len(self._postings[g]), g))
+        prefix = len(ordered) - math.ceil(threshold * len(ordered)) + 1
+        return ordered[:max(prefix, 1)]
+
+    def jaccard(self, a: int, b: int) -> float:
+        grams_a, grams_b = self._grams[a], self._grams[b]
+        shared = len(grams_a & grams_b)
+        union = len(grams_a) + len(grams_b) - shared
+        return shared / union if union else 0.0
+
+    def similar_pairs(self, threshold: float = 0.4) -> Iterator[Tuple[int, int, float]]:
+        """Pares (a, b, jaccard) con a < b y jaccard >= threshold"""
+        for tag_id, grams in self._grams.items():
+            if not grams:
+                continue
+            size = len(grams)
+            candidates: Set[int] = set()
+            for gram in self._probe_grams(grams, threshold):
+                candidates.update(self._postings[gram])
+
+            for other in candidates:
+                # Cada par se verifica una vez, desde el id menor
+                if other <= tag_id:
+                    continue
+                other_size = len(self._grams[other])
+                if min(size, other_size) < threshold * max(size, other_size):
+                    continue
+                jaccard = self.jaccard(tag_id, other)
+                if jaccard >= threshold:
+                    yield tag_id, other, jaccard
+
+
+def _stem(token: str) -> str:
+    # Plural simple (es/en): "costos" -> "costo", "costs" -> "cost"
+    return token[:-1] if len(token) > 3 and token.endswith('s') else token
+
+
+def _stemmed_tokens(name: str) -> List[str]:
+    return [_stem(t) for t in word_tokens(name)]
+
+
+def abbreviation_score(name_a: str, name_b: str) -> float:
+    """
+    1.0 si los nombres normalizados coinciden; ABBREVIATION_SCORE si uno
+    abrevia al otro palabra por palabra ("Costos oc." / "Costo oculto").
+    """
+    tokens_a, tokens_b = _stemmed_tokens(name_a), _stemmed_tokens(name_b)
+    if not tokens_a or len(tokens_a) != len(tokens_b):
+        return 0.0
+    if tokens_a == tokens_b:
+        return 1.0
+
+    for a, b in zip(tokens_a, tokens_b):
+        short, long_ = sorted((a, b), key=len)
+        if len(short) < 2 or not long_.startswith(short):
+            return 0.0
+    return ABBREVIATION_SCORE
+
+
+def abbreviation_pairs(names: Dict[int, str]) -> Iterator[Tuple[int, int]]:
+    """
+    Pares candidatos a abreviatura. Un nombre solo puede abreviar a otro con
+    el mismo número de palabras y las mismas dos primeras letras en cada una,
+    así que se agrupa por esa firma y se compara solo dentro de cada grupo.
+    """
+    blocks: Dict[tuple, List[int]] = {}
+    for tag_id, name in names.items():
+        tokens = _stemmed_tokens(name)
+        if tokens and all(len(t) >= 2 for t in tokens):
+            blocks.setdefault(tuple(t[:2] for t in tokens), []).append(tag_id)
+
+    for members in blocks.values():
+        members.sort()
+        for i, a in enumerate(members):
+            for b in members[i + 1:]:
+                yield a, b
+
+
+def _usage_vectors(cells: StudyTagCellsDTO) -> Dict[int, Dict[int, int]]:
+    vectors: Dict[int, Dict[int, int]] = {}
+    for study_id, tag_id, count in zip(
+            cells.study_ids.tolist(), cells.tag_ids.tolist(), cells.quote_counts.tolist()):
+        vectors.setdefault(tag_id, {})[study_id] = count
+    return vectors
+
+
+def _cosine(a: Dict[int, int], b: Dict[int, int]) -> float:
+    if not a or not b:
+        return 0.0
+    dot = sum(count * b.get(study_id, 0) for study_id, count in a.items())
+    norm = np.sqrt(sum(v * v for v in a.values())) * np.sqrt(sum(v * v for v in b.values()))
+    return float(dot / norm) if norm else 0.0
+
+
+class MergeCandidateFinder:
+    """
+    Propone fusiones de tags inductivos del proyecto.
+
+    La similitud de nombre es el máximo entre el Jaccard de trigramas y la
+    detección de abreviaturas. Opcionalmente se combina con el coseno entre
+    los perfiles de uso por estudio: dos códigos duplicados suelen aplicarse
+    en los mismos estudios por coders distintos.
+    """
+
+    def find(
+            self,
+            catalog: List[TagCatalogEntryDTO],
+            usage: Optional[StudyTagCellsDTO] = None,
+            min_score: float = 0.4
+    ) -> List[dict]:
+        entries = {
+            e.tag_id: e for e in catalog if e.status != TagStatus.REJECTED.value
+        }
+        names = {tag_id: e.name for tag_id, e in entries.items()}
+        index = TrigramTagIndex(names)
+        vectors = _usage_vectors(usage) if usage is not None else None
+
+        pairs: Dict[Tuple[int, int], float] = {
+            (a, b): jaccard
+            for a, b, jaccard in index.similar_pairs(threshold=min_score)
+        }
+        for a, b in abbreviation_pairs(names):
+            if (a, b) not in pairs:
+                pairs[(a, b)] = index.jaccard(a, b)
+
+        candidates = []
+        for (a, b), jaccard in pairs.items():
+            if TagType.INDUCTIVE.value not in (entries[a].type, entries[b].type):
+                continue
+
+            name_similarity = max(jaccard, abbreviation_score(names[a], names[b]))
+            if name_similarity < min_score:
+                continue
+
+            score = name_similarity
+            co_usage = None
+            if vectors is not None:
+                co_usage = _cosine(vectors.get(a, {}), vectors.get(b, {}))
+                score = NAME_WEIGHT * name_similarity + (1 - NAME_WEIGHT) * co_usage
+
+            target, source = self._orient(entries[a], entries[b])
+            candidates.append({
+                'target_tag_id': target.tag_id,
+                'target_name': target.name,
+                'source_tag_id': source.tag_id,
+                'source_name': source.name,
+                'score': round(score, 4),
+                'name_similarity': round(name_similarity, 4),
+                'co_usage': None if co_usage is None else round(co_usage, 4),
+            })
+
+        candidates.sort(key=lambda c: (-c['score'], c['target_tag_id'], c['source_tag_id']))
+        return candidates
+
+    @staticmethod
+    def _orient(a: TagCatalogEntryDTO, b: TagCatalogEntryDTO):
+        """El que queda: deductivo, aprobado y más usado, en ese orden"""
+        def weight(e: TagCatalogEntryDTO):
+            return (
+                e.type == TagType.DEDUCTIVE.value,
+                e.status == TagStatus.APPROVED.value,
+                e.quote_count,
+                -e.tag_id,
+            )
+        return (a, b) if weight(a) >= weight(b) else (b, a)
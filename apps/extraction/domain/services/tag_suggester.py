@@ -0,0 +1,117 @@
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+
+from .tfidf import DEFAULT_N_FEATURES, HashingTfVectorizer, smooth_idf
+
+
+class TfidfTagSuggester:
+    """
+    Sugerencia de tags por vecinos más cercanos (coseno TF-IDF) entre las
+    quotes ya codificadas de un proyecto.
+
+    Las frecuencias se guardan en segmentos CSC, que funcionan como índice
+    invertido: para un texto nuevo solo se leen las columnas de sus términos,
+    así el costo depende de cuántas quotes comparten términos, no del total.
+
+    Cada `add` agrega un segmento nuevo sin copiar los anteriores; los
+    segmentos se fusionan cuando el último alcanza el tamaño del previo (como
+    un LSM), así hay O(log n) segmentos y cada fila se copia O(log n) veces.
+    Cada segmento guarda sus frecuencias al cuadrado: como el idf cambia con
+    cada alta, las normas de fila se recalculan con un producto
+    matriz-vector por segmento, sin volver a elevar ni apilar la matriz.
+    """
+
+    def __init__(self, n_features: int = DEFAULT_N_FEATURES):
+        self.vectorizer = HashingTfVectorizer(n_features)
+        self.quote_ids: List[int] = []
+        self.quote_tags: List[Tuple[int, ...]] = []
+        self.df = np.zeros(n_features, dtype=np.int64)
+
+        self._segments: List[sp.csc_matrix] = []
+        self._squared: List[sp.csr_matrix] = []
+        self._pending: List[sp.csr_matrix] = []
+        self._idf = None
+        self._row_norms = None
+
+    def __len__(self) -> int:
+        return len(self.quote_ids)
+
+    def add(self, quote_ids: Sequence[int], texts: Sequence[str], tag_ids: Sequence[Sequence[int]]) -> None:
+        if not quote_ids:
+            return
+        block = self.vectorizer.transform(texts)
+        self.df += np.bincount(block.indices, minlength=self.df.shape[0])
+        self.quote_ids.extend(quote_ids)
+        self.quote_tags.extend(tuple(t) for t in tag_ids)
+        self._pending.append(block)
+        self._idf = None
+
+    def _append_segment(self, block: sp.csr_matrix) -> None:
+        self._segments.append(block.tocsc())
+        self._squared.append(block.multiply(block).tocsr())
+        while len(self._segments) > 1 and self._segments[-1].shape[0] >= self._segments[-2].shape[0]:
+            last, squared = self._segments.pop(), self._squared.pop()
+            self._segments[-1] = sp.vstack([self._segments[-1], last], format='csc')
+            self._squared[-1] = sp.vstack([self._squared[-1], squared], format='csr')
+
+    def _refresh(self) -> None:
+        for block in self._pending:
+            self._append_segment(block)
+        self._pending = []
+        if self._idf is None and self._segments:
+            self._idf = smooth_idf(self.df, len(self.quote_ids))
+            weights = self._idf ** 2
+            self._row_norms = np.sqrt(np.concatenate([squared @ weights for squared in self._squared]))
+            self._row_norms[self._row_norms == 0] = 1
+
+    def nearest(self, text: str, k: int = 25) -> List[Tuple[int, float]]:
+        """Filas (índice interno, similitud) de las k quotes más parecidas"""
+        self._refresh()
+        query = self.vectorizer.transform([text])
+        if not query.nnz or not self.quote_ids:
+            return []
+
+        terms = query.indices
+        weights = query.data * self._idf[terms]
+        query_norm = float(np.linalg.norm(weights))
+
+        # Producto punto solo sobre las columnas (términos) de la consulta
+        term_weights = weights * self._idf[terms]
+        dots = np.concatenate([segment[:, terms] @ term_weights for segment in self._segments])
+        scores = dots / (self._row_norms * query_norm)
+
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k)[:k]]
+        ordered = candidates[np.argsort(-scores[candidates], kind='stable')]
+        return [(int(row), float(scores[row])) for row in ordered]
+
+    def suggest(self, text: str, k: int = 25, limit: int = 5) -> List[dict]:
+        """
+        Tags votados por los vecinos, ponderados por similitud. `score` es la
+        fracción del peso de los vecinos que lleva el tag; `support` cuántos
+        vecinos lo usan.
+        """
+        neighbours = self.nearest(text, k)
+        total = sum(similarity for _, similarity in neighbours)
+        if not total:
+            return []
+
+        votes: Dict[int, float] = {}
+        support: Dict[int, int] = {}
+        for row, similarity in neighbours:
+            for tag_id in self.quote_tags[row]:
+                votes[tag_id] = votes.get(tag_id, 0.0) + similarity
+                support[tag_id] = support.get(tag_id, 0) + 1
+
+        ranked = sorted(votes.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [
+            {
+                'tag_id': tag_id,
+                'score': round(weight / total, 4),
+                'support': support[tag_id],
+            }
+            for tag_id, weight in ranked
+        ]
@@ -0,0 +1,49 @@
+from typing import Dict, List, Optional
+
+
+class TagTree:
+    """
+    Jerarquía del libro de códigos en memoria, a partir del padre de cada tag.
+
+    Para recorridos por tag (rutas, agregación a un nivel) sobre el catálogo
+    completo de un proyecto; las consultas de subárbol contra la BD usan la
+    tabla de clausura.
+    """
+
+    def __init__(self, parents: Dict[int, Optional[int]]):
+        self.parents = parents
+        self._paths: Dict[int, List[int]] = {}
+
+    def path(self, tag_id: int) -> List[int]:
+        """Ids desde la raíz hasta el tag (incluido)"""
+        cached = self._paths.get(tag_id)
+        if cached is not None:
+            return cached
+
+        chain = []
+        current = tag_id
+        while current is not None and current not in self._paths:
+            chain.append(current)
+            current = self.parents.get(current)
+            if len(chain) > len(self.parents) + 1:
+                raise ValueError(f"Ciclo en la jerarquía de tags en torno al tag {tag_id}")
+
+        prefix = self._paths[current] if current is not None else []
+        for depth, node in enumerate(reversed(chain)):
+            self._paths[node] = prefix + list(reversed(chain))[:depth + 1]
+        return self._paths[tag_id]
+
+    def level(self, tag_id: int) -> int:
+        """0 para las raíces"""
+        return len(self.path(tag_id)) - 1
+
+    def ancestor_at_level(self, tag_id: int, level: int) -> int:
+        """Ancestro del tag en el nivel indicado; el propio tag si está más arriba"""
+        path = self.path(tag_id)
+        return path[min(level, len(path) - 1)]
+
+    def rollup_map(self, level: int) -> Dict[int, int]:
+        return {tag_id: self.ancestor_at_level(tag_id, level) for tag_id in self.parents}
+
+    def label(self, tag_id: int, names: Dict[int, str], separator: str = ' > ') -> str:
+        return separator.join(names.get(node, '') for node in self.path(tag_id))
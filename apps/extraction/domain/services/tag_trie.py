@@ -0,0 +1,62 @@
+from typing import Dict, Iterable, List
+
+from ..dtos.tag_dtos import TagSuggestionDTO
+from .text_normalization import normalize_text
+
+
+class _Node:
+    __slots__ = ('children', 'top')
+
+    def __init__(self):
+        self.children: Dict[str, '_Node'] = {}
+        self.top: List[int] = []
+
+
+class TagPrefixTrie:
+    """
+    Trie de prefijos sobre los nombres normalizados (sin tildes ni mayúsculas).
+
+    Cada nombre se inserta desde el inicio de cada palabra, así "ocu" sugiere
+    "Costo oculto". Los tags se insertan en orden de ranking y cada nodo
+    guarda sus primeros `top_k`, de modo que una consulta solo recorre el
+    prefijo: O(len(prefijo)) sin importar cuántos tags tenga el proyecto.
+    """
+
+    def __init__(self, suggestions: Iterable[TagSuggestionDTO], top_k: int = 50):
+        self.top_k = top_k
+        self._root = _Node()
+        self._tags: Dict[int, TagSuggestionDTO] = {}
+
+        for suggestion in sorted(suggestions, key=lambda s: s.rank):
+            self._tags[suggestion.tag_id] = suggestion
+            self._insert(suggestion)
+
+    def __len__(self) -> int:
+        return len(self._tags)
+
+    def _insert(self, suggestion: TagSuggestionDTO) -> None:
+        normalized = normalize_text(suggestion.name)
+        starts = [0] + [i + 1 for i, c in enumerate(normalized) if c == ' ']
+
+        visited = set()
+        for start in starts:
+            node = self._root
+            self._offer(node, suggestion.tag_id, visited)
+            for char in normalized[start:]:
+                node = node.children.setdefault(char, _Node())
+                self._offer(node, suggestion.tag_id, visited)
+
+    def _offer(self, node: _Node, tag_id: int, visited: set) -> None:
+        # Un mismo nodo puede alcanzarse desde dos palabras del mismo nombre
+        if id(node) in visited or len(node.top) >= self.top_k:
+            return
+        visited.add(id(node))
+        node.top.append(tag_id)
+
+    def search(self, prefix: str, limit: int = 10) -> List[TagSuggestionDTO]:
+        node = self._root
+        for char in normalize_text(prefix):
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return [self._tags[tag_id] for tag_id in node.top[:limit]]
@@ -0,0 +1,55 @@
+import re
+import unicodedata
+from typing import List
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+# Palabras vacías (es/en) ya normalizadas, sin tildes
+STOPWORDS = frozenset("""
+a al algo algun alguna algunas alguno algunos ante antes como con contra cual
+cuando de del desde donde durante e el ella ellas ellos en entre era eran es esa
+esas ese eso esos esta estaba estan estar este esto estos fue fueron ha habia han
+hasta hay la las le les lo los mas me mi mis mucho muy ni no nos o os otra otras
+otro otros para pero poco por porque que quien se sea ser si sin sobre son su sus
+tambien tan te tiene tienen todo todos tu un una unas uno unos y ya
+about after all also an and any are as at be been before being between both but
+by can could did do does for from had has have he her his how i if in into is it
+its more most no not of on only or other our out over she so some such than that
+the their them then there these they this those through to too under up very was
+we were what when where which while who will with would you your
+""".split())
+
+
+def strip_accents(text: str) -> str:
+    """'Migración' -> 'Migracion' (descompone y elimina marcas diacríticas)"""
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def normalize_text(text: str) -> str:
+    """Minúsculas, sin tildes y con cualquier separador reducido a un espacio"""
+    return _NON_ALNUM.sub(' ', strip_accents(text or '').lower()).strip()
+
+
+def word_tokens(text: str) -> List[str]:
+    normalized = normalize_text(text)
+    return normalized.split() if normalized else []
+
+
+def char_ngrams(text: str, n: int) -> List[str]:
+    """
+    N-gramas de caracteres del texto normalizado, con un espacio de relleno
+    en los extremos para que los prefijos/sufijos también cuenten.
+    """
+    normalized = normalize_text(text)
+    if not normalized:
+        return []
+    padded = f" {normalized} "
+    if len(padded) <= n:
+        return [padded]
+    return [padded[i:i + n] for i in range(len(padded) - n + 1)]
+
+
+def content_tokens(text: str) -> List[str]:
+    """Palabras normalizadas sin palabras vacías ni tokens de una letra"""
+    return [t for t in word_tokens(text) if len(t) > 1 and t not in STOPWORDS]
@@ -0,0 +1,99 @@
+import zlib
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+
+from .text_normalization import content_tokens
+
+# 2^18 columnas: colisiones despreciables para el vocabulario de un proyecto
+DEFAULT_N_FEATURES = 1 << 18
+
+
+class HashingTfVectorizer:
+    """
+    Vectores de frecuencia (log(1 + tf)) con el truco de hashing: la columna
+    de cada término es crc32(término) mod n_features. No hay vocabulario que
+    ajustar, así que documentos nuevos se vectorizan igual que los antiguos y
+    los modelos pueden crecer de forma incremental.
+    """
+
+    def __init__(self, n_features: int = DEFAULT_N_FEATURES):
+        self.n_features = n_features
+
+    def _columns(self, text: str) -> np.ndarray:
+        tokens = content_tokens(text)
+        return np.fromiter(
+            (zlib.crc32(t.encode('utf-8')) % self.n_features for t in tokens),
+            dtype=np.int64,
+            count=len(tokens)
+        )
+
+    def transform(self, texts: Iterable[str]) -> sp.csr_matrix:
+        indptr = [0]
+        indices: List[np.ndarray] = []
+        data: List[np.ndarray] = []
+
+        for text in texts:
+            columns, counts = np.unique(self._columns(text), return_counts=True)
+            indices.append(columns)
+            data.append(np.log1p(counts).astype(np.float32))
+            indptr.append(indptr[-1] + len(columns))
+
+        return sp.csr_matrix(
+            (
+                np.concatenate(data) if data else np.empty(0, np.float32),
+                np.concatenate(indices) if indices else np.empty(0, np.int64),
+                np.asarray(indptr, dtype=np.int64),
+            ),
+            shape=(len(indptr) - 1, self.n_features),
+        )
+
+
+def smooth_idf(df: np.ndarray, n_docs: int) -> np.ndarray:
+    return (np.log((1 + n_docs) / (1 + df)) + 1).astype(np.float32)
+
+
+
+def vectorize_chunk(texts: List[str], n_features: int = DEFAULT_N_FEATURES) -> Tuple[sp.csr_matrix, Dict[int, str]]:
+    """
+    Vectoriza un lote y devuelve también columna -> término, para poder
+    nombrar columnas después. Es una función de módulo para poder ejecutarse
+    en un pool de procesos.
+    """
+    vectorizer = HashingTfVectorizer(n_features)
+    terms: Dict[int, str] = {}
+    for text in texts:
+        for token in content_tokens(text):
+            terms.setdefault(zlib.crc32(token.encode('utf-8')) % n_features, token)
+    return vectorizer.transform(texts), terms
+
+
+def select_columns(
+        tf: sp.csr_matrix,
+        min_df: int = 2,
+        max_df_ratio: float = 0.5,
+        max_features: int = 20000
+) -> np.ndarray:
+    """
+    Columnas útiles para agrupar: ni rarísimas (min_df) ni casi universales
+    (max_df_ratio); de las restantes, las max_features más frecuentes.
+    """
+    df = np.bincount(tf.indices, minlength=tf.shape[1])
+    eligible = np.flatnonzero((df >= min_df) & (df <= max_df_ratio * max(tf.shape[0], 1)))
+    if len(eligible) > max_features:
+        eligible = eligible[np.argsort(-df[eligible], kind='stable')[:max_features]]
+    return np.sort(eligible)
+
+
+def l2_normalize_rows(matrix: sp.csr_matrix) -> sp.csr_matrix:
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return sp.csr_matrix(sp.diags(1 / norms) @ matrix)
+
+
+def tfidf_matrix(tf: sp.csr_matrix) -> sp.csr_matrix:
+    """TF-IDF normalizado por fila, con el idf del propio corpus"""
+    df = np.bincount(tf.indices, minlength=tf.shape[1])
+    idf = smooth_idf(df, tf.shape[0])
+    return l2_normalize_rows(sp.csr_matrix(tf.multiply(idf)))
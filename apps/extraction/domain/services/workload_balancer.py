@@ -0,0 +1,131 @@
+import heapq
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Set, Tuple
+
+from ..dtos.assignment_dtos import ExtractionSlotDTO, PlannedAssignmentDTO
+from ..exceptions.extraction_exceptions import ExtractionValidationError
+
+
+class WorkloadBalancer:
+    """
+    Reparte extracciones entre codificadores manteniendo la carga pareja.
+
+    Los codificadores viven en un heap ordenado por (extracciones abiertas, id):
+    cada asignación saca al menos cargado que todavía no trabaja en el estudio,
+    así repartir S estudios entre C codificadores cuesta O(S·log C).
+
+    Reglas de Negocio:
+    - Un estudio nunca recibe dos veces al mismo codificador
+    - Los extraction_order de un estudio son 1..N sin huecos (N según el modo)
+    - La carga inicial son las extracciones abiertas que cada uno ya tiene
+    - Los cupos vacantes (sin asignar, ver open_slots) se ocupan antes de crear otros
+    """
+
+    def __init__(self, user_ids: Iterable[int], slots: Iterable[ExtractionSlotDTO] = ()):
+        self.slots = list(slots)
+        load = Counter(s.user_id for s in self.slots if s.is_open and s.user_id is not None)
+        self._heap: List[Tuple[int, int]] = [(load[u], u) for u in sorted(set(user_ids))]
+        heapq.heapify(self._heap)
+
+        self._users_by_study: Dict[int, Set[int]] = defaultdict(set)
+        self._orders_by_study: Dict[int, Set[int]] = defaultdict(set)
+        self._vacant_by_study: Dict[int, List[ExtractionSlotDTO]] = defaultdict(list)
+        for slot in self.slots:
+            if slot.user_id is None:
+                self._vacant_by_study[slot.study_id].append(slot)
+            else:
+                self._users_by_study[slot.study_id].add(slot.user_id)
+            self._orders_by_study[slot.study_id].add(slot.extraction_order)
+
+    @property
+    def load_by_user(self) -> Dict[int, int]:
+        return {user_id: load for load, user_id in self._heap}
+
+    def plan(
+            self,
+            study_ids: Iterable[int],
+            per_study: int
+    ) -> Tuple[List[PlannedAssignmentDTO], List[int]]:
+        """
+        Completa cada estudio hasta `per_study` extracciones.
+        Retorna (asignaciones, estudios que no se pudieron completar). Las
+        asignaciones con extraction_id ocupan un cupo vacante existente.
+        """
+        if len(self._heap) < per_study:
+            raise ExtractionValidationError(
+                f"Se necesitan al menos {per_study} codificadores distintos por estudio"
+            )
+
+        planned: List[PlannedAssignmentDTO] = []
+        unfilled: List[int] = []
+        for study_id in sorted(set(study_ids)):
+            vacant = self._vacant_by_study.pop(study_id, [])
+            free = sorted(
+                [(slot.extraction_order, slot.extraction_id) for slot in vacant] +
+                [(order, None) for order in self.missing_orders(study_id, per_study)]
+            )
+            if not free:
+                continue
+
+            users = self._pick(len(free), self._users_by_study[study_id])
+            for (order, extraction_id), user_id in zip(free, users):
+                planned.append(PlannedAssignmentDTO(study_id, user_id, order, extraction_id))
+                self._users_by_study[study_id].add(user_id)
+                self._orders_by_study[study_id].add(order)
+            if len(users) < len(free):
+                unfilled.append(study_id)
+
+        return planned, unfilled
+
+    def missing_orders(self, study_id: int, per_study: int) -> List[int]:
+        """extraction_order de 1..per_study que el estudio todavía no tiene"""
+        taken = self._orders_by_study[study_id]
+        return [order for order in range(1, per_study + 1) if order not in taken]
+
+    def open_slots(self, study_ids: Iterable[int], per_study: int) -> List[PlannedAssignmentDTO]:
+        """
+        Cupos sin asignar que faltan para completar cada estudio. Alimentan la
+        cola de trabajo: cada codificador reclama el siguiente cupo vacante.
+        """
+        return [
+            PlannedAssignmentDTO(study_id, None, order)
+            for study_id in sorted(set(study_ids))
+            for order in self.missing_orders(study_id, per_study)
+        ]
+
+    def plan_handover(self, leaving_user_id: int) -> Tuple[Dict[int, int], List[int]]:
+        """
+        Reparte las extracciones abiertas de un codificador que deja el proyecto.
+        Retorna ({extraction_id: nuevo user_id}, extracciones sin reemplazo posible).
+        """
+        self._heap = [(load, u) for load, u in self._heap if u != leaving_user_id]
+        heapq.heapify(self._heap)
+
+        moves: Dict[int, int] = {}
+        orphaned: List[int] = []
+        for slot in sorted(self.slots, key=lambda s: (s.study_id, s.extraction_order)):
+            if slot.user_id != leaving_user_id or not slot.is_open:
+                continue
+
+            taken = self._users_by_study[slot.study_id]
+            users = self._pick(1, taken)
+            if not users:
+                orphaned.append(slot.extraction_id)
+                continue
+            moves[slot.extraction_id] = users[0]
+            taken.add(users[0])
+
+        return moves, orphaned
+
+    def _pick(self, count: int, exclude: Set[int]) -> List[int]:
+        picked: List[Tuple[int, int]] = []
+        skipped: List[Tuple[int, int]] = []
+        while self._heap and len(picked) < count:
+            entry = heapq.heappop(self._heap)
+            (skipped if entry[1] in exclude else picked).append(entry)
+
+        for entry in skipped:
+            heapq.heappush(self._heap, entry)
+        for load, user_id in picked:
+            heapq.heappush(self._heap, (load + 1, user_id))
+        return [user_id for _, user_id in picked]
@@ -0,0 +1,10 @@
+from enum import Enum
+
+class ConsensusStatus(str, Enum):
+    """Resultado de alinear una quote entre las extracciones de un estudio"""
+    AGREED = 'agreed'  # Todas la marcaron, con los mismos tags
+    CONFLICTING = 'conflicting'  # Varias la marcaron, con tags distintos
+    UNIQUE = 'unique'  # Solo una extracción la marcó
+
+    def __str__(self):
+        return self.value
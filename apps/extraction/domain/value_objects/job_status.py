@@ -0,0 +1,11 @@
+from enum import Enum
+
+class JobStatus(str, Enum):
+    """Estados de un trabajo en la cola persistente"""
+    QUEUED = 'Queued'  # Esperando a ser reclamado por un worker
+    RUNNING = 'Running'  # Reclamado, con lease vigente
+    DONE = 'Done'  # Terminado con éxito
+    FAILED = 'Failed'  # Agotó sus reintentos
+
+    def __str__(self):
+        return self.value
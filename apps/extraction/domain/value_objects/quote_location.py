@@ -11,6 +11,7 @@ class QuoteLocation:
         page: Número de página (1-indexed)
         text_location: Texto descriptivo (ej: "Sección 3.2, párrafo 2")
         coordinates: Coordenadas del rectángulo de selección (opcional)
+        page_count: Páginas del documento al momento de citar (opcional)
     """
     page: int
     text_location: str = ""
@@ -18,11 +19,15 @@ class QuoteLocation:
     y1: Optional[float] = None  # Coordenada Y inicio
     x2: Optional[float] = None  # Coordenada X fin
     y2: Optional[float] = None  # Coordenada Y fin
+    page_count: Optional[int] = None
 
     def __post_init__(self):
         if self.page < 1:
             raise ValueError("El número de página debe ser mayor a 0")
 
+        if self.page_count is not None and self.page > self.page_count:
+            raise ValueError("La página no puede superar el total de páginas del documento")
+
         coords = [self.x1, self.y1, self.x2, self.y2]
         if any(c is not None for c in coords):
             if not all(c is not None for c in coords):
@@ -50,7 +55,8 @@ class QuoteLocation:
                 "y1": self.y1,
                 "x2": self.x2,
                 "y2": self.y2
-            } if self.has_coordinates else None
+            } if self.has_coordinates else None,
+            "page_count": self.page_count
         }
 
     @classmethod
@@ -63,5 +69,6 @@ class QuoteLocation:
             x1=coords.get('x1') if coords else None,
             y1=coords.get('y1') if coords else None,
             x2=coords.get('x2') if coords else None,
-            y2=coords.get('y2') if coords else None
+            y2=coords.get('y2') if coords else None,
+            page_count=data.get('page_count')
         )
\ No newline at end of file
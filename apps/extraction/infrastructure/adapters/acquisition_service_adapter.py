@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from ...domain.repositories.i_acquisition_repository import IAcquisitionRepository
 
 try:
@@ -25,4 +25,9 @@ class AcquisitionServiceAdapter(IAcquisitionRepository):
     def get_project_context(self, study_id: int) -> Optional[int]:
         if not self.service:
             return None
-        return self.service.get_project_id(study_id)
\ No newline at end of file
+        return self.service.get_project_id(study_id)
+
+    def get_study_ids_by_project(self, project_id: int) -> List[int]:
+        if not self.service:
+            return []
+        return list(self.service.get_study_ids_by_project(project_id))
@@ -0,0 +1,37 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+
+
+class LocalVersionedCache:
+    """
+    Caché LRU en memoria del proceso, con la misma interfaz que VersionedCache.
+
+    Para estructuras que conviene no serializar (índices, árboles): cada
+    worker mantiene la suya y, como la clave incluye la versión de los datos,
+    basta con que otra versión la reemplace.
+    """
+
+    def __init__(self, prefix: str = 'extraction', maxsize: int = 256):
+        self.prefix = prefix
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, namespace: str, *parts: Any) -> str:
+        return ':'.join([self.prefix, namespace, *(str(p) for p in parts)])
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any], timeout: int = None) -> Any:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        value = compute()
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
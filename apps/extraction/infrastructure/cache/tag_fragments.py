@@ -0,0 +1,130 @@
+import json
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List
+
+from ...domain.entities.tag import Tag
+from ...domain.repositories.i_project_version_repository import IProjectVersionRepository
+from ..mappers.domain_mappers import TagMapper
+from ..models import TagModel
+from ..search.base import batched
+
+
+def dumps(value) -> str:
+    """JSON compacto, igual que el JSONRenderer de DRF"""
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def splice(fields: dict, **raw: str) -> str:
+    """Objeto JSON de `fields` con miembros ya renderizados agregados al final"""
+    head = dumps(fields)
+    members = ','.join(f'{dumps(name)}:{value}' for name, value in raw.items())
+    if not members:
+        return head
+    return f'{head[:-1]},{members}}}' if fields else f'{{{members}}}'
+
+
+def json_array(fragments: Iterable[str]) -> str:
+    return f"[{','.join(fragments)}]"
+
+
+def _detail(tag: Tag) -> dict:
+    return {
+        "id": tag.id,
+        "name": tag.name,
+        "project_id": tag.project_id,
+        "is_mandatory": tag.is_mandatory,
+        "status": tag.status.value,
+        "visibility": tag.visibility.value,
+        "type": tag.type.value,
+        "created_by_user_id": tag.created_by_user_id,
+        "question_id": tag.question_id,
+    }
+
+
+def _compact(tag: Tag) -> dict:
+    return {
+        "id": tag.id,
+        "name": tag.name,
+        "color": tag.color,
+        "is_mandatory": tag.is_mandatory,
+    }
+
+
+class TagFragmentCache:
+    """
+    Fragmentos JSON de tags, en memoria del proceso.
+
+    La clave es (forma, tag_id, tag_catalog_version del proyecto): un tag se
+    serializa una vez por versión del catálogo y las respuestas pegan el
+    texto tal cual, así el costo depende de los tags distintos y no de los
+    pares quote–tag.
+
+    La versión se lee antes que el tag y los faltantes se recargan de la base
+    en lugar de usar el objeto recibido (que puede venir de un snapshot): un
+    fragmento guardado nunca es más viejo que su clave.
+    """
+
+    SHAPES: Dict[str, Callable[[Tag], dict]] = {
+        'detail': _detail,  # TagResponseSerializer
+        'compact': _compact,  # visor de PDF
+    }
+
+    def __init__(self, version_repo: IProjectVersionRepository, maxsize: int = 8192):
+        self.version_repo = version_repo
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def fragments(self, tags: Iterable[Tag], shape: str = 'detail') -> Dict[int, str]:
+        """{tag_id: JSON} para los tags distintos de la respuesta"""
+        render = self.SHAPES[shape]
+        by_id = {tag.id: tag for tag in tags}
+        versions = {
+            project_id: self.version_repo.get(project_id).tag_catalog_version
+            for project_id in {tag.project_id for tag in by_id.values()}
+        }
+        keys = {tag_id: (shape, tag_id, versions[tag.project_id]) for tag_id, tag in by_id.items()}
+
+        result: Dict[int, str] = {}
+        with self._lock:
+            for tag_id, key in keys.items():
+                fragment = self._entries.get(key)
+                if fragment is not None:
+                    self._entries.move_to_end(key)
+                    result[tag_id] = fragment
+
+        missing = [tag_id for tag_id in by_id if tag_id not in result]
+        if not missing:
+            return result
+
+        fresh = self._load(missing)
+        stored = {}
+        for tag_id in missing:
+            tag = fresh.get(tag_id)
+            if tag is None:
+                # Tag ya eliminado (quotes archivadas): se renderiza sin guardar
+                result[tag_id] = dumps(render(by_id[tag_id]))
+                continue
+            result[tag_id] = dumps(render(tag))
+            if tag.project_id == by_id[tag_id].project_id:
+                stored[keys[tag_id]] = result[tag_id]
+
+        with self._lock:
+            self._entries.update(stored)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+    @staticmethod
+    def join(fragments: Dict[int, str], tags: Iterable[Tag]) -> str:
+        """Arreglo JSON de los tags de una quote"""
+        return json_array(fragments[tag.id] for tag in tags)
+
+    @staticmethod
+    def _load(tag_ids: List[int]) -> Dict[int, Tag]:
+        tags: Dict[int, Tag] = {}
+        for batch in batched(tag_ids):
+            for model in TagModel.objects.filter(pk__in=batch):
+                tags[model.id] = TagMapper.to_domain(model)
+        return tags
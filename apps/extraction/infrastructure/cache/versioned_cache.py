@@ -0,0 +1,49 @@
+from typing import Any, Callable, Dict, Hashable, Iterable
+
+from django.core.cache import cache as default_cache
+
+
+class VersionedCache:
+    """
+    Caché de resultados derivados (analítica, índices) cuya clave incluye la
+    versión de los datos de origen. No hace falta invalidar: al cambiar los
+    datos cambia la versión y la entrada vieja simplemente expira.
+    """
+
+    def __init__(self, backend=None, prefix: str = 'extraction', timeout: int = 60 * 60):
+        self.backend = backend or default_cache
+        self.prefix = prefix
+        self.timeout = timeout
+
+    def key(self, namespace: str, *parts: Any) -> str:
+        return ':'.join([self.prefix, namespace, *(str(p) for p in parts)])
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any], timeout: int = None) -> Any:
+        value = self.backend.get(key)
+        if value is None:
+            value = compute()
+            self.backend.set(key, value, timeout or self.timeout)
+        return value
+
+    def get_many_or_compute(
+            self,
+            keys: Dict[Hashable, str],
+            compute_missing: Callable[[Iterable[Hashable]], Dict[Hashable, Any]],
+            timeout: int = None
+    ) -> Dict[Hashable, Any]:
+        """
+        Variante por lotes: `keys` mapea cada ítem a su clave. Los ítems sin
+        entrada se calculan con una sola llamada a `compute_missing`.
+        """
+        found = self.backend.get_many(list(keys.values()))
+        values = {item: found[key] for item, key in keys.items() if key in found}
+
+        missing = [item for item in keys if item not in values]
+        if missing:
+            computed = compute_missing(missing)
+            self.backend.set_many(
+                {keys[item]: value for item, value in computed.items()},
+                timeout or self.timeout
+            )
+            values.update(computed)
+        return values
@@ -0,0 +1,76 @@
+import csv
+import json
+from datetime import date, datetime
+from typing import Iterable, Iterator, List
+
+# Tamaño aproximado de cada bloque enviado al cliente
+FLUSH_BYTES = 64 * 1024
+
+CONTENT_TYPES = {
+    'csv': 'text/csv; charset=utf-8',
+    'jsonl': 'application/x-ndjson; charset=utf-8',
+}
+
+
+class _Echo:
+    """Pseudo-buffer para csv.writer: devuelve la línea en lugar de guardarla"""
+
+    def write(self, value):
+        return value
+
+
+def _to_json_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _to_csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, (list, tuple)):
+        return '|'.join(str(v) for v in value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _buffered(lines: Iterable[str]) -> Iterator[str]:
+    """Agrupa líneas en bloques de ~64KB para no emitir un chunk por fila"""
+    buffer, size = [], 0
+    for line in lines:
+        buffer.append(line)
+        size += len(line)
+        if size >= FLUSH_BYTES:
+            yield ''.join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield ''.join(buffer)
+
+
+def stream_csv(rows: Iterable[dict], columns: List[str]) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+
+    def lines():
+        yield writer.writerow(columns)
+        for row in rows:
+            yield writer.writerow([_to_csv_value(row.get(c)) for c in columns])
+
+    return _buffered(lines())
+
+
+def stream_jsonl(rows: Iterable[dict], columns: List[str]) -> Iterator[str]:
+    def lines():
+        for row in rows:
+            yield json.dumps(
+                {c: _to_json_value(row.get(c)) for c in columns},
+                ensure_ascii=False
+            ) + '\n'
+
+    return _buffered(lines())
+
+
+STREAM_WRITERS = {
+    'csv': stream_csv,
+    'jsonl': stream_jsonl,
+}
@@ -0,0 +1,94 @@
+import csv
+import io
+import json
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from ...domain.dtos.codebook_dtos import CodebookEntryDTO
+from ...domain.exceptions.extraction_exceptions import ExtractionValidationError
+from ...domain.services.codebook import PATH_SEPARATOR
+
+CODEBOOK_FORMATS = ('csv', 'json')
+
+TRUE_VALUES = {'1', 'true', 'yes', 'si', 'sí', 'x'}
+
+
+def parse_codebook(content: str, fmt: str) -> List[CodebookEntryDTO]:
+    """
+    Lee un libro de códigos.
+
+    CSV: columnas `path` ("Tema > Subtema > Código") o `name` + `parent`
+    (ruta del padre), y opcionalmente `is_mandatory` y `question_id`.
+
+    JSON: lista de objetos con las mismas claves, o árbol anidado con
+    `name` y `children`.
+    """
+    if fmt == 'csv':
+        rows = csv.DictReader(io.StringIO(content.lstrip('﻿')))
+        return [_entry(row, line) for line, row in enumerate(rows, start=2)]
+
+    if fmt == 'json':
+        try:
+            data = json.loads(content)
+        except ValueError as e:
+            raise ExtractionValidationError(f"JSON inválido: {e}")
+        return entries_from_json(data)
+
+    raise ExtractionValidationError(
+        f"Formato inválido: {fmt}. Opciones: {', '.join(CODEBOOK_FORMATS)}"
+    )
+
+
+def entries_from_json(data) -> List[CodebookEntryDTO]:
+    """Entradas a partir del JSON ya decodificado (lista plana o árbol)"""
+    if isinstance(data, dict):
+        data = data.get('tags', [data])
+    if not isinstance(data, list):
+        raise ExtractionValidationError("El JSON debe ser una lista de códigos")
+    return list(_walk(data, ()))
+
+
+def _walk(nodes: Iterable, parent: Tuple[str, ...]) -> Iterator[CodebookEntryDTO]:
+    for index, node in enumerate(nodes, start=1):
+        if not isinstance(node, dict):
+            raise ExtractionValidationError(f"Entrada {index}: se esperaba un objeto")
+        entry = _entry(node, index, parent)
+        yield entry
+        yield from _walk(node.get('children') or [], entry.path)
+
+
+def _entry(row: dict, position: int, parent: Tuple[str, ...] = ()) -> CodebookEntryDTO:
+    path = _path(row.get('path'))
+    if not path:
+        name = str(row.get('name') or '').strip()
+        if not name:
+            raise ExtractionValidationError(f"Entrada {position}: falta `path` o `name`")
+        path = (parent or _path(row.get('parent'))) + (name,)
+
+    return CodebookEntryDTO(
+        path=path,
+        is_mandatory=_bool(row.get('is_mandatory')),
+        question_id=_int(row.get('question_id'), position),
+    )
+
+
+def _path(value) -> Tuple[str, ...]:
+    if isinstance(value, (list, tuple)):
+        return tuple(str(v).strip() for v in value)
+    if not value:
+        return ()
+    return tuple(part.strip() for part in str(value).split(PATH_SEPARATOR.strip()))
+
+
+def _bool(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value or '').strip().lower() in TRUE_VALUES
+
+
+def _int(value, position: int) -> Optional[int]:
+    if value in (None, ''):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ExtractionValidationError(f"Entrada {position}: question_id inválido ({value})")
@@ -0,0 +1,67 @@
+import heapq
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional, Tuple
+
+from ...domain.repositories.i_extraction_phase_repository import IExtractionPhaseRepository
+
+
+class PhaseDeadlineScheduler:
+    """
+    Mantiene en un heap los próximos end_date de fases con auto_close.
+
+    El heap se recarga desde la BD cada `refresh_interval` con las fases que
+    vencen dentro de `horizon` (consulta sobre el índice status/end_date). Entre
+    recargas, el worker duerme exactamente hasta el próximo deadline, así una
+    fase se cierra segundos después de vencer sin escanear la tabla.
+
+    El cierre es un UPDATE idempotente, por lo que varios workers pueden
+    ejecutar su propio scheduler sin coordinarse.
+    """
+
+    def __init__(
+            self,
+            phase_repo: IExtractionPhaseRepository,
+            close_expired: Callable[[datetime], List[int]],
+            horizon: timedelta = timedelta(hours=1),
+            refresh_interval: timedelta = timedelta(seconds=10)
+    ):
+        self.phase_repo = phase_repo
+        self.close_expired = close_expired
+        self.horizon = horizon
+        self.refresh_interval = refresh_interval
+        self._heap: List[Tuple[datetime, int]] = []
+        self._next_refresh: Optional[datetime] = None
+
+    def refresh(self, now: datetime) -> None:
+        self._heap = self.phase_repo.get_upcoming_deadlines(now + self.horizon)
+        heapq.heapify(self._heap)
+        self._next_refresh = now + self.refresh_interval
+
+    def tick(self, now: datetime) -> List[int]:
+        """
+        Cierra las fases vencidas. Retorna los project_id cerrados.
+        """
+        must_refresh = self._next_refresh is None or now >= self._next_refresh
+        if must_refresh:
+            self.refresh(now)
+
+        if not self._heap or self._heap[0][0] > now:
+            # En cada recarga se barre también lo vencido fuera del heap
+            # (fases activadas con end_date ya pasado entre recargas).
+            return self.close_expired(now) if must_refresh else []
+
+        while self._heap and self._heap[0][0] <= now:
+            heapq.heappop(self._heap)
+
+        return self.close_expired(now)
+
+    def seconds_until_next(self, now: datetime) -> float:
+        """Tiempo hasta el próximo deadline o recarga, lo que ocurra antes"""
+        candidates = []
+        if self._heap:
+            candidates.append(self._heap[0][0])
+        if self._next_refresh:
+            candidates.append(self._next_refresh)
+        if not candidates:
+            return 0.0
+        return max(0.0, (min(candidates) - now).total_seconds())
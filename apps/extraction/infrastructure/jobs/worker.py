@@ -0,0 +1,119 @@
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Optional, Sequence
+
+from django.db import close_old_connections
+from django.utils import timezone
+
+from ...domain.entities.job import Job
+from ...domain.repositories.i_job_queue_repository import IJobQueueRepository
+from .scheduler import PhaseDeadlineScheduler
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[dict], Optional[dict]]
+
+
+class JobWorker:
+    """
+    Worker de la cola de jobs.
+
+    Cada iteración: (1) deja que el scheduler cierre fases vencidas,
+    (2) reclama un lote de jobs y los ejecuta con el handler registrado
+    para su `kind`. Pueden correr varios procesos worker en paralelo.
+    """
+
+    def __init__(
+            self,
+            queue_repo: IJobQueueRepository,
+            handlers: Dict[str, JobHandler],
+            scheduler: Optional[PhaseDeadlineScheduler] = None,
+            queues: Sequence[str] = ('default',),
+            batch_size: int = 1,
+            lease_seconds: int = 300,
+            poll_interval: float = 2.0,
+            retry_base_seconds: int = 30,
+            worker_id: Optional[str] = None
+    ):
+        self.queue_repo = queue_repo
+        self.handlers = handlers
+        self.scheduler = scheduler
+        self.queues = list(queues)
+        self.batch_size = batch_size
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.retry_base_seconds = retry_base_seconds
+        self.worker_id = worker_id or (
+            f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        )
+
+    def run_once(self) -> int:
+        """Ejecuta una iteración. Retorna cuántos jobs se procesaron."""
+        if self.scheduler:
+            closed = self.scheduler.tick(timezone.now())
+            if closed:
+                logger.info("Fases cerradas automáticamente: %s", closed)
+
+        jobs = self.queue_repo.claim(
+            self.worker_id,
+            self.queues,
+            limit=self.batch_size,
+            lease_seconds=self.lease_seconds
+        )
+        for job in jobs:
+            self._execute(job)
+
+        return len(jobs)
+
+    def run_forever(self, stop_event: Optional[threading.Event] = None) -> None:
+        stop_event = stop_event or threading.Event()
+
+        while not stop_event.is_set():
+            close_old_connections()
+            processed = self.run_once()
+            if processed:
+                continue
+
+            wait = self.poll_interval
+            if self.scheduler:
+                wait = min(wait, self.scheduler.seconds_until_next(timezone.now()))
+            stop_event.wait(max(wait, 0.05))
+
+    def _execute(self, job: Job) -> None:
+        if job.attempts > job.max_attempts:
+            # Lease expirado de un job que ya consumió todos sus intentos
+            self.queue_repo.fail(job.id, self.worker_id, job.last_error or "Lease expirado")
+            return
+
+        handler = self.handlers.get(job.kind)
+        if not handler:
+            self.queue_repo.fail(
+                job.id,
+                self.worker_id,
+                f"No hay handler registrado para '{job.kind}'",
+                retry_delay_seconds=self.retry_base_seconds
+            )
+            return
+
+        started = time.monotonic()
+        try:
+            result = handler(job.payload)
+        except Exception as exc:
+            logger.exception("Job %s (%s) falló", job.id, job.kind)
+            self.queue_repo.fail(
+                job.id,
+                self.worker_id,
+                f"{type(exc).__name__}: {exc}",
+                retry_delay_seconds=self.retry_base_seconds * 2 ** (job.attempts - 1)
+            )
+            return
+
+        if not self.queue_repo.complete(job.id, self.worker_id, result):
+            logger.warning(
+                "Job %s terminó tras perder el lease (%.1fs)",
+                job.id, time.monotonic() - started
+            )
@@ -1,11 +1,18 @@
 from apps.extraction.domain.entities.extraction_phase import ExtractionPhase
+from typing import List, Optional
 from ...domain.entities.extraction import Extraction
 from ...domain.entities.extraction_phase import ExtractionPhase
+from ...domain.entities.job import Job
 from ...domain.entities.quote import Quote
+from ...domain.entities.quote_cluster import QuoteCluster, QuoteClusterRun
 from ...domain.entities.tag import Tag
 from ...domain.value_objects.extraction_mode import ExtractionMode
 from ...domain.value_objects.extraction_status import ExtractionStatus
-from ..models import ExtractionModel, QuoteModel, TagModel, ExtractionPhaseModel
+from ..models import (
+    ExtractionModel, QuoteModel, TagModel, ExtractionPhaseModel, JobModel,
+    QuoteClusterRunModel, QuoteClusterModel,
+)
+from ...domain.value_objects.job_status import JobStatus
 from ...domain.value_objects.phase_status import PhaseStatus
 from ...domain.value_objects.quote_location import QuoteLocation
 from ...domain.value_objects.tag_status import TagStatus
@@ -31,6 +38,7 @@ class ExtractionPhaseMapper:
             min_quotes_required=model.min_quotes_required,
             max_quotes_per_extraction=model.max_quotes_per_extraction,
             requires_approval=model.requires_approval,
+            closed_at=model.closed_at,
             created_at=model.created_at,
             updated_at=model.updated_at
         )
@@ -49,27 +57,32 @@ class ExtractionPhaseMapper:
             'min_quotes_required': entity.min_quotes_required,
             'max_quotes_per_extraction': entity.max_quotes_per_extraction,
             'requires_approval': entity.requires_approval,
+            'closed_at': entity.closed_at,
         }
 
 
 class ExtractionMapper:
     @staticmethod
-    def to_domain(model: ExtractionModel) -> Extraction:
+    def to_domain(model: ExtractionModel, quotes: Optional[List[Quote]] = None) -> Extraction:
+        """`quotes` permite hidratar desde un snapshot en vez de model.quotes"""
         if not model:
             return None
 
-        quotes_domain = [QuoteMapper.to_domain(q) for q in model.quotes.all()]
+        quotes_domain = quotes if quotes is not None else [QuoteMapper.to_domain(q) for q in model.quotes.all()]
 
         return Extraction(
             id=model.id,
             study_id=model.study_id,
-            assigned_to_user_id=model.assigned_to_id if model.assigned_to else None,
+            assigned_to_user_id=model.assigned_to_id,
             status=ExtractionStatus(model.status),
             started_at=model.started_at,
             completed_at=model.completed_at,
             quotes=quotes_domain,
             extraction_order=model.extraction_order,
-            max_quotes=100
+            max_quotes=100,
+            version=model.version,
+            is_consensus=model.is_consensus,
+            project_id=model.project_id
         )
 
     @staticmethod
@@ -82,6 +95,8 @@ class ExtractionMapper:
             'started_at': entity.started_at,
             'completed_at': entity.completed_at,
             'extraction_order': entity.extraction_order,
+            'is_consensus': entity.is_consensus,
+            'project_id': entity.project_id,
         }
 
 
@@ -98,6 +113,8 @@ class TagMapper:
             status=TagStatus(model.status),
             visibility=TagVisibility(model.visibility),
             type=TagType(model.type),
+            parent_id=model.parent_id,
+            color=model.color,
         )
 
     @staticmethod
@@ -112,6 +129,7 @@ class TagMapper:
             'status': entity.status.value,
             'visibility': entity.visibility.value,
             'type': entity.type.value,
+            'color': entity.color,
         }
 
 
@@ -119,21 +137,25 @@ class QuoteMapper:
     @staticmethod
     def to_domain(model: QuoteModel) -> Quote:
         tags_domain = [TagMapper.to_domain(t) for t in model.tags.all()]
-        location = None
-        if model.location_data:
-            try:
-                location = QuoteLocation.from_dict(model.location_data)
-            except (KeyError, ValueError):
-                location = None
         return Quote(
             id=model.id,
             extraction_id=model.extraction_id,
             text=model.text_portion,
             researcher_id=model.researcher_id,
             tags=tags_domain,
-            location=location,
+            location=QuoteMapper.location_from_data(model.location_data),
+            project_id=model.project_id,
         )
 
+    @staticmethod
+    def location_from_data(location_data: Optional[dict]) -> Optional[QuoteLocation]:
+        if not location_data:
+            return None
+        try:
+            return QuoteLocation.from_dict(location_data)
+        except (KeyError, ValueError):
+            return None
+
     @staticmethod
     def to_db(entity: Quote) -> dict:  # ✅ Nuevo método
         """Retorna diccionario para crear/actualizar modelo Django"""
@@ -143,7 +165,62 @@ class QuoteMapper:
         return {
             'extraction_id': entity.extraction_id,
             'text_portion': entity.text,
-            'location': entity.location,
             'researcher_id': entity.researcher_id,
             'location_data': location_data,
-        }
\ No newline at end of file
+            'project_id': entity.project_id,
+        }
+
+
+class JobMapper:
+    @staticmethod
+    def to_domain(model: JobModel) -> Job | None:
+        if not model:
+            return None
+
+        return Job(
+            id=model.id,
+            kind=model.kind,
+            queue=model.queue,
+            payload=model.payload or {},
+            status=JobStatus(model.status),
+            attempts=model.attempts,
+            max_attempts=model.max_attempts,
+            run_after=model.run_after,
+            locked_by=model.locked_by,
+            locked_until=model.locked_until,
+            result=model.result,
+            last_error=model.last_error,
+            created_at=model.created_at,
+        )
+
+
+class QuoteClusterMapper:
+    @staticmethod
+    def run_to_domain(model: QuoteClusterRunModel) -> QuoteClusterRun | None:
+        if not model:
+            return None
+
+        return QuoteClusterRun(
+            id=model.id,
+            project_id=model.project_id,
+            requested_by_user_id=model.requested_by_user_id,
+            k=model.k,
+            max_tags=model.max_tags,
+            status=JobStatus(model.status),
+            quote_count=model.quote_count,
+            cohesion=model.cohesion,
+            error=model.error,
+            created_at=model.created_at,
+            finished_at=model.finished_at,
+        )
+
+    @staticmethod
+    def cluster_to_domain(model: QuoteClusterModel) -> QuoteCluster:
+        return QuoteCluster(
+            run_id=model.run_id,
+            label=model.label,
+            size=model.size,
+            top_terms=list(model.top_terms or []),
+            sample_quote_ids=list(model.sample_quote_ids or []),
+            tag_id=model.tag_id,
+        )
@@ -0,0 +1,103 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List
+
+from django.db.models import QuerySet
+
+from ...domain.entities.quote import Quote
+from ...domain.entities.tag import Tag
+from ...domain.value_objects.tag_status import TagStatus
+from ...domain.value_objects.tag_type import TagType
+from ...domain.value_objects.tag_visibility import TagVisibility
+from ..models import QuoteModel, TagModel
+from ..search.base import batched
+from .domain_mappers import QuoteMapper
+
+_QUOTE_FIELDS = ('id', 'extraction_id', 'text_portion', 'researcher_id', 'location_data', 'project_id')
+_TAG_FIELDS = (
+    'id', 'name', 'project_id', 'is_mandatory', 'created_by_user_id',
+    'question_id', 'status', 'visibility', 'type', 'parent_id', 'color',
+)
+
+
+class TagInterner:
+    """
+    Flyweight de tags para una carga: un único Tag por id, leído de tuplas.
+
+    Con prefetch, cada vínculo quote–tag instancia un TagModel y un Tag (con
+    tres Enum); acá el costo es por tag distinto y las quotes comparten la
+    misma instancia.
+    """
+
+    def __init__(self):
+        self._tags: Dict[int, Tag] = {}
+
+    def get_many(self, tag_ids: Iterable[int]) -> Dict[int, Tag]:
+        missing = sorted({t for t in tag_ids if t not in self._tags})
+        for batch in batched(missing):
+            for row in TagModel.objects.filter(pk__in=batch).values_list(*_TAG_FIELDS):
+                self._tags[row[0]] = self._build(row)
+        return self._tags
+
+    @staticmethod
+    def _build(row: tuple) -> Tag:
+        (tag_id, name, project_id, is_mandatory, created_by_user_id,
+         question_id, status, visibility, tag_type, parent_id, color) = row
+        return Tag(
+            id=tag_id,
+            name=name,
+            project_id=project_id,
+            is_mandatory=is_mandatory,
+            created_by_user_id=created_by_user_id,
+            question_id=question_id,
+            status=TagStatus(status),
+            visibility=TagVisibility(visibility),
+            type=TagType(tag_type),
+            parent_id=parent_id,
+            color=color,
+        )
+
+
+class QuoteRowMapper:
+    """
+    Camino rápido de hidratación: quotes y vínculos como tuplas
+    (values_list) y entidades construidas directamente, sin pasar por
+    instancias de modelo. Tres consultas por lote sin importar el volumen.
+    """
+
+    def __init__(self, interner: TagInterner = None):
+        self.interner = interner or TagInterner()
+
+    def load(self, quotes: QuerySet) -> List[Quote]:
+        """Quotes del queryset en orden de id, con sus tags internados"""
+        rows = list(quotes.order_by('id').values_list(*_QUOTE_FIELDS))
+        if not rows:
+            return []
+
+        through = QuoteModel.tags.through
+        tag_ids_by_quote = defaultdict(list)
+        for batch in batched([row[0] for row in rows]):
+            links = through.objects.filter(quotemodel_id__in=batch).order_by('id')
+            for quote_id, tag_id in links.values_list('quotemodel_id', 'tagmodel_id'):
+                tag_ids_by_quote[quote_id].append(tag_id)
+
+        tags = self.interner.get_many(t for ids in tag_ids_by_quote.values() for t in ids)
+        location_from_data = QuoteMapper.location_from_data
+        return [
+            Quote(
+                id=quote_id,
+                extraction_id=extraction_id,
+                text=text,
+                researcher_id=researcher_id,
+                tags=[tags[t] for t in tag_ids_by_quote.get(quote_id, ())],
+                location=location_from_data(location_data),
+                project_id=project_id,
+            )
+            for quote_id, extraction_id, text, researcher_id, location_data, project_id in rows
+        ]
+
+    def load_by_extraction(self, extraction_ids: List[int]) -> Dict[int, List[Quote]]:
+        by_extraction: Dict[int, List[Quote]] = defaultdict(list)
+        for batch in batched(extraction_ids):
+            for quote in self.load(QuoteModel.objects.filter(extraction_id__in=batch)):
+                by_extraction[quote.extraction_id].append(quote)
+        return by_extraction
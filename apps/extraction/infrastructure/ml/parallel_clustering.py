@@ -0,0 +1,104 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List
+
+import numpy as np
+import scipy.sparse as sp
+
+from ...domain.dtos.analytics_dtos import QuoteTextBatchDTO
+from ...domain.dtos.clustering_dtos import ClusteringResultDTO, ClusterSummaryDTO
+from ...domain.services.quote_clustering import (
+    MiniBatchSphericalKMeans,
+    assign_to_centroids,
+    top_terms,
+)
+from ...domain.services.tfidf import select_columns, tfidf_matrix, vectorize_chunk
+
+
+class ParallelQuoteClusterer:
+    """
+    Agrupa quotes repartiendo en un pool de procesos lo que es paralelizable:
+    la tokenización/vectorización de cada lote leído de la BD y la asignación
+    final de todas las filas a su centroide. El ajuste por mini-lotes es
+    secuencial y corre en el proceso principal.
+
+    Los procesos hijos solo hacen cálculo numérico (no tocan la BD) y se
+    crean con 'spawn' para no heredar conexiones ni hilos del worker.
+    """
+
+    def __init__(
+            self,
+            workers: int = None,
+            max_features: int = 20000,
+            min_df: int = 2,
+            samples_per_cluster: int = 5,
+            terms_per_cluster: int = 10
+    ):
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.max_features = max_features
+        self.min_df = min_df
+        self.samples_per_cluster = samples_per_cluster
+        self.terms_per_cluster = terms_per_cluster
+
+    def cluster(self, batches: Iterable[QuoteTextBatchDTO], k: int, seed: int = 0) -> ClusteringResultDTO:
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=context) as pool:
+            quote_ids: List[int] = []
+            futures = []
+            # Se envía cada lote apenas se lee, así la BD y el pool trabajan a la vez
+            for batch in batches:
+                quote_ids.extend(batch.quote_ids)
+                futures.append(pool.submit(vectorize_chunk, batch.texts))
+
+            blocks = []
+            terms: Dict[int, str] = {}
+            for future in futures:
+                block, block_terms = future.result()
+                blocks.append(block)
+                for column, term in block_terms.items():
+                    terms.setdefault(column, term)
+
+            if not blocks:
+                raise ValueError("El proyecto no tiene quotes para agrupar")
+
+            tf = sp.vstack(blocks, format='csr')
+            columns = select_columns(tf, min_df=self.min_df, max_features=self.max_features)
+            matrix = tfidf_matrix(sp.csr_matrix(tf[:, columns]))
+            column_terms = [terms.get(int(c), '') for c in columns]
+
+            # Las quotes sin términos útiles no aportan al agrupamiento
+            useful = np.flatnonzero(np.diff(matrix.indptr) > 0)
+            matrix = matrix[useful]
+            quote_ids_arr = np.asarray(quote_ids, dtype=np.int64)[useful]
+
+            centroids = MiniBatchSphericalKMeans(k, seed=seed).fit(matrix)
+
+            step = max(1, -(-matrix.shape[0] // (self.workers * 4)))
+            chunks = [matrix[i:i + step] for i in range(0, matrix.shape[0], step)]
+            parts = list(pool.map(assign_to_centroids, chunks, [centroids] * len(chunks)))
+
+        labels = np.concatenate([p[0] for p in parts])
+        scores = np.concatenate([p[1] for p in parts])
+
+        return ClusteringResultDTO(
+            quote_ids=quote_ids_arr,
+            labels=labels,
+            scores=scores,
+            clusters=self._summaries(quote_ids_arr, labels, scores, centroids, column_terms),
+        )
+
+    def _summaries(self, quote_ids, labels, scores, centroids, column_terms) -> List[ClusterSummaryDTO]:
+        summaries = []
+        for label in range(centroids.shape[0]):
+            members = np.flatnonzero(labels == label)
+            if not len(members):
+                continue
+            central = members[np.argsort(-scores[members], kind='stable')[:self.samples_per_cluster]]
+            summaries.append(ClusterSummaryDTO(
+                label=label,
+                size=int(len(members)),
+                top_terms=top_terms(centroids[label], column_terms, self.terms_per_cluster),
+                sample_quote_ids=quote_ids[central].tolist(),
+            ))
+        return summaries
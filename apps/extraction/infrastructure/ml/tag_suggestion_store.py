@@ -0,0 +1,80 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from ...domain.dtos.analytics_dtos import QuoteSetFingerprintDTO
+from ...domain.repositories.i_analytics_repository import IAnalyticsRepository
+from ...domain.repositories.i_project_version_repository import IProjectVersionRepository
+from ...domain.services.tag_suggester import TfidfTagSuggester
+
+
+@dataclass
+class _ProjectModel:
+    catalog_version: int
+    coding_version: int = -1
+    last_quote_id: int = 0
+    fingerprint: QuoteSetFingerprintDTO = field(default_factory=QuoteSetFingerprintDTO)
+    suggester: TfidfTagSuggester = field(default_factory=TfidfTagSuggester)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class TagSuggestionModelStore:
+    """
+    Modelos TF-IDF por proyecto, en memoria del proceso.
+
+    Al pedir un modelo se compara la versión de codificación del proyecto con
+    la del modelo. Si cambió, se verifica que las quotes hasta el último id
+    incorporado sigan siendo las mismas (huella: cantidad y suma de ids de
+    quotes y tags); si es así el cambio fue solo de altas y se leen las de id
+    mayor. Si no (quotes borradas, archivadas, re-etiquetadas o confirmadas
+    fuera de orden de id por altas concurrentes) el modelo se reconstruye
+    desde cero, igual que ante un cambio en el catálogo de tags.
+    """
+
+    def __init__(
+            self,
+            analytics_repo: IAnalyticsRepository,
+            version_repo: IProjectVersionRepository,
+            max_projects: int = 16,
+            chunk_size: int = 2000
+    ):
+        self.analytics_repo = analytics_repo
+        self.version_repo = version_repo
+        self.max_projects = max_projects
+        self.chunk_size = chunk_size
+        self._models: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _entry(self, project_id: int, catalog_version: int) -> _ProjectModel:
+        with self._lock:
+            entry = self._models.get(project_id)
+            if entry is None or entry.catalog_version != catalog_version:
+                entry = _ProjectModel(catalog_version=catalog_version)
+                self._models[project_id] = entry
+            self._models.move_to_end(project_id)
+            while len(self._models) > self.max_projects:
+                self._models.popitem(last=False)
+            return entry
+
+    def get(self, project_id: int) -> TfidfTagSuggester:
+        versions = self.version_repo.get(project_id)
+        entry = self._entry(project_id, versions.tag_catalog_version)
+
+        with entry.lock:
+            if entry.coding_version != versions.coding_version:
+                current = self.analytics_repo.get_quote_set_fingerprint(project_id, entry.last_quote_id)
+                if current != entry.fingerprint:
+                    entry.suggester = TfidfTagSuggester()
+                    entry.last_quote_id = 0
+                    entry.fingerprint = QuoteSetFingerprintDTO()
+                for batch in self.analytics_repo.iter_quote_text_batches(
+                        project_id,
+                        after_quote_id=entry.last_quote_id,
+                        chunk_size=self.chunk_size
+                ):
+                    entry.suggester.add(batch.quote_ids, batch.texts, batch.tag_ids)
+                    entry.last_quote_id = batch.quote_ids[-1]
+                    entry.fingerprint = entry.fingerprint.extended(batch)
+                entry.coding_version = versions.coding_version
+
+        return entry.suggester
@@ -5,6 +5,7 @@ from django.utils import timezone
 
 from ..domain.value_objects.extraction_mode import ExtractionMode
 from ..domain.value_objects.extraction_status import ExtractionStatus
+from ..domain.value_objects.job_status import JobStatus
 from ..domain.value_objects.phase_status import PhaseStatus
 from ..domain.value_objects.tag_status import TagStatus
 from ..domain.value_objects.tag_type import TagType
@@ -77,6 +78,12 @@ class ExtractionPhaseModel(models.Model):
         help_text="Las extracciones completadas requieren aprobación del owner"
     )
 
+    closed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Momento en que la fase pasó a COMPLETED o AUTO_CLOSED"
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -88,6 +95,7 @@ class ExtractionPhaseModel(models.Model):
         indexes = [
             models.Index(fields=['project_id', 'status']),
             models.Index(fields=['status', 'end_date']),  # Para auto_close jobs
+            models.Index(fields=['status', 'closed_at']),  # Para archivado en frío
         ]
 
     def __str__(self):
@@ -112,6 +120,11 @@ class ExtractionModel(models.Model):
         help_text="ID del estudio en el servicio de Acquisition/Studies",
         db_index=True
     )
+    project_id = models.BigIntegerField(
+        null=True,
+        blank=True,
+        help_text="Proyecto del estudio, copiado al crear (evita consultar Acquisition por estudio)"
+    )
     assigned_to = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.SET_NULL,
@@ -129,6 +142,14 @@ class ExtractionModel(models.Model):
     )
     started_at = models.DateTimeField(null=True, blank=True)
     completed_at = models.DateTimeField(null=True, blank=True)
+    version = models.PositiveIntegerField(
+        default=1,
+        help_text="Se incrementa con cada cambio de la extracción o de sus quotes (clave de caché)"
+    )
+    is_consensus = models.BooleanField(
+        default=False,
+        help_text="Borrador de consenso entre las extracciones del estudio (extraction_order=0)"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -136,13 +157,21 @@ class ExtractionModel(models.Model):
         db_table = 'extraction_extraction'
         indexes = [
             models.Index(fields=['study_id', 'assigned_to']),
-            models.Index(fields=['study_id', 'extraction_order']),
+            models.Index(fields=['status', 'completed_at']),
+            models.Index(fields=['project_id', 'status']),
         ]
         constraints = [
             models.UniqueConstraint(
                 fields=['study_id', 'assigned_to'],
+                condition=models.Q(is_consensus=False),
                 name='unique_study_user_extraction'
-            )
+            ),
+            # Cada extraction_order es un cupo: dos altas simultáneas no pueden
+            # tomar el mismo (su índice reemplaza al de study_id/extraction_order)
+            models.UniqueConstraint(
+                fields=['study_id', 'extraction_order'],
+                name='unique_study_extraction_order'
+            ),
         ]
 
     def __str__(self):
@@ -171,9 +200,45 @@ class TagModel(models.Model):
         choices=[(s.value, s.value) for s in TagVisibility],
         default=TagVisibility.PRIVATE.value
     )
+    parent = models.ForeignKey(
+        'self',
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name='children',
+        help_text="Tema padre en el libro de códigos (NULL = raíz)"
+    )
 
     class Meta:
         db_table = 'extraction_tag'
+        indexes = [
+            models.Index(fields=['project_id', 'status', 'visibility']),
+            models.Index(fields=['project_id', 'created_by_user_id']),
+            # Cola de moderación: pendientes por proyecto en orden de id
+            models.Index(fields=['project_id', 'status', 'id']),
+        ]
+
+
+class TagClosureModel(models.Model):
+    """
+    Tabla de clausura de la jerarquía de tags: una fila por cada par
+    (ancestro, descendiente), incluido el propio tag con depth=0.
+
+    "Todo lo que cuelga de X" es un filtro por ancestor, y "los ancestros de Y"
+    un filtro por descendant, ambos sobre índice y sin recursión.
+    """
+    ancestor = models.ForeignKey(TagModel, on_delete=models.CASCADE, related_name='descendant_links')
+    descendant = models.ForeignKey(TagModel, on_delete=models.CASCADE, related_name='ancestor_links')
+    depth = models.PositiveSmallIntegerField()
+
+    class Meta:
+        db_table = 'extraction_tag_closure'
+        constraints = [
+            models.UniqueConstraint(fields=['ancestor', 'descendant'], name='unique_tag_closure_path')
+        ]
+        indexes = [
+            models.Index(fields=['descendant', 'depth']),
+        ]
 
 class QuoteModel(models.Model):
     extraction = models.ForeignKey(
@@ -181,6 +246,11 @@ class QuoteModel(models.Model):
         on_delete=models.CASCADE,
         related_name='quotes'
     )
+    project_id = models.BigIntegerField(
+        null=True,
+        blank=True,
+        help_text="Proyecto de la extracción, copiado al crear"
+    )
     text_portion = models.TextField()
     location_data = models.JSONField(
         null=True,
@@ -195,10 +265,266 @@ class QuoteModel(models.Model):
         db_table = 'extraction_quote'
         indexes = [
             models.Index(fields=['extraction', 'created_at']),
+            models.Index(fields=['project_id', 'created_at']),
         ]
 
     def __str__(self):
         page_info = ""
         if self.location_data and self.location_data.get('page'):
             page_info = f" (Pág. {self.location_data['page']})"
-        return f"Quote {self.id}{page_info}: {self.text_portion[:50]}"
\ No newline at end of file
+        return f"Quote {self.id}{page_info}: {self.text_portion[:50]}"
+
+
+class ProjectDataVersionModel(models.Model):
+    """
+    Contadores de versión por proyecto para invalidar cachés derivadas.
+
+    - tag_catalog_version: cambia al crear/editar/eliminar tags del proyecto
+    - coding_version: cambia al crear/editar/eliminar quotes (o sus tags)
+    """
+    project_id = models.IntegerField(unique=True)
+    tag_catalog_version = models.PositiveBigIntegerField(default=0)
+    coding_version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'extraction_project_version'
+
+    def __str__(self):
+        return (
+            f"Project {self.project_id} "
+            f"(tags v{self.tag_catalog_version}, coding v{self.coding_version})"
+        )
+
+
+class JobModel(models.Model):
+    """
+    Cola persistente de trabajos en segundo plano.
+
+    Los workers reclaman jobs con un lease (locked_by/locked_until); si un
+    worker muere, el job vuelve a estar disponible cuando el lease expira.
+    """
+    kind = models.CharField(max_length=100, help_text="Tipo de job (ej: phases.close_expired)")
+    queue = models.CharField(max_length=50, default='default')
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(
+        max_length=20,
+        choices=[(s.value, s.value) for s in JobStatus],
+        default=JobStatus.QUEUED.value
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=3)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=100, null=True, blank=True)
+    locked_until = models.DateTimeField(null=True, blank=True)
+    dedupe_key = models.CharField(max_length=200, null=True, blank=True)
+    result = models.JSONField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'extraction_job'
+        indexes = [
+            models.Index(fields=['queue', 'status', 'run_after']),  # Para claim
+            models.Index(fields=['status', 'locked_until']),  # Leases expirados
+            models.Index(fields=['dedupe_key', 'status']),
+        ]
+
+    def __str__(self):
+        return f"Job {self.id} - {self.kind} ({self.status})"
+
+
+class QuoteSignatureModel(models.Model):
+    """
+    Firma MinHash de una quote (índice de casi duplicados).
+
+    extraction_id/researcher_id se copian de la quote para poder filtrar y
+    agrupar candidatos sin volver a leer extraction_quote.
+    """
+    quote = models.OneToOneField(
+        QuoteModel,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='signature'
+    )
+    project_id = models.IntegerField(db_index=True)
+    extraction_id = models.IntegerField()
+    researcher_id = models.IntegerField()
+    signature = models.BinaryField()
+
+    class Meta:
+        db_table = 'extraction_quote_signature'
+
+
+class QuoteLshBucketModel(models.Model):
+    """Una fila por banda LSH de cada quote: las búsquedas van por (project_id, band_key)"""
+    project_id = models.IntegerField()
+    band_key = models.BigIntegerField()
+    quote = models.ForeignKey(
+        QuoteModel,
+        on_delete=models.CASCADE,
+        related_name='lsh_buckets'
+    )
+
+    class Meta:
+        db_table = 'extraction_quote_lsh_bucket'
+        indexes = [
+            models.Index(fields=['project_id', 'band_key']),
+        ]
+
+
+class QuoteClusterRunModel(models.Model):
+    """Ejecución del agrupamiento de quotes de un proyecto"""
+    project_id = models.IntegerField()
+    requested_by_user_id = models.IntegerField()
+    k = models.PositiveSmallIntegerField()
+    max_tags = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        help_text="Solo quotes con a lo sumo esta cantidad de tags (None: todas)"
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=[(s.value, s.value) for s in JobStatus],
+        default=JobStatus.QUEUED.value
+    )
+    quote_count = models.PositiveIntegerField(default=0)
+    cohesion = models.FloatField(null=True, blank=True)
+    error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'extraction_quote_cluster_run'
+        indexes = [
+            models.Index(fields=['project_id', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"ClusterRun {self.id} - Project {self.project_id} (k={self.k}, {self.status})"
+
+
+class QuoteClusterModel(models.Model):
+    run = models.ForeignKey(
+        QuoteClusterRunModel,
+        on_delete=models.CASCADE,
+        related_name='clusters'
+    )
+    label = models.PositiveSmallIntegerField()
+    size = models.PositiveIntegerField()
+    top_terms = models.JSONField(default=list)
+    sample_quote_ids = models.JSONField(default=list)
+    tag_id = models.IntegerField(null=True, blank=True, help_text="Tag inductivo creado desde el cluster")
+
+    class Meta:
+        db_table = 'extraction_quote_cluster'
+        constraints = [
+            models.UniqueConstraint(fields=['run', 'label'], name='unique_cluster_label_per_run'),
+        ]
+
+
+class QuoteClusterAssignmentModel(models.Model):
+    run = models.ForeignKey(
+        QuoteClusterRunModel,
+        on_delete=models.CASCADE,
+        related_name='assignments'
+    )
+    quote = models.ForeignKey(QuoteModel, on_delete=models.CASCADE)
+    label = models.PositiveSmallIntegerField()
+    score = models.FloatField(help_text="Similitud coseno con el centroide")
+
+    class Meta:
+        db_table = 'extraction_quote_cluster_assignment'
+        indexes = [
+            models.Index(fields=['run', 'label', 'score']),
+        ]
+
+
+class SaturationStateModel(models.Model):
+    """
+    Curva de saturación acumulada por proyecto (una fila por proyecto).
+    Guarda el cursor de la última extracción procesada para continuar
+    incrementalmente.
+    """
+    project_id = models.IntegerField(unique=True)
+    tag_catalog_version = models.PositiveBigIntegerField(default=0)
+    seen_tag_ids = models.JSONField(default=list)
+    points = models.JSONField(default=list)
+    last_completed_at = models.DateTimeField(null=True, blank=True)
+    last_extraction_id = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'extraction_saturation_state'
+
+    def __str__(self):
+        return f"Saturation Project {self.project_id} ({len(self.seen_tag_ids)} códigos)"
+
+
+class ExtractionDetailProjectionModel(models.Model):
+    """
+    Modelo de lectura (CQRS) del detalle de una extracción.
+
+    `document` guarda el JSON ya renderizado (quotes, tags y ubicaciones) tal
+    como lo responde GET /extractions/{id}/; los handlers de escritura lo
+    regeneran después del commit. Los demás campos son los que necesita el
+    control de acceso sin abrir el documento.
+    """
+    extraction = models.OneToOneField(
+        ExtractionModel,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='detail_projection'
+    )
+    study_id = models.BigIntegerField()
+    project_id = models.BigIntegerField(null=True, blank=True)
+    assigned_to_user_id = models.BigIntegerField(null=True, blank=True)
+    source_version = models.PositiveIntegerField(
+        help_text="ExtractionModel.version con la que se renderizó el documento"
+    )
+    document = models.TextField()
+    rendered_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'extraction_detail_projection'
+        indexes = [
+            models.Index(fields=['project_id']),
+        ]
+
+    def __str__(self):
+        return f"Detail projection Extraction {self.extraction_id} (v{self.source_version})"
+
+
+class ExtractionSnapshotModel(models.Model):
+    """
+    Snapshot inmutable de una extracción congelada (completada o con la fase
+    cerrada): sus quotes y los tags que usan, en JSON comprimido con zlib.
+
+    source_version es la ExtractionModel.version capturada; mientras coincida,
+    las lecturas salen del snapshot. Con archived_at las quotes ya no están en
+    las tablas calientes y el snapshot es la única copia.
+    """
+    extraction = models.OneToOneField(
+        ExtractionModel,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='snapshot'
+    )
+    project_id = models.BigIntegerField(null=True, blank=True)
+    format_version = models.PositiveSmallIntegerField(default=1)
+    source_version = models.PositiveIntegerField()
+    quote_count = models.PositiveIntegerField(default=0)
+    raw_size = models.PositiveIntegerField(help_text="Bytes del JSON antes de comprimir")
+    payload = models.BinaryField()
+    captured_at = models.DateTimeField(auto_now=True)
+    archived_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'extraction_snapshot'
+        indexes = [
+            models.Index(fields=['project_id', 'archived_at']),
+        ]
+
+    def __str__(self):
+        return f"Snapshot Extraction {self.extraction_id} (v{self.source_version}, {self.quote_count} quotes)"
@@ -0,0 +1,151 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from django.db import transaction
+from django.utils import timezone
+
+from ...domain.dtos.extraction_detail_dtos import ExtractionDetailDocumentDTO
+from ...domain.entities.extraction import Extraction
+from ...domain.repositories.i_extraction_detail_projection import IExtractionDetailProjection
+from ..cache.tag_fragments import TagFragmentCache, dumps, json_array, splice
+from ..repositories.django_extraction_snapshot_repository import load_extractions
+from ..models import ExtractionDetailProjectionModel, ExtractionModel, QuoteModel
+from ..search.base import batched
+
+_UPDATE_FIELDS = ['study_id', 'project_id', 'assigned_to_user_id', 'source_version', 'document', 'rendered_at']
+
+
+class DjangoExtractionDetailProjection(IExtractionDetailProjection):
+    """
+    Tabla extraction_detail_projection: un documento JSON por extracción.
+
+    El renderizado (agregado → dict → JSON) se paga una vez por escritura en
+    lugar de en cada GET. refresh() difiere el trabajo a transaction.on_commit
+    para no proyectar datos que terminen en rollback; fuera de una transacción
+    on_commit ejecuta de inmediato.
+    """
+
+    def __init__(self, tag_fragments: TagFragmentCache):
+        self.tag_fragments = tag_fragments
+
+    def get(self, extraction_id: int) -> Optional[ExtractionDetailDocumentDTO]:
+        row = ExtractionDetailProjectionModel.objects.filter(pk=extraction_id).values_list(
+            'study_id', 'project_id', 'assigned_to_user_id', 'document'
+        ).first()
+        if row is None:
+            return None
+        study_id, project_id, assigned_to_user_id, document = row
+        return ExtractionDetailDocumentDTO(extraction_id, study_id, project_id, assigned_to_user_id, document)
+
+    def render(self, extraction_id: int) -> Optional[ExtractionDetailDocumentDTO]:
+        rows = self._project([extraction_id])
+        return self._to_dto(rows[0]) if rows else None
+
+    def refresh(self, extraction_ids: Iterable[int]) -> None:
+        ids = sorted({pk for pk in extraction_ids if pk is not None})
+        if ids:
+            transaction.on_commit(lambda: self._project(ids))
+
+    def refresh_by_tags(self, tag_ids: Iterable[int]) -> None:
+        through = QuoteModel.tags.through
+        extraction_ids = set()
+        for batch in batched(sorted(set(tag_ids))):
+            extraction_ids.update(
+                through.objects.filter(tagmodel_id__in=batch)
+                .values_list('quotemodel__extraction_id', flat=True)
+                .distinct()
+            )
+        self.refresh(extraction_ids)
+
+    def rebuild(self, project_id: int = None, chunk_size: int = 500) -> int:
+        qs = ExtractionModel.objects.all()
+        if project_id is not None:
+            qs = qs.filter(project_id=project_id)
+        ids = qs.order_by('id').values_list('id', flat=True).iterator(chunk_size=chunk_size)
+
+        total = 0
+        batch: List[int] = []
+        for extraction_id in ids:
+            batch.append(extraction_id)
+            if len(batch) >= chunk_size:
+                total += len(self._project(batch))
+                batch = []
+        if batch:
+            total += len(self._project(batch))
+        return total
+
+    def _project(self, extraction_ids: List[int]) -> List[ExtractionDetailProjectionModel]:
+        """Renderiza y hace upsert de los documentos; las extracciones borradas salen por CASCADE"""
+        rows = []
+        for batch in batched(extraction_ids):
+            models = list(ExtractionModel.objects.filter(pk__in=batch))
+            extractions = load_extractions(models)
+            fragments = self.tag_fragments.fragments(
+                t for e in extractions for q in e.quotes for t in q.tags
+            )
+            for model, extraction in zip(models, extractions):
+                rows.append(ExtractionDetailProjectionModel(
+                    extraction_id=model.id,
+                    study_id=model.study_id,
+                    project_id=model.project_id,
+                    assigned_to_user_id=model.assigned_to_id,
+                    source_version=model.version,
+                    document=self.render_json(extraction, fragments),
+                    rendered_at=timezone.now()
+                ))
+
+        ExtractionDetailProjectionModel.objects.bulk_create(
+            rows,
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=['extraction'],
+            update_fields=_UPDATE_FIELDS
+        )
+        return rows
+
+    @staticmethod
+    def _to_dto(row: ExtractionDetailProjectionModel) -> ExtractionDetailDocumentDTO:
+        return ExtractionDetailDocumentDTO(
+            extraction_id=row.extraction_id,
+            study_id=row.study_id,
+            project_id=row.project_id,
+            assigned_to_user_id=row.assigned_to_user_id,
+            document=row.document
+        )
+
+    def render_json(self, extraction: Extraction, fragments: Dict[int, str]) -> str:
+        """Mismo contrato que ExtractionDetailSerializer; los tags se pegan desde la caché"""
+        quotes = json_array(
+            splice(
+                {
+                    "id": q.id,
+                    "text": q.text,
+                    "location": q.location.to_dict() if q.location else None,
+                    "researcher_id": q.researcher_id,
+                },
+                tags=TagFragmentCache.join(fragments, q.tags)
+            )
+            for q in extraction.quotes
+        )
+        return splice(
+            {
+                "id": extraction.id,
+                "study_id": extraction.study_id,
+                "assigned_to_user_id": extraction.assigned_to_user_id,
+                "status": extraction.status.value,
+                "started_at": self._datetime(extraction.started_at),
+                "completed_at": self._datetime(extraction.completed_at),
+            },
+            quotes=quotes,
+            is_active=dumps(extraction.is_active)
+        )
+
+    @staticmethod
+    def _datetime(value: Optional[datetime]) -> Optional[str]:
+        """ISO 8601 en la zona activa, con 'Z' para UTC (igual que DRF)"""
+        if value is None:
+            return None
+        if timezone.is_aware(value):
+            value = timezone.localtime(value)
+        text = value.isoformat()
+        return text[:-6] + 'Z' if text.endswith('+00:00') else text
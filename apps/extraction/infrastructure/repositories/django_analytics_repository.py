@@ -0,0 +1,188 @@
+from array import array
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+from django.db.models import Count, IntegerField, Min, Sum
+from django.db.models.fields.json import KT
+from django.db.models.functions import Cast, Coalesce, Substr
+
+from ...domain.dtos.analytics_dtos import PageTagLinksDTO, QuoteSetFingerprintDTO, QuoteTagIncidenceDTO, QuoteTextBatchDTO, StudyTagCellsDTO, TagCatalogEntryDTO
+from ...domain.repositories.i_analytics_repository import IAnalyticsRepository
+from ..models import QuoteModel, TagModel
+from .project_scope import project_extractions, project_quotes
+
+
+# Límite prudente de parámetros por consulta IN (SQLite)
+IN_BATCH_SIZE = 900
+
+
+class DjangoAnalyticsRepository(IAnalyticsRepository):
+
+    def get_quote_tag_incidence(self, project_id: int) -> QuoteTagIncidenceDTO:
+        through = QuoteModel.tags.through
+        rows = through.objects.filter(
+            quotemodel__project_id=project_id,
+            quotemodel__extraction__is_consensus=False
+        ).values_list(
+            'quotemodel_id',
+            'quotemodel__extraction_id',
+            'quotemodel__extraction__study_id',
+            'tagmodel_id',
+        ).iterator(chunk_size=10000)
+
+        # array('q') evita una lista de tuplas intermedia
+        quote_ids, extraction_ids, study_ids, tag_ids = (array('q') for _ in range(4))
+        for quote_id, extraction_id, study_id, tag_id in rows:
+            quote_ids.append(quote_id)
+            extraction_ids.append(extraction_id)
+            study_ids.append(study_id)
+            tag_ids.append(tag_id)
+
+        return QuoteTagIncidenceDTO(
+            quote_ids=np.frombuffer(quote_ids, dtype=np.int64),
+            extraction_ids=np.frombuffer(extraction_ids, dtype=np.int64),
+            study_ids=np.frombuffer(study_ids, dtype=np.int64),
+            tag_ids=np.frombuffer(tag_ids, dtype=np.int64),
+        )
+
+    def get_tag_names(self, project_id: int) -> Dict[int, str]:
+        return dict(
+            TagModel.objects.filter(project_id=project_id).values_list('id', 'name')
+        )
+
+    def get_tag_parents(self, project_id: int) -> Dict[int, Optional[int]]:
+        return dict(
+            TagModel.objects.filter(project_id=project_id).values_list('id', 'parent_id')
+        )
+
+    def get_tag_catalog(self, project_id: int) -> List[TagCatalogEntryDTO]:
+        rows = TagModel.objects.filter(
+            project_id=project_id
+        ).annotate(
+            quote_count=Count('quotes')
+        ).values_list('id', 'name', 'type', 'status', 'quote_count')
+
+        return [TagCatalogEntryDTO(*row) for row in rows]
+
+
+    def get_study_tag_cells(self, project_id: int) -> StudyTagCellsDTO:
+        through = QuoteModel.tags.through
+        rows = through.objects.filter(
+            quotemodel__project_id=project_id,
+            quotemodel__extraction__is_consensus=False
+        ).values(
+            'quotemodel__extraction__study_id',
+            'tagmodel_id',
+        ).annotate(
+            quote_count=Count('quotemodel_id'),
+            sample_quote_id=Min('quotemodel_id'),
+        ).values_list(
+            'quotemodel__extraction__study_id',
+            'tagmodel_id',
+            'quote_count',
+            'sample_quote_id',
+        ).order_by()
+
+        columns = np.array(list(rows), dtype=np.int64).reshape(-1, 4)
+        return StudyTagCellsDTO(
+            study_ids=columns[:, 0],
+            tag_ids=columns[:, 1],
+            quote_counts=columns[:, 2],
+            sample_quote_ids=columns[:, 3],
+        )
+
+    def get_quote_snippets(self, quote_ids: Iterable[int], length: int = 200) -> Dict[int, str]:
+        quote_ids = list(quote_ids)
+        snippets = {}
+        for start in range(0, len(quote_ids), IN_BATCH_SIZE):
+            snippets.update(
+                QuoteModel.objects.filter(
+                    pk__in=quote_ids[start:start + IN_BATCH_SIZE]
+                ).annotate(
+                    snippet=Substr('text_portion', 1, length)
+                ).values_list('id', 'snippet')
+            )
+        return snippets
+
+    def iter_quote_text_batches(
+            self,
+            project_id: int,
+            after_quote_id: int = 0,
+            chunk_size: int = 2000
+    ) -> Iterator[QuoteTextBatchDTO]:
+        rows = project_quotes(project_id).filter(
+            pk__gt=after_quote_id
+        ).order_by('pk').values_list('id', 'text_portion').iterator(chunk_size=chunk_size)
+
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= chunk_size:
+                yield self._text_batch(batch)
+                batch = []
+        if batch:
+            yield self._text_batch(batch)
+
+    def get_quote_set_fingerprint(self, project_id: int, up_to_quote_id: int) -> QuoteSetFingerprintDTO:
+        quotes = project_quotes(project_id).filter(pk__lte=up_to_quote_id)
+        totals = quotes.aggregate(quote_count=Count('id'), quote_id_sum=Coalesce(Sum('id'), 0))
+        links = QuoteModel.tags.through.objects.filter(quotemodel__in=quotes).aggregate(
+            link_count=Count('id'), tag_id_sum=Coalesce(Sum('tagmodel_id'), 0)
+        )
+        return QuoteSetFingerprintDTO(**totals, **links)
+
+    @staticmethod
+    def _text_batch(rows: list) -> QuoteTextBatchDTO:
+        quote_ids = [quote_id for quote_id, _ in rows]
+        tags_by_quote = defaultdict(list)
+        for quote_id, tag_id in QuoteModel.tags.through.objects.filter(
+                quotemodel_id__in=quote_ids
+        ).order_by('tagmodel_id').values_list('quotemodel_id', 'tagmodel_id'):
+            tags_by_quote[quote_id].append(tag_id)
+
+        return QuoteTextBatchDTO(
+            quote_ids=quote_ids,
+            texts=[text for _, text in rows],
+            tag_ids=[tuple(tags_by_quote.get(quote_id, ())) for quote_id in quote_ids],
+        )
+
+    def get_extraction_versions(self, project_id: int, study_id: Optional[int] = None) -> Dict[int, int]:
+        qs = project_extractions(project_id)
+        if study_id is not None:
+            qs = qs.filter(study_id=study_id)
+        return dict(qs.values_list('id', 'version'))
+
+    def get_page_tag_links(self, project_id: int, extraction_ids: Iterable[int]) -> PageTagLinksDTO:
+        extraction_ids = list(extraction_ids)
+
+        # Se parte de QuoteModel: KT no resuelve bien el JSON a través de la
+        # tabla intermedia autogenerada. El filtro y el values sobre `tags`
+        # comparten el mismo JOIN.
+        columns = tuple(array('q') for _ in range(4))
+        for start in range(0, len(extraction_ids), IN_BATCH_SIZE):
+            rows = QuoteModel.objects.filter(
+                extraction_id__in=extraction_ids[start:start + IN_BATCH_SIZE],
+                tags__project_id=project_id
+            ).annotate(
+                page=Cast(KT('location_data__page'), IntegerField()),
+                page_count=Coalesce(Cast(KT('location_data__page_count'), IntegerField()), 0),
+            ).filter(
+                page__isnull=False
+            ).values_list(
+                'extraction_id', 'page', 'page_count', 'tags__id'
+            ).order_by().iterator(chunk_size=10000)
+
+            for row in rows:
+                for column, value in zip(columns, row):
+                    column.append(value)
+
+        extraction_col, pages, page_counts, tag_ids = (
+            np.frombuffer(column, dtype=np.int64) for column in columns
+        )
+        return PageTagLinksDTO(
+            extraction_ids=extraction_col,
+            pages=pages,
+            page_counts=page_counts,
+            tag_ids=tag_ids,
+        )
@@ -1,4 +1,5 @@
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Tuple
 from django.db.models import Q
 from django.utils import timezone
 from ...domain.repositories.i_extraction_phase_repository import IExtractionPhaseRepository
@@ -7,18 +8,28 @@ from ..models import ExtractionPhaseModel
 from ..mappers.domain_mappers import ExtractionPhaseMapper
 from ...domain.value_objects.phase_status import PhaseStatus
 
+CLOSED_STATUSES = (PhaseStatus.COMPLETED, PhaseStatus.AUTO_CLOSED)
+
 
 class DjangoExtractionPhaseRepository(IExtractionPhaseRepository):
 
-    def get_by_project_id(self, project_id: int) -> Optional[ExtractionPhase]:
+    def get_by_project_id(self, project_id: int, for_update: bool = False) -> Optional[ExtractionPhase]:
+        qs = ExtractionPhaseModel.objects.all()
+        if for_update:
+            qs = qs.select_for_update()
         try:
-            model = ExtractionPhaseModel.objects.get(project_id=project_id)
+            model = qs.get(project_id=project_id)
             return ExtractionPhaseMapper.to_domain(model)
         except ExtractionPhaseModel.DoesNotExist:
             return None
 
     def save(self, phase: ExtractionPhase) -> ExtractionPhase:
         data = ExtractionPhaseMapper.to_db(phase)
+        # update() no pasa por auto_now: la fecha de cierre se guarda explícita
+        if phase.status in CLOSED_STATUSES:
+            data['closed_at'] = phase.closed_at or timezone.now()
+        else:
+            data['closed_at'] = None
 
         if phase.id:
             ExtractionPhaseModel.objects.filter(pk=phase.id).update(**data)
@@ -39,4 +50,48 @@ class DjangoExtractionPhaseRepository(IExtractionPhaseRepository):
             end_date__lte=now
         )
 
-        return [ExtractionPhaseMapper.to_domain(m) for m in qs]
\ No newline at end of file
+        return [ExtractionPhaseMapper.to_domain(m) for m in qs]
+
+    def close_expired_phases(self, now: datetime, batch_size: int = 500) -> List[int]:
+        closed_project_ids = []
+
+        while True:
+            expired = ExtractionPhaseModel.objects.filter(
+                status=PhaseStatus.ACTIVE.value,
+                auto_close=True,
+                end_date__lte=now
+            ).order_by('end_date')
+
+            batch = list(expired.values_list('id', 'project_id')[:batch_size])
+            if not batch:
+                break
+
+            # El filtro de estado se repite para no pisar cambios concurrentes
+            ExtractionPhaseModel.objects.filter(
+                pk__in=[phase_id for phase_id, _ in batch],
+                status=PhaseStatus.ACTIVE.value
+            ).update(status=PhaseStatus.AUTO_CLOSED.value, closed_at=now, updated_at=now)
+
+            closed_project_ids.extend(project_id for _, project_id in batch)
+            if len(batch) < batch_size:
+                break
+
+        return closed_project_ids
+
+    def list_closed_project_ids(self, closed_before: datetime) -> List[int]:
+        return list(
+            ExtractionPhaseModel.objects.filter(
+                status__in=[s.value for s in CLOSED_STATUSES],
+                closed_at__lte=closed_before
+            ).order_by('project_id').values_list('project_id', flat=True)
+        )
+
+    def get_upcoming_deadlines(self, until: datetime) -> List[Tuple[datetime, int]]:
+        qs = ExtractionPhaseModel.objects.filter(
+            status=PhaseStatus.ACTIVE.value,
+            auto_close=True,
+            end_date__isnull=False,
+            end_date__lte=until
+        ).order_by('end_date')
+
+        return list(qs.values_list('end_date', 'project_id'))
@@ -1,56 +1,58 @@
-from typing import Optional, List
-from django.db import transaction
+from collections import defaultdict
+from typing import Dict, Iterable, Optional, List, Tuple
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F
+from ...domain.dtos.assignment_dtos import ExtractionSlotDTO
 from ...domain.repositories.i_extraction_repository import IExtractionRepository
 from ...domain.entities.extraction import Extraction
+from ...domain.value_objects.extraction_status import ExtractionStatus
 from ..models import ExtractionModel
 from ..mappers.domain_mappers import ExtractionMapper
+from .django_extraction_snapshot_repository import load_extractions
+from ..search.base import batched
 
 
 class DjangoExtractionRepository(IExtractionRepository):
+    """
+    Los cupos vacantes (assigned_to NULL) son la cola de trabajo de claim_vacant.
+    Igual que DjangoJobQueueRepository.claim: en PostgreSQL los candidatos se
+    leen con SELECT ... FOR UPDATE SKIP LOCKED y en SQLite el UPDATE condicional
+    sobre assigned_to IS NULL hace de compare-and-swap.
+    """
+
+    CLAIM_CANDIDATES = 8
 
     def get_all_by_study_id(self, study_id: int) -> List[Extraction]:
         """Obtiene todas las extracciones de un estudio"""
-        qs = ExtractionModel.objects.prefetch_related(
-            'quotes__tags'
-        ).filter(study_id=study_id).order_by('extraction_order')
-
-        return [ExtractionMapper.to_domain(m) for m in qs]
+        qs = ExtractionModel.objects.filter(study_id=study_id).order_by('extraction_order')
+        return load_extractions(list(qs))
 
     def get_by_study_and_user(self, study_id: int, user_id: int) -> Optional[Extraction]:
         """Obtiene la extracción de un usuario para un estudio específico"""
-        try:
-            model = ExtractionModel.objects.prefetch_related(
-                'quotes__tags'
-            ).get(study_id=study_id, assigned_to_id=user_id)
-
-            return ExtractionMapper.to_domain(model)
-        except ExtractionModel.DoesNotExist:
-            return None
+        return self._first(ExtractionModel.objects.filter(
+            study_id=study_id, assigned_to_id=user_id, is_consensus=False
+        ))
 
     def get_by_id(self, extraction_id: int) -> Optional[Extraction]:
-        try:
-            model = ExtractionModel.objects.prefetch_related(
-                'quotes__tags'
-            ).get(pk=extraction_id)
-            return ExtractionMapper.to_domain(model)
-        except ExtractionModel.DoesNotExist:
-            return None
+        return self._first(ExtractionModel.objects.filter(pk=extraction_id))
 
     def get_by_study_id(self, study_id: int) -> Optional[Extraction]:
+        return self._first(ExtractionModel.objects.filter(study_id=study_id))
+
+    @staticmethod
+    def _first(qs) -> Optional[Extraction]:
+        """Las congeladas se hidratan desde su snapshot (ver load_extractions)"""
         try:
-            model = ExtractionModel.objects.prefetch_related(
-                'quotes__tags'
-            ).get(study_id=study_id)
-            return ExtractionMapper.to_domain(model)
+            model = qs.get()
         except ExtractionModel.DoesNotExist:
             return None
+        return load_extractions([model])[0]
 
-    @transaction.atomic
     def save(self, extraction: Extraction) -> Extraction:
         data = ExtractionMapper.to_db(extraction)
 
         if extraction.id:
-            ExtractionModel.objects.filter(pk=extraction.id).update(**data)
+            ExtractionModel.objects.filter(pk=extraction.id).update(**data, version=F('version') + 1)
             model = ExtractionModel.objects.prefetch_related(
                 'quotes__tags'
             ).get(pk=extraction.id)
@@ -60,6 +62,9 @@ class DjangoExtractionRepository(IExtractionRepository):
 
         return ExtractionMapper.to_domain(model)
 
+    def delete(self, extraction_id: int) -> None:
+        ExtractionModel.objects.filter(pk=extraction_id).delete()
+
     def list_by_user(
             self,
             user_id: int,
@@ -68,6 +73,145 @@ class DjangoExtractionRepository(IExtractionRepository):
         qs = ExtractionModel.objects.filter(assigned_to_id=user_id)
 
         if include_quotes:
-            qs = qs.prefetch_related('quotes__tags')
+            return load_extractions(list(qs))
+
+        return [ExtractionMapper.to_domain(m) for m in qs]
+
+    def get_slots_by_studies(self, study_ids: Iterable[int]) -> List[ExtractionSlotDTO]:
+        slots = []
+        for batch in batched(sorted(set(study_ids))):
+            rows = ExtractionModel.objects.filter(
+                study_id__in=batch,
+                is_consensus=False
+            ).values_list(
+                'id', 'study_id', 'assigned_to_id', 'extraction_order', 'status'
+            )
+            slots.extend(
+                ExtractionSlotDTO(
+                    extraction_id=pk,
+                    study_id=study_id,
+                    user_id=user_id,
+                    extraction_order=order,
+                    is_open=status != ExtractionStatus.DONE.value
+                )
+                for pk, study_id, user_id, order, status in rows
+            )
+        return slots
+
+    def bulk_create(self, extractions: List[Extraction]) -> int:
+        models = ExtractionModel.objects.bulk_create(
+            [ExtractionModel(**ExtractionMapper.to_db(e)) for e in extractions],
+            batch_size=500
+        )
+        return len(models)
+
+    @transaction.atomic
+    def reassign(self, moves: Dict[int, int]) -> int:
+        by_user = defaultdict(list)
+        for extraction_id, user_id in moves.items():
+            by_user[user_id].append(extraction_id)
+
+        updated = 0
+        for user_id, extraction_ids in sorted(by_user.items()):
+            for batch in batched(sorted(extraction_ids)):
+                updated += ExtractionModel.objects.filter(pk__in=batch).update(
+                    assigned_to_id=user_id,
+                    version=F('version') + 1
+                )
+        return updated
+
+    @transaction.atomic
+    def fill_vacant(self, moves: Dict[int, int]) -> int:
+        filled = 0
+        for extraction_id, user_id in sorted(moves.items()):
+            filled += ExtractionModel.objects.filter(
+                pk=extraction_id,
+                assigned_to__isnull=True
+            ).update(assigned_to_id=user_id, version=F('version') + 1)
+        return filled
+
+    def claim_vacant(self, study_ids: Iterable[int], user_id: int) -> Optional[Extraction]:
+        for batch in batched(sorted(set(study_ids))):
+            while True:
+                with transaction.atomic():
+                    qs = ExtractionModel.objects.filter(
+                        study_id__in=batch,
+                        assigned_to__isnull=True
+                    ).exclude(
+                        study_id__in=ExtractionModel.objects.filter(
+                            study_id__in=batch,
+                            assigned_to_id=user_id,
+                            is_consensus=False
+                        ).values('study_id')
+                    ).order_by('study_id', 'extraction_order')
+
+                    if connection.features.has_select_for_update_skip_locked:
+                        qs = qs.select_for_update(skip_locked=True)
+
+                    candidate_ids = list(qs.values_list('id', flat=True)[:self.CLAIM_CANDIDATES])
+                    for extraction_id in candidate_ids:
+                        if self._take_vacant(extraction_id, user_id):
+                            return self.get_by_id(extraction_id)
+
+                if not candidate_ids:
+                    break
+                # Otros ganaron todos los candidatos: se vuelve a leer el mismo lote
+        return None
+
+    @staticmethod
+    def _take_vacant(extraction_id: int, user_id: int) -> bool:
+        try:
+            with transaction.atomic():
+                return ExtractionModel.objects.filter(
+                    pk=extraction_id,
+                    assigned_to__isnull=True
+                ).update(assigned_to_id=user_id, version=F('version') + 1) == 1
+        except IntegrityError:
+            # El mismo usuario acaba de reclamar otro cupo de ese estudio
+            return False
+
+    def count_assigned_by_study(self, study_id: int) -> int:
+        return ExtractionModel.objects.filter(
+            study_id=study_id,
+            assigned_to__isnull=False,
+            is_consensus=False
+        ).count()
+
+    def has_user_extraction(self, study_id: int, user_id: int) -> bool:
+        return ExtractionModel.objects.filter(
+            study_id=study_id,
+            assigned_to_id=user_id,
+            is_consensus=False
+        ).exists()
+
+    def insert_in_free_slot(self, extraction: Extraction, capacity: int) -> Optional[Extraction]:
+        data = ExtractionMapper.to_db(extraction)
+        # Cada conflicto significa que otra alta ocupó un cupo: a lo sumo `capacity` intentos
+        for _ in range(capacity):
+            taken = set(
+                ExtractionModel.objects.filter(study_id=extraction.study_id)
+                .values_list('extraction_order', flat=True)
+            )
+            free = [order for order in range(1, capacity + 1) if order not in taken]
+            if not free:
+                return None
+
+            data['extraction_order'] = free[0]
+            try:
+                with transaction.atomic():
+                    model = ExtractionModel.objects.create(**data)
+            except IntegrityError:
+                if self.has_user_extraction(extraction.study_id, extraction.assigned_to_user_id):
+                    return None
+                continue
+
+            extraction.id = model.id
+            extraction.extraction_order = model.extraction_order
+            return extraction
+        return None
 
-        return [ExtractionMapper.to_domain(m) for m in qs]
\ No newline at end of file
+    def get_version_stamps(self, extraction_ids: Iterable[int]) -> Dict[int, Tuple[int, int]]:
+        rows = ExtractionModel.objects.filter(pk__in=list(extraction_ids)).values_list(
+            'id', 'study_id', 'version'
+        )
+        return {pk: (study_id, version) for pk, study_id, version in rows}
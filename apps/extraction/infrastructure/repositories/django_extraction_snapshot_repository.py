@@ -0,0 +1,243 @@
+import json
+import zlib
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from ...domain.entities.extraction import Extraction
+from ...domain.entities.quote import Quote
+from ...domain.repositories.i_extraction_snapshot_repository import IExtractionSnapshotRepository
+from ...domain.repositories.i_project_version_repository import IProjectVersionRepository
+from ..mappers.domain_mappers import ExtractionMapper, QuoteMapper, TagMapper
+from ..mappers.row_mappers import QuoteRowMapper
+from ..models import ExtractionModel, ExtractionSnapshotModel, QuoteModel, TagModel
+from ..search.base import batched
+
+SNAPSHOT_FORMAT = 1
+COMPRESSION_LEVEL = 6
+
+_TAG_FIELDS = (
+    'id', 'name', 'project_id', 'is_mandatory', 'created_by_user_id',
+    'question_id', 'status', 'visibility', 'type', 'parent_id', 'color',
+)
+
+
+def encode_snapshot(document: dict) -> Tuple[bytes, int]:
+    """Retorna (payload comprimido, tamaño del JSON original)"""
+    raw = json.dumps(document, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return zlib.compress(raw, COMPRESSION_LEVEL), len(raw)
+
+
+def decode_snapshot(payload) -> dict:
+    return json.loads(zlib.decompress(bytes(payload)).decode('utf-8'))
+
+
+def snapshot_quotes(document: dict) -> List[Quote]:
+    """Quotes del snapshot como entidades (los tags se comparten entre quotes)"""
+    tags = {
+        tag_id: TagMapper.to_domain(TagModel(**fields))
+        for tag_id, fields in ((int(k), v) for k, v in document['tags'].items())
+    }
+    extraction = document['extraction']
+    return [
+        Quote(
+            id=q['id'],
+            extraction_id=extraction['id'],
+            text=q['text'],
+            researcher_id=q['researcher_id'],
+            tags=[tags[t] for t in q['tag_ids'] if t in tags],
+            location=QuoteMapper.location_from_data(q['location_data']),
+            project_id=extraction['project_id'],
+        )
+        for q in document['quotes']
+    ]
+
+
+def load_extractions(models: List[ExtractionModel]) -> List[Extraction]:
+    """
+    Hidrata extracciones: las congeladas desde su snapshot (una lectura por
+    lote) y el resto por tuplas con tags internados (QuoteRowMapper). Los
+    campos propios de la extracción siempre salen de la fila viva.
+    """
+    if not models:
+        return []
+
+    frozen: Dict[int, dict] = {}
+    rows = ExtractionSnapshotModel.objects.filter(
+        extraction_id__in=[m.id for m in models]
+    ).values_list('extraction_id', 'source_version', 'archived_at', 'payload')
+    version_of = {m.id: m.version for m in models}
+    for extraction_id, source_version, archived_at, payload in rows:
+        if archived_at is not None or source_version == version_of[extraction_id]:
+            frozen[extraction_id] = decode_snapshot(payload)
+
+    hot = QuoteRowMapper().load_by_extraction([m.id for m in models if m.id not in frozen])
+    return [
+        ExtractionMapper.to_domain(
+            m, quotes=snapshot_quotes(frozen[m.id]) if m.id in frozen else hot.get(m.id, [])
+        )
+        for m in models
+    ]
+
+
+def iter_archived_documents(project_id: int, chunk_size: int = 200) -> Iterator[dict]:
+    """Snapshots archivados del proyecto, descomprimidos de a uno"""
+    rows = ExtractionSnapshotModel.objects.filter(
+        project_id=project_id, archived_at__isnull=False
+    ).order_by('extraction_id').values_list('payload', flat=True).iterator(chunk_size=chunk_size)
+    for payload in rows:
+        yield decode_snapshot(payload)
+
+
+class DjangoExtractionSnapshotRepository(IExtractionSnapshotRepository):
+    """
+    Tabla extraction_snapshot: un JSON comprimido (zlib) por extracción.
+
+    El documento guarda la extracción, sus quotes con location_data y
+    created_at tal cual, y el catálogo de los tags que usan (una vez por
+    snapshot, no por quote). Las quotes archivadas se leen de acá para el
+    detalle, el diff y la exportación.
+    """
+
+    def __init__(self, version_repo: IProjectVersionRepository):
+        self.version_repo = version_repo
+
+    def capture(self, extraction_ids: Iterable[int]) -> int:
+        written = 0
+        for batch in batched(sorted(set(extraction_ids))):
+            models = list(
+                ExtractionModel.objects.filter(pk__in=batch)
+                .exclude(snapshot__archived_at__isnull=False)
+            )
+            written += self._write(models)
+        return written
+
+    def capture_project(self, project_id: int, chunk_size: int = 500) -> int:
+        stale = ExtractionModel.objects.filter(project_id=project_id).filter(
+            Q(snapshot__isnull=True) |
+            Q(snapshot__archived_at__isnull=True) & ~Q(snapshot__source_version=F('version'))
+        )
+        ids = list(stale.order_by('id').values_list('id', flat=True))
+        return sum(self.capture(ids[i:i + chunk_size]) for i in range(0, len(ids), chunk_size))
+
+    def archive_project(self, project_id: int, chunk_size: int = 500) -> List[int]:
+        self.capture_project(project_id, chunk_size=chunk_size)
+
+        extraction_ids = list(
+            ExtractionSnapshotModel.objects.filter(project_id=project_id, archived_at__isnull=True)
+            .order_by('extraction_id').values_list('extraction_id', flat=True)
+        )
+        archived_quote_ids = []
+        for start in range(0, len(extraction_ids), chunk_size):
+            batch = extraction_ids[start:start + chunk_size]
+            with transaction.atomic():
+                # Solo las que siguen iguales a su snapshot: un cambio concurrente
+                # deja la extracción caliente hasta la próxima corrida
+                current = list(
+                    ExtractionSnapshotModel.objects.select_for_update()
+                    .filter(extraction_id__in=batch, archived_at__isnull=True,
+                            source_version=F('extraction__version'))
+                    .values_list('extraction_id', flat=True)
+                )
+                quote_ids = list(
+                    QuoteModel.objects.filter(extraction_id__in=current).values_list('id', flat=True)
+                )
+                for quote_batch in batched(quote_ids):
+                    QuoteModel.objects.filter(pk__in=quote_batch).delete()
+                # Solo estas extracciones perdieron quotes calientes: su versión
+                # (y la del snapshot, que sigue siendo su contenido) invalida
+                # las cachés por extracción, como el heatmap
+                ExtractionModel.objects.filter(pk__in=current).update(version=F('version') + 1)
+                ExtractionSnapshotModel.objects.filter(extraction_id__in=current).update(
+                    archived_at=timezone.now(),
+                    source_version=F('source_version') + 1
+                )
+            if quote_ids:
+                # Resultados cacheados por proyecto (co-ocurrencia, matriz, sugerencias)
+                self.version_repo.bump_coding([project_id])
+            archived_quote_ids.extend(quote_ids)
+        return archived_quote_ids
+
+    def _write(self, models: List[ExtractionModel]) -> int:
+        if not models:
+            return 0
+
+        quotes_by_extraction = defaultdict(list)
+        quote_rows = QuoteModel.objects.filter(
+            extraction_id__in=[m.id for m in models]
+        ).order_by('id').values_list(
+            'id', 'extraction_id', 'researcher_id', 'text_portion', 'location_data', 'created_at'
+        )
+        for quote_id, extraction_id, researcher_id, text, location_data, created_at in quote_rows:
+            quotes_by_extraction[extraction_id].append({
+                'id': quote_id,
+                'researcher_id': researcher_id,
+                'text': text,
+                'location_data': location_data,
+                'created_at': self._datetime(created_at),
+                'tag_ids': [],
+            })
+
+        quote_index = {q['id']: q for quotes in quotes_by_extraction.values() for q in quotes}
+        through = QuoteModel.tags.through
+        tag_ids = set()
+        for batch in batched(list(quote_index)):
+            links = through.objects.filter(quotemodel_id__in=batch).order_by('tagmodel_id')
+            for quote_id, tag_id in links.values_list('quotemodel_id', 'tagmodel_id'):
+                quote_index[quote_id]['tag_ids'].append(tag_id)
+                tag_ids.add(tag_id)
+        catalog = {
+            row['id']: row
+            for row in TagModel.objects.filter(pk__in=tag_ids).values(*_TAG_FIELDS)
+        }
+
+        snapshots = []
+        for model in models:
+            quotes = quotes_by_extraction.get(model.id, [])
+            used = {t for q in quotes for t in q['tag_ids']}
+            raw = {
+                'format': SNAPSHOT_FORMAT,
+                'extraction': {
+                    'id': model.id,
+                    'study_id': model.study_id,
+                    'project_id': model.project_id,
+                    'assigned_to_user_id': model.assigned_to_id,
+                    'status': model.status,
+                    'extraction_order': model.extraction_order,
+                    'is_consensus': model.is_consensus,
+                    'started_at': self._datetime(model.started_at),
+                    'completed_at': self._datetime(model.completed_at),
+                    'version': model.version,
+                },
+                'tags': {str(t): catalog[t] for t in sorted(used) if t in catalog},
+                'quotes': quotes,
+            }
+            payload, raw_size = encode_snapshot(raw)
+            snapshots.append(ExtractionSnapshotModel(
+                extraction_id=model.id,
+                project_id=model.project_id,
+                format_version=SNAPSHOT_FORMAT,
+                source_version=model.version,
+                quote_count=len(quotes),
+                raw_size=raw_size,
+                payload=payload,
+                captured_at=timezone.now(),
+            ))
+
+        ExtractionSnapshotModel.objects.bulk_create(
+            snapshots,
+            batch_size=200,
+            update_conflicts=True,
+            unique_fields=['extraction'],
+            update_fields=['project_id', 'format_version', 'source_version', 'quote_count',
+                           'raw_size', 'payload', 'captured_at']
+        )
+        return len(snapshots)
+
+    @staticmethod
+    def _datetime(value: Optional[datetime]) -> Optional[str]:
+        return value.isoformat() if value else None
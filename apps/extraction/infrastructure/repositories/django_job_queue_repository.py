@@ -0,0 +1,145 @@
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence
+
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from ...domain.entities.job import Job
+from ...domain.repositories.i_job_queue_repository import IJobQueueRepository
+from ...domain.value_objects.job_status import JobStatus
+from ..mappers.domain_mappers import JobMapper
+from ..models import JobModel
+
+
+class DjangoJobQueueRepository(IJobQueueRepository):
+    """
+    Cola de jobs sobre la base de datos.
+
+    En PostgreSQL el reclamo usa SELECT ... FOR UPDATE SKIP LOCKED, así varios
+    workers reclaman en paralelo sin bloquearse. En SQLite (sin SKIP LOCKED) el
+    UPDATE condicional actúa como compare-and-swap: si otro worker ganó la
+    carrera, la fila ya no cumple el filtro y simplemente no se reclama.
+    """
+
+    def enqueue(
+            self,
+            kind: str,
+            payload: Optional[dict] = None,
+            queue: str = 'default',
+            run_after: Optional[datetime] = None,
+            max_attempts: int = 3,
+            dedupe_key: Optional[str] = None
+    ) -> Job:
+        if dedupe_key:
+            existing = JobModel.objects.filter(
+                dedupe_key=dedupe_key,
+                status__in=[JobStatus.QUEUED.value, JobStatus.RUNNING.value]
+            ).first()
+            if existing:
+                return JobMapper.to_domain(existing)
+
+        model = JobModel.objects.create(
+            kind=kind,
+            queue=queue,
+            payload=payload or {},
+            run_after=run_after or timezone.now(),
+            max_attempts=max_attempts,
+            dedupe_key=dedupe_key,
+        )
+        return JobMapper.to_domain(model)
+
+    @staticmethod
+    def _claimable(now: datetime) -> Q:
+        return (
+            Q(status=JobStatus.QUEUED.value, run_after__lte=now) |
+            Q(status=JobStatus.RUNNING.value, locked_until__lt=now)
+        )
+
+    def claim(
+            self,
+            worker_id: str,
+            queues: Sequence[str],
+            limit: int = 1,
+            lease_seconds: int = 300
+    ) -> List[Job]:
+        now = timezone.now()
+
+        with transaction.atomic():
+            qs = JobModel.objects.filter(
+                self._claimable(now),
+                queue__in=list(queues)
+            ).order_by('run_after', 'id')
+
+            if connection.features.has_select_for_update_skip_locked:
+                qs = qs.select_for_update(skip_locked=True)
+
+            candidate_ids = list(qs.values_list('id', flat=True)[:limit])
+            if not candidate_ids:
+                return []
+
+            JobModel.objects.filter(
+                self._claimable(now),
+                pk__in=candidate_ids
+            ).update(
+                status=JobStatus.RUNNING.value,
+                locked_by=worker_id,
+                locked_until=now + timedelta(seconds=lease_seconds),
+                attempts=F('attempts') + 1,
+                updated_at=now,
+            )
+
+            claimed = JobModel.objects.filter(
+                pk__in=candidate_ids,
+                status=JobStatus.RUNNING.value,
+                locked_by=worker_id
+            ).order_by('run_after', 'id')
+
+            return [JobMapper.to_domain(m) for m in claimed]
+
+    def complete(self, job_id: int, worker_id: str, result: Optional[dict] = None) -> bool:
+        updated = JobModel.objects.filter(
+            pk=job_id,
+            status=JobStatus.RUNNING.value,
+            locked_by=worker_id
+        ).update(
+            status=JobStatus.DONE.value,
+            result=result,
+            locked_until=None,
+            updated_at=timezone.now(),
+        )
+        return updated == 1
+
+    def fail(self, job_id: int, worker_id: str, error: str, retry_delay_seconds: int = 30) -> bool:
+        now = timezone.now()
+        owned = JobModel.objects.filter(
+            pk=job_id,
+            status=JobStatus.RUNNING.value,
+            locked_by=worker_id
+        )
+
+        # Reintento con backoff exponencial mientras queden intentos
+        retried = owned.filter(attempts__lt=F('max_attempts')).update(
+            status=JobStatus.QUEUED.value,
+            run_after=now + timedelta(seconds=retry_delay_seconds),
+            locked_by=None,
+            locked_until=None,
+            last_error=error,
+            updated_at=now,
+        )
+        if retried:
+            return True
+
+        failed = owned.update(
+            status=JobStatus.FAILED.value,
+            locked_until=None,
+            last_error=error,
+            updated_at=now,
+        )
+        return failed == 1
+
+    def get_by_id(self, job_id: int) -> Optional[Job]:
+        try:
+            return JobMapper.to_domain(JobModel.objects.get(pk=job_id))
+        except JobModel.DoesNotExist:
+            return None
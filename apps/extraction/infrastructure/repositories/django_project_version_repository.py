@@ -0,0 +1,48 @@
+from typing import Iterable
+
+from django.db.models import F
+
+from ...domain.dtos.analytics_dtos import ProjectVersionsDTO
+from ...domain.repositories.i_project_version_repository import IProjectVersionRepository
+from ..models import ProjectDataVersionModel
+
+
+class DjangoProjectVersionRepository(IProjectVersionRepository):
+    """
+    Los contadores viven en BD (no en la caché) para que todos los procesos
+    vean el mismo valor: una caché local desactualizada nunca sirve datos
+    viejos porque la clave incluye la versión leída de aquí.
+    """
+
+    def get(self, project_id: int) -> ProjectVersionsDTO:
+        row = ProjectDataVersionModel.objects.filter(
+            project_id=project_id
+        ).values_list('tag_catalog_version', 'coding_version').first()
+
+        if not row:
+            return ProjectVersionsDTO(project_id=project_id)
+
+        return ProjectVersionsDTO(
+            project_id=project_id,
+            tag_catalog_version=row[0],
+            coding_version=row[1]
+        )
+
+    def _bump(self, project_ids: Iterable[int], field: str) -> None:
+        project_ids = sorted({p for p in project_ids if p is not None})
+        if not project_ids:
+            return
+
+        ProjectDataVersionModel.objects.bulk_create(
+            [ProjectDataVersionModel(project_id=p) for p in project_ids],
+            ignore_conflicts=True
+        )
+        ProjectDataVersionModel.objects.filter(
+            project_id__in=project_ids
+        ).update(**{field: F(field) + 1})
+
+    def bump_tag_catalog(self, project_ids: Iterable[int]) -> None:
+        self._bump(project_ids, 'tag_catalog_version')
+
+    def bump_coding(self, project_ids: Iterable[int]) -> None:
+        self._bump(project_ids, 'coding_version')
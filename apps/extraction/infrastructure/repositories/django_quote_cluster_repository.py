@@ -0,0 +1,107 @@
+from typing import List, Optional
+
+from django.db import transaction
+from django.utils import timezone
+
+from ...domain.dtos.clustering_dtos import ClusteringResultDTO
+from ...domain.entities.quote_cluster import QuoteCluster, QuoteClusterRun
+from ...domain.repositories.i_quote_cluster_repository import IQuoteClusterRepository
+from ...domain.value_objects.job_status import JobStatus
+from ..mappers.domain_mappers import QuoteClusterMapper
+from ..models import QuoteClusterAssignmentModel, QuoteClusterModel, QuoteClusterRunModel
+
+
+class DjangoQuoteClusterRepository(IQuoteClusterRepository):
+
+    def __init__(self, batch_size: int = 5000):
+        self.batch_size = batch_size
+
+    def create_run(self, run: QuoteClusterRun) -> QuoteClusterRun:
+        model = QuoteClusterRunModel.objects.create(
+            project_id=run.project_id,
+            requested_by_user_id=run.requested_by_user_id,
+            k=run.k,
+            max_tags=run.max_tags,
+            status=run.status.value,
+        )
+        return QuoteClusterMapper.run_to_domain(model)
+
+    def get_run(self, run_id: int) -> Optional[QuoteClusterRun]:
+        model = QuoteClusterRunModel.objects.filter(pk=run_id).first()
+        return QuoteClusterMapper.run_to_domain(model)
+
+    def list_runs(self, project_id: int, limit: int = 20) -> List[QuoteClusterRun]:
+        qs = QuoteClusterRunModel.objects.filter(project_id=project_id).order_by('-created_at')[:limit]
+        return [QuoteClusterMapper.run_to_domain(m) for m in qs]
+
+    def mark_running(self, run_id: int) -> None:
+        QuoteClusterRunModel.objects.filter(pk=run_id).update(
+            status=JobStatus.RUNNING.value,
+            error="",
+        )
+
+    def mark_failed(self, run_id: int, error: str) -> None:
+        QuoteClusterRunModel.objects.filter(pk=run_id).update(
+            status=JobStatus.FAILED.value,
+            error=error,
+            finished_at=timezone.now(),
+        )
+
+    @transaction.atomic
+    def save_results(self, run_id: int, result: ClusteringResultDTO) -> None:
+        # Un reintento del job reemplaza lo que hubiera dejado el intento anterior
+        QuoteClusterAssignmentModel.objects.filter(run_id=run_id).delete()
+        QuoteClusterModel.objects.filter(run_id=run_id).delete()
+
+        QuoteClusterModel.objects.bulk_create([
+            QuoteClusterModel(
+                run_id=run_id,
+                label=c.label,
+                size=c.size,
+                top_terms=c.top_terms,
+                sample_quote_ids=c.sample_quote_ids,
+            )
+            for c in result.clusters
+        ])
+
+        quote_ids = result.quote_ids.tolist()
+        labels = result.labels.tolist()
+        scores = result.scores.tolist()
+        for start in range(0, len(quote_ids), self.batch_size):
+            end = start + self.batch_size
+            QuoteClusterAssignmentModel.objects.bulk_create([
+                QuoteClusterAssignmentModel(run_id=run_id, quote_id=q, label=l, score=s)
+                for q, l, s in zip(quote_ids[start:end], labels[start:end], scores[start:end])
+            ])
+
+        QuoteClusterRunModel.objects.filter(pk=run_id).update(
+            status=JobStatus.DONE.value,
+            quote_count=len(quote_ids),
+            cohesion=result.cohesion,
+            error="",
+            finished_at=timezone.now(),
+        )
+
+    def get_clusters(self, run_id: int) -> List[QuoteCluster]:
+        qs = QuoteClusterModel.objects.filter(run_id=run_id).order_by('-size', 'label')
+        return [QuoteClusterMapper.cluster_to_domain(m) for m in qs]
+
+    def get_cluster(self, run_id: int, label: int) -> Optional[QuoteCluster]:
+        model = QuoteClusterModel.objects.filter(run_id=run_id, label=label).first()
+        return QuoteClusterMapper.cluster_to_domain(model) if model else None
+
+    def get_cluster_quotes(self, run_id: int, label: int, limit: int = 50, offset: int = 0) -> List[dict]:
+        rows = QuoteClusterAssignmentModel.objects.filter(
+            run_id=run_id,
+            label=label
+        ).order_by('-score', 'quote_id').values_list(
+            'quote_id', 'quote__extraction_id', 'quote__text_portion', 'score'
+        )[offset:offset + limit]
+
+        return [
+            {'quote_id': q, 'extraction_id': e, 'text': t, 'score': round(s, 4)}
+            for q, e, t, s in rows
+        ]
+
+    def set_cluster_tag(self, run_id: int, label: int, tag_id: int) -> None:
+        QuoteClusterModel.objects.filter(run_id=run_id, label=label).update(tag_id=tag_id)
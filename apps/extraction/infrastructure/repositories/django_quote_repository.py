@@ -1,28 +1,36 @@
-from typing import List, Optional
+from collections import defaultdict
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
 
 from django.db import transaction
+from django.db.models import Exists, F, OuterRef
 
+from ...domain.repositories.i_project_version_repository import IProjectVersionRepository
 from ...domain.repositories.i_quote_repository import IQuoteRepository
 from ...domain.entities.quote import Quote
-from ..models import QuoteModel
+from ...domain.services.tag_tree import TagTree
+from ..models import ExtractionModel, QuoteModel, TagModel
 from ..mappers.domain_mappers import QuoteMapper
+from ..mappers.row_mappers import QuoteRowMapper
+from .django_extraction_snapshot_repository import iter_archived_documents
+from .project_scope import project_quotes
 
 class DjangoQuoteRepository(IQuoteRepository):
+    def __init__(self, version_repo: IProjectVersionRepository):
+        self.version_repo = version_repo
+
     @transaction.atomic
     def save(self, quote: Quote) -> Quote:
         # 1. Mapear a Dict para el modelo
-        data = {
-            'extraction_id': quote.extraction_id,
-            'text_portion': quote.text,
-            'location': quote.location,
-            'researcher_id': quote.researcher_id,
-        }
+        data = QuoteMapper.to_db(quote)
 
         # 2. Guardar el objeto principal (Quote)
         if quote.id:
             QuoteModel.objects.filter(pk=quote.id).update(**data)
             model = QuoteModel.objects.get(pk=quote.id)
         else:
+            if data['project_id'] is None:
+                data['project_id'] = self._extraction_project_ids([quote.extraction_id]).get(quote.extraction_id)
             model = QuoteModel.objects.create(**data)
             quote.id = model.id  # Asignar ID generado
 
@@ -32,8 +40,41 @@ class DjangoQuoteRepository(IQuoteRepository):
             tag_ids = [t.id for t in quote.tags]
             model.tags.set(tag_ids)  # Django maneja la tabla intermedia aquí
 
+        self.version_repo.bump_coding(t.project_id for t in quote.tags)
+        self._touch_extraction(model.extraction_id)
+
         return QuoteMapper.to_domain(model)
 
+    @transaction.atomic
+    def bulk_create(self, quotes: List[Quote]) -> int:
+        fallback = self._extraction_project_ids(
+            {q.extraction_id for q in quotes if q.project_id is None}
+        )
+        for quote in quotes:
+            if quote.project_id is None:
+                quote.project_id = fallback.get(quote.extraction_id)
+
+        models = QuoteModel.objects.bulk_create(
+            [QuoteModel(**QuoteMapper.to_db(q)) for q in quotes],
+            batch_size=500
+        )
+        through = QuoteModel.tags.through
+        through.objects.bulk_create(
+            [
+                through(quotemodel_id=model.id, tagmodel_id=tag.id)
+                for quote, model in zip(quotes, models)
+                for tag in quote.tags
+            ],
+            batch_size=1000
+        )
+        for quote, model in zip(quotes, models):
+            quote.id = model.id
+
+        self.version_repo.bump_coding({t.project_id for q in quotes for t in q.tags})
+        for extraction_id in {q.extraction_id for q in quotes}:
+            self._touch_extraction(extraction_id)
+        return len(models)
+
     def get_by_id(self, quote_id: int) -> Optional[Quote]:
         try:
             model = QuoteModel.objects.get(pk=quote_id)
@@ -42,8 +83,138 @@ class DjangoQuoteRepository(IQuoteRepository):
             return None
 
     def get_by_tag(self, tag_id: int) -> List[Quote]:
-        qs = QuoteModel.objects.filter(tags__id=tag_id)
-        return [QuoteMapper.to_domain(m) for m in qs]
+        return QuoteRowMapper().load(QuoteModel.objects.filter(tags__id=tag_id))
+
+    def get_by_tag_subtree(self, tag_id: int, offset: int = 0, limit: int = 50) -> Tuple[int, List[Quote]]:
+        through = QuoteModel.tags.through
+        qs = QuoteModel.objects.filter(
+            Exists(through.objects.filter(
+                quotemodel_id=OuterRef('pk'),
+                tagmodel__ancestor_links__ancestor_id=tag_id
+            )),
+            extraction__is_consensus=False
+        )
+        page_ids = list(qs.order_by('id').values_list('id', flat=True)[offset:offset + limit])
+        return qs.count(), QuoteRowMapper().load(QuoteModel.objects.filter(pk__in=page_ids))
 
     def delete(self, quote_id: int) -> None:
-        QuoteModel.objects.filter(pk=quote_id).delete()
\ No newline at end of file
+        project_ids = set(
+            QuoteModel.tags.through.objects.filter(
+                quotemodel_id=quote_id
+            ).values_list('tagmodel__project_id', flat=True)
+        )
+        extraction_ids = list(
+            QuoteModel.objects.filter(pk=quote_id).values_list('extraction_id', flat=True)
+        )
+        QuoteModel.objects.filter(pk=quote_id).delete()
+        self.version_repo.bump_coding(project_ids)
+        for extraction_id in extraction_ids:
+            self._touch_extraction(extraction_id)
+
+    @staticmethod
+    def _extraction_project_ids(extraction_ids) -> dict:
+        """project_id heredado de la extracción cuando la quote no lo trae"""
+        if not extraction_ids:
+            return {}
+        return dict(
+            ExtractionModel.objects.filter(pk__in=list(extraction_ids)).values_list('id', 'project_id')
+        )
+
+    @staticmethod
+    def _touch_extraction(extraction_id: int) -> None:
+        """Invalida las cachés por versión de la extracción"""
+        ExtractionModel.objects.filter(pk=extraction_id).update(version=F('version') + 1)
+
+    def iter_export_rows_by_project(self, project_id: int, chunk_size: int = 2000) -> Iterator[dict]:
+        # Catálogo de tags del proyecto cargado una sola vez
+        catalog = list(
+            TagModel.objects.filter(project_id=project_id).values_list('id', 'name', 'parent_id')
+        )
+        tag_names = {tag_id: name for tag_id, name, _ in catalog}
+        tree = TagTree({tag_id: parent_id for tag_id, _, parent_id in catalog})
+        tag_paths = {tag_id: tree.label(tag_id, tag_names) for tag_id in tag_names}
+
+        # iterator() usa cursores del lado del servidor en PostgreSQL
+        rows = project_quotes(project_id).order_by('id').values_list(
+            'id',
+            'extraction_id',
+            'extraction__study_id',
+            'extraction__extraction_order',
+            'extraction__status',
+            'researcher_id',
+            'location_data',
+            'text_portion',
+            'created_at',
+        ).iterator(chunk_size=chunk_size)
+
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= chunk_size:
+                yield from self._export_batch(project_id, batch, tag_names, tag_paths)
+                batch = []
+
+        if batch:
+            yield from self._export_batch(project_id, batch, tag_names, tag_paths)
+
+        yield from self._archived_rows(project_id, tag_names, tag_paths)
+
+    @staticmethod
+    def _archived_rows(project_id: int, tag_names: dict, tag_paths: dict) -> Iterator[dict]:
+        """Quotes archivadas en frío: salen de los snapshots con el mismo formato"""
+        for document in iter_archived_documents(project_id):
+            extraction = document['extraction']
+            if extraction['is_consensus']:
+                continue
+            frozen_names = {int(k): v['name'] for k, v in document['tags'].items()}
+            for quote in document['quotes']:
+                location_data = quote['location_data'] or {}
+                tag_ids = quote['tag_ids']
+                yield {
+                    'quote_id': quote['id'],
+                    'project_id': project_id,
+                    'study_id': extraction['study_id'],
+                    'extraction_id': extraction['id'],
+                    'extraction_order': extraction['extraction_order'],
+                    'extraction_status': extraction['status'],
+                    'researcher_id': quote['researcher_id'],
+                    'page': location_data.get('page'),
+                    'text_location': location_data.get('text_location', ''),
+                    'text': quote['text'],
+                    'tag_ids': tag_ids,
+                    'tag_names': [tag_names.get(t, frozen_names.get(t, '')) for t in tag_ids],
+                    'tag_paths': [tag_paths.get(t, frozen_names.get(t, '')) for t in tag_ids],
+                    'created_at': datetime.fromisoformat(quote['created_at']) if quote['created_at'] else None,
+                }
+
+    @staticmethod
+    def _export_batch(project_id: int, batch: list, tag_names: dict, tag_paths: dict) -> Iterator[dict]:
+        """Resuelve los tags del lote con una sola consulta a la tabla intermedia"""
+        through = QuoteModel.tags.through
+        tags_by_quote = defaultdict(list)
+        links = through.objects.filter(
+            quotemodel_id__in=[row[0] for row in batch]
+        ).order_by('tagmodel_id').values_list('quotemodel_id', 'tagmodel_id')
+        for quote_id, tag_id in links:
+            tags_by_quote[quote_id].append(tag_id)
+
+        for (quote_id, extraction_id, study_id, extraction_order, extraction_status,
+             researcher_id, location_data, text, created_at) in batch:
+            location_data = location_data or {}
+            tag_ids = tags_by_quote.get(quote_id, [])
+            yield {
+                'quote_id': quote_id,
+                'project_id': project_id,
+                'study_id': study_id,
+                'extraction_id': extraction_id,
+                'extraction_order': extraction_order,
+                'extraction_status': extraction_status,
+                'researcher_id': researcher_id,
+                'page': location_data.get('page'),
+                'text_location': location_data.get('text_location', ''),
+                'text': text,
+                'tag_ids': tag_ids,
+                'tag_names': [tag_names.get(t, '') for t in tag_ids],
+                'tag_paths': [tag_paths.get(t, '') for t in tag_ids],
+                'created_at': created_at,
+            }
@@ -0,0 +1,69 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Iterator, Optional
+
+from django.db.models import Q
+
+from ...domain.entities.saturation_state import SaturationPoint, SaturationState
+from ...domain.repositories.i_saturation_repository import ISaturationRepository
+from ...domain.services.saturation import CompletedExtractionRow
+from ...domain.value_objects.extraction_status import ExtractionStatus
+from ..models import QuoteModel, SaturationStateModel
+from .project_scope import project_extractions
+
+
+class DjangoSaturationRepository(ISaturationRepository):
+
+    def get_state_for_update(self, project_id: int) -> SaturationState:
+        SaturationStateModel.objects.get_or_create(project_id=project_id)
+        model = SaturationStateModel.objects.select_for_update().get(project_id=project_id)
+
+        return SaturationState(
+            project_id=project_id,
+            tag_catalog_version=model.tag_catalog_version,
+            seen_tag_ids=set(model.seen_tag_ids),
+            points=[SaturationPoint.from_dict(p) for p in model.points],
+            last_completed_at=model.last_completed_at,
+            last_extraction_id=model.last_extraction_id,
+        )
+
+    def save_state(self, state: SaturationState) -> None:
+        SaturationStateModel.objects.filter(project_id=state.project_id).update(
+            tag_catalog_version=state.tag_catalog_version,
+            seen_tag_ids=sorted(state.seen_tag_ids),
+            points=[p.to_dict() for p in state.points],
+            last_completed_at=state.last_completed_at,
+            last_extraction_id=state.last_extraction_id,
+        )
+
+    def iter_completed_extractions(
+            self,
+            project_id: int,
+            after_completed_at: Optional[datetime],
+            after_extraction_id: int,
+            batch_size: int = 500
+    ) -> Iterator[CompletedExtractionRow]:
+        through = QuoteModel.tags.through
+        qs = project_extractions(project_id).filter(
+            status=ExtractionStatus.DONE.value,
+            completed_at__isnull=False,
+        )
+        if after_completed_at is not None:
+            qs = qs.filter(
+                Q(completed_at__gt=after_completed_at) |
+                Q(completed_at=after_completed_at, pk__gt=after_extraction_id)
+            )
+
+        rows = list(qs.order_by('completed_at', 'pk').values_list('pk', 'study_id', 'completed_at'))
+
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            tags_by_extraction = defaultdict(set)
+            for extraction_id, tag_id in through.objects.filter(
+                    quotemodel__extraction_id__in=[r[0] for r in batch],
+                    tagmodel__project_id=project_id
+            ).values_list('quotemodel__extraction_id', 'tagmodel_id').distinct():
+                tags_by_extraction[extraction_id].add(tag_id)
+
+            for extraction_id, study_id, completed_at in batch:
+                yield extraction_id, study_id, completed_at, tags_by_extraction[extraction_id]
@@ -1,17 +1,28 @@
-from typing import List, Optional
+from collections import defaultdict
+from typing import Iterable, List, Optional, Set
+from django.db import transaction
+from ...domain.dtos.tag_dtos import TagModerationItemDTO, TagSuggestionDTO, TagTreeNodeDTO
+from ...domain.repositories.i_project_version_repository import IProjectVersionRepository
 from ...domain.repositories.i_tag_repository import ITagRepository
 from ...domain.entities.tag import Tag
-from ..models import TagModel
+from ..models import TagClosureModel, TagModel
 from ..mappers.domain_mappers import TagMapper
-from django.db.models import Q
+from ..search.base import batched
+from django.db.models import Count, F, Q
 
 from ...domain.value_objects.tag_status import TagStatus
 from ...domain.value_objects.tag_visibility import TagVisibility
 
+# Los borradores de consenso copian quotes de los codificadores con sus tags:
+# no cuentan como uso (ver project_scope)
+CODER_QUOTES = Q(quotes__extraction__is_consensus=False)
+CODER_DESCENDANT_QUOTES = Q(descendant__quotes__extraction__is_consensus=False)
+
 
 class DjangoTagRepository(ITagRepository):
-    def __init__(self, acquisition_adapter):
+    def __init__(self, acquisition_adapter, version_repo: IProjectVersionRepository):
         self.acquisition_adapter = acquisition_adapter
+        self.version_repo = version_repo
 
     def get_by_ids(self, tag_ids: List[int]) -> List[Tag]:
         qs = TagModel.objects.filter(pk__in=tag_ids)
@@ -21,6 +32,72 @@ class DjangoTagRepository(ITagRepository):
         model = TagModel.objects.get(pk=tag_id)
         return TagMapper.to_domain(model)
 
+    def list_by_project(self, project_id: int) -> List[Tag]:
+        return [TagMapper.to_domain(m) for m in TagModel.objects.filter(project_id=project_id)]
+
+    @transaction.atomic
+    def bulk_create(self, tags: List[Tag]) -> List[Tag]:
+        if not tags:
+            return []
+
+        models = TagModel.objects.bulk_create(
+            [TagModel(**TagMapper.to_db(t), parent_id=t.parent_id) for t in tags],
+            batch_size=500
+        )
+
+        # Ancestros de todos los padres en una consulta por lote de ids
+        ancestors = defaultdict(list)
+        parent_ids = sorted({t.parent_id for t in tags if t.parent_id})
+        for batch in batched(parent_ids):
+            for ancestor_id, descendant_id, depth in TagClosureModel.objects.filter(
+                    descendant_id__in=batch
+            ).values_list('ancestor_id', 'descendant_id', 'depth'):
+                ancestors[descendant_id].append((ancestor_id, depth))
+
+        rows = []
+        for tag, model in zip(tags, models):
+            tag.id = model.id
+            rows.append(TagClosureModel(ancestor_id=model.id, descendant_id=model.id, depth=0))
+            rows.extend(
+                TagClosureModel(ancestor_id=ancestor_id, descendant_id=model.id, depth=depth + 1)
+                for ancestor_id, depth in ancestors.get(tag.parent_id, ())
+            )
+        TagClosureModel.objects.bulk_create(rows, batch_size=1000)
+
+        self.version_repo.bump_tag_catalog({t.project_id for t in tags})
+        return tags
+
+    def set_moderation(
+            self,
+            tag_ids: List[int],
+            status: TagStatus,
+            visibility: TagVisibility,
+            project_ids: Iterable[int]
+    ) -> int:
+        updated = TagModel.objects.filter(pk__in=tag_ids).update(
+            status=status.value,
+            visibility=visibility.value
+        )
+        self.version_repo.bump_tag_catalog(project_ids)
+        return updated
+
+    def _pending(self, project_id: int):
+        return TagModel.objects.filter(project_id=project_id, status=TagStatus.PENDING.value)
+
+    def list_pending(self, project_id: int, after_id: int = 0, limit: int = 50) -> List[TagModerationItemDTO]:
+        rows = self._pending(project_id).filter(
+            pk__gt=after_id
+        ).order_by('pk').annotate(
+            quote_count=Count('quotes', filter=CODER_QUOTES)
+        ).values_list(
+            'id', 'name', 'type', 'created_by_user_id', 'question_id', 'parent_id', 'quote_count'
+        )[:limit]
+        return [TagModerationItemDTO(*row) for row in rows]
+
+    def count_pending(self, project_id: int) -> int:
+        return self._pending(project_id).count()
+
+    @transaction.atomic
     def save(self, tag: Tag) -> Tag:
         data = TagMapper.to_db(tag)
 
@@ -28,13 +105,125 @@ class DjangoTagRepository(ITagRepository):
             TagModel.objects.filter(pk=tag.id).update(**data)
             model = TagModel.objects.get(pk=tag.id)
         else:
-            model = TagModel.objects.create(**data)
+            model = TagModel.objects.create(**data, parent_id=tag.parent_id)
             tag.id = model.id
+            self._insert_closure(model.id, tag.parent_id)
 
+        self.version_repo.bump_tag_catalog([tag.project_id])
         return TagMapper.to_domain(model)
 
+    @staticmethod
+    def _insert_closure(tag_id: int, parent_id: Optional[int]) -> None:
+        rows = [TagClosureModel(ancestor_id=tag_id, descendant_id=tag_id, depth=0)]
+        if parent_id:
+            rows.extend(
+                TagClosureModel(ancestor_id=ancestor_id, descendant_id=tag_id, depth=depth + 1)
+                for ancestor_id, depth in TagClosureModel.objects.filter(
+                    descendant_id=parent_id
+                ).values_list('ancestor_id', 'depth')
+            )
+        TagClosureModel.objects.bulk_create(rows)
+
+    @transaction.atomic
     def delete(self, tag: Tag) -> None:
+        # Los caminos que pasaban por el tag se acortan un nivel y sus hijos
+        # suben a su padre; las filas del propio tag caen por CASCADE.
+        ancestor_ids = list(TagClosureModel.objects.filter(
+            descendant_id=tag.id, depth__gt=0
+        ).values_list('ancestor_id', flat=True))
+        if ancestor_ids:
+            TagClosureModel.objects.filter(
+                ancestor_id__in=ancestor_ids,
+                descendant_id__in=TagClosureModel.objects.filter(
+                    ancestor_id=tag.id, depth__gt=0
+                ).values('descendant_id')
+            ).update(depth=F('depth') - 1)
+        TagModel.objects.filter(parent_id=tag.id).update(parent_id=tag.parent_id)
+
         TagModel.objects.filter(pk=tag.id).delete()
+        self.version_repo.bump_tag_catalog([tag.project_id])
+        self.version_repo.bump_coding([tag.project_id])
+
+    def get_subtree_ids(self, tag_id: int) -> List[int]:
+        return list(
+            TagClosureModel.objects.filter(ancestor_id=tag_id).values_list('descendant_id', flat=True)
+        )
+
+    def get_ancestor_ids(self, tag_ids: Iterable[int]) -> Set[int]:
+        return set(
+            TagClosureModel.objects.filter(
+                descendant_id__in=list(tag_ids)
+            ).values_list('ancestor_id', flat=True)
+        )
+
+    def get_subtree(self, tag_id: int) -> List[TagTreeNodeDTO]:
+        links = TagClosureModel.objects.filter(ancestor_id=tag_id)
+
+        # Quotes distintas bajo cada nodo: una sola consulta agrupada
+        rolled_up = dict(
+            TagClosureModel.objects.filter(
+                ancestor_id__in=links.values('descendant_id')
+            ).values('ancestor_id').annotate(
+                quote_count=Count('descendant__quotes', distinct=True, filter=CODER_DESCENDANT_QUOTES)
+            ).values_list('ancestor_id', 'quote_count').order_by()
+        )
+
+        rows = links.annotate(
+            direct_quote_count=Count('descendant__quotes', filter=CODER_DESCENDANT_QUOTES)
+        ).values_list(
+            'descendant_id', 'descendant__name', 'descendant__parent_id',
+            'depth', 'descendant__status', 'direct_quote_count'
+        ).order_by('depth', 'descendant__name')
+
+        return [
+            TagTreeNodeDTO(
+                tag_id=node_id,
+                name=name,
+                parent_id=parent_id,
+                depth=depth,
+                status=status,
+                direct_quote_count=direct,
+                quote_count=rolled_up.get(node_id, 0),
+            )
+            for node_id, name, parent_id, depth, status, direct in rows
+        ]
+
+    @transaction.atomic
+    def move(self, tag: Tag, new_parent_id: Optional[int]) -> None:
+        subtree = TagClosureModel.objects.filter(ancestor_id=tag.id)
+        subtree_ids = subtree.values('descendant_id')
+
+        # 1. Cortar los caminos que entran al subárbol desde fuera
+        TagClosureModel.objects.filter(
+            descendant_id__in=subtree_ids
+        ).exclude(
+            ancestor_id__in=subtree_ids
+        ).delete()
+
+        # 2. Conectar cada ancestro del nuevo padre con cada nodo del subárbol
+        if new_parent_id:
+            ancestors = list(
+                TagClosureModel.objects.filter(
+                    descendant_id=new_parent_id
+                ).values_list('ancestor_id', 'depth')
+            )
+            nodes = list(subtree.values_list('descendant_id', 'depth'))
+            TagClosureModel.objects.bulk_create(
+                (
+                    TagClosureModel(
+                        ancestor_id=ancestor_id,
+                        descendant_id=node_id,
+                        depth=ancestor_depth + node_depth + 1
+                    )
+                    for ancestor_id, ancestor_depth in ancestors
+                    for node_id, node_depth in nodes
+                ),
+                batch_size=1000
+            )
+
+        TagModel.objects.filter(pk=tag.id).update(parent_id=new_parent_id)
+        tag.parent_id = new_parent_id
+        self.version_repo.bump_tag_catalog([tag.project_id])
 
     def get_mandatory_tags_for_project_context(self, study_id: int) -> List[Tag]:
         project_id = self.acquisition_adapter.get_project_context(study_id)
@@ -60,6 +249,23 @@ class DjangoTagRepository(ITagRepository):
             Q(created_by_user_id=user_id)
         ).filter(
             status=TagStatus.APPROVED.value
-        ).distinct()
+        )
 
-        return [TagMapper.to_domain(m) for m in qs]
\ No newline at end of file
+        return [TagMapper.to_domain(m) for m in qs]
+
+    def list_suggestions(self, project_id: int, user_id: Optional[int] = None) -> List[TagSuggestionDTO]:
+        qs = TagModel.objects.filter(project_id=project_id)
+        if user_id is None:
+            qs = qs.filter(
+                visibility=TagVisibility.PUBLIC.value,
+                status=TagStatus.APPROVED.value
+            )
+        else:
+            qs = qs.filter(created_by_user_id=user_id).exclude(
+                visibility=TagVisibility.PUBLIC.value
+            ).exclude(status=TagStatus.REJECTED.value)
+
+        rows = qs.annotate(quote_count=Count('quotes', filter=CODER_QUOTES)).values_list(
+            'id', 'name', 'color', 'is_mandatory', 'type', 'status', 'quote_count'
+        )
+        return [TagSuggestionDTO(*row) for row in rows]
\ No newline at end of file
@@ -0,0 +1,28 @@
+from django.db.models import QuerySet
+
+from ..models import ExtractionModel, QuoteModel
+
+
+def project_quotes(project_id: int) -> QuerySet:
+    """
+    Quotes que pertenecen a un proyecto.
+
+    project_id se copia en la quote al crearla (ver backfill_project_ids para
+    datos anteriores), así el alcance por proyecto es un recorrido del índice
+    (project_id, created_at) sin consultar Acquisition estudio por estudio.
+
+    Los borradores de consenso repiten quotes de las extracciones del estudio,
+    así que quedan fuera para no contarlas dos veces.
+    """
+    return QuoteModel.objects.filter(
+        project_id=project_id,
+        extraction__is_consensus=False
+    )
+
+
+def project_extractions(project_id: int) -> QuerySet:
+    """Extracciones del proyecto, sin borradores de consenso (índice project_id/status)"""
+    return ExtractionModel.objects.filter(
+        project_id=project_id,
+        is_consensus=False
+    )
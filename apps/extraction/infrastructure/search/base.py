@@ -0,0 +1,104 @@
+import re
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Tuple
+
+from django.db import connection
+
+from ...domain.dtos.search_dtos import QuoteSearchFilters
+from ...domain.repositories.i_quote_search_index import IQuoteSearchIndex
+from ..models import QuoteModel, TagModel
+from ..repositories.project_scope import project_quotes
+
+TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+# Límite prudente de parámetros por sentencia (SQLite)
+IN_BATCH_SIZE = 900
+
+
+def parse_terms(text: str) -> List[str]:
+    """Palabras de la búsqueda, sin operadores ni comillas del usuario"""
+    return TERM_RE.findall(text or "")
+
+
+def batched(ids: Iterable[int], size: int = IN_BATCH_SIZE):
+    """Agrupa ids en listas de a lo sumo `size` (para cláusulas IN)"""
+    batch = []
+    for quote_id in ids:
+        batch.append(quote_id)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class BaseQuoteSearchIndex(IQuoteSearchIndex, ABC):
+    """
+    Lógica común a los motores FTS: filtros por proyecto/tag/coder/página
+    (resueltos contra las tablas de quotes y tags) y reconstrucción por lotes.
+    Cada backend define cómo indexa, borra y consulta su estructura.
+    """
+
+    page_expression = None  # Expresión SQL que extrae la página de location_data
+
+    quote_table = QuoteModel._meta.db_table
+    tag_table = TagModel._meta.db_table
+    through_table = QuoteModel.tags.through._meta.db_table
+
+    def _filter_sql(self, filters: QuoteSearchFilters) -> Tuple[str, list]:
+        clauses = ["q.project_id = %s"]
+        params = [filters.project_id]
+
+        if filters.tag_id is not None:
+            clauses.append(
+                f"EXISTS (SELECT 1 FROM {self.through_table} ft "
+                f"WHERE ft.quotemodel_id = q.id AND ft.tagmodel_id = %s)"
+            )
+            params.append(filters.tag_id)
+
+        if filters.researcher_id is not None:
+            clauses.append("q.researcher_id = %s")
+            params.append(filters.researcher_id)
+
+        if filters.page is not None:
+            clauses.append(f"{self.page_expression} = %s")
+            params.append(filters.page)
+
+        return " AND ".join(clauses), params
+
+    _batches = staticmethod(batched)
+
+    @staticmethod
+    def _placeholders(batch: list) -> str:
+        return ", ".join(["%s"] * len(batch))
+
+    @abstractmethod
+    def _clear_all(self) -> None:
+        """Vacía el índice completo (antes de reconstruirlo entero)"""
+        pass
+
+    def rebuild(self, project_id: int = None, chunk_size: int = 2000) -> int:
+        if project_id is None:
+            self._clear_all()
+            qs = QuoteModel.objects.all()
+        else:
+            qs = project_quotes(project_id)
+
+        ids = qs.order_by('id').values_list('id', flat=True).iterator(chunk_size=chunk_size)
+
+        total = 0
+        for batch in self._batches(ids, size=min(chunk_size, IN_BATCH_SIZE)):
+            self.index_quotes(batch)
+            total += len(batch)
+        return total
+
+    @staticmethod
+    def _execute(sql: str, params: list = None) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params or [])
+
+    @staticmethod
+    def _fetchall(sql: str, params: list) -> list:
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchall()
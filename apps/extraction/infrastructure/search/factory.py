@@ -0,0 +1,11 @@
+from django.db import connection
+
+from .postgres_fts import PostgresQuoteSearchIndex
+from .sqlite_fts5 import SqliteQuoteSearchIndex
+
+
+def build_quote_search_index():
+    """Elige el motor FTS según la BD configurada"""
+    if connection.vendor == 'postgresql':
+        return PostgresQuoteSearchIndex()
+    return SqliteQuoteSearchIndex()
@@ -0,0 +1,207 @@
+from itertools import chain, combinations, groupby
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+from ...domain.dtos.near_duplicate_dtos import NearDuplicateClusterDTO, NearDuplicateMatchDTO
+from ...domain.repositories.i_near_duplicate_index import INearDuplicateIndex
+from ...domain.services.near_duplicates import MinHasher, cluster_pairs
+from ..models import QuoteLshBucketModel, QuoteModel, QuoteSignatureModel
+from ..repositories.project_scope import project_quotes
+from .base import batched
+
+QuoteRow = Tuple[int, str, int, int]  # (quote_id, text, extraction_id, researcher_id)
+
+
+class MinHashLshIndex(INearDuplicateIndex):
+    """
+    Índice LSH persistido en BD.
+
+    Cada quote guarda su firma MinHash y una fila por banda con la clave de
+    esa banda. Una consulta calcula las claves del texto nuevo y lee solo los
+    buckets coincidentes vía el índice (project_id, band_key): el costo depende
+    del número de candidatos, no del tamaño del proyecto. Los candidatos se
+    confirman comparando firmas completas.
+    """
+
+    # Buckets de hasta este tamaño se comparan par a par (como mucho 496 pares)
+    MAX_PAIRWISE_BUCKET = 32
+
+    def __init__(self, hasher: Optional[MinHasher] = None):
+        self.hasher = hasher or MinHasher()
+
+    def _write_batch(self, project_id: int, rows: List[QuoteRow]) -> None:
+        signatures = []
+        buckets = []
+        for quote_id, text, extraction_id, researcher_id in rows:
+            signature = self.hasher.signature(text)
+            signatures.append(QuoteSignatureModel(
+                quote_id=quote_id,
+                project_id=project_id,
+                extraction_id=extraction_id,
+                researcher_id=researcher_id,
+                signature=MinHasher.to_bytes(signature),
+            ))
+            buckets.extend(
+                QuoteLshBucketModel(project_id=project_id, band_key=key, quote_id=quote_id)
+                for key in self.hasher.band_keys(signature)
+            )
+
+        QuoteSignatureModel.objects.bulk_create(signatures)
+        QuoteLshBucketModel.objects.bulk_create(buckets, batch_size=2000)
+
+    def index_quotes(self, project_id: int, quote_ids: Iterable[int]) -> None:
+        for batch in batched(quote_ids):
+            QuoteSignatureModel.objects.filter(quote_id__in=batch).delete()
+            QuoteLshBucketModel.objects.filter(quote_id__in=batch).delete()
+
+            rows = list(
+                QuoteModel.objects
+                .filter(pk__in=batch)
+                .values_list('id', 'text_portion', 'extraction_id', 'researcher_id')
+            )
+            self._write_batch(project_id, rows)
+
+    def rebuild(self, project_id: int, chunk_size: int = 2000) -> int:
+        QuoteSignatureModel.objects.filter(project_id=project_id).delete()
+        QuoteLshBucketModel.objects.filter(project_id=project_id).delete()
+
+        rows = (
+            project_quotes(project_id)
+            .order_by('pk')
+            .values_list('id', 'text_portion', 'extraction_id', 'researcher_id')
+            .iterator(chunk_size=chunk_size)
+        )
+
+        total = 0
+        batch: List[QuoteRow] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= chunk_size:
+                self._write_batch(project_id, batch)
+                total += len(batch)
+                batch = []
+        if batch:
+            self._write_batch(project_id, batch)
+            total += len(batch)
+
+        return total
+
+    def find_similar(
+            self,
+            project_id: int,
+            text: str,
+            threshold: float,
+            extraction_id: Optional[int] = None
+    ) -> List[NearDuplicateMatchDTO]:
+        signature = self.hasher.signature(text)
+
+        candidates = QuoteLshBucketModel.objects.filter(
+            project_id=project_id,
+            band_key__in=self.hasher.band_keys(signature)
+        ).values('quote_id')
+
+        stored = QuoteSignatureModel.objects.filter(quote_id__in=candidates)
+        if extraction_id is not None:
+            stored = stored.filter(extraction_id=extraction_id)
+
+        matches = []
+        for quote_id, ext_id, researcher_id, raw in stored.values_list(
+                'quote_id', 'extraction_id', 'researcher_id', 'signature'):
+            similarity = MinHasher.similarity(signature, MinHasher.from_bytes(raw))
+            if similarity >= threshold:
+                matches.append(NearDuplicateMatchDTO(
+                    quote_id=quote_id,
+                    extraction_id=ext_id,
+                    researcher_id=researcher_id,
+                    similarity=round(similarity, 4),
+                ))
+
+        matches.sort(key=lambda m: (-m.similarity, m.quote_id))
+        return matches
+
+    def _candidate_pairs(self, project_id: int) -> Tuple[Set[Tuple[int, int]], List[List[int]]]:
+        """
+        Recorre los buckets ordenados por clave (mismo índice de las búsquedas).
+
+        Los buckets de hasta MAX_PAIRWISE_BUCKET miembros emiten todos sus pares:
+        comparar solo contra un miembro perdería el par real cuando ese miembro
+        es una colisión espuria. Los buckets más grandes se devuelven aparte y se
+        resuelven contra representantes confirmados (_bucket_pairs).
+        """
+        rows = (
+            QuoteLshBucketModel.objects
+            .filter(project_id=project_id)
+            .order_by('band_key', 'quote_id')
+            .values_list('band_key', 'quote_id')
+            .iterator(chunk_size=5000)
+        )
+
+        pairs: Set[Tuple[int, int]] = set()
+        large: List[List[int]] = []
+        for _, members in groupby(rows, key=lambda r: r[0]):
+            quote_ids = [quote_id for _, quote_id in members]
+            if len(quote_ids) <= self.MAX_PAIRWISE_BUCKET:
+                pairs.update(combinations(quote_ids, 2))
+            else:
+                large.append(quote_ids)
+        return pairs, large
+
+    @staticmethod
+    def _bucket_pairs(
+            quote_ids: List[int],
+            signatures: Dict[int, np.ndarray],
+            threshold: float
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Pares confirmados de un bucket grande: cada miembro se compara con los
+        representantes de los grupos ya formados en el bucket y, si no coincide
+        con ninguno, abre un grupo nuevo. El costo es miembros x grupos en lugar
+        de cuadrático, sin depender de que el primer miembro sea un duplicado real.
+        """
+        representatives: List[int] = []
+        for quote_id in quote_ids:
+            if quote_id not in signatures:
+                continue
+            matched = False
+            for rep in representatives:
+                if MinHasher.similarity(signatures[rep], signatures[quote_id]) >= threshold:
+                    matched = True
+                    yield rep, quote_id
+            if not matched:
+                representatives.append(quote_id)
+
+    def find_clusters(self, project_id: int, threshold: float) -> List[NearDuplicateClusterDTO]:
+        pairs, large = self._candidate_pairs(project_id)
+        if not pairs and not large:
+            return []
+
+        involved = sorted(
+            {quote_id for pair in pairs for quote_id in pair}
+            | {quote_id for bucket in large for quote_id in bucket}
+        )
+        info: Dict[int, tuple] = {}
+        for batch in batched(involved):
+            for quote_id, ext_id, researcher_id, raw in QuoteSignatureModel.objects.filter(
+                    quote_id__in=batch
+            ).values_list('quote_id', 'extraction_id', 'researcher_id', 'signature'):
+                info[quote_id] = (ext_id, researcher_id, MinHasher.from_bytes(raw))
+
+        signatures = {quote_id: row[2] for quote_id, row in info.items()}
+        confirmed = chain(
+            (
+                (a, b) for a, b in pairs
+                if a in info and b in info
+                and MinHasher.similarity(info[a][2], info[b][2]) >= threshold
+            ),
+            chain.from_iterable(self._bucket_pairs(bucket, signatures, threshold) for bucket in large)
+        )
+
+        return [
+            NearDuplicateClusterDTO(
+                quote_ids=group,
+                extraction_ids=sorted({info[q][0] for q in group}),
+                researcher_ids=sorted({info[q][1] for q in group}),
+            )
+            for group in cluster_pairs(confirmed)
+        ]
@@ -0,0 +1,90 @@
+from typing import Iterable, List
+
+from ...domain.dtos.search_dtos import QuoteSearchFilters, QuoteSearchHitDTO
+from .base import BaseQuoteSearchIndex, parse_terms
+
+SEARCH_TABLE = 'extraction_quote_search'
+
+# Configuraciones creadas en la migración: spanish/english + unaccent
+DOCUMENT_SQL = (
+    "to_tsvector('extraction_es', {text}) || to_tsvector('extraction_en', {text})"
+)
+QUERY_SQL = (
+    "SELECT to_tsquery('extraction_es', %s) || to_tsquery('extraction_en', %s) AS query"
+)
+
+
+class PostgresQuoteSearchIndex(BaseQuoteSearchIndex):
+    """
+    Índice tsvector + GIN para PostgreSQL.
+
+    El documento combina las configuraciones española e inglesa (ambas con
+    unaccent), así los stems de los dos idiomas coinciden sin tildes.
+    """
+
+    page_expression = "(q.location_data ->> 'page')::int"
+
+    def index_quotes(self, quote_ids: Iterable[int]) -> None:
+        for batch in self._batches(quote_ids):
+            self._execute(
+                f"INSERT INTO {SEARCH_TABLE} (quote_id, document) "
+                f"SELECT id, {DOCUMENT_SQL.format(text='text_portion')} "
+                f"FROM {self.quote_table} WHERE id IN ({self._placeholders(batch)}) "
+                f"ON CONFLICT (quote_id) DO UPDATE SET document = EXCLUDED.document",
+                batch
+            )
+
+    def remove_quotes(self, quote_ids: Iterable[int]) -> None:
+        for batch in self._batches(quote_ids):
+            self._execute(
+                f"DELETE FROM {SEARCH_TABLE} WHERE quote_id IN ({self._placeholders(batch)})",
+                batch
+            )
+
+    def _clear_all(self) -> None:
+        self._execute(f"TRUNCATE {SEARCH_TABLE}")
+
+    @staticmethod
+    def _tsquery_expression(text: str) -> str:
+        terms = parse_terms(text)
+        if not terms:
+            return ""
+        # AND de términos; el último admite prefijo (búsqueda mientras se escribe)
+        return " & ".join([*terms[:-1], f"{terms[-1]}:*"])
+
+    def search(
+            self,
+            text: str,
+            filters: QuoteSearchFilters,
+            limit: int = 20,
+            offset: int = 0
+    ) -> List[QuoteSearchHitDTO]:
+        tsquery = self._tsquery_expression(text)
+        if not tsquery:
+            return []
+
+        where, params = self._filter_sql(filters)
+        rows = self._fetchall(
+            f"SELECT q.id, q.extraction_id, q.researcher_id, {self.page_expression}, "
+            f"ts_headline('extraction_es', q.text_portion, sq.query, "
+            f"'StartSel=<mark>, StopSel=</mark>, MaxFragments=2, FragmentDelimiter=…'), "
+            f"ts_rank_cd(s.document, sq.query) AS rank "
+            f"FROM {SEARCH_TABLE} s "
+            f"JOIN {self.quote_table} q ON q.id = s.quote_id "
+            f"CROSS JOIN ({QUERY_SQL}) AS sq "
+            f"WHERE s.document @@ sq.query AND {where} "
+            f"ORDER BY rank DESC LIMIT %s OFFSET %s",
+            [tsquery, tsquery, *params, limit, offset]
+        )
+
+        return [
+            QuoteSearchHitDTO(
+                quote_id=quote_id,
+                extraction_id=extraction_id,
+                researcher_id=researcher_id,
+                page=page,
+                snippet=snippet,
+                rank=round(float(rank), 6),
+            )
+            for quote_id, extraction_id, researcher_id, page, snippet, rank in rows
+        ]
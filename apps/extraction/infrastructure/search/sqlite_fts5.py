@@ -0,0 +1,82 @@
+from typing import Iterable, List
+
+from ...domain.dtos.search_dtos import QuoteSearchFilters, QuoteSearchHitDTO
+from .base import BaseQuoteSearchIndex, parse_terms
+
+FTS_TABLE = 'extraction_quote_fts'
+
+
+class SqliteQuoteSearchIndex(BaseQuoteSearchIndex):
+    """
+    Índice FTS5 para desarrollo (SQLite).
+
+    El tokenizer unicode61 con remove_diacritics 2 pliega tildes y mayúsculas
+    tanto al indexar como al consultar ("migracion" encuentra "Migración").
+    """
+
+    page_expression = "json_extract(q.location_data, '$.page')"
+
+    def index_quotes(self, quote_ids: Iterable[int]) -> None:
+        for batch in self._batches(quote_ids):
+            marks = self._placeholders(batch)
+            self._execute(f"DELETE FROM {FTS_TABLE} WHERE rowid IN ({marks})", batch)
+            self._execute(
+                f"INSERT INTO {FTS_TABLE} (rowid, text_portion) "
+                f"SELECT id, text_portion FROM {self.quote_table} WHERE id IN ({marks})",
+                batch
+            )
+
+    def remove_quotes(self, quote_ids: Iterable[int]) -> None:
+        for batch in self._batches(quote_ids):
+            self._execute(
+                f"DELETE FROM {FTS_TABLE} WHERE rowid IN ({self._placeholders(batch)})",
+                batch
+            )
+
+    def _clear_all(self) -> None:
+        self._execute(f"DELETE FROM {FTS_TABLE}")
+
+    @staticmethod
+    def _match_expression(text: str) -> str:
+        terms = parse_terms(text)
+        if not terms:
+            return ""
+        # Cada término entre comillas (AND implícito); el último como prefijo
+        quoted = [f'"{t}"' for t in terms]
+        quoted[-1] += "*"
+        return " ".join(quoted)
+
+    def search(
+            self,
+            text: str,
+            filters: QuoteSearchFilters,
+            limit: int = 20,
+            offset: int = 0
+    ) -> List[QuoteSearchHitDTO]:
+        match = self._match_expression(text)
+        if not match:
+            return []
+
+        where, params = self._filter_sql(filters)
+        rows = self._fetchall(
+            f"SELECT q.id, q.extraction_id, q.researcher_id, {self.page_expression}, "
+            f"snippet({FTS_TABLE}, 0, '<mark>', '</mark>', '…', 24), "
+            f"bm25({FTS_TABLE}) AS rank "
+            f"FROM {FTS_TABLE} f JOIN {self.quote_table} q ON q.id = f.rowid "
+            f"WHERE {FTS_TABLE} MATCH %s AND {where} "
+            f"ORDER BY rank LIMIT %s OFFSET %s",
+            [match, *params, limit, offset]
+        )
+
+        # bm25 es menor cuanto más relevante; se invierte para exponerlo
+        return [
+            QuoteSearchHitDTO(
+                quote_id=quote_id,
+                extraction_id=extraction_id,
+                researcher_id=researcher_id,
+                page=page,
+                snippet=snippet,
+                rank=round(-rank, 6),
+            )
+            for quote_id, extraction_id, researcher_id, page, snippet, rank in rows
+        ]
@@ -0,0 +1,41 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from apps.extraction.application.commands.archive_closed_projects import ArchiveClosedProjectsCommand
+from apps.extraction.container import container
+from apps.extraction.domain.exceptions.extraction_exceptions import ExtractionException
+
+
+class Command(BaseCommand):
+    help = (
+        'Archiva en frío las quotes de proyectos con la fase cerrada hace más de '
+        'N días: quedan solo en los snapshots comprimidos (la exportación sigue funcionando)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--older-than-days', type=int, default=180)
+        parser.add_argument('--project-id', type=int, default=None)
+        parser.add_argument('--chunk-size', type=int, default=500)
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Solo listar los proyectos elegibles')
+
+    def handle(self, *args, **options):
+        command = ArchiveClosedProjectsCommand(
+            closed_before=timezone.now() - timedelta(days=options['older_than_days']),
+            project_id=options['project_id'],
+            dry_run=options['dry_run'],
+            chunk_size=options['chunk_size']
+        )
+        try:
+            result = container.archive_closed_projects_handler.handle(command)
+        except ExtractionException as e:
+            raise CommandError(str(e))
+
+        for project_id, archived in result.archived_quotes_by_project.items():
+            label = 'elegible' if options['dry_run'] else f'{archived} quotes archivadas'
+            self.stdout.write(self.style.SUCCESS(f'Project {project_id}: {label}'))
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Total de quotes archivadas: {result.archived_quotes}')
+        )
@@ -0,0 +1,75 @@
+from collections import defaultdict
+from typing import Dict, Optional
+
+from django.core.management.base import BaseCommand
+from django.db.models import OuterRef, Subquery
+from apps.extraction.container import container
+from apps.extraction.infrastructure.models import ExtractionModel, QuoteModel
+
+
+class Command(BaseCommand):
+    help = (
+        'Completa project_id en extracciones y quotes creadas antes de la '
+        'desnormalización. Es idempotente: solo toca filas con project_id nulo'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        extractions = self._backfill_extractions(chunk_size)
+        quotes = self._backfill_quotes(chunk_size)
+        self.stdout.write(self.style.SUCCESS(
+            f'Extracciones actualizadas: {extractions}. Quotes actualizadas: {quotes}'
+        ))
+
+    def _backfill_extractions(self, chunk_size: int) -> int:
+        """Un solo llamado a Acquisition por estudio y un UPDATE por proyecto en cada tramo"""
+        project_by_study: Dict[int, Optional[int]] = {}
+        updated = 0
+        last_id = 0
+        while True:
+            rows = list(
+                ExtractionModel.objects
+                .filter(project_id__isnull=True, id__gt=last_id)
+                .order_by('id')
+                .values_list('id', 'study_id')[:chunk_size]
+            )
+            if not rows:
+                return updated
+            last_id = rows[-1][0]
+
+            ids_by_project = defaultdict(list)
+            for extraction_id, study_id in rows:
+                if study_id not in project_by_study:
+                    project_by_study[study_id] = container.acquisition_adapter.get_project_context(study_id)
+                project_id = project_by_study[study_id]
+                if project_id is not None:
+                    ids_by_project[project_id].append(extraction_id)
+
+            for project_id, ids in ids_by_project.items():
+                updated += ExtractionModel.objects.filter(id__in=ids).update(project_id=project_id)
+
+    @staticmethod
+    def _backfill_quotes(chunk_size: int) -> int:
+        """Copia el project_id de la extracción por rangos de id para acotar cada UPDATE"""
+        extraction_project = ExtractionModel.objects.filter(
+            pk=OuterRef('extraction_id')
+        ).values('project_id')[:1]
+
+        updated = 0
+        last_id = 0
+        while True:
+            ids = list(
+                QuoteModel.objects
+                .filter(project_id__isnull=True, extraction__project_id__isnull=False, id__gt=last_id)
+                .order_by('id')
+                .values_list('id', flat=True)[:chunk_size]
+            )
+            if not ids:
+                return updated
+            last_id = ids[-1]
+            updated += QuoteModel.objects.filter(
+                id__gte=ids[0], id__lte=last_id, project_id__isnull=True
+            ).update(project_id=Subquery(extraction_project))
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.extraction.application.commands.clone_codebook import CloneCodebookCommand
+from apps.extraction.container import container
+from apps.extraction.domain.exceptions.extraction_exceptions import ExtractionException
+
+
+class Command(BaseCommand):
+    help = 'Copia los tags aprobados (con su jerarquía) de un proyecto a otro'
+
+    def add_arguments(self, parser):
+        parser.add_argument('source_project_id', type=int)
+        parser.add_argument('target_project_id', type=int)
+        parser.add_argument('--user-id', type=int,
+                            help='Autor de los tags. Por defecto: el owner del proyecto destino')
+
+    def handle(self, *args, **options):
+        target_id = options['target_project_id']
+
+        user_id = options['user_id']
+        if user_id is None:
+            project = container.project_adapter.get_project_by_id(target_id)
+            if not project:
+                raise CommandError(f"El proyecto {target_id} no existe")
+            user_id = project.owner_id
+
+        try:
+            result = container.clone_codebook_handler.handle(CloneCodebookCommand(
+                source_project_id=options['source_project_id'],
+                target_project_id=target_id,
+                user_id=user_id
+            ))
+        except ExtractionException as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Tags creados: {result.created} (ya existentes: {result.existing})"
+        ))
+        if result.dropped_question_ids:
+            self.stdout.write(self.style.WARNING(
+                "Preguntas no presentes en el destino (vínculo omitido): "
+                + ', '.join(map(str, result.dropped_question_ids))
+            ))
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from apps.extraction.application.commands.close_expired_phases import CloseExpiredPhasesCommand
+from apps.extraction.container import container
+
+
+class Command(BaseCommand):
+    help = 'Cierra automáticamente fases de extracción que ya pasaron su end_date'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        result = container.close_expired_phases_handler.handle(
+            CloseExpiredPhasesCommand(batch_size=options['batch_size'])
+        )
+
+        for project_id in result.closed_project_ids:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f'Fase cerrada: Project {project_id}'
+                )
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Total de fases cerradas: {result.closed_count}'
+            )
+        )
@@ -0,0 +1,36 @@
+import json
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from apps.extraction.container import container
+
+
+class Command(BaseCommand):
+    help = (
+        'Agrupa las quotes casi duplicadas de un proyecto (MinHash/LSH). '
+        'Los grupos con más de un coder son pasajes coincidentes de doble extracción.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('project_id', type=int)
+        parser.add_argument('--threshold', type=float, default=0.8)
+        parser.add_argument('--rebuild', action='store_true',
+                            help='Recalcular antes las firmas de todas las quotes del proyecto')
+        parser.add_argument('--cross-coder-only', action='store_true')
+
+    def handle(self, *args, **options):
+        index = container.near_duplicate_index
+
+        if options['rebuild']:
+            with transaction.atomic():
+                total = index.rebuild(options['project_id'])
+            self.stderr.write(f'Quotes indexadas: {total}')
+
+        clusters = index.find_clusters(options['project_id'], threshold=options['threshold'])
+        if options['cross_coder_only']:
+            clusters = [c for c in clusters if c.cross_coder]
+
+        for cluster in clusters:
+            self.stdout.write(json.dumps(cluster.to_dict()))
+
+        self.stderr.write(self.style.SUCCESS(f'Grupos encontrados: {len(clusters)}'))
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+from apps.extraction.application.commands.run_quote_clustering import RunQuoteClusteringCommand
+from apps.extraction.container import container
+from apps.extraction.domain.entities.quote_cluster import QuoteClusterRun
+from apps.extraction.infrastructure.ml.parallel_clustering import ParallelQuoteClusterer
+
+
+class Command(BaseCommand):
+    help = (
+        'Agrupa (k-means por mini-lotes sobre TF-IDF) las quotes de un proyecto '
+        'en este proceso, sin pasar por la cola de jobs'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('project_id', type=int)
+        parser.add_argument('--k', type=int, default=20)
+        parser.add_argument('--max-tags', type=int, default=None)
+        parser.add_argument('--workers', type=int, default=None,
+                            help='Procesos del pool. Por defecto: núcleos - 1')
+        parser.add_argument('--user-id', type=int, default=0,
+                            help='Usuario que figura como solicitante')
+
+    def handle(self, *args, **options):
+        run = container.quote_cluster_repository.create_run(QuoteClusterRun(
+            id=None,
+            project_id=options['project_id'],
+            requested_by_user_id=options['user_id'],
+            k=options['k'],
+            max_tags=options['max_tags'],
+        ))
+
+        handler = container.run_quote_clustering_handler
+        if options['workers']:
+            handler.clusterer = ParallelQuoteClusterer(workers=options['workers'])
+
+        summary = handler.handle(RunQuoteClusteringCommand(run_id=run.id))
+
+        for cluster in container.quote_cluster_repository.get_clusters(run.id):
+            self.stdout.write(f"[{cluster.label}] {cluster.size:>7}  {', '.join(cluster.top_terms)}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Ejecución {run.id}: {summary['quote_count']} quotes en "
+            f"{summary['clusters']} clusters (cohesión {summary['cohesion']})"
+        ))
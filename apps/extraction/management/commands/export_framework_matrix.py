@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+from apps.extraction.container import container
+from apps.extraction.infrastructure.exporters.streaming import stream_csv
+
+
+class Command(BaseCommand):
+    help = 'Exporta en CSV la matriz estudio x tag (framework matrix) de un proyecto'
+
+    def add_arguments(self, parser):
+        parser.add_argument('project_id', type=int)
+        parser.add_argument('--snippets', action='store_true',
+                            help='Incluir un fragmento de ejemplo en cada celda')
+        parser.add_argument('--snippet-length', type=int, default=200)
+        parser.add_argument('--file', help='Ruta de salida. Por defecto: stdout')
+
+    def handle(self, *args, **options):
+        handler = container.get_framework_matrix_handler
+
+        # Uso administrativo: sin la verificación de owner de handle()
+        matrix = handler.build_matrix(options['project_id'])
+        chunks = stream_csv(
+            handler.iter_rows(matrix, options['snippets'], options['snippet_length']),
+            handler.columns(matrix)
+        )
+
+        if not options['file']:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending='')
+            return
+
+        with open(options['file'], 'w', encoding='utf-8', newline='') as fh:
+            for chunk in chunks:
+                fh.write(chunk)
+
+        studies, tags = matrix.shape
+        self.stderr.write(self.style.SUCCESS(
+            f"Matriz {studies} estudios x {tags} tags escrita en {options['file']}"
+        ))
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+from apps.extraction.application.queries.export_project_quotes import EXPORT_COLUMNS
+from apps.extraction.container import container
+from apps.extraction.infrastructure.exporters.streaming import STREAM_WRITERS
+
+
+class Command(BaseCommand):
+    help = 'Exporta en streaming (CSV o JSON Lines) todas las quotes codificadas de un proyecto'
+
+    def add_arguments(self, parser):
+        parser.add_argument('project_id', type=int)
+        parser.add_argument('--output', choices=sorted(STREAM_WRITERS), default='csv')
+        parser.add_argument('--file', help='Ruta de salida. Por defecto: stdout')
+        parser.add_argument('--chunk-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        rows = container.quote_repository.iter_export_rows_by_project(
+            options['project_id'],
+            chunk_size=options['chunk_size']
+        )
+        chunks = STREAM_WRITERS[options['output']](rows, EXPORT_COLUMNS)
+
+        if not options['file']:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending='')
+            return
+
+        with open(options['file'], 'w', encoding='utf-8', newline='') as fh:
+            for chunk in chunks:
+                fh.write(chunk)
+
+        self.stderr.write(self.style.SUCCESS(f"Exportación escrita en {options['file']}"))
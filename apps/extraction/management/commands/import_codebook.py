@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.extraction.application.commands.import_codebook import ImportCodebookCommand
+from apps.extraction.container import container
+from apps.extraction.domain.exceptions.extraction_exceptions import ExtractionException
+from apps.extraction.infrastructure.importers.codebook import CODEBOOK_FORMATS, parse_codebook
+
+
+class Command(BaseCommand):
+    help = 'Importa un libro de códigos deductivo (CSV o JSON) en un proyecto'
+
+    def add_arguments(self, parser):
+        parser.add_argument('project_id', type=int)
+        parser.add_argument('file')
+        parser.add_argument('--format', choices=CODEBOOK_FORMATS,
+                            help='Por defecto: según la extensión del archivo')
+        parser.add_argument('--user-id', type=int,
+                            help='Autor de los tags. Por defecto: el owner del proyecto')
+
+    def handle(self, *args, **options):
+        path = options['file']
+        fmt = options['format'] or ('json' if path.lower().endswith('.json') else 'csv')
+        project_id = options['project_id']
+
+        user_id = options['user_id']
+        if user_id is None:
+            project = container.project_adapter.get_project_by_id(project_id)
+            if not project:
+                raise CommandError(f"El proyecto {project_id} no existe")
+            user_id = project.owner_id
+
+        try:
+            with open(path, encoding='utf-8') as fh:
+                entries = parse_codebook(fh.read(), fmt)
+            result = container.import_codebook_handler.handle(
+                ImportCodebookCommand(project_id=project_id, user_id=user_id, entries=entries)
+            )
+        except ExtractionException as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Tags creados: {result.created} (ya existentes: {result.existing})"
+        ))
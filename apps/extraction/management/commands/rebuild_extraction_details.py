@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from apps.extraction.container import container
+
+
+class Command(BaseCommand):
+    help = (
+        'Reconstruye la proyección de lectura del detalle de extracciones '
+        '(todas o las de un proyecto)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--project-id', type=int, default=None)
+        parser.add_argument('--chunk-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        projected = container.extraction_detail_projection.rebuild(
+            project_id=options['project_id'],
+            chunk_size=options['chunk_size']
+        )
+        self.stdout.write(self.style.SUCCESS(f'Extracciones proyectadas: {projected}'))
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from apps.extraction.container import container
+
+
+class Command(BaseCommand):
+    help = 'Reconstruye el índice de texto completo de quotes (todo o un proyecto)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--project-id', type=int, default=None)
+        parser.add_argument('--chunk-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            total = container.quote_search_index.rebuild(
+                project_id=options['project_id'],
+                chunk_size=options['chunk_size']
+            )
+
+        self.stdout.write(self.style.SUCCESS(f'Quotes indexadas: {total}'))
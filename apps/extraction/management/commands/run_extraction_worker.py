@@ -0,0 +1,55 @@
+import signal
+import threading
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from apps.extraction.container import container
+from apps.extraction.infrastructure.jobs.worker import JobWorker
+
+
+class Command(BaseCommand):
+    help = (
+        'Ejecuta un worker de la cola de jobs de extracción '
+        '(cierre automático de fases, exportaciones, analítica)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--queue', action='append', dest='queues',
+                            help='Cola a atender (repetible). Por defecto: default')
+        parser.add_argument('--batch-size', type=int, default=1)
+        parser.add_argument('--lease-seconds', type=int, default=300)
+        parser.add_argument('--poll-interval', type=float, default=2.0)
+        parser.add_argument('--no-scheduler', action='store_true',
+                            help='No cerrar fases vencidas desde este worker')
+        parser.add_argument('--once', action='store_true',
+                            help='Procesar una sola iteración y salir')
+
+    def handle(self, *args, **options):
+        scheduler = None
+        if not options['no_scheduler']:
+            scheduler = container.phase_deadline_scheduler(
+                refresh_interval=timedelta(seconds=max(options['poll_interval'], 1) * 5)
+            )
+
+        worker = JobWorker(
+            container.job_queue,
+            container.job_handlers,
+            scheduler=scheduler,
+            queues=options['queues'] or ['default'],
+            batch_size=options['batch_size'],
+            lease_seconds=options['lease_seconds'],
+            poll_interval=options['poll_interval'],
+        )
+
+        if options['once']:
+            processed = worker.run_once()
+            self.stdout.write(self.style.SUCCESS(f'Jobs procesados: {processed}'))
+            return
+
+        stop_event = threading.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, lambda *_: stop_event.set())
+
+        self.stdout.write(self.style.SUCCESS(f'Worker {worker.worker_id} iniciado'))
+        worker.run_forever(stop_event)
+        self.stdout.write(self.style.SUCCESS('Worker detenido'))
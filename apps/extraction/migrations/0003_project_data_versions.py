@@ -0,0 +1,26 @@
+# Generated by Django 5.2.7 on 2026-10-19 17:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('extraction', '0002_job_queue'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectDataVersionModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('project_id', models.IntegerField(unique=True)),
+                ('tag_catalog_version', models.PositiveBigIntegerField(default=0)),
+                ('coding_version', models.PositiveBigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'extraction_project_version',
+            },
+        ),
+    ]
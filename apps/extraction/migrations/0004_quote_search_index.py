@@ -0,0 +1,66 @@
+from django.db import migrations
+
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS extraction_quote_fts USING fts5("
+    "text_portion, tokenize = 'unicode61 remove_diacritics 2')",
+    # Borrados en cascada (ej: al eliminar una extracción) no pasan por el repositorio
+    "CREATE TRIGGER IF NOT EXISTS extraction_quote_fts_ad AFTER DELETE ON extraction_quote "
+    "BEGIN DELETE FROM extraction_quote_fts WHERE rowid = old.id; END",
+    "INSERT INTO extraction_quote_fts (rowid, text_portion) "
+    "SELECT id, text_portion FROM extraction_quote",
+]
+
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS extraction_quote_fts_ad",
+    "DROP TABLE IF EXISTS extraction_quote_fts",
+]
+
+POSTGRES_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    "CREATE TEXT SEARCH CONFIGURATION extraction_es (COPY = spanish)",
+    "ALTER TEXT SEARCH CONFIGURATION extraction_es "
+    "ALTER MAPPING FOR hword, hword_part, word WITH unaccent, spanish_stem",
+    "CREATE TEXT SEARCH CONFIGURATION extraction_en (COPY = english)",
+    "ALTER TEXT SEARCH CONFIGURATION extraction_en "
+    "ALTER MAPPING FOR hword, hword_part, word WITH unaccent, english_stem",
+    "CREATE TABLE extraction_quote_search ("
+    "quote_id bigint PRIMARY KEY REFERENCES extraction_quote (id) ON DELETE CASCADE, "
+    "document tsvector NOT NULL)",
+    "CREATE INDEX extraction_quote_search_document_gin "
+    "ON extraction_quote_search USING GIN (document)",
+    "INSERT INTO extraction_quote_search (quote_id, document) "
+    "SELECT id, to_tsvector('extraction_es', text_portion) || "
+    "to_tsvector('extraction_en', text_portion) FROM extraction_quote",
+]
+
+POSTGRES_BACKWARD = [
+    "DROP TABLE IF EXISTS extraction_quote_search",
+    "DROP TEXT SEARCH CONFIGURATION IF EXISTS extraction_en",
+    "DROP TEXT SEARCH CONFIGURATION IF EXISTS extraction_es",
+]
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        statements = statements_by_vendor.get(schema_editor.connection.vendor, [])
+        for sql in statements:
+            schema_editor.execute(sql)
+    return run
+
+
+class Migration(migrations.Migration):
+    """
+    Índice de texto completo sobre extraction_quote.text_portion.
+    SQLite: tabla virtual FTS5. PostgreSQL: tsvector + GIN con unaccent.
+    """
+
+    dependencies = [
+        ('extraction', '0003_project_data_versions'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run({'sqlite': SQLITE_FORWARD, 'postgresql': POSTGRES_FORWARD}),
+            _run({'sqlite': SQLITE_BACKWARD, 'postgresql': POSTGRES_BACKWARD}),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.7 on 2026-10-19 17:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('extraction', '0004_quote_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuoteSignatureModel',
+            fields=[
+                ('quote', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='signature', serialize=False, to='extraction.quotemodel')),
+                ('project_id', models.IntegerField(db_index=True)),
+                ('extraction_id', models.IntegerField()),
+                ('researcher_id', models.IntegerField()),
+                ('signature', models.BinaryField()),
+            ],
+            options={
+                'db_table': 'extraction_quote_signature',
+            },
+        ),
+        migrations.CreateModel(
+            name='QuoteLshBucketModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('project_id', models.IntegerField()),
+                ('band_key', models.BigIntegerField()),
+                ('quote', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='lsh_buckets', to='extraction.quotemodel')),
+            ],
+            options={
+                'db_table': 'extraction_quote_lsh_bucket',
+                'indexes': [models.Index(fields=['project_id', 'band_key'], name='extraction__project_3b43a0_idx')],
+            },
+        ),
+    ]
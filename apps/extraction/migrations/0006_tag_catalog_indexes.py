@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('extraction', '0005_quote_near_duplicates'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tagmodel',
+            index=models.Index(fields=['project_id', 'status', 'visibility'], name='extraction__project_2b6493_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tagmodel',
+            index=models.Index(fields=['project_id', 'created_by_user_id'], name='extraction__project_86e289_idx'),
+        ),
+    ]
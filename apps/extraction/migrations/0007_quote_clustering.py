@@ -0,0 +1,64 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('extraction', '0006_tag_catalog_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuoteClusterRunModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('project_id', models.IntegerField()),
+                ('requested_by_user_id', models.IntegerField()),
+                ('k', models.PositiveSmallIntegerField()),
+                ('max_tags', models.PositiveSmallIntegerField(blank=True, help_text='Solo quotes con a lo sumo esta cantidad de tags (None: todas)', null=True)),
+                ('status', models.CharField(choices=[('Queued', 'Queued'), ('Running', 'Running'), ('Done', 'Done'), ('Failed', 'Failed')], default='Queued', max_length=20)),
+                ('quote_count', models.PositiveIntegerField(default=0)),
+                ('cohesion', models.FloatField(blank=True, null=True)),
+                ('error', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'extraction_quote_cluster_run',
+                'indexes': [models.Index(fields=['project_id', 'created_at'], name='extraction__project_228093_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='QuoteClusterModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('label', models.PositiveSmallIntegerField()),
+                ('size', models.PositiveIntegerField()),
+                ('top_terms', models.JSONField(default=list)),
+                ('sample_quote_ids', models.JSONField(default=list)),
+                ('tag_id', models.IntegerField(blank=True, help_text='Tag inductivo creado desde el cluster', null=True)),
+                ('run', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='clusters', to='extraction.quoteclusterrunmodel')),
+            ],
+            options={
+                'db_table': 'extraction_quote_cluster',
+                'constraints': [models.UniqueConstraint(fields=('run', 'label'), name='unique_cluster_label_per_run')],
+            },
+        ),
+        migrations.CreateModel(
+            name='QuoteClusterAssignmentModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('label', models.PositiveSmallIntegerField()),
+                ('score', models.FloatField(help_text='Similitud coseno con el centroide')),
+                ('quote', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='extraction.quotemodel')),
+                ('run', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='assignments', to='extraction.quoteclusterrunmodel')),
+            ],
+            options={
+                'db_table': 'extraction_quote_cluster_assignment',
+                'indexes': [models.Index(fields=['run', 'label', 'score'], name='extraction__run_id_559529_idx')],
+            },
+        ),
+    ]
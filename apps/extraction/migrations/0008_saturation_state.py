@@ -0,0 +1,35 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('extraction', '0007_quote_clustering'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SaturationStateModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('project_id', models.IntegerField(unique=True)),
+                ('tag_catalog_version', models.PositiveBigIntegerField(default=0)),
+                ('seen_tag_ids', models.JSONField(default=list)),
+                ('points', models.JSONField(default=list)),
+                ('last_completed_at', models.DateTimeField(blank=True, null=True)),
+                ('last_extraction_id', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'extraction_saturation_state',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='extractionmodel',
+            index=models.Index(fields=['status', 'completed_at'], name='extraction__status_748daa_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('extraction', '0008_saturation_state'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='extractionmodel',
+            name='version',
+            field=models.PositiveIntegerField(default=1, help_text='Se incrementa con cada cambio de la extracción o de sus quotes (clave de caché)'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def seed_closure(apps, schema_editor):
+    # Todos los tags existentes son raíces: solo falta la fila reflexiva
+    TagModel = apps.get_model('extraction', 'TagModel')
+    TagClosureModel = apps.get_model('extraction', 'TagClosureModel')
+    TagClosureModel.objects.bulk_create(
+        (
+            TagClosureModel(ancestor_id=tag_id, descendant_id=tag_id, depth=0)
+            for tag_id in TagModel.objects.values_list('id', flat=True).iterator()
+        ),
+        batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('extraction', '0009_extraction_version_page_heatmap'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tagmodel',
+            name='parent',
+            field=models.ForeignKey(blank=True, help_text='Tema padre en el libro de códigos (NULL = raíz)', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='children', to='extraction.tagmodel'),
+        ),
+        migrations.CreateModel(
+            name='TagClosureModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('depth', models.PositiveSmallIntegerField()),
+                ('ancestor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='descendant_links', to='extraction.tagmodel')),
+                ('descendant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ancestor_links', to='extraction.tagmodel')),
+            ],
+            options={
+                'db_table': 'extraction_tag_closure',
+                'indexes': [models.Index(fields=['descendant', 'depth'], name='extraction__descend_7ef0c9_idx')],
+                'constraints': [models.UniqueConstraint(fields=('ancestor', 'descendant'), name='unique_tag_closure_path')],
+            },
+        ),
+        migrations.RunPython(seed_closure, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('extraction', '0010_tag_hierarchy'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tagmodel',
+            index=models.Index(fields=['project_id', 'status', 'id'], name='extraction__project_3f4277_idx'),
+        ),
+    ]
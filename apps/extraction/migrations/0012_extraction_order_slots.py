@@ -0,0 +1,40 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:30
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def renumber_duplicate_orders(apps, schema_editor):
+    # Las altas concurrentes pudieron repetir extraction_order: se renumera
+    # 1..N por estudio (en el orden original) antes de crear la restricción
+    ExtractionModel = apps.get_model('extraction', 'ExtractionModel')
+    duplicated = (
+        ExtractionModel.objects.values('study_id', 'extraction_order')
+        .annotate(n=models.Count('id')).filter(n__gt=1)
+        .values_list('study_id', flat=True).distinct()
+    )
+    for study_id in list(duplicated):
+        rows = ExtractionModel.objects.filter(study_id=study_id).order_by('extraction_order', 'id')
+        for order, row in enumerate(rows, start=1):
+            if row.extraction_order != order:
+                ExtractionModel.objects.filter(pk=row.pk).update(extraction_order=order)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('extraction', '0011_tag_moderation_queue_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(renumber_duplicate_orders, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='extractionmodel',
+            name='extraction__study_i_13a575_idx',
+        ),
+        migrations.AddConstraint(
+            model_name='extractionmodel',
+            constraint=models.UniqueConstraint(fields=('study_id', 'extraction_order'), name='unique_study_extraction_order'),
+        ),
+    ]
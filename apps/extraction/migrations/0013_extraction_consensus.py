@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:33
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('extraction', '0012_extraction_order_slots'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='extractionmodel',
+            name='unique_study_user_extraction',
+        ),
+        migrations.AddField(
+            model_name='extractionmodel',
+            name='is_consensus',
+            field=models.BooleanField(default=False, help_text='Borrador de consenso entre las extracciones del estudio (extraction_order=0)'),
+        ),
+        migrations.AddConstraint(
+            model_name='extractionmodel',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_consensus', False)), fields=('study_id', 'assigned_to'), name='unique_study_user_extraction'),
+        ),
+    ]
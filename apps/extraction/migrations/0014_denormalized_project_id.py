@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:35
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('extraction', '0013_extraction_consensus'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='extractionmodel',
+            name='project_id',
+            field=models.BigIntegerField(blank=True, help_text='Proyecto del estudio, copiado al crear (evita consultar Acquisition por estudio)', null=True),
+        ),
+        migrations.AddField(
+            model_name='quotemodel',
+            name='project_id',
+            field=models.BigIntegerField(blank=True, help_text='Proyecto de la extracción, copiado al crear', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='extractionmodel',
+            index=models.Index(fields=['project_id', 'status'], name='extraction__project_3cb962_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quotemodel',
+            index=models.Index(fields=['project_id', 'created_at'], name='extraction__project_490142_idx'),
+        ),
+    ]
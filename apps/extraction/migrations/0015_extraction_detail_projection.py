@@ -0,0 +1,30 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('extraction', '0014_denormalized_project_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExtractionDetailProjectionModel',
+            fields=[
+                ('extraction', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='detail_projection', serialize=False, to='extraction.extractionmodel')),
+                ('study_id', models.BigIntegerField()),
+                ('project_id', models.BigIntegerField(blank=True, null=True)),
+                ('assigned_to_user_id', models.BigIntegerField(blank=True, null=True)),
+                ('source_version', models.PositiveIntegerField(help_text='ExtractionModel.version con la que se renderizó el documento')),
+                ('document', models.TextField()),
+                ('rendered_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'extraction_detail_projection',
+                'indexes': [models.Index(fields=['project_id'], name='extraction__project_2a7f65_idx')],
+            },
+        ),
+    ]
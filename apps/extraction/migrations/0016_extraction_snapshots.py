@@ -0,0 +1,32 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('extraction', '0015_extraction_detail_projection'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExtractionSnapshotModel',
+            fields=[
+                ('extraction', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='snapshot', serialize=False, to='extraction.extractionmodel')),
+                ('project_id', models.BigIntegerField(blank=True, null=True)),
+                ('format_version', models.PositiveSmallIntegerField(default=1)),
+                ('source_version', models.PositiveIntegerField()),
+                ('quote_count', models.PositiveIntegerField(default=0)),
+                ('raw_size', models.PositiveIntegerField(help_text='Bytes del JSON antes de comprimir')),
+                ('payload', models.BinaryField()),
+                ('captured_at', models.DateTimeField(auto_now=True)),
+                ('archived_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'extraction_snapshot',
+                'indexes': [models.Index(fields=['project_id', 'archived_at'], name='extraction__project_b09c95_idx')],
+            },
+        ),
+    ]
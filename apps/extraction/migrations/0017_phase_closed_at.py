@@ -0,0 +1,34 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:58
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def stamp_closed_phases(apps, schema_editor):
+    # La fecha real de cierre no quedó registrada (updated_at puede ser
+    # anterior): se toma la de la migración, así el archivado en frío cuenta
+    # el plazo completo desde ahora en vez de adelantarse
+    ExtractionPhaseModel = apps.get_model('extraction', 'ExtractionPhaseModel')
+    ExtractionPhaseModel.objects.filter(
+        status__in=['Completed', 'AutoClosed'], closed_at__isnull=True
+    ).update(closed_at=timezone.now())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('extraction', '0016_extraction_snapshots'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='extractionphasemodel',
+            name='closed_at',
+            field=models.DateTimeField(blank=True, help_text='Momento en que la fase pasó a COMPLETED o AUTO_CLOSED', null=True),
+        ),
+        migrations.RunPython(stamp_closed_phases, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='extractionphasemodel',
+            index=models.Index(fields=['status', 'closed_at'], name='extraction__status_ea8ef1_idx'),
+        ),
+    ]
@@ -5,7 +5,8 @@
 from .infrastructure.models import (
     ExtractionModel,
     TagModel,
-    QuoteModel
+    QuoteModel,
+    JobModel,
 )
 
 # Nota: No definas nada más aquí, solo impórtalos.
\ No newline at end of file
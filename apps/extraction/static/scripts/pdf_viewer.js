@@ -11,6 +11,8 @@ class PDFViewer {
 
         this.quotes = [];
         this.availableTags = [];
+        this.selectedTags = new Map();
+        this.tagSearchTimer = null;
         this.currentSelection = null;
 
         this.init();
@@ -41,8 +43,9 @@ class PDFViewer {
         document.getElementById('page-count').textContent = this.totalPages;
     }
 
-    async loadTags() {
-        const response = await fetch(API_URLS.availableTags);
+    async loadTags(prefix = '') {
+        const params = new URLSearchParams({ project_id: PROJECT_ID, q: prefix, limit: 20 });
+        const response = await fetch(`${API_URLS.autocompleteTags}?${params}`);
         const data = await response.json();
         this.availableTags = data.tags || [];
         this.renderTagsCheckboxes();
@@ -60,22 +63,38 @@ class PDFViewer {
     renderTagsCheckboxes() {
         const container = document.getElementById('tags-container');
 
-        if (this.availableTags.length === 0) {
+        // Selected tags stay visible even when they don't match the search
+        const tags = [...this.selectedTags.values()].concat(
+            this.availableTags.filter(tag => !this.selectedTags.has(tag.id))
+        );
+
+        if (tags.length === 0) {
             container.innerHTML = '<p class="text-sm text-base-content/60 text-center py-4">No tags available</p>';
             return;
         }
 
-        container.innerHTML = this.availableTags.map(tag => `
+        container.innerHTML = tags.map(tag => `
             <label class="flex items-center gap-2 p-2 hover:bg-base-300 rounded cursor-pointer">
                 <input type="checkbox" 
                        class="checkbox checkbox-sm checkbox-primary tag-checkbox" 
-                       value="${tag.id}" />
+                       value="${tag.id}" ${this.selectedTags.has(tag.id) ? 'checked' : ''} />
                 <span class="badge badge-sm" style="background-color: ${tag.color || '#6366f1'}">
                     ${tag.name}
                 </span>
                 ${tag.is_mandatory ? '<span class="badge badge-xs badge-error">Required</span>' : ''}
             </label>
         `).join('');
+
+        container.querySelectorAll('.tag-checkbox').forEach(cb => {
+            cb.addEventListener('change', () => {
+                const tagId = parseInt(cb.value);
+                if (cb.checked) {
+                    this.selectedTags.set(tagId, tags.find(tag => tag.id === tagId));
+                } else {
+                    this.selectedTags.delete(tagId);
+                }
+            });
+        });
     }
 
     async renderPage(pageNum) {
@@ -143,6 +162,12 @@ class PDFViewer {
     }
 
     setupEventListeners() {
+        // Tag autocomplete
+        document.getElementById('tag-search').addEventListener('input', (e) => {
+            clearTimeout(this.tagSearchTimer);
+            this.tagSearchTimer = setTimeout(() => this.loadTags(e.target.value.trim()), 150);
+        });
+
         // Navigation
         document.getElementById('prev-page').addEventListener('click', () => {
             if (this.currentPage > 1) {
@@ -237,6 +262,45 @@ class PDFViewer {
 
         document.getElementById('quote-form').classList.remove('hidden');
         this.switchTab('create');
+        this.loadTagSuggestions(this.currentSelection.text);
+    }
+
+    async loadTagSuggestions(text) {
+        const container = document.getElementById('tag-suggestions');
+        container.innerHTML = '';
+
+        try {
+            const response = await fetch(API_URLS.suggestTags, {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                    'X-CSRFToken': CSRF_TOKEN
+                },
+                body: JSON.stringify({ project_id: PROJECT_ID, text: text })
+            });
+            if (!response.ok) return;
+
+            const data = await response.json();
+            container.innerHTML = (data.suggestions || []).map(tag => `
+                <button type="button" class="badge badge-outline badge-primary gap-1 tag-suggestion"
+                        data-tag-id="${tag.tag_id}" data-tag-name="${tag.name}"
+                        title="${Math.round(tag.score * 100)}% of similar quotes">
+                    + ${tag.name}
+                </button>
+            `).join('');
+
+            container.querySelectorAll('.tag-suggestion').forEach(button => {
+                button.addEventListener('click', () => {
+                    const tagId = parseInt(button.dataset.tagId);
+                    this.selectedTags.set(tagId, { id: tagId, name: button.dataset.tagName });
+                    button.remove();
+                    this.renderTagsCheckboxes();
+                });
+            });
+        } catch (error) {
+            // Suggestions are optional: the form keeps working without them
+            console.warn('Tag suggestions unavailable:', error);
+        }
     }
 
     clearSelection() {
@@ -244,15 +308,16 @@ class PDFViewer {
         document.getElementById('quote-form').classList.add('hidden');
         document.getElementById('quote-form').reset();
 
-        // Clear checkboxes
-        document.querySelectorAll('.tag-checkbox').forEach(cb => cb.checked = false);
+        // Clear selected tags
+        this.selectedTags.clear();
+        document.getElementById('tag-suggestions').innerHTML = '';
+        this.renderTagsCheckboxes();
 
         window.getSelection().removeAllRanges();
     }
 
     async createQuote() {
-        const selectedTags = Array.from(document.querySelectorAll('.tag-checkbox:checked'))
-            .map(cb => parseInt(cb.value));
+        const selectedTags = [...this.selectedTags.keys()];
 
         if (selectedTags.length === 0) {
             alert('Please select at least one tag');
@@ -271,7 +336,8 @@ class PDFViewer {
                 x1: this.currentSelection.x1,
                 y1: this.currentSelection.y1,
                 x2: this.currentSelection.x2,
-                y2: this.currentSelection.y2
+                y2: this.currentSelection.y2,
+                page_count: this.totalPages
             }
         };
 
@@ -0,0 +1,36 @@
+#language: es
+Característica: Reclamo concurrente de cupos de extracción
+  Para que dos codificadores nunca trabajen sobre el mismo cupo,
+  Como Investigador del proyecto,
+  Quiero reclamar el siguiente estudio pendiente sin pisar a mis compañeros.
+
+  Antecedentes:
+    Dado un proyecto en modo "Double" con los estudios [10, 11] y los codificadores ["ana", "juan", "luis"]
+
+  Escenario: Dos codificadores toman el mismo cupo vacante con la misma lectura
+    Dado que el estudio 10 tiene un cupo vacante
+    Cuando "ana" y luego "juan" intentan tomar ese cupo
+    Entonces solo "ana" queda asignada al cupo
+    Y la versión del cupo aumentó una sola vez
+
+  Escenario: Un codificador que reclama varias veces recibe estudios distintos
+    Cuando "ana" reclama el siguiente estudio 3 veces
+    Entonces "ana" obtuvo los estudios [10, 11, None]
+    Y ningún estudio tiene dos cupos de "ana"
+
+  Escenario: Los reclamos agotan los cupos que pide el modo de la fase
+    Cuando "ana", "juan" y "luis" reclaman el siguiente estudio por turnos 2 veces
+    Entonces cada estudio tiene 2 cupos asignados y ninguno vacante
+    Y 2 reclamos quedaron sin estudio
+
+  Esquema del escenario: Alta directa en el primer cupo libre del estudio
+    Dado que en el estudio 10 ya trabajan <ocupados>
+    Cuando "<codificador>" da de alta su extracción del estudio 10
+    Entonces el alta <resultado>
+
+    Ejemplos:
+      | ocupados         | codificador | resultado                 |
+      | []               | ana         | ocupa el cupo 1           |
+      | ["juan"]         | ana         | ocupa el cupo 2           |
+      | ["juan", "luis"] | ana         | no se crea                |
+      | ["ana"]          | ana         | no se crea                |
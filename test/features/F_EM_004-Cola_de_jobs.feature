@@ -0,0 +1,34 @@
+#language: es
+Característica: Cola persistente de jobs de extracción
+  Para que los trabajos en segundo plano se ejecuten una sola vez aunque haya varios workers,
+  Como operador de la plataforma,
+  Quiero que cada job tenga un único dueño, se reintente ante errores y se libere si su worker muere.
+
+  Antecedentes:
+    Dado un job "snapshots.freeze_project" encolado con 2 intentos como máximo
+
+  Escenario: Dos workers reclaman el mismo job
+    Cuando el worker "w1" reclama jobs
+    Y el worker "w2" reclama jobs
+    Entonces "w1" obtuvo el job y "w2" no obtuvo ninguno
+    Y el job queda en estado "Running" bloqueado por "w1"
+
+  Escenario: Encolar con la misma clave de deduplicación no duplica el job
+    Cuando se vuelve a encolar el job con la misma clave
+    Entonces hay 1 job en la cola
+
+  Escenario: Un job que falla se reintenta hasta agotar sus intentos
+    Cuando el worker "w1" reclama jobs
+    Y "w1" reporta el error "timeout"
+    Entonces el job queda en estado "Queued" con 1 intento usado
+    Cuando el worker "w2" reclama jobs
+    Y "w2" reporta el error "timeout"
+    Entonces el job queda en estado "Failed" con 2 intentos usados
+    Y el último error del job es "timeout"
+
+  Escenario: Un lease vencido pasa a otro worker y el anterior ya no puede cerrarlo
+    Cuando el worker "w1" reclama jobs con un lease vencido
+    Y el worker "w2" reclama jobs
+    Entonces "w2" obtuvo el job
+    Y "w1" no puede completar el job
+    Pero "w2" completa el job
@@ -0,0 +1,47 @@
+#language: es
+Característica: Jerarquía del libro de códigos
+  Para organizar los tags en categorías y subcategorías sin romper los conteos por subárbol,
+  Como Dueño de la investigación,
+  Quiero mover y eliminar tags manteniendo la jerarquía consistente.
+
+  Antecedentes:
+    Dado el libro de códigos del proyecto con la jerarquía:
+      | Tag             | Padre           |
+      | Costos          |                 |
+      | Costos directos | Costos          |
+      | Licencias       | Costos directos |
+      | Beneficios      |                 |
+
+  Esquema del escenario: No se puede mover un tag dentro de su propio subárbol
+    Cuando el Owner mueve "<Tag>" bajo "<Nuevo_Padre>"
+    Entonces el movimiento se rechaza por jerarquía inválida
+    Y los ancestros de "Licencias" siguen siendo:
+      | Ancestro        | Profundidad |
+      | Licencias       | 0           |
+      | Costos directos | 1           |
+      | Costos          | 2           |
+
+    Ejemplos:
+      | Tag             | Nuevo_Padre     |
+      | Costos          | Licencias       |
+      | Costos          | Costos directos |
+      | Costos directos | Costos directos |
+
+  Escenario: Mover un subárbol recalcula las profundidades de todos sus nodos
+    Cuando el Owner mueve "Costos directos" bajo "Beneficios"
+    Entonces "Costos directos" cuelga de "Beneficios"
+    Y los ancestros de "Licencias" siguen siendo:
+      | Ancestro        | Profundidad |
+      | Licencias       | 0           |
+      | Costos directos | 1           |
+      | Beneficios      | 2           |
+    Y el subárbol de "Costos" contiene solo ["Costos"]
+
+  Escenario: Eliminar un tag intermedio sube a sus hijos un nivel
+    Cuando se elimina el tag "Costos directos"
+    Entonces "Licencias" cuelga de "Costos"
+    Y los ancestros de "Licencias" siguen siendo:
+      | Ancestro  | Profundidad |
+      | Licencias | 0           |
+      | Costos    | 1           |
+    Y el subárbol de "Costos" contiene solo ["Costos", "Licencias"]
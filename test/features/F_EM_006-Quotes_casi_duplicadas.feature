@@ -0,0 +1,22 @@
+#language: es
+Característica: Agrupamiento de quotes casi duplicadas
+  Para revisar de una vez las quotes que distintos codificadores copiaron casi igual,
+  Como Dueño de la investigación,
+  Quiero que el índice LSH agrupe los casi duplicados aunque compartan bucket con colisiones espurias.
+
+  Antecedentes:
+    Dado las quotes del proyecto:
+      | Quote   | Texto                                                                   |
+      | espuria | Los participantes prefirieron la versión móvil por su rapidez de carga. |
+      | dup1    | El costo de licencias fue la principal barrera para adoptar la herramienta. |
+      | dup2    | El costo de las licencias fue la principal barrera para adoptar la herramienta. |
+    Y que el índice LSH solo tiene un bucket con ["espuria", "dup1", "dup2"]
+
+  Esquema del escenario: Una colisión espuria al frente del bucket no separa a los duplicados reales
+    Cuando se agrupan los casi duplicados comparando par a par buckets de hasta <tope> quotes
+    Entonces se forma solo el grupo ["dup1", "dup2"]
+
+    Ejemplos:
+      | tope |
+      | 32   |
+      | 2    |
@@ -0,0 +1,41 @@
+#language: es
+Característica: Mapa de calor página x tag
+  Para ver en qué zona de los documentos aparece cada tema,
+  Como Investigador del proyecto,
+  Quiero un histograma de quotes por página o por posición relativa en el documento.
+
+  Antecedentes:
+    Dado los enlaces quote-tag con su página:
+      | Extracción | Tag | Página | Total |
+      | 1          | 7   | 1      | 8     |
+      | 1          | 7   | 8      | 8     |
+      | 1          | 9   | 3      | 8     |
+      | 2          | 7   | 2      | 0     |
+      | 2          | 9   | 4      | 0     |
+      | 2          | 9   | 4      | 0     |
+
+  Escenario: Por página hay un bin por página hasta la más alta citada
+    Cuando se arma el mapa de calor por página
+    Entonces los bordes de los bins son [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    Y el tag 7 tiene los conteos [1, 1, 0, 0, 0, 0, 0, 1]
+    Y el tag 9 tiene los conteos [0, 0, 1, 2, 0, 0, 0, 0]
+
+  Escenario: Normalizado, la posición es relativa al total de páginas del documento
+    Cuando se arma el mapa de calor normalizado en 4 bins
+    Entonces los bordes de los bins son [0.0, 0.25, 0.5, 0.75, 1.0]
+    Y el tag 7 tiene los conteos [1, 1, 0, 1]
+    Y el tag 9 tiene los conteos [0, 1, 0, 2]
+
+  Escenario: Sin total de páginas se usa la página más alta citada en la extracción
+    Cuando se arma el mapa de calor normalizado en 4 bins solo con la extracción 2
+    Entonces el tag 7 tiene los conteos [0, 1, 0, 0]
+    Y el tag 9 tiene los conteos [0, 0, 0, 2]
+
+  Esquema del escenario: Las celdas en caché se suman con las recién calculadas
+    Cuando se arma el mapa de calor <modo> con la extracción 1 en caché y la 2 recién calculada
+    Entonces el mapa coincide con el calculado de una sola vez
+
+    Ejemplos:
+      | modo                   |
+      | por página             |
+      | normalizado en 4 bins  |
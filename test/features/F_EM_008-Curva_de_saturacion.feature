@@ -0,0 +1,46 @@
+#language: es
+Característica: Curva de saturación temática
+  Para decidir cuándo dejar de incorporar estudios,
+  Como Dueño de la investigación,
+  Quiero ver cuántos códigos nuevos aporta cada extracción completada sin reprocesar la historia en cada consulta.
+
+  Antecedentes:
+    Dado el libro de códigos con los tags ["Costos", "Licencias", "Tiempo", "Soporte"]
+    Y las extracciones completadas:
+      | Extracción | Estudio | Completada | Tags              |
+      | E2         | 11      | 10:00      | Costos, Licencias |
+      | E3         | 12      | 10:05      | Costos            |
+    Y que ya se consultó la curva de saturación
+
+  Escenario: La consulta siguiente retoma desde el cursor
+    Dado las extracciones completadas:
+      | Extracción | Estudio | Completada | Tags            |
+      | E4         | 13      | 10:05      | Tiempo          |
+      | E1         | 10      | 10:10      | Costos, Soporte |
+    Cuando se consulta la curva de saturación
+    Entonces la consulta procesó 2 extracciones
+    Y la curva tiene los puntos:
+      | Extracción | Nuevos | Acumulado |
+      | E2         | 2      | 2         |
+      | E3         | 0      | 2         |
+      | E4         | 1      | 3         |
+      | E1         | 1      | 4         |
+    Y las últimas 0 extracciones no aportaron códigos nuevos
+
+  Escenario: Sin extracciones nuevas no se reprocesa nada
+    Cuando se consulta la curva de saturación
+    Entonces la consulta procesó 0 extracciones
+    Y la curva tiene los puntos:
+      | Extracción | Nuevos | Acumulado |
+      | E2         | 2      | 2         |
+      | E3         | 0      | 2         |
+    Y las últimas 1 extracciones no aportaron códigos nuevos
+
+  Escenario: Un cambio en el catálogo de tags reinicia la curva
+    Dado que cambió el catálogo de tags del proyecto
+    Cuando se consulta la curva de saturación
+    Entonces la consulta procesó 2 extracciones
+    Y la curva tiene los puntos:
+      | Extracción | Nuevos | Acumulado |
+      | E2         | 2      | 2         |
+      | E3         | 0      | 2         |
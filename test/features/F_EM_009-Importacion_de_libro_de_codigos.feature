@@ -0,0 +1,47 @@
+#language: es
+Característica: Importación de un libro de códigos deductivo
+  Para empezar a codificar con el marco teórico ya cargado,
+  Como Dueño de la investigación,
+  Quiero importar un libro de códigos jerárquico y poder volver a importarlo sin duplicar tags.
+
+  Antecedentes:
+    Dado el libro de códigos en CSV:
+      | path                              | is_mandatory |
+      | Economía > Costes > Costo oculto  | true         |
+      | Economía > Beneficios             | false        |
+      | Adopción                          | false        |
+
+  Escenario: Los temas intermedios que no son entradas se crean igual
+    Cuando el Owner importa el libro de códigos
+    Entonces se crearon 5 tags y 0 ya existían
+    Y el proyecto tiene los tags:
+      | Ruta                             | Obligatorio |
+      | Adopción                         | no          |
+      | Economía                         | no          |
+      | Economía > Beneficios            | no          |
+      | Economía > Costes                | no          |
+      | Economía > Costes > Costo oculto | sí          |
+
+  Escenario: Reimportar el mismo libro no duplica tags
+    Dado que el Owner ya importó el libro de códigos
+    Cuando el Owner importa el libro de códigos
+    Entonces se crearon 0 tags y 3 ya existían
+    Y el proyecto tiene 5 tags
+
+  Escenario: Reimportar con mayúsculas y espacios distintos agrega solo los códigos nuevos
+    Dado que el Owner ya importó el libro de códigos
+    Cuando el Owner importa el libro de códigos en CSV:
+      | path                                 | is_mandatory |
+      | economía >  COSTES > costo   oculto  | true         |
+      | Economía > Costes > Licencias        | false        |
+    Entonces se crearon 1 tags y 1 ya existían
+    Y el proyecto tiene 6 tags
+    Y "Licencias" cuelga del tema existente "Costes"
+
+  Escenario: Una ruta repetida en el archivo es un error
+    Cuando el Owner importa el libro de códigos en CSV:
+      | path                 | is_mandatory |
+      | Economía > Costes    | false        |
+      | economía > costes    | false        |
+    Entonces la importación se rechaza por código repetido
+    Y el proyecto tiene 0 tags
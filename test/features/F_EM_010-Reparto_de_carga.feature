@@ -0,0 +1,64 @@
+#language: es
+Característica: Reparto de carga entre codificadores
+  Para que nadie quede sobrecargado ni codifique dos veces el mismo estudio,
+  Como Dueño de la investigación,
+  Quiero repartir los estudios y traspasar el trabajo de quien deja el proyecto.
+
+  Antecedentes:
+    Dado los codificadores ["ana", "juan", "luis"]
+
+  Escenario: El reparto completa los estudios con el menos cargado que no trabaja en cada uno
+    Dado las extracciones existentes:
+      | Extracción | Estudio | Codificador | Orden | Abierta |
+      | E1         | 10      | ana         | 1     | sí      |
+      | E2         | 11      | juan        | 1     | sí      |
+      | E3         | 11      |             | 2     | sí      |
+    Cuando se reparten los estudios [10, 11, 12] con 2 codificadores por estudio
+    Entonces las asignaciones planeadas son:
+      | Estudio | Orden | Codificador | Cupo existente |
+      | 10      | 2     | luis        |                |
+      | 11      | 2     | ana         | E3             |
+      | 12      | 1     | juan        |                |
+      | 12      | 2     | luis        |                |
+    Y ningún estudio repite codificador
+    Y la carga queda en {"ana": 2, "juan": 2, "luis": 2}
+
+  Escenario: El menos cargado se salta si ya trabajó en el estudio
+    Dado las extracciones existentes:
+      | Extracción | Estudio | Codificador | Orden | Abierta |
+      | E1         | 20      | luis        | 1     | no      |
+      | E2         | 21      | ana         | 1     | sí      |
+      | E3         | 22      | juan        | 1     | sí      |
+    Cuando se reparten los estudios [20, 23] con 2 codificadores por estudio
+    Entonces las asignaciones planeadas son:
+      | Estudio | Orden | Codificador | Cupo existente |
+      | 20      | 2     | ana         |                |
+      | 23      | 1     | luis        |                |
+      | 23      | 2     | juan        |                |
+    Y ningún estudio repite codificador
+    Y la carga queda en {"ana": 2, "juan": 2, "luis": 1}
+
+  Escenario: El traspaso reparte solo las extracciones abiertas de quien se va
+    Dado las extracciones existentes:
+      | Extracción | Estudio | Codificador | Orden | Abierta |
+      | E1         | 10      | ana         | 1     | sí      |
+      | E2         | 10      | juan        | 2     | sí      |
+      | E3         | 11      | ana         | 1     | sí      |
+      | E4         | 12      | ana         | 1     | no      |
+      | E5         | 12      | luis        | 2     | sí      |
+    Cuando "ana" deja el proyecto
+    Entonces sus extracciones pasan a:
+      | Extracción | Codificador |
+      | E1         | luis        |
+      | E3         | juan        |
+    Y no quedan extracciones sin reemplazo
+    Y ningún estudio repite codificador
+
+  Escenario: Sin otro codificador libre en el estudio la extracción queda sin reemplazo
+    Dado las extracciones existentes:
+      | Extracción | Estudio | Codificador | Orden | Abierta |
+      | E1         | 10      | ana         | 1     | sí      |
+      | E2         | 10      | juan        | 2     | sí      |
+      | E3         | 10      | luis        | 3     | sí      |
+    Cuando "ana" deja el proyecto
+    Entonces quedan sin reemplazo las extracciones ["E1"]
@@ -0,0 +1,186 @@
+"""
+BDD Steps para el reclamo de cupos de extracción (ClaimNextStudyHandler,
+claim_vacant / _take_vacant e insert_in_free_slot).
+
+Las carreras se reproducen de forma determinista: el segundo codificador
+actúa con la misma lectura que el primero, después de que este confirmó.
+"""
+
+import ast
+from collections import Counter
+
+from behave import given, when, then
+from django.contrib.auth import get_user_model
+
+from apps.extraction.application.commands.claim_next_study import (
+    ClaimNextStudyCommand,
+    ClaimNextStudyHandler
+)
+from apps.extraction.container import container
+from apps.extraction.domain.entities.extraction import Extraction
+from apps.extraction.domain.value_objects.extraction_status import ExtractionStatus
+from apps.extraction.infrastructure.models import ExtractionModel, ExtractionPhaseModel
+from apps.extraction.infrastructure.repositories.django_extraction_repository import DjangoExtractionRepository
+
+from puertos_en_memoria import EstudiosEnMemoria, ProyectoEnMemoria
+
+PROJECT_ID = 1
+
+
+# ================================================
+# GIVEN
+# ================================================
+
+@given('un proyecto en modo "{mode}" con los estudios {study_ids} y los codificadores {usernames}')
+def step_project_with_coders(context, mode, study_ids, usernames):
+    User = get_user_model()
+    context.study_ids = ast.literal_eval(study_ids)
+    context.users = {
+        name: User.objects.create_user(username=name, password='x')
+        for name in ast.literal_eval(usernames)
+    }
+    owner = User.objects.create_user(username='owner', password='x')
+
+    ExtractionPhaseModel.objects.create(project_id=PROJECT_ID, mode=mode, status='Active')
+    context.capacity = 2 if mode == 'Double' else 1
+
+    context.claim_handler = ClaimNextStudyHandler(
+        container.extraction_repository,
+        container.phase_repository,
+        EstudiosEnMemoria(PROJECT_ID, context.study_ids),
+        ProyectoEnMemoria(PROJECT_ID, owner.id, [u.id for u in context.users.values()]),
+        container.extraction_detail_projection
+    )
+
+
+@given('que el estudio {study_id:d} tiene un cupo vacante')
+def step_vacant_slot(context, study_id):
+    context.slot = ExtractionModel.objects.create(
+        study_id=study_id,
+        project_id=PROJECT_ID,
+        assigned_to=None,
+        extraction_order=1,
+        status=ExtractionStatus.PENDING.value
+    )
+
+
+@given('que en el estudio {study_id:d} ya trabajan {usernames}')
+def step_study_taken_by(context, study_id, usernames):
+    for order, name in enumerate(ast.literal_eval(usernames), start=1):
+        ExtractionModel.objects.create(
+            study_id=study_id,
+            project_id=PROJECT_ID,
+            assigned_to=context.users[name],
+            extraction_order=order,
+            status=ExtractionStatus.IN_PROGRESS.value
+        )
+
+
+# ================================================
+# WHEN
+# ================================================
+
+@when('"{first}" y luego "{second}" intentan tomar ese cupo')
+def step_race_same_slot(context, first, second):
+    # Ambos leyeron el mismo candidato; el segundo llega cuando el primero ya confirmó
+    context.taken = {
+        name: DjangoExtractionRepository._take_vacant(context.slot.id, context.users[name].id)
+        for name in (first, second)
+    }
+
+
+def _claim(context, name):
+    claimed = context.claim_handler.handle(
+        ClaimNextStudyCommand(project_id=PROJECT_ID, user_id=context.users[name].id)
+    )
+    return claimed.study_id if claimed else None
+
+
+@when('"{name}" reclama el siguiente estudio {times:d} veces')
+def step_claim_repeatedly(context, name, times):
+    context.claimed = [_claim(context, name) for _ in range(times)]
+
+
+@when('"{a}", "{b}" y "{c}" reclaman el siguiente estudio por turnos {rounds:d} veces')
+def step_claim_round_robin(context, a, b, c, rounds):
+    context.claimed = [_claim(context, name) for _ in range(rounds) for name in (a, b, c)]
+
+
+@when('"{name}" da de alta su extracción del estudio {study_id:d}')
+def step_insert_in_free_slot(context, name, study_id):
+    extraction = Extraction(
+        id=None,
+        study_id=study_id,
+        assigned_to_user_id=context.users[name].id,
+        status=ExtractionStatus.PENDING,
+        project_id=PROJECT_ID
+    )
+    context.inserted = container.extraction_repository.insert_in_free_slot(extraction, context.capacity)
+
+
+# ================================================
+# THEN
+# ================================================
+
+@then('solo "{name}" queda asignada al cupo')
+def step_only_winner(context, name):
+    winners = [n for n, took in context.taken.items() if took]
+    assert winners == [name], f"Ganaron el cupo: {winners}"
+
+    context.slot.refresh_from_db()
+    assert context.slot.assigned_to_id == context.users[name].id, \
+        f"El cupo quedó asignado a {context.slot.assigned_to_id}"
+
+
+@then('la versión del cupo aumentó una sola vez')
+def step_version_bumped_once(context):
+    assert context.slot.version == 2, f"Versión {context.slot.version}, se esperaba 2"
+
+
+@then('"{name}" obtuvo los estudios {expected}')
+def step_claimed_studies(context, name, expected):
+    expected = ast.literal_eval(expected)
+    assert context.claimed == expected, f"Obtuvo {context.claimed}, se esperaba {expected}"
+
+
+@then('ningún estudio tiene dos cupos de "{name}"')
+def step_no_duplicate_slots(context, name):
+    per_study = Counter(
+        ExtractionModel.objects.filter(
+            assigned_to=context.users[name], is_consensus=False
+        ).values_list('study_id', flat=True)
+    )
+    repeated = {study_id: n for study_id, n in per_study.items() if n > 1}
+    assert not repeated, f"Cupos repetidos: {repeated}"
+
+
+@then('cada estudio tiene {count:d} cupos asignados y ninguno vacante')
+def step_slots_filled(context, count):
+    for study_id in context.study_ids:
+        slots = ExtractionModel.objects.filter(study_id=study_id, is_consensus=False)
+        assigned = slots.filter(assigned_to__isnull=False).count()
+        vacant = slots.filter(assigned_to__isnull=True).count()
+        assert (assigned, vacant) == (count, 0), \
+            f"Estudio {study_id}: {assigned} asignados y {vacant} vacantes"
+
+        users = list(slots.values_list('assigned_to_id', flat=True))
+        assert len(set(users)) == len(users), f"Estudio {study_id} con un codificador repetido"
+
+
+@then('{count:d} reclamos quedaron sin estudio')
+def step_empty_claims(context, count):
+    empty = context.claimed.count(None)
+    assert empty == count, f"{empty} reclamos vacíos, se esperaban {count}"
+
+
+@then('el alta ocupa el cupo {order:d}')
+def step_inserted_in_slot(context, order):
+    assert context.inserted is not None, "El alta no se creó"
+    assert context.inserted.extraction_order == order, \
+        f"Ocupó el cupo {context.inserted.extraction_order}, se esperaba {order}"
+
+
+@then('el alta no se crea')
+def step_insert_rejected(context):
+    assert context.inserted is None, f"Se creó la extracción {context.inserted.id}"
+    assert ExtractionModel.objects.count() <= context.capacity, "Se superó la capacidad del estudio"
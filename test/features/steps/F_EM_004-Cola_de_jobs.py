@@ -0,0 +1,115 @@
+"""
+BDD Steps para la cola persistente de jobs (DjangoJobQueueRepository):
+reclamo exclusivo, deduplicación, reintentos y vencimiento del lease.
+"""
+
+from behave import given, when, then
+
+from apps.extraction.container import container
+from apps.extraction.infrastructure.models import JobModel
+
+QUEUE = 'default'
+
+
+def _job(context):
+    return container.job_queue.get_by_id(context.job.id)
+
+
+# ================================================
+# GIVEN
+# ================================================
+
+@given('un job "{kind}" encolado con {max_attempts:d} intentos como máximo')
+def step_job_enqueued(context, kind, max_attempts):
+    context.dedupe_key = f"{kind}:1"
+    context.job = container.job_queue.enqueue(
+        kind,
+        {"project_id": 1},
+        queue=QUEUE,
+        max_attempts=max_attempts,
+        dedupe_key=context.dedupe_key
+    )
+    context.claims = {}
+
+
+# ================================================
+# WHEN
+# ================================================
+
+@when('el worker "{worker}" reclama jobs')
+def step_worker_claims(context, worker):
+    context.claims[worker] = container.job_queue.claim(worker, [QUEUE], limit=5)
+
+
+@when('el worker "{worker}" reclama jobs con un lease vencido')
+def step_worker_claims_expired_lease(context, worker):
+    context.claims[worker] = container.job_queue.claim(worker, [QUEUE], limit=5, lease_seconds=-1)
+
+
+@when('se vuelve a encolar el job con la misma clave')
+def step_enqueue_again(context):
+    context.requeued = container.job_queue.enqueue(
+        context.job.kind, {"project_id": 1}, queue=QUEUE, dedupe_key=context.dedupe_key
+    )
+
+
+@when('"{worker}" reporta el error "{error}"')
+def step_worker_fails(context, worker, error):
+    assert container.job_queue.fail(context.job.id, worker, error, retry_delay_seconds=0), \
+        f"{worker} no pudo reportar el error"
+
+
+# ================================================
+# THEN
+# ================================================
+
+@then('"{winner}" obtuvo el job y "{loser}" no obtuvo ninguno')
+def step_exclusive_claim(context, winner, loser):
+    assert [j.id for j in context.claims[winner]] == [context.job.id], \
+        f"{winner} obtuvo {context.claims[winner]}"
+    assert context.claims[loser] == [], f"{loser} también obtuvo {context.claims[loser]}"
+
+
+@then('"{worker}" obtuvo el job')
+def step_worker_got_job(context, worker):
+    assert [j.id for j in context.claims[worker]] == [context.job.id], \
+        f"{worker} obtuvo {context.claims[worker]}"
+
+
+@then('el job queda en estado "{status}" bloqueado por "{worker}"')
+def step_job_locked_by(context, status, worker):
+    job = _job(context)
+    assert (job.status.value, job.locked_by) == (status, worker), \
+        f"Estado {job.status.value}, bloqueado por {job.locked_by}"
+
+
+@then('hay {count:d} job en la cola')
+def step_queue_size(context, count):
+    assert context.requeued.id == context.job.id, "Se creó un job nuevo"
+    assert JobModel.objects.count() == count, f"Hay {JobModel.objects.count()} jobs"
+
+
+@then('el job queda en estado "{status}" con {attempts:d} intento usado')
+@then('el job queda en estado "{status}" con {attempts:d} intentos usados')
+def step_job_attempts(context, status, attempts):
+    job = _job(context)
+    assert (job.status.value, job.attempts) == (status, attempts), \
+        f"Estado {job.status.value} con {job.attempts} intentos"
+
+
+@then('el último error del job es "{error}"')
+def step_job_last_error(context, error):
+    assert _job(context).last_error == error, f"Último error: {_job(context).last_error}"
+
+
+@then('"{worker}" no puede completar el job')
+def step_stale_worker_cannot_complete(context, worker):
+    assert not container.job_queue.complete(context.job.id, worker), \
+        f"{worker} completó un job que ya no le pertenece"
+
+
+@then('"{worker}" completa el job')
+def step_worker_completes(context, worker):
+    assert container.job_queue.complete(context.job.id, worker, {"ok": True}), \
+        f"{worker} no pudo completar el job"
+    assert _job(context).status.value == 'Done'
@@ -0,0 +1,108 @@
+"""
+BDD Steps para la jerarquía de tags sobre la tabla de clausura
+(MoveTagHandler, DjangoTagRepository.move / delete).
+"""
+
+import ast
+
+from behave import given, when, then
+
+from apps.extraction.application.commands.move_tag import MoveTagCommand, MoveTagHandler
+from apps.extraction.container import container
+from apps.extraction.domain.entities.tag import Tag
+from apps.extraction.domain.exceptions.extraction_exceptions import InvalidTagHierarchy
+from apps.extraction.domain.value_objects.tag_status import TagStatus
+from apps.extraction.domain.value_objects.tag_visibility import TagVisibility
+from apps.extraction.infrastructure.models import TagClosureModel, TagModel
+
+from puertos_en_memoria import ProyectoEnMemoria
+
+PROJECT_ID = 1
+OWNER_ID = 1
+
+
+# ================================================
+# GIVEN
+# ================================================
+
+@given('el libro de códigos del proyecto con la jerarquía:')
+def step_codebook_hierarchy(context):
+    context.tags = {}
+    for row in context.table:
+        parent = context.tags.get(row['Padre']) if row['Padre'] else None
+        context.tags[row['Tag']] = container.tag_repository.save(Tag(
+            id=None,
+            name=row['Tag'],
+            project_id=PROJECT_ID,
+            is_mandatory=False,
+            created_by_user_id=OWNER_ID,
+            status=TagStatus.APPROVED,
+            visibility=TagVisibility.PUBLIC,
+            parent_id=parent.id if parent else None
+        ))
+    context.move_handler = MoveTagHandler(
+        container.tag_repository,
+        ProyectoEnMemoria(PROJECT_ID, OWNER_ID)
+    )
+
+
+# ================================================
+# WHEN
+# ================================================
+
+@when('el Owner mueve "{name}" bajo "{parent_name}"')
+def step_owner_moves_tag(context, name, parent_name):
+    context.error = None
+    try:
+        context.move_handler.handle(MoveTagCommand(
+            tag_id=context.tags[name].id,
+            new_parent_id=context.tags[parent_name].id,
+            user_id=OWNER_ID
+        ))
+    except InvalidTagHierarchy as e:
+        context.error = e
+
+
+@when('se elimina el tag "{name}"')
+def step_delete_tag(context, name):
+    container.tag_repository.delete(context.tags[name])
+
+
+# ================================================
+# THEN
+# ================================================
+
+@then('el movimiento se rechaza por jerarquía inválida')
+def step_move_rejected(context):
+    assert isinstance(context.error, InvalidTagHierarchy), "El movimiento debía rechazarse"
+
+
+@then('"{name}" cuelga de "{parent_name}"')
+def step_tag_parent(context, name, parent_name):
+    parent_id = TagModel.objects.get(pk=context.tags[name].id).parent_id
+    assert parent_id == context.tags[parent_name].id, \
+        f"'{name}' cuelga de {parent_id}, se esperaba '{parent_name}'"
+
+
+@then('los ancestros de "{name}" siguen siendo:')
+def step_closure_of(context, name):
+    names = {tag.id: tag_name for tag_name, tag in context.tags.items()}
+    actual = sorted(
+        (names[ancestor_id], depth)
+        for ancestor_id, depth in TagClosureModel.objects.filter(
+            descendant_id=context.tags[name].id
+        ).values_list('ancestor_id', 'depth')
+    )
+    expected = sorted((row['Ancestro'], int(row['Profundidad'])) for row in context.table)
+    assert actual == expected, (
+        f"Clausura de '{name}':\n"
+        f"  Esperada: {expected}\n"
+        f"  Obtenida: {actual}"
+    )
+
+
+@then('el subárbol de "{name}" contiene solo {expected}')
+def step_subtree_of(context, name, expected):
+    names = {tag.id: tag_name for tag_name, tag in context.tags.items()}
+    actual = sorted(names[t] for t in container.tag_repository.get_subtree_ids(context.tags[name].id))
+    assert actual == sorted(ast.literal_eval(expected)), f"Subárbol de '{name}': {actual}"
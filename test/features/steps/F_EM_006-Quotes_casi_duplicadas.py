@@ -0,0 +1,75 @@
+"""
+BDD Steps para el agrupamiento de casi duplicados del índice LSH
+(MinHashLshIndex.find_clusters).
+
+El bucket compartido se arma a mano para que el primer miembro sea una
+colisión espuria, el caso que el recorrido por bucket no debe perder.
+"""
+
+import ast
+
+from behave import given, when, then
+from django.contrib.auth import get_user_model
+
+from apps.extraction.infrastructure.models import ExtractionModel, QuoteLshBucketModel, QuoteModel
+from apps.extraction.infrastructure.search.minhash_lsh import MinHashLshIndex
+
+PROJECT_ID = 1
+THRESHOLD = 0.5
+
+
+# ================================================
+# GIVEN
+# ================================================
+
+@given('las quotes del proyecto:')
+def step_project_quotes(context):
+    researcher = get_user_model().objects.create_user(username='ana', password='x')
+    extraction = ExtractionModel.objects.create(
+        study_id=10,
+        project_id=PROJECT_ID,
+        assigned_to=researcher,
+        extraction_order=1
+    )
+    context.quotes = {
+        row['Quote']: QuoteModel.objects.create(
+            extraction=extraction,
+            project_id=PROJECT_ID,
+            text_portion=row['Texto'],
+            researcher=researcher
+        )
+        for row in context.table
+    }
+    context.index = MinHashLshIndex()
+    context.index.index_quotes(PROJECT_ID, [q.id for q in context.quotes.values()])
+
+
+@given('que el índice LSH solo tiene un bucket con {names}')
+def step_single_bucket(context, names):
+    QuoteLshBucketModel.objects.filter(project_id=PROJECT_ID).delete()
+    QuoteLshBucketModel.objects.bulk_create(
+        QuoteLshBucketModel(project_id=PROJECT_ID, band_key=1, quote_id=context.quotes[name].id)
+        for name in ast.literal_eval(names)
+    )
+
+
+# ================================================
+# WHEN
+# ================================================
+
+@when('se agrupan los casi duplicados comparando par a par buckets de hasta {cap:d} quotes')
+def step_find_clusters(context, cap):
+    context.index.MAX_PAIRWISE_BUCKET = cap
+    context.clusters = context.index.find_clusters(PROJECT_ID, threshold=THRESHOLD)
+
+
+# ================================================
+# THEN
+# ================================================
+
+@then('se forma solo el grupo {names}')
+def step_single_cluster(context, names):
+    by_id = {quote.id: name for name, quote in context.quotes.items()}
+    groups = [sorted(by_id[q] for q in cluster.quote_ids) for cluster in context.clusters]
+    expected = sorted(ast.literal_eval(names))
+    assert groups == [expected], f"Grupos: {groups}, se esperaba [{expected}]"
@@ -0,0 +1,115 @@
+"""
+BDD Steps para el mapa de calor página x tag (PageTagHeatmapBuilder.cells
+y assemble), sin base de datos: los enlaces se arman como PageTagLinksDTO.
+"""
+
+import ast
+
+import numpy as np
+from behave import given, when, then
+
+from apps.extraction.domain.dtos.analytics_dtos import PageTagLinksDTO
+from apps.extraction.domain.services.page_heatmap import PageTagHeatmapBuilder
+
+
+def _links(rows) -> PageTagLinksDTO:
+    rows = list(rows)
+    return PageTagLinksDTO(
+        extraction_ids=np.array([r[0] for r in rows], dtype=np.int64),
+        pages=np.array([r[1] for r in rows], dtype=np.int64),
+        page_counts=np.array([r[2] for r in rows], dtype=np.int64),
+        tag_ids=np.array([r[3] for r in rows], dtype=np.int64),
+    )
+
+
+def _links_of(context, extraction_ids) -> PageTagLinksDTO:
+    return _links(r for r in context.rows if r[0] in extraction_ids)
+
+
+def _mode(text):
+    """'por página' -> (False, 0); 'normalizado en N bins' -> (True, N)"""
+    if text == 'por página':
+        return False, 0
+    return True, int(text.split()[2])
+
+
+def _build(context, normalize, bins, extraction_ids=None):
+    links = context.links if extraction_ids is None else _links_of(context, extraction_ids)
+    cells = context.builder.cells(links, normalize, bins)
+    return context.builder.assemble(cells.values(), normalize, bins)
+
+
+# ================================================
+# GIVEN
+# ================================================
+
+@given('los enlaces quote-tag con su página:')
+def step_page_tag_links(context):
+    context.rows = [
+        (int(row['Extracción']), int(row['Página']), int(row['Total'] or 0), int(row['Tag']))
+        for row in context.table
+    ]
+    context.links = _links(context.rows)
+    context.builder = PageTagHeatmapBuilder()
+
+
+# ================================================
+# WHEN
+# ================================================
+
+@when('se arma el mapa de calor por página')
+def step_heatmap_by_page(context):
+    context.heatmap = _build(context, False, 0)
+
+
+@when('se arma el mapa de calor normalizado en {bins:d} bins')
+def step_heatmap_normalized(context, bins):
+    context.heatmap = _build(context, True, bins)
+
+
+@when('se arma el mapa de calor normalizado en {bins:d} bins solo con la extracción {extraction_id:d}')
+def step_heatmap_normalized_single(context, bins, extraction_id):
+    context.heatmap = _build(context, True, bins, {extraction_id})
+
+
+@when('se arma el mapa de calor {mode} con la extracción {cached:d} en caché y la {fresh:d} recién calculada')
+def step_heatmap_cached_and_fresh(context, mode, cached, fresh):
+    normalize, bins = _mode(mode)
+    builder = context.builder
+    # Las celdas de la caché se calcularon antes y por separado
+    cells = {
+        **builder.cells(_links_of(context, {cached}), normalize, bins),
+        **builder.cells(_links_of(context, {fresh}), normalize, bins),
+    }
+    context.heatmap = builder.assemble(cells.values(), normalize, bins)
+    context.expected = _build(context, normalize, bins)
+
+
+# ================================================
+# THEN
+# ================================================
+
+@then('los bordes de los bins son {edges}')
+def step_bin_edges(context, edges):
+    actual = context.heatmap.bin_edges.tolist()
+    assert actual == ast.literal_eval(edges), f"Bordes: {actual}"
+
+
+@then('el tag {tag_id:d} tiene los conteos {counts}')
+def step_tag_counts(context, tag_id, counts):
+    tag_ids = context.heatmap.tag_ids.tolist()
+    assert tag_id in tag_ids, f"El tag {tag_id} no está en el mapa: {tag_ids}"
+    actual = context.heatmap.counts[tag_ids.index(tag_id)].tolist()
+    assert actual == ast.literal_eval(counts), f"Tag {tag_id}: {actual}"
+
+
+@then('el mapa coincide con el calculado de una sola vez')
+def step_heatmap_matches(context):
+    actual, expected = context.heatmap, context.expected
+    assert actual.tag_ids.tolist() == expected.tag_ids.tolist(), \
+        f"Tags: {actual.tag_ids.tolist()}, se esperaba {expected.tag_ids.tolist()}"
+    assert actual.bin_edges.tolist() == expected.bin_edges.tolist(), \
+        f"Bordes: {actual.bin_edges.tolist()}, se esperaba {expected.bin_edges.tolist()}"
+    assert np.array_equal(actual.counts, expected.counts), (
+        f"Conteos:\n  Esperados: {expected.counts.tolist()}\n  Obtenidos: {actual.counts.tolist()}"
+    )
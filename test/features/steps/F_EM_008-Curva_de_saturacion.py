@@ -0,0 +1,158 @@
+"""
+BDD Steps para la curva de saturación (GetSaturationCurveHandler con
+SaturationTracker y DjangoSaturationRepository): el cursor
+(completed_at, id) hace que cada consulta procese solo lo nuevo.
+
+Las extracciones se crean en orden de nombre (E1, E2, ...) para que sus ids
+sigan ese orden aunque se completen en otro.
+"""
+
+import ast
+from datetime import datetime, timezone
+
+from behave import given, when, then
+from django.contrib.auth import get_user_model
+
+from apps.extraction.application.queries.get_saturation_curve import (
+    GetSaturationCurveHandler,
+    GetSaturationCurveQuery
+)
+from apps.extraction.container import container
+from apps.extraction.domain.entities.tag import Tag
+from apps.extraction.domain.services.saturation import SaturationTracker
+from apps.extraction.domain.value_objects.extraction_status import ExtractionStatus
+from apps.extraction.domain.value_objects.tag_status import TagStatus
+from apps.extraction.domain.value_objects.tag_visibility import TagVisibility
+from apps.extraction.infrastructure.models import ExtractionModel, QuoteModel
+
+from puertos_en_memoria import ProyectoEnMemoria
+
+PROJECT_ID = 1
+
+
+class TrackerQueCuenta(SaturationTracker):
+    """Registra cuántas extracciones procesó la última consulta"""
+
+    def advance(self, state, rows):
+        self.processed = super().advance(state, rows)
+        return self.processed
+
+
+def _completed_at(text: str) -> datetime:
+    hour, minute = map(int, text.split(':'))
+    return datetime(2025, 1, 1, hour, minute, tzinfo=timezone.utc)
+
+
+def _query(context):
+    context.result = context.handler.handle(
+        GetSaturationCurveQuery(project_id=PROJECT_ID, user_id=context.researcher.id)
+    )
+
+
+# ================================================
+# GIVEN
+# ================================================
+
+@given('el libro de códigos con los tags {names}')
+def step_codebook_tags(context, names):
+    context.researcher = get_user_model().objects.create_user(username='ana', password='x')
+    context.tags = {
+        name: container.tag_repository.save(Tag(
+            id=None,
+            name=name,
+            project_id=PROJECT_ID,
+            is_mandatory=False,
+            created_by_user_id=context.researcher.id,
+            status=TagStatus.APPROVED,
+            visibility=TagVisibility.PUBLIC
+        ))
+        for name in ast.literal_eval(names)
+    }
+    context.tracker = TrackerQueCuenta()
+    context.handler = GetSaturationCurveHandler(
+        container.saturation_repository,
+        container.project_version_repository,
+        ProyectoEnMemoria(PROJECT_ID, context.researcher.id),
+        context.tracker
+    )
+    # Se crean todas de antemano, pendientes, para fijar el orden de ids
+    context.extractions = {
+        f"E{n}": ExtractionModel.objects.create(
+            study_id=9 + n,
+            project_id=PROJECT_ID,
+            assigned_to=context.researcher,
+            status=ExtractionStatus.PENDING.value
+        )
+        for n in range(1, 5)
+    }
+
+
+@given('las extracciones completadas:')
+def step_completed_extractions(context):
+    for row in context.table:
+        extraction = context.extractions[row['Extracción']]
+        extraction.study_id = int(row['Estudio'])
+        extraction.status = ExtractionStatus.DONE.value
+        extraction.completed_at = _completed_at(row['Completada'])
+        extraction.save()
+
+        quote = QuoteModel.objects.create(
+            extraction=extraction,
+            project_id=PROJECT_ID,
+            text_portion=f"Fragmento de {row['Extracción']}",
+            researcher=context.researcher
+        )
+        quote.tags.set(context.tags[name.strip()].id for name in row['Tags'].split(','))
+
+
+@given('que ya se consultó la curva de saturación')
+def step_curve_already_queried(context):
+    _query(context)
+
+
+@given('que cambió el catálogo de tags del proyecto')
+def step_tag_catalog_changed(context):
+    container.project_version_repository.bump_tag_catalog([PROJECT_ID])
+
+
+# ================================================
+# WHEN
+# ================================================
+
+@when('se consulta la curva de saturación')
+def step_query_curve(context):
+    _query(context)
+
+
+# ================================================
+# THEN
+# ================================================
+
+@then('la consulta procesó {count:d} extracciones')
+def step_processed(context, count):
+    assert context.tracker.processed == count, \
+        f"Se procesaron {context.tracker.processed} extracciones, se esperaban {count}"
+
+
+@then('la curva tiene los puntos:')
+def step_curve_points(context):
+    names = {model.id: name for name, model in context.extractions.items()}
+    actual = [
+        (names[p['extraction_id']], p['new_count'], p['cumulative'])
+        for p in context.result['points']
+    ]
+    expected = [
+        (row['Extracción'], int(row['Nuevos']), int(row['Acumulado']))
+        for row in context.table
+    ]
+    assert actual == expected, (
+        f"Puntos de la curva:\n"
+        f"  Esperados: {expected}\n"
+        f"  Obtenidos: {actual}"
+    )
+
+
+@then('las últimas {count:d} extracciones no aportaron códigos nuevos')
+def step_streak(context, count):
+    streak = context.result['extractions_without_new_codes']
+    assert streak == count, f"Racha sin códigos nuevos: {streak}, se esperaba {count}"
@@ -0,0 +1,129 @@
+"""
+BDD Steps para la importación de libros de códigos (ImportCodebookHandler
+con CodebookPlanner): temas implícitos y reimportación idempotente.
+"""
+
+import csv
+import io
+
+from behave import given, when, then
+
+from apps.extraction.application.commands.import_codebook import (
+    ImportCodebookCommand,
+    ImportCodebookHandler
+)
+from apps.extraction.container import container
+from apps.extraction.domain.exceptions.extraction_exceptions import ExtractionValidationError
+from apps.extraction.infrastructure.importers.codebook import parse_codebook
+from apps.extraction.infrastructure.models import TagModel
+
+from puertos_en_memoria import PreguntasEnMemoria, ProyectoEnMemoria
+
+PROJECT_ID = 1
+OWNER_ID = 1
+
+
+def _csv(table) -> str:
+    """La tabla del escenario como archivo CSV"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(table.headings)
+    writer.writerows(row.cells for row in table)
+    return buffer.getvalue()
+
+
+def _import(context, content):
+    context.result = context.error = None
+    try:
+        context.result = context.import_handler.handle(ImportCodebookCommand(
+            project_id=PROJECT_ID,
+            user_id=OWNER_ID,
+            entries=parse_codebook(content, 'csv')
+        ))
+    except ExtractionValidationError as e:
+        context.error = e
+
+
+def _path(tags, tag):
+    path = [tag.name]
+    while tag.parent_id:
+        tag = tags[tag.parent_id]
+        path.insert(0, tag.name)
+    return ' > '.join(path)
+
+
+# ================================================
+# GIVEN
+# ================================================
+
+@given('el libro de códigos en CSV:')
+def step_codebook_csv(context):
+    context.codebook = _csv(context.table)
+    context.import_handler = ImportCodebookHandler(
+        container.tag_repository,
+        PreguntasEnMemoria(PROJECT_ID),
+        ProyectoEnMemoria(PROJECT_ID, OWNER_ID)
+    )
+
+
+@given('que el Owner ya importó el libro de códigos')
+def step_codebook_already_imported(context):
+    _import(context, context.codebook)
+    assert context.error is None, f"La primera importación falló: {context.error}"
+
+
+# ================================================
+# WHEN
+# ================================================
+
+@when('el Owner importa el libro de códigos')
+def step_import_codebook(context):
+    _import(context, context.codebook)
+
+
+@when('el Owner importa el libro de códigos en CSV:')
+def step_import_other_codebook(context):
+    _import(context, _csv(context.table))
+
+
+# ================================================
+# THEN
+# ================================================
+
+@then('se crearon {created:d} tags y {existing:d} ya existían')
+def step_import_result(context, created, existing):
+    assert context.error is None, f"La importación falló: {context.error}"
+    actual = (context.result.created, context.result.existing)
+    assert actual == (created, existing), f"Creados/existentes: {actual}"
+
+
+@then('el proyecto tiene los tags:')
+def step_project_tags(context):
+    tags = {t.id: t for t in TagModel.objects.filter(project_id=PROJECT_ID)}
+    actual = sorted((_path(tags, t), t.is_mandatory) for t in tags.values())
+    expected = sorted((row['Ruta'], row['Obligatorio'] == 'sí') for row in context.table)
+    assert actual == expected, (
+        f"Tags del proyecto:\n"
+        f"  Esperados: {expected}\n"
+        f"  Obtenidos: {actual}"
+    )
+
+
+@then('el proyecto tiene {count:d} tags')
+def step_project_tag_count(context, count):
+    actual = TagModel.objects.filter(project_id=PROJECT_ID).count()
+    assert actual == count, f"El proyecto tiene {actual} tags, se esperaban {count}"
+
+
+@then('"{name}" cuelga del tema existente "{parent_name}"')
+def step_hangs_from_existing(context, name, parent_name):
+    parents = TagModel.objects.filter(project_id=PROJECT_ID, name=parent_name)
+    assert parents.count() == 1, f"Hay {parents.count()} tags '{parent_name}'"
+    tag = TagModel.objects.get(project_id=PROJECT_ID, name=name)
+    assert tag.parent_id == parents.get().id, f"'{name}' cuelga de {tag.parent_id}"
+
+
+@then('la importación se rechaza por código repetido')
+def step_import_rejected(context):
+    assert isinstance(context.error, ExtractionValidationError), "La importación debía rechazarse"
+    assert 'repetido' in str(context.error), f"Error inesperado: {context.error}"
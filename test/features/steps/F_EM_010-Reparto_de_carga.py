@@ -0,0 +1,120 @@
+"""
+BDD Steps para el reparto de carga (WorkloadBalancer.plan y plan_handover),
+sin base de datos: las extracciones existentes se arman como ExtractionSlotDTO.
+"""
+
+import ast
+from collections import defaultdict
+
+from behave import given, when, then
+
+from apps.extraction.domain.dtos.assignment_dtos import ExtractionSlotDTO
+from apps.extraction.domain.services.workload_balancer import WorkloadBalancer
+
+
+def _balancer(context) -> WorkloadBalancer:
+    return WorkloadBalancer(context.users.values(), context.slots)
+
+
+# ================================================
+# GIVEN
+# ================================================
+
+@given('los codificadores {names}')
+def step_coders(context, names):
+    context.users = {name: user_id for user_id, name in enumerate(ast.literal_eval(names), start=1)}
+    context.names = {user_id: name for name, user_id in context.users.items()}
+    context.slots = []
+    context.extractions = {}
+
+
+@given('las extracciones existentes:')
+def step_existing_extractions(context):
+    for extraction_id, row in enumerate(context.table, start=len(context.slots) + 1):
+        context.extractions[row['Extracción']] = extraction_id
+        context.slots.append(ExtractionSlotDTO(
+            extraction_id=extraction_id,
+            study_id=int(row['Estudio']),
+            user_id=context.users[row['Codificador']] if row['Codificador'] else None,
+            extraction_order=int(row['Orden']),
+            is_open=row['Abierta'] == 'sí'
+        ))
+
+
+# ================================================
+# WHEN
+# ================================================
+
+@when('se reparten los estudios {study_ids} con {per_study:d} codificadores por estudio')
+def step_plan(context, study_ids, per_study):
+    context.balancer = _balancer(context)
+    context.planned, context.unfilled = context.balancer.plan(ast.literal_eval(study_ids), per_study)
+    context.assignments = [
+        (slot.study_id, slot.user_id) for slot in context.slots if slot.user_id is not None
+    ] + [(a.study_id, a.user_id) for a in context.planned]
+
+
+@when('"{name}" deja el proyecto')
+def step_handover(context, name):
+    context.moves, context.orphaned = _balancer(context).plan_handover(context.users[name])
+    context.assignments = [
+        (slot.study_id, context.moves.get(slot.extraction_id, slot.user_id))
+        for slot in context.slots
+        if slot.user_id is not None and slot.extraction_id not in context.orphaned
+    ]
+
+
+# ================================================
+# THEN
+# ================================================
+
+@then('las asignaciones planeadas son:')
+def step_planned_assignments(context):
+    names = {extraction_id: name for name, extraction_id in context.extractions.items()}
+    actual = sorted(
+        (a.study_id, a.extraction_order, context.names[a.user_id], names.get(a.extraction_id, ''))
+        for a in context.planned
+    )
+    expected = sorted(
+        (int(row['Estudio']), int(row['Orden']), row['Codificador'], row['Cupo existente'])
+        for row in context.table
+    )
+    assert actual == expected, (
+        f"Asignaciones:\n"
+        f"  Esperadas: {expected}\n"
+        f"  Obtenidas: {actual}"
+    )
+
+
+@then('ningún estudio repite codificador')
+def step_no_repeated_coder(context):
+    by_study = defaultdict(list)
+    for study_id, user_id in context.assignments:
+        by_study[study_id].append(user_id)
+    repeated = {s: users for s, users in by_study.items() if len(set(users)) != len(users)}
+    assert not repeated, f"Estudios con un codificador repetido: {repeated}"
+
+
+@then('la carga queda en {loads}')
+def step_final_load(context, loads):
+    actual = {context.names[u]: load for u, load in context.balancer.load_by_user.items()}
+    assert actual == ast.literal_eval(loads), f"Carga: {actual}"
+
+
+@then('sus extracciones pasan a:')
+def step_handover_moves(context):
+    names = {extraction_id: name for name, extraction_id in context.extractions.items()}
+    actual = sorted((names[e], context.names[u]) for e, u in context.moves.items())
+    expected = sorted((row['Extracción'], row['Codificador']) for row in context.table)
+    assert actual == expected, f"Traspasos: {actual}, se esperaba {expected}"
+
+
+@then('no quedan extracciones sin reemplazo')
+def step_no_orphans(context):
+    assert not context.orphaned, f"Sin reemplazo: {context.orphaned}"
+
+
+@then('quedan sin reemplazo las extracciones {names}')
+def step_orphans(context, names):
+    expected = sorted(context.extractions[n] for n in ast.literal_eval(names))
+    assert sorted(context.orphaned) == expected, f"Sin reemplazo: {context.orphaned}"
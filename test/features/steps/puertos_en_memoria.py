@@ -0,0 +1,78 @@
+"""
+Implementaciones en memoria de los puertos hacia otros Bounded Contexts
+(Projects, Acquisition y Design), para ejercitar los handlers de extracción
+contra la base de datos de prueba sin depender de esos servicios.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from apps.extraction.domain.dtos.design_dtos import ResearchQuestionDTO
+from apps.extraction.domain.dtos.project_dtos import ProjectDTO, ProjectMemberDTO, StageDTO
+from apps.extraction.domain.repositories.i_acquisition_repository import IAcquisitionRepository
+from apps.extraction.domain.repositories.i_design_repository import IDesignRepository
+from apps.extraction.domain.repositories.i_project_repository import IProjectRepository
+
+
+class ProyectoEnMemoria(IProjectRepository):
+    def __init__(self, project_id: int, owner_id: int, member_ids: List[int] = ()):
+        self.project = ProjectDTO(id=project_id, name=f"Proyecto {project_id}", description="", owner_id=owner_id)
+        self.member_ids = [owner_id, *[m for m in member_ids if m != owner_id]]
+
+    def get_project_by_id(self, project_id: int) -> Optional[ProjectDTO]:
+        return self.project if project_id == self.project.id else None
+
+    def exists(self, project_id: int) -> bool:
+        return project_id == self.project.id
+
+    def is_member(self, project_id: int, user_id: int) -> bool:
+        return self.exists(project_id) and user_id in self.member_ids
+
+    def get_members(self, project_id: int) -> List[ProjectMemberDTO]:
+        if not self.exists(project_id):
+            return []
+        return [
+            ProjectMemberDTO(
+                user_id=user_id,
+                role='OWNER' if user_id == self.project.owner_id else 'RESEARCHER',
+                joined_at=datetime(2025, 1, 1)
+            )
+            for user_id in self.member_ids
+        ]
+
+    def get_current_stage(self, project_id: int) -> Optional[StageDTO]:
+        return StageDTO(name='Extraction', status='OPENED')
+
+
+class EstudiosEnMemoria(IAcquisitionRepository):
+    def __init__(self, project_id: int, study_ids: List[int]):
+        self.project_by_study: Dict[int, int] = {study_id: project_id for study_id in study_ids}
+
+    def get_study_details(self, study_id: int) -> dict:
+        return {"id": study_id, "project_id": self.project_by_study.get(study_id)}
+
+    def exists(self, study_id: int) -> bool:
+        return study_id in self.project_by_study
+
+    def get_project_context(self, study_id: int) -> Optional[int]:
+        return self.project_by_study.get(study_id)
+
+    def get_study_ids_by_project(self, project_id: int) -> List[int]:
+        return sorted(s for s, p in self.project_by_study.items() if p == project_id)
+
+
+class PreguntasEnMemoria(IDesignRepository):
+    def __init__(self, project_id: int, question_ids: List[int] = ()):
+        self.questions = {
+            question_id: ResearchQuestionDTO(id=question_id, text=f"Pregunta {question_id}", project_id=project_id)
+            for question_id in question_ids
+        }
+
+    def get_question_by_id(self, question_id: int) -> Optional[ResearchQuestionDTO]:
+        return self.questions.get(question_id)
+
+    def get_questions_by_project(self, project_id: int) -> List[ResearchQuestionDTO]:
+        return [q for q in self.questions.values() if q.project_id == project_id]
+
+    def question_exists(self, question_id: int) -> bool:
+        return question_id in self.questions